@@ -0,0 +1,122 @@
+"""
+Measure the cold start time of the bumper CLI.
+
+Each measurement is made in a fresh interpreter so that nothing is served from an already populated
+module cache:
+
+  * The cumulative import time of `bumper.cli`, as reported by `python -X importtime`
+  * The wall-clock time of `bumper --help`
+  * The wall-clock time of `bumper bump patch` against a minimal project
+
+Results are printed & optionally written to JSON. If `--budget-ms` is specified, the script exits
+with a non-zero status if the median wall-clock time of any CLI invocation exceeds the budget.
+
+Usage: python benchmarks/startup.py [--runs N] [--output PATH] [--budget-ms MS]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_CONFIG = """\
+[tool.bumper]
+current_version = "0.1.0"
+versioning_type = "semver"
+
+[[tool.bumper.files]]
+file = "./README.md"
+search = "v{current_version}"
+"""
+
+CLI = (sys.executable, "-m", "bumper.cli")
+
+# Measure the working tree rather than any installed copy of bumper
+REPO_ROOT = Path(__file__).parent.parent
+ENV = {**os.environ, "PYTHONPATH": str(REPO_ROOT)}
+
+
+def import_time_us(module: str) -> int:
+    """Return the cumulative import time of `module`, in microseconds, from `-X importtime`."""
+    proc = subprocess.run(
+        (sys.executable, "-X", "importtime", "-c", f"import {module}"),
+        capture_output=True,
+        text=True,
+        check=True,
+        env=ENV,
+    )
+
+    # Lines are formatted as "import time: <self> | <cumulative> | <name>"
+    for line in reversed(proc.stderr.splitlines()):
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        if name.strip() == module:
+            return int(cumulative)
+
+    raise ValueError(f"No import time reported for '{module}'")
+
+
+def wall_time_ms(args: tuple[str, ...], cwd: Path, runs: int) -> list[float]:
+    """Return the wall-clock time, in milliseconds, of each of `runs` invocations of `args`."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(args, cwd=cwd, capture_output=True, check=True, env=ENV)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    return timings
+
+
+def run(runs: int) -> dict[str, dict[str, float]]:
+    """Run each startup benchmark, returning the summary statistics of each."""
+    results = {"import bumper.cli": [import_time_us("bumper.cli") / 1000 for _ in range(runs)]}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        project_dir = Path(tmp)
+        (project_dir / ".bumper.toml").write_text(PROJECT_CONFIG)
+        (project_dir / "README.md").write_text("v0.1.0\n")
+
+        results["bumper --help"] = wall_time_ms((*CLI, "--help"), project_dir, runs)
+        results["bumper bump patch"] = wall_time_ms((*CLI, "bump", "patch"), project_dir, runs)
+
+    return {
+        name: {"median_ms": statistics.median(t), "min_ms": min(t), "max_ms": max(t)}
+        for name, t in results.items()
+    }
+
+
+def main() -> int:  # noqa: D103
+    parser = argparse.ArgumentParser(description="Measure the cold start time of the bumper CLI.")
+    parser.add_argument("--runs", type=int, default=10, help="Number of runs per measurement.")
+    parser.add_argument("--output", type=Path, help="Write the results to this JSON file.")
+    parser.add_argument("--budget-ms", type=float, help="Maximum median CLI wall-clock time.")
+    args = parser.parse_args()
+
+    summary = run(args.runs)
+    for name, stats in summary.items():
+        print(f"{name:<20} median {stats['median_ms']:8.1f} ms (min {stats['min_ms']:.1f} ms)")
+
+    if args.output:
+        args.output.write_text(json.dumps(summary, indent=2))
+
+    if args.budget_ms is not None:
+        over_budget = [
+            name
+            for name, stats in summary.items()
+            if name.startswith("bumper") and stats["median_ms"] > args.budget_ms
+        ]
+        for name in over_budget:
+            print(f"{name} exceeds the startup budget of {args.budget_ms} ms")
+
+        if over_budget:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,239 @@
+"""
+Benchmark bumper against a synthetic project.
+
+A project is generated with a configurable number of target files, file size, rules per file, and
+match density; the following are then timed against a fresh copy of the project:
+
+  * `parse_config`
+  * `_merge_bumpers`
+  * `bump_ver`, both with & without `dry_run`
+  * `bump_ver` with every rule limited to its first occurrence, using `max_occurrences`
+  * A full `bumper bump patch` CLI invocation
+
+Results are printed & optionally written to JSON so they can be compared between commits. If a
+baseline results file is provided using `--compare`, the script exits with a non-zero status if the
+median time of any benchmark exceeds its baseline median by more than `--threshold`.
+
+Usage: python -m benchmarks.suite [--files N] [--file-size BYTES] [--rules N] [--density N]
+                                  [--repeat N] [--output PATH] [--compare PATH] [--threshold FRAC]
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import typing as t
+from pathlib import Path
+
+from bumper.bump import BumpType, _merge_bumpers, bump_ver
+from bumper.config import BumperFile, CONFIG_SEARCH, SearchOptions, parse_config
+
+REPO_ROOT = Path(__file__).parent.parent
+CURRENT_VERSION = "1.2.3"
+
+FILLER_LINE = "Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor.\n"
+
+
+class ProjectSpec(t.NamedTuple):  # noqa: D101
+    n_files: int
+    file_size: int
+    n_rules: int
+    density: float  # Matches per rule per KiB
+
+
+def _rule(idx: int) -> str:
+    return f'key_{idx} = "{{current_version}}"'
+
+
+def generate_project(root_dir: Path, spec: ProjectSpec) -> None:
+    """
+    Generate a synthetic project matching the provided specification in `root_dir`.
+
+    Each target file is padded with filler text to `file_size` bytes, with occurrences of each of
+    its rules spread evenly throughout.
+    """
+    rules = [_rule(i) for i in range(spec.n_rules)]
+    rendered = [r.replace("{current_version}", CURRENT_VERSION) + "\n" for r in rules]
+
+    n_matches = max(1, round(spec.density * spec.file_size / 1024))
+    n_lines = max(spec.file_size // len(FILLER_LINE), 1)
+    stride = max(n_lines // n_matches, 1)
+
+    lines = []
+    for line_idx in range(n_lines):
+        lines.append(FILLER_LINE)
+        if line_idx % stride == 0 and line_idx // stride < n_matches:
+            lines.extend(rendered)
+    contents = "".join(lines)
+
+    cfg_lines = [
+        "[tool.bumper]",
+        f'current_version = "{CURRENT_VERSION}"',
+        'versioning_type = "semver"',
+        "",
+    ]
+    src_dir = root_dir / "src"
+    src_dir.mkdir(parents=True)
+    for file_idx in range(spec.n_files):
+        filename = f"file_{file_idx:05}.txt"
+        (src_dir / filename).write_text(contents)
+        for rule in rules:
+            cfg_lines.extend(
+                ("[[tool.bumper.files]]", f'file = "./src/{filename}"', f"search = '{rule}'", "")
+            )
+
+    cfg_lines.extend(("[[tool.bumper.files]]", 'file = "./.bumper.toml"'))
+    cfg_lines.extend((f"search = '{CONFIG_SEARCH}'", ""))
+    (root_dir / ".bumper.toml").write_text("\n".join(cfg_lines))
+
+
+def _time_call(func: t.Callable[[], t.Any]) -> float:
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        func()
+    return time.perf_counter() - start
+
+
+class Benchmark(t.NamedTuple):  # noqa: D101
+    name: str
+    func: t.Callable[[Path], t.Callable[[], t.Any]]
+
+
+def _bump(dry_run: bool) -> t.Callable[[Path], t.Callable[[], t.Any]]:
+    def _setup(project_dir: Path) -> t.Callable[[], t.Any]:
+        current_version, _, files, options = parse_config(project_dir / ".bumper.toml")
+        return lambda: bump_ver(current_version, files, BumpType.PATCH, dry_run, options)
+
+    return _setup
+
+
+def _bump_first_occurrence(project_dir: Path) -> t.Callable[[], t.Any]:
+    current_version, _, files, options = parse_config(project_dir / ".bumper.toml")
+    files = [f._replace(search_options=SearchOptions(max_occurrences=1)) for f in files]
+    return lambda: bump_ver(current_version, files, BumpType.PATCH, False, options)
+
+
+def _merge(project_dir: Path) -> t.Callable[[], t.Any]:
+    _, _, files, _ = parse_config(project_dir / ".bumper.toml")
+    files = [*files, BumperFile(file=Path("./.bumper.toml"), search=CONFIG_SEARCH)]
+    return lambda: _merge_bumpers(files)
+
+
+def _cli(project_dir: Path) -> t.Callable[[], t.Any]:
+    env = {**os.environ, "PYTHONPATH": str(REPO_ROOT)}
+    args = (sys.executable, "-m", "bumper.cli", "bump", "patch")
+    return lambda: subprocess.run(args, cwd=project_dir, env=env, capture_output=True, check=True)
+
+
+BENCHMARKS = (
+    Benchmark("parse_config", lambda d: lambda: parse_config(d / ".bumper.toml")),
+    Benchmark("_merge_bumpers", _merge),
+    Benchmark("bump_ver (dry run)", _bump(dry_run=True)),
+    Benchmark("bump_ver", _bump(dry_run=False)),
+    Benchmark("bump_ver (bounded)", _bump_first_occurrence),
+    Benchmark("cli bump patch", _cli),
+)
+
+
+def run(spec: ProjectSpec, repeat: int) -> dict[str, dict[str, float]]:
+    """
+    Time each benchmark `repeat` times, returning the summary statistics of each.
+
+    Each run is made against a fresh copy of the generated project, from within the project's
+    directory.
+    """
+    timings: dict[str, list[float]] = {b.name: [] for b in BENCHMARKS}
+    with tempfile.TemporaryDirectory() as tmp:
+        template_dir = Path(tmp) / "template"
+        generate_project(template_dir, spec)
+
+        project_dir = Path(tmp) / "project"
+        start_dir = Path.cwd()
+        try:
+            for _ in range(repeat):
+                for bench in BENCHMARKS:
+                    shutil.copytree(template_dir, project_dir)
+                    os.chdir(project_dir)
+
+                    timings[bench.name].append(_time_call(bench.func(project_dir)))
+
+                    os.chdir(start_dir)
+                    shutil.rmtree(project_dir)
+        finally:
+            os.chdir(start_dir)
+
+    return {
+        name: {"median_s": statistics.median(times), "min_s": min(times), "max_s": max(times)}
+        for name, times in timings.items()
+    }
+
+
+def compare(
+    results: dict[str, dict[str, float]], baseline: dict[str, dict[str, float]], threshold: float
+) -> list[str]:
+    """Return the names of the benchmarks whose median regressed by more than `threshold`."""
+    regressions = []
+    for name, stats in results.items():
+        if name not in baseline:
+            continue
+
+        ratio = stats["median_s"] / baseline[name]["median_s"]
+        print(f"{name:<20} {ratio:6.2f}x baseline")
+        if ratio > 1 + threshold:
+            regressions.append(name)
+
+    return regressions
+
+
+def main() -> int:  # noqa: D103
+    parser = argparse.ArgumentParser(description="Benchmark bumper against a synthetic project.")
+    parser.add_argument("--files", type=int, default=100, help="Number of target files.")
+    parser.add_argument("--file-size", type=int, default=64 * 1024, help="Target file size, bytes.")
+    parser.add_argument("--rules", type=int, default=2, help="Number of rules per target file.")
+    parser.add_argument("--density", type=float, default=0.1, help="Matches per rule per KiB.")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of runs per benchmark.")
+    parser.add_argument("--output", type=Path, help="Write the results to this JSON file.")
+    parser.add_argument("--compare", type=Path, help="Baseline results JSON file.")
+    parser.add_argument("--threshold", type=float, default=0.1, help="Allowed fractional slowdown.")
+    args = parser.parse_args()
+
+    spec = ProjectSpec(args.files, args.file_size, args.rules, args.density)
+    results = run(spec, args.repeat)
+    for name, stats in results.items():
+        print(f"{name:<20} median {stats['median_s'] * 1000:9.2f} ms")
+
+    if args.output:
+        report = {
+            "python": platform.python_version(),
+            "spec": spec._asdict(),
+            "results": results,
+        }
+        args.output.write_text(json.dumps(report, indent=2))
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        if baseline["spec"] != spec._asdict():
+            print("Warning: baseline was generated using a different project specification")
+
+        regressions = compare(results, baseline["results"], args.threshold)
+        for name in regressions:
+            print(f"{name} regressed by more than {args.threshold:.0%}")
+
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,6 @@
 from pathlib import Path
 
 CONFIG_PRIORITY = (Path(".bumper.toml"), Path("pyproject.toml"))
+
+# Directory, relative to the current directory, containing bumper's caches & daemon socket
+CACHE_DIR = Path(".bumper-cache")
@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import gzip
+import io
+import struct
+import typing as t
+import zipfile
+from pathlib import Path
+
+# Header ID of the extra field holding ZIP64 sizes & offsets, which is regenerated when rewritten
+ZIP64_EXTRA_ID = 0x0001
+ZIP64_LIMIT = 0xFFFFFFFF
+ZIP64_VERSION = 45
+
+# Record layouts of the zip file format, see APPNOTE.TXT sections 4.3.7, 4.3.12, & 4.3.14 to 4.3.16
+LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+CENTRAL_HEADER = struct.Struct("<4s4B4HL2L5H2L")
+END_OF_CENTRAL_DIR = struct.Struct("<4s4H2LH")
+ZIP64_END_OF_CENTRAL_DIR = struct.Struct("<4sQ2H2L4Q")
+ZIP64_END_LOCATOR = struct.Struct("<4sLQL")
+CENTRAL_HEADER_SIG = b"PK\x01\x02"
+END_OF_CENTRAL_DIR_SIG = b"PK\x05\x06"
+ZIP64_END_OF_CENTRAL_DIR_SIG = b"PK\x06\x06"
+ZIP64_END_LOCATOR_SIG = b"PK\x06\x07"
+DATA_DESCRIPTOR_SIG = b"PK\x07\x08"
+
+# General purpose flag set when the sizes & CRC of a member follow its data in a data descriptor
+FLAG_DATA_DESCRIPTOR = 0x08
+
+COPY_CHUNK_SIZE = 1 << 20
+
+
+def read_members(archive: Path, names: t.Iterable[str]) -> dict[str, bytes]:
+    """
+    Decompress the named members of the provided zip archive.
+
+    Only the named members are decompressed; the remainder of the archive is never read.
+
+    Raises `FileNotFoundError` if any of the members is not present in the archive.
+    """
+    with zipfile.ZipFile(archive) as zf:
+        members = {}
+        for name in names:
+            try:
+                members[name] = zf.read(name)
+            except KeyError:
+                raise FileNotFoundError(f"No member named '{name}' in '{archive}'") from None
+
+    return members
+
+
+def read_gzip(target: Path) -> tuple[bytes, int]:
+    """Decompress the provided gzip file, returning its contents & its recorded modified time."""
+    with gzip.GzipFile(target, "rb") as f:
+        data = f.read()
+        return data, f.mtime or 0
+
+
+def write_gzip(dst: t.BinaryIO, data: bytes, name: str, mtime: int) -> None:
+    """Compress the provided contents to `dst`, recording the provided original file name & time."""
+    with gzip.GzipFile(filename=name, mode="wb", fileobj=dst, mtime=mtime) as f:
+        f.write(data)
+
+
+def _strip_zip64(extra: bytes) -> bytes:
+    """Remove any ZIP64 field from the provided extra data, as it is regenerated when written."""
+    fields = []
+    pos = 0
+    while pos + 4 <= len(extra):
+        header_id, size = struct.unpack("<HH", extra[pos : pos + 4])
+        if header_id != ZIP64_EXTRA_ID:
+            fields.append(extra[pos : pos + 4 + size])
+        pos += 4 + size
+
+    return b"".join(fields)
+
+
+def _extra_ids(extra: bytes) -> set[int]:
+    """Collect the header IDs of the fields of the provided extra data."""
+    ids = set()
+    pos = 0
+    while pos + 4 <= len(extra):
+        header_id, size = struct.unpack("<HH", extra[pos : pos + 4])
+        ids.add(header_id)
+        pos += 4 + size
+
+    return ids
+
+
+def _record_size(f: t.BinaryIO, info: zipfile.ZipInfo) -> tuple[int, bytes]:
+    """
+    Measure the stored record of the provided member, as found in the archive open as `f`.
+
+    A member's record spans its local header, its compressed data, & its data descriptor, if it has
+    one. Returns the size of the record along with the member's name, as encoded in its local
+    header.
+    """
+    f.seek(info.header_offset)
+    header = LOCAL_HEADER.unpack(f.read(LOCAL_HEADER.size))
+    name_len, extra_len = header[-2:]
+    raw_name = f.read(name_len)
+    local_extra = f.read(extra_len)
+    size = LOCAL_HEADER.size + name_len + extra_len + info.compress_size
+    if info.flag_bits & FLAG_DATA_DESCRIPTOR:
+        f.seek(info.header_offset + size)
+        has_sig = f.read(4) == DATA_DESCRIPTOR_SIG
+        is_zip64 = ZIP64_EXTRA_ID in _extra_ids(local_extra)
+        size += (16 if has_sig else 12) + (8 if is_zip64 else 0)
+
+    return size, raw_name
+
+
+def _copy_range(src: t.BinaryIO, dst: t.BinaryIO, offset: int, size: int) -> None:
+    """Copy `size` bytes of `src`, starting at `offset`, to `dst` in chunks."""
+    src.seek(offset)
+    while size:
+        chunk = src.read(min(size, COPY_CHUNK_SIZE))
+        if not chunk:
+            raise zipfile.BadZipFile("Truncated member data")
+        dst.write(chunk)
+        size -= len(chunk)
+
+
+def _member_info(info: zipfile.ZipInfo) -> zipfile.ZipInfo:
+    """Build the entry of a replaced member, retaining the original entry's metadata."""
+    rewritten = zipfile.ZipInfo(info.filename, info.date_time)
+    rewritten.compress_type = info.compress_type
+    rewritten.comment = info.comment
+    rewritten.create_system = info.create_system
+    rewritten.internal_attr = info.internal_attr
+    rewritten.external_attr = info.external_attr
+    rewritten.extra = _strip_zip64(info.extra)
+    return rewritten
+
+
+def _replaced_record(info: zipfile.ZipInfo, data: bytes) -> tuple[bytes, zipfile.ZipInfo, bytes]:
+    """
+    Compress the new contents of the provided member into a stored record.
+
+    The record is built by writing the member to an in-memory archive, so any compression method
+    supported by `zipfile` may be used. Returns the record along with its entry & encoded name.
+    """
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        zf.writestr(_member_info(info), data)
+
+    with zipfile.ZipFile(buf) as zf:
+        (replaced,) = zf.infolist()
+        size, raw_name = _record_size(buf, replaced)
+
+    return buf.getvalue()[:size], replaced, raw_name
+
+
+def _dos_datetime(date_time: tuple[int, ...]) -> tuple[int, int]:
+    """Pack the provided timestamp into the MS-DOS time & date used by zip headers."""
+    year, month, day, hour, minute, second = date_time
+    return hour << 11 | minute << 5 | second // 2, (year - 1980) << 9 | month << 5 | day
+
+
+def _central_header(info: zipfile.ZipInfo, raw_name: bytes, offset: int) -> bytes:
+    """
+    Build the central directory header of the provided member, stored at `offset`.
+
+    Any size or offset too large for its field is recorded in a regenerated ZIP64 extra field.
+    """
+    zip64 = [n for n in (info.file_size, info.compress_size, offset) if n >= ZIP64_LIMIT]
+    extra = _strip_zip64(info.extra)
+    extract_version = info.extract_version
+    if zip64:
+        extra = struct.pack(f"<HH{len(zip64)}Q", ZIP64_EXTRA_ID, 8 * len(zip64), *zip64) + extra
+        extract_version = max(extract_version, ZIP64_VERSION)
+
+    dos_time, dos_date = _dos_datetime(info.date_time)
+    header = CENTRAL_HEADER.pack(
+        CENTRAL_HEADER_SIG,
+        info.create_version,
+        info.create_system,
+        extract_version,
+        info.reserved,
+        info.flag_bits,
+        info.compress_type,
+        dos_time,
+        dos_date,
+        info.CRC,
+        min(info.compress_size, ZIP64_LIMIT),
+        min(info.file_size, ZIP64_LIMIT),
+        len(raw_name),
+        len(extra),
+        len(info.comment),
+        0,
+        info.internal_attr,
+        info.external_attr,
+        min(offset, ZIP64_LIMIT),
+    )
+    return header + raw_name + extra + info.comment
+
+
+def _end_records(n_members: int, dir_offset: int, dir_size: int, comment: bytes) -> bytes:
+    """Build the end of central directory record, preceded by its ZIP64 counterpart if required."""
+    records = b""
+    if n_members > 0xFFFF or dir_offset >= ZIP64_LIMIT or dir_size >= ZIP64_LIMIT:
+        records = ZIP64_END_OF_CENTRAL_DIR.pack(
+            ZIP64_END_OF_CENTRAL_DIR_SIG,
+            ZIP64_END_OF_CENTRAL_DIR.size - 12,
+            ZIP64_VERSION,
+            ZIP64_VERSION,
+            0,
+            0,
+            n_members,
+            n_members,
+            dir_size,
+            dir_offset,
+        ) + ZIP64_END_LOCATOR.pack(ZIP64_END_LOCATOR_SIG, 0, dir_offset + dir_size, 1)
+
+    return (
+        records
+        + END_OF_CENTRAL_DIR.pack(
+            END_OF_CENTRAL_DIR_SIG,
+            0,
+            0,
+            min(n_members, 0xFFFF),
+            min(n_members, 0xFFFF),
+            min(dir_size, ZIP64_LIMIT),
+            min(dir_offset, ZIP64_LIMIT),
+            len(comment),
+        )
+        + comment
+    )
+
+
+def rewrite_zip(archive: Path, dst: t.BinaryIO, replaced: dict[str, bytes]) -> None:
+    """
+    Write a copy of the provided zip archive to `dst`, replacing the contents of the given members.
+
+    The stored records of members other than the replaced members, i.e. their local headers,
+    compressed data, & data descriptors, are copied across verbatim in chunks, without being
+    decompressed, so the cost of a rewrite is proportional to the size of the replaced members.
+    Replaced members are recompressed using their original compression method & metadata. The
+    central directory is then written anew, as member offsets may have shifted.
+
+    Members are written in the order they appear in the archive & the archive's comment is
+    preserved.
+    """
+    entries = []
+    offset = 0
+    with zipfile.ZipFile(archive) as zin, archive.open("rb") as src:
+        for info in zin.infolist():
+            size, raw_name = _record_size(src, info)
+            if info.filename in replaced:
+                record, info, raw_name = _replaced_record(info, replaced[info.filename])
+                dst.write(record)
+                size = len(record)
+            else:
+                _copy_range(src, dst, info.header_offset, size)
+
+            entries.append(_central_header(info, raw_name, offset))
+            offset += size
+
+        comment = zin.comment
+
+    directory = b"".join(entries)
+    dst.write(directory)
+    dst.write(_end_records(len(entries), offset, len(directory), comment))
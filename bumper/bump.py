@@ -1,13 +1,54 @@
-import copy
-import datetime as dt
-import difflib
+import contextlib
+import os
+import time
+import typing as t
 from collections import defaultdict
 from enum import StrEnum
 from pathlib import Path
 
-from packaging import version
+from bumper import CACHE_DIR
+from bumper.config import (
+    BumperConfigError,
+    BumperFile,
+    BumperOptions,
+    CD,
+    CONFIG_SEARCH,
+    DEFAULT_OPTIONS,
+    VersioningType,
+    parse_config,
+)
+from bumper.replace import RuleMatcher, patch_in_place
+from bumper.targets import (
+    MEMBER_SEP,
+    PROBE_SIZE,
+    TargetFormat,
+    byte_rules,
+    contents_diff,
+    decode_errors,
+    file_labels,
+    is_gzip,
+    merge_targets,
+    read_scope,
+    render_rules,
+    replace_contents,
+    requires_scope,
+    scoped_rules,
+    sniff_format,
+    split_member,
+    text_matcher,
+    text_rules,
+    text_scoped_rules,
+)
+from bumper.version import Version
 
-from bumper.config import BumperFile
+# Modules only required by specific code paths are imported where they're used to keep the CLI's
+# startup time down
+if t.TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    from bumper.index import FileEntry, OccurrenceIndex
+    from bumper.profiling import FileProfile, FileProfiler, Profile
+    from bumper.scoped import ScopedMatcher, ScopedRule
 
 
 class BumpType(StrEnum):  # noqa: D101
@@ -20,8 +61,15 @@ class BumpType(StrEnum):  # noqa: D101
     DATE = "date"
 
 
-def _build_new_version(current_version: version.Version, bump_type: BumpType) -> version.Version:
+def build_new_version(current_version: Version, bump_type: BumpType) -> Version:
+    """
+    Build the version following `current_version` for the provided bump type.
+
+    Any SemVer pre-release or build metadata of `current_version` is dropped.
+    """
     if bump_type == BumpType.DATE:
+        import datetime as dt
+
         utc_date = dt.datetime.now(dt.timezone.utc).date()
         version_year, version_month, version_micro = (
             current_version.major,
@@ -30,71 +78,1328 @@ def _build_new_version(current_version: version.Version, bump_type: BumpType) ->
         )
 
         if (version_year == utc_date.year) and (version_month == utc_date.month):
-            new_version = version.Version(f"{version_year}.{version_month:02}.{version_micro+1}")
+            new_release = (version_year, version_month, version_micro + 1)
         else:
-            new_version = version.Version(f"{utc_date.year}.{utc_date.month:02}.0")
+            new_release = (utc_date.year, utc_date.month, 0)
     else:
         major, minor, patch = current_version.major, current_version.minor, current_version.micro
         if bump_type is BumpType.MAJOR:
-            new_version = version.Version(f"{major+1}.0.0")
+            new_release = (major + 1, 0, 0)
         elif bump_type is BumpType.MINOR:
-            new_version = version.Version(f"{major}.{minor+1}.0")
+            new_release = (major, minor + 1, 0)
         elif bump_type is BumpType.PATCH:  # pragma: no branch
-            new_version = version.Version(f"{major}.{minor}.{patch+1}")
+            new_release = (major, minor, patch + 1)
 
-    return new_version
+    return Version.from_parts(new_release)
 
 
-def _merge_bumpers(files: list[BumperFile]) -> dict[Path, list[str]]:
-    """Consolidate bump specifications per-file for downstream use."""
-    file_operations = defaultdict(list)
-    for b in files:
-        file_operations[b.file].append(b.search)
+def bump_type_mismatch(versioning_type: VersioningType, bump_by: BumpType) -> str | None:
+    """Return an explanation if `bump_by` is not valid for the versioning type, else `None`."""
+    if versioning_type == VersioningType.SEMVER:
+        if bump_by == BumpType.DATE:
+            return "SemVer projects must bump by major, minor, or patch."
+    elif versioning_type == VersioningType.CALVER:
+        if bump_by != BumpType.DATE:
+            return "CalVer projects must bump by date."
 
-    return file_operations
+    return None
 
 
-def bump_ver(
-    current_version: version.Version, files: list[BumperFile], bump_type: BumpType, dry_run: bool
+def _merge_bumpers(
+    files: list[BumperFile], root_dir: Path = CD, use_git: bool = False
+) -> dict[Path, list[str]]:
+    """Consolidate bump specifications per-file for downstream use; see `merge_targets`."""
+    return merge_targets(files, root_dir=root_dir, use_git=use_git)[0]
+
+
+class BumpError(Exception): ...  # noqa: D101
+
+
+class _BumpJob(t.NamedTuple):
+    file: Path
+    label: str
+    rules: list[str]
+    replacements: list[tuple[str, str]]
+    options: BumperOptions
+    index_entry: "FileEntry | None" = None
+    encoding: str | None = None
+    scoped: "list[ScopedRule] | None" = None
+    profile: bool = False
+    stage: bool = False
+    members: "list[_BumpJob] | None" = None
+
+
+def _group_archives(jobs: list[_BumpJob]) -> list[_BumpJob]:
+    """
+    Group the jobs targeting members of the same zip archive into a single job for the archive.
+
+    Each archive's job takes the place of the first job targeting one of its members, so the archive
+    is only rewritten once however many of its members are bumped. The archive's job is labeled by
+    the archive portion of its members' labels & its rules are prefixed by the name of the member
+    they target, e.g. `pkg/METADATA::Version: {current_version}`.
+    """
+    grouped: list[_BumpJob] = []
+    archives: dict[Path, _BumpJob] = {}
+    for job in jobs:
+        member = split_member(job.file)
+        if member is None:
+            grouped.append(job)
+            continue
+
+        archive, name = member
+        if archive not in archives:
+            label = job.label.partition(MEMBER_SEP)[0]
+            archives[archive] = _BumpJob(archive, label, [], [], job.options, members=[])
+            grouped.append(archives[archive])
+
+        archives[archive].rules.extend(f"{name}{MEMBER_SEP}{rule}" for rule in job.rules)
+        t.cast(list[_BumpJob], archives[archive].members).append(job)
+
+    return grouped
+
+
+class FileResult(t.NamedTuple):
+    """
+    Outcome of bumping a single target file.
+
+    `hits` contains the number of occurrences of each of the file's `rules`, in the same order. The
+    `diff` of the requested changes is only provided for dry runs. `bytes_written` is the number of
+    bytes written to the file, which is the size of the replaced occurrences for files patched in
+    place & the size of the new contents for rewritten files. `elapsed` is the wall-clock time, in
+    seconds, spent processing the file. If profiling was requested, `profile` contains the time
+    spent in each phase of the bump.
+
+    For transactional bumps, the new contents of a modified file are written to the `staged`
+    temporary file rather than the file itself, & `bytes_written` is the size of the staged file.
+    Staged files are moved into place once every file has been processed.
+
+    If the file could not be bumped, `error` contains the raised exception. Files detected as binary
+    are skipped, which is indicated by `binary`.
+    """
+
+    file: Path
+    label: str
+    rules: list[str]
+    hits: list[int]
+    changed: bool
+    diff: str | None = None
+    error: Exception | None = None
+    binary: bool = False
+    bytes_written: int = 0
+    elapsed: float = 0.0
+    profile: "FileProfile | None" = None
+    index_entry: "FileEntry | None" = None
+    staged: Path | None = None
+
+    def to_json(self) -> dict[str, t.Any]:
+        """
+        Serialize the result, excluding its index entry & staged file.
+
+        Errors are reduced to their message.
+        """
+        return {
+            "file": self.file.as_posix(),
+            "label": self.label,
+            "rules": self.rules,
+            "hits": self.hits,
+            "changed": self.changed,
+            "diff": self.diff,
+            "error": None if self.error is None else str(self.error),
+            "binary": self.binary,
+            "bytes_written": self.bytes_written,
+            "elapsed": self.elapsed,
+            "profile": None if self.profile is None else self.profile.to_json(),
+        }
+
+    @classmethod
+    def from_json(cls, raw: dict[str, t.Any]) -> "FileResult":  # noqa: D102
+        profile = None
+        if raw["profile"] is not None:
+            from bumper.profiling import FileProfile
+
+            profile = FileProfile.from_json(raw["profile"])
+
+        return cls(
+            file=Path(raw["file"]),
+            label=raw["label"],
+            rules=raw["rules"],
+            hits=raw["hits"],
+            changed=raw["changed"],
+            diff=raw["diff"],
+            error=None if raw["error"] is None else BumpError(raw["error"]),
+            binary=raw["binary"],
+            bytes_written=raw["bytes_written"],
+            elapsed=raw["elapsed"],
+            profile=profile,
+        )
+
+
+def _report_unmatched(label: str, rules: list[str], hits: list[int]) -> None:
+    """Provide feedback for any of the file's search rules that did not match anything."""
+    for rule, n_hits in zip(rules, hits, strict=True):
+        if not n_hits:
+            print(f"{label} - No matches for '{rule}'")
+
+
+def _patched_size(encoded: list[tuple[bytes, bytes]], hits: list[int]) -> int:
+    """Calculate the number of bytes overwritten by patching the provided rules in place."""
+    return sum(
+        n_hits * len(replace)
+        for n_hits, (search, replace) in zip(hits, encoded, strict=True)
+        if search != replace
+    )
+
+
+def _meets_threshold(target_file: Path, threshold: int | None) -> bool:
+    """Determine whether `target_file` is at least `threshold` bytes in size, if one is set."""
+    if threshold is None:
+        return False
+
+    return target_file.stat().st_size >= threshold
+
+
+def _temp_file(target_file: Path) -> tuple[int, Path]:
+    """Create a temporary file alongside `target_file`, returning its file descriptor & path."""
+    import tempfile
+
+    fd, tmp_name = tempfile.mkstemp(
+        dir=target_file.parent, prefix=f".{target_file.name}.", suffix=".tmp"
+    )
+    return fd, Path(tmp_name)
+
+
+def _move_into_place(target_file: Path, tmp_path: Path, stage: bool) -> Path | None:
+    """
+    Move the temporary file containing the new contents of `target_file` into place.
+
+    The temporary file is given the permissions of the target file. If `stage` is `True`, the
+    temporary file is left in place & its path is returned for it to be moved by the transaction.
+    """
+    import shutil
+
+    shutil.copymode(target_file, tmp_path)
+    if stage:
+        return tmp_path
+
+    os.replace(tmp_path, target_file)
+    return None
+
+
+def _rewrite_file(
+    target_file: Path, write: t.Callable[[t.BinaryIO], object], stage: bool = False
+) -> Path | None:
+    """
+    Rewrite `target_file` with the contents written by `write` to a temporary file alongside it.
+
+    The temporary file is moved into place once written, or staged if `stage` is `True`, in which
+    case its path is returned. The temporary file is removed if it can't be written.
+    """
+    fd, tmp_path = _temp_file(target_file)
+    staged = None
+    try:
+        with open(fd, "wb") as f:
+            write(f)
+
+        staged = _move_into_place(target_file, tmp_path, stage)
+    finally:
+        if staged is None:
+            tmp_path.unlink(missing_ok=True)
+
+    return staged
+
+
+def _stage_contents(target_file: Path, data: bytes) -> Path:
+    """Write the new contents of `target_file` to a staged temporary file, returning its path."""
+    return t.cast(Path, _rewrite_file(target_file, lambda f: f.write(data), stage=True))
+
+
+def _stream_bump(
+    target_file: Path, replacements: list[tuple[str, str]], fmt: TargetFormat, stage: bool = False
+) -> tuple[list[int], bool, Path | None]:
+    """
+    Stream the replaced contents of `target_file` into a temporary file alongside it.
+
+    The temporary file is only moved into place if a modification has been made, otherwise it is
+    discarded. If `stage` is `True`, the temporary file is staged rather than moved into place.
+    Contents are only decoded if the target file is not processed as raw bytes.
+
+    Returns a list of per-rule hit counts, whether the file was modified, & the staged file, if any.
+    """
+    fd, tmp_path = _temp_file(target_file)
+    staged = None
+    try:
+        if fmt.byte_level:
+            byte_matcher = RuleMatcher(byte_rules(replacements, fmt))
+            with target_file.open("rb") as src, open(fd, "wb") as dst:
+                hits = byte_matcher.stream(src, dst)
+            changed = byte_matcher.changes(hits)
+        else:
+            str_matcher = RuleMatcher(text_rules(replacements, fmt))
+            with (
+                target_file.open(encoding=fmt.encoding, newline="") as src,
+                open(fd, "w", encoding=fmt.encoding, newline="") as dst,
+            ):
+                hits = str_matcher.stream(src, dst)
+            changed = str_matcher.changes(hits)
+
+        if changed:
+            staged = _move_into_place(target_file, tmp_path, stage)
+    finally:
+        if staged is None:
+            tmp_path.unlink(missing_ok=True)
+
+    return hits, changed, staged
+
+
+def _in_worker_process() -> bool:
+    """Check whether this is a worker process of a process pool, e.g. of a recursive bump."""
+    import multiprocessing
+
+    return multiprocessing.parent_process() is not None
+
+
+def _segmented_bump(
+    target_file: Path, encoded: list[tuple[bytes, bytes]], n_segments: int, stage: bool = False
+) -> tuple[list[int], bool, int, Path | None]:
+    """
+    Bump `target_file` by processing up to `n_segments` line-aligned segments of it concurrently.
+
+    Matches are located by the shared pool of processes; see `bumper.segments.locate` &
+    `bumper.segments.shared_pool`. If every rule's
+    replacement is of equal length to its search string, the matches of each segment are then
+    patched into the file in place. Otherwise, or if `stage` is `True`, each replaced segment is
+    written directly to its offset within a temporary file, which is moved into place or staged.
+
+    Returns a list of per-rule hit counts, whether the file was modified, the number of bytes
+    written, & the staged file, if any.
+    """
+    from bumper import segments
+
+    pool = segments.shared_pool()
+    located = segments.locate(target_file, encoded, n_segments, pool)
+    hits = segments.segment_hits(encoded, located)
+    if not RuleMatcher(encoded).changes(hits):
+        return hits, False, 0, None
+
+    if not stage and all(len(search) == len(replace) for search, replace in encoded):
+        segments.patch(target_file, encoded, located, pool)
+        return hits, True, _patched_size(encoded, hits), None
+
+    fd, tmp_path = _temp_file(target_file)
+    os.close(fd)
+    staged = None
+    try:
+        n_bytes = segments.write(target_file, tmp_path, encoded, located, pool)
+        staged = _move_into_place(target_file, tmp_path, stage)
+    finally:
+        if staged is None:
+            tmp_path.unlink(missing_ok=True)
+
+    return hits, True, n_bytes, staged
+
+
+def _replace_prefix(
+    target_file: Path, prefix: bytes, n_replaced: int, stage: bool = False
+) -> Path | None:
+    """
+    Replace the first `n_replaced` bytes of `target_file` with `prefix`.
+
+    The new contents are written to a temporary file alongside the target file, which is then moved
+    into place, so the remainder of the file is copied rather than read into memory. If `stage` is
+    `True`, the temporary file is staged rather than moved into place & its path is returned.
+    """
+    import shutil
+
+    def _write(dst: t.BinaryIO) -> None:
+        with target_file.open("rb") as src:
+            dst.write(prefix)
+            src.seek(n_replaced)
+            shutil.copyfileobj(src, dst)
+
+    return _rewrite_file(target_file, _write, stage)
+
+
+def _scoped_bump(
+    target_file: Path,
+    matcher: "ScopedMatcher",
+    fmt: TargetFormat,
+    profiler: "FileProfiler | None",
+    stage: bool = False,
+) -> tuple[list[int], bool, int, Path | None]:
+    """
+    Apply the matcher's rules to `target_file`, only reading the prefix of the file they require.
+
+    If the rules are bounded, only the replaced prefix of the file is rewritten: in place if its
+    encoded size is unchanged, otherwise along with a copy of the remainder of the file. If `stage`
+    is `True`, the new contents are always written to a staged temporary file instead.
+
+    Returns a list of per-rule hit counts, whether the file was modified, the number of bytes
+    written, & the staged file, if any.
+    """
+    with target_file.open("rb") as f:
+        text, complete, n_read = read_scope(f, matcher, fmt)
+
+    if profiler is not None:
+        profiler.bytes_read = n_read
+        profiler.lap("read")
+
+    new, hits = matcher.apply(text)
+    if profiler is not None:
+        profiler.lap("replace")
+
+    if new == text:
+        return hits, False, 0, None
+
+    errors = decode_errors(fmt)
+    new_data = new.encode(fmt.encoding, errors)
+    n_bytes = len(new_data)
+    staged = None
+    if complete and stage:
+        staged = _stage_contents(target_file, new_data)
+    elif complete:
+        target_file.write_bytes(new_data)
+    else:
+        n_replaced = len(text.encode(fmt.encoding, errors))
+        if n_replaced == len(new_data) and not stage:
+            with target_file.open("r+b") as f:
+                f.write(new_data)
+        else:
+            staged = _replace_prefix(target_file, new_data, n_replaced, stage)
+            n_bytes = (staged or target_file).stat().st_size
+
+    if profiler is not None:
+        profiler.lap("write")
+
+    return hits, True, n_bytes, staged
+
+
+def _apply_contents(job: _BumpJob, data: bytes, dry_run: bool) -> tuple[FileResult, bytes | None]:
+    """
+    Apply the job's rendered replacements to the provided contents of its target, in memory.
+
+    Used for targets whose contents must be decompressed, which are always read in full.
+
+    Returns the result along with the new contents, which are `None` if no modifications are made
+    or this is a dry run.
+    """
+    fmt = sniff_format(data[:PROBE_SIZE], job.encoding)
+    if fmt is None:
+        hits = [0] * len(job.rules)
+        return FileResult(job.file, job.label, job.rules, hits, changed=False, binary=True), None
+
+    if dry_run:
+        matcher = text_matcher(job.replacements, job.scoped, fmt)
+        diff, hits = contents_diff(data, matcher, fmt, job.label)
+        changed = diff is not None
+        return FileResult(job.file, job.label, job.rules, hits, changed, diff=diff), None
+
+    new, hits = replace_contents(data, job.replacements, fmt, job.scoped)
+    if new == data:
+        return FileResult(job.file, job.label, job.rules, hits, changed=False), None
+
+    return FileResult(job.file, job.label, job.rules, hits, changed=True), new
+
+
+def _apply_gzip(job: _BumpJob, dry_run: bool, profiler: "FileProfiler | None") -> FileResult:
+    """
+    Apply the job's rendered replacements to the decompressed contents of its gzip target file.
+
+    If modified, the contents are recompressed, retaining the original file name & modification
+    time recorded in the file's header.
+    """
+    from bumper.archive import read_gzip, write_gzip
+
+    data, mtime = read_gzip(job.file)
+    if profiler is not None:
+        profiler.bytes_read = job.file.stat().st_size
+        profiler.lap("decompress")
+
+    result, new = _apply_contents(job, data, dry_run)
+    if profiler is not None:
+        profiler.lap("diff" if dry_run else "replace")
+
+    if new is None:
+        return result
+
+    staged = _rewrite_file(job.file, lambda f: write_gzip(f, new, job.file.stem, mtime), job.stage)
+    if profiler is not None:
+        profiler.lap("write")
+
+    return result._replace(bytes_written=(staged or job.file).stat().st_size, staged=staged)
+
+
+def _apply_archive(job: _BumpJob, dry_run: bool, profiler: "FileProfiler | None") -> FileResult:
+    """
+    Apply the rendered replacements of each of the job's member jobs to its zip archive.
+
+    Only the targeted members are decompressed. If any are modified, the archive is rewritten once,
+    with every other member copied across verbatim; see `bumper.archive.rewrite_zip`. Per-rule hit
+    counts are reported in the order of the archive job's rules, & the diffs of a dry run are
+    combined.
+    """
+    from bumper.archive import read_members, rewrite_zip
+
+    members = t.cast(list[_BumpJob], job.members)
+    names = [t.cast(tuple[Path, str], split_member(member.file))[1] for member in members]
+    contents = read_members(job.file, names)
+    if profiler is not None:
+        profiler.bytes_read = job.file.stat().st_size
+        profiler.lap("decompress")
+
+    hits: list[int] = []
+    diffs: list[str] = []
+    replaced: dict[str, bytes] = {}
+    for name, member in zip(names, members, strict=True):
+        result, new = _apply_contents(member, contents[name], dry_run)
+        hits.extend(result.hits)
+        if result.diff is not None:
+            diffs.append(result.diff)
+        if new is not None:
+            replaced[name] = new
+
+    if profiler is not None:
+        profiler.lap("diff" if dry_run else "replace")
+
+    if dry_run:
+        diff = "\n".join(diffs) if diffs else None
+        return FileResult(job.file, job.label, job.rules, hits, changed=bool(diffs), diff=diff)
+
+    if not replaced:
+        return FileResult(job.file, job.label, job.rules, hits, changed=False)
+
+    staged = _rewrite_file(job.file, lambda f: rewrite_zip(job.file, f, replaced), job.stage)
+    if profiler is not None:
+        profiler.lap("write")
+
+    n_bytes = (staged or job.file).stat().st_size
+    return FileResult(
+        job.file, job.label, job.rules, hits, changed=True, bytes_written=n_bytes, staged=staged
+    )
+
+
+def _apply_job(job: _BumpJob, dry_run: bool, profiler: "FileProfiler | None") -> FileResult:
+    """Apply the job's rendered replacements to its target file; see `_bump_file` for details."""
+    if job.members is not None:
+        return _apply_archive(job, dry_run, profiler)
+
+    if is_gzip(job.file):
+        return _apply_gzip(job, dry_run, profiler)
+
+    target_file, label, rules, replacements, options, index_entry, encoding, scoped, *_ = job
+    stage = job.stage
+    if dry_run:
+        # Dry runs always read the full file, so its contents are probed directly
+        data = target_file.read_bytes()
+        header = data[:PROBE_SIZE]
+        if profiler is not None:
+            profiler.bytes_read = len(data)
+            profiler.lap("read")
+    else:
+        with target_file.open("rb") as f:
+            header = f.read(PROBE_SIZE)
+
+    fmt = sniff_format(header, encoding)
+    if profiler is not None:
+        profiler.lap("probe")
+
+    if fmt is None:
+        return FileResult(target_file, label, rules, [0] * len(rules), changed=False, binary=True)
+
+    if dry_run:
+        diff, hits = contents_diff(data, text_matcher(replacements, scoped, fmt), fmt, label)
+        if profiler is not None:
+            profiler.lap("diff")
+
+        return FileResult(target_file, label, rules, hits, changed=diff is not None, diff=diff)
+
+    if scoped is not None:
+        from bumper.scoped import ScopedMatcher
+
+        scoped_matcher = ScopedMatcher(text_scoped_rules(scoped, fmt))
+        hits, changed, n_bytes, staged = _scoped_bump(
+            target_file, scoped_matcher, fmt, profiler, stage
+        )
+        return FileResult(
+            target_file, label, rules, hits, changed, bytes_written=n_bytes, staged=staged
+        )
+
+    # Empty files can't be memory mapped, but there's nothing to patch anyway
+    encoded = byte_rules(replacements, fmt) if fmt.byte_level and header else None
+
+    # Offsets of rules spanning multiple lines depend on the file's line endings, so aren't indexed.
+    # Staged files are always rewritten in full, so can't be bumped using the index
+    multiline = any("\n" in search for search, _ in replacements)
+    if encoded is not None and options.occurrence_index and not multiline and not stage:
+        from bumper.index import bump_indexed
+
+        hits, entry = bump_indexed(target_file, rules, encoded, index_entry)
+        if profiler is not None:
+            profiler.lap("indexed")
+
+        changed = RuleMatcher(encoded).changes(hits)
+        n_bytes = 0
+        if changed and all(len(search) == len(replace) for search, replace in encoded):
+            n_bytes = _patched_size(encoded, hits)
+        elif changed:
+            n_bytes = target_file.stat().st_size
+
+        return FileResult(
+            target_file,
+            label,
+            rules,
+            hits,
+            changed=changed,
+            bytes_written=n_bytes,
+            index_entry=entry,
+        )
+
+    # Every other method reads the full file
+    if profiler is not None:
+        profiler.bytes_read = target_file.stat().st_size
+
+    # Segments are processed by one process per CPU, so there's no benefit on a single CPU. Within a
+    # worker process, e.g. of a recursive bump, the CPUs are already occupied by the worker's pool
+    n_segments = os.cpu_count() or 1
+    segmented = n_segments > 1 and _meets_threshold(target_file, options.parallel_threshold)
+    if encoded is not None and segmented and not _in_worker_process():
+        hits, changed, n_bytes, staged = _segmented_bump(target_file, encoded, n_segments, stage)
+        if profiler is not None:
+            profiler.lap("segments")
+
+        return FileResult(
+            target_file, label, rules, hits, changed, bytes_written=n_bytes, staged=staged
+        )
+
+    # Staged files are always rewritten in full, so can't be patched in place
+    if (
+        encoded is not None
+        and not stage
+        and all(len(search) == len(replace) for search, replace in encoded)
+    ):
+        matcher = RuleMatcher(encoded)
+        hits = patch_in_place(target_file, matcher)
+        if profiler is not None:
+            profiler.lap("patch")
+
+        changed = matcher.changes(hits)
+        n_bytes = _patched_size(encoded, hits)
+        return FileResult(target_file, label, rules, hits, changed, bytes_written=n_bytes)
+
+    if _meets_threshold(target_file, options.stream_threshold):
+        hits, changed, staged = _stream_bump(target_file, replacements, fmt, stage)
+        if profiler is not None:
+            profiler.lap("stream")
+
+        n_bytes = (staged or target_file).stat().st_size if changed else 0
+        return FileResult(
+            target_file, label, rules, hits, changed, bytes_written=n_bytes, staged=staged
+        )
+
+    # Files shorter than the probe have already been read in full
+    old = header if len(header) < PROBE_SIZE else target_file.read_bytes()
+    if profiler is not None:
+        profiler.lap("read")
+
+    new, hits = replace_contents(old, replacements, fmt)
+    if profiler is not None:
+        profiler.lap("replace")
+
+    if new == old:
+        return FileResult(target_file, label, rules, hits, changed=False)
+
+    staged = _stage_contents(target_file, new) if stage else None
+    if staged is None:
+        target_file.write_bytes(new)
+    if profiler is not None:
+        profiler.lap("write")
+
+    return FileResult(
+        target_file, label, rules, hits, changed=True, bytes_written=len(new), staged=staged
+    )
+
+
+def _bump_file(job: _BumpJob, dry_run: bool) -> FileResult:
+    """
+    Apply the job's rendered replacements to its target file.
+
+    Target files are processed as raw bytes unless a non-UTF-8 encoding is declared by the job, or
+    detected from the file's BOM. Files detected as binary are skipped.
+
+    If `dry_run` is `True`, the file is not modified and the diff of the requested changes is
+    included in the result instead.
+
+    If the occurrence index is enabled by the job's options, the file is bumped using the job's
+    index entry where possible and the refreshed entry is included in the result.
+
+    If profiling is enabled for the job, the time spent in each phase of the bump is recorded in the
+    result's profile.
+
+    If staging is enabled for the job, the new contents of a modified file are written to a staged
+    temporary file alongside it, which is included in the result, rather than to the file itself.
+
+    Gzip target files, & the members of zip archives, are bumped within their decompressed
+    contents. The members of an archive are bumped by a single job, so the archive is only
+    rewritten once; see `_group_archives`.
+
+    Any exception raised while processing the file is captured by the result rather than raised.
+    """
+    start = time.perf_counter()
+    profiler = None
+    if job.profile:
+        from bumper.profiling import FileProfiler
+
+        profiler = FileProfiler()
+
+    try:
+        result = _apply_job(job, dry_run, profiler)
+    except Exception as e:
+        result = FileResult(job.file, job.label, job.rules, [0] * len(job.rules), False, error=e)
+
+    elapsed = time.perf_counter() - start
+    if profiler is None:
+        return result._replace(elapsed=elapsed)
+
+    return result._replace(elapsed=elapsed, profile=profiler.finish())
+
+
+def _map_files(
+    jobs: list[_BumpJob], dry_run: bool, n_workers: int, processes: bool = False
+) -> t.Iterator[FileResult]:
+    """
+    Bump each of the provided jobs.
+
+    If more than one worker is requested, files are processed concurrently using a bounded thread
+    pool, or a process pool if `processes` is `True`. Results are yielded in the same order as
+    `jobs`, regardless of the order in which they complete.
+    """
+    n_workers = min(n_workers, len(jobs))
+    if n_workers <= 1:
+        for job in jobs:
+            yield _bump_file(job, dry_run=dry_run)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    pool: Executor
+    if processes:
+        pool = ProcessPoolExecutor(max_workers=n_workers)
+    else:
+        pool = ThreadPoolExecutor(max_workers=n_workers)
+
+    with pool:
+        futures = [pool.submit(_bump_file, job, dry_run=dry_run) for job in jobs]
+        for future in futures:
+            yield future.result()
+
+
+def report_results(results: t.Iterable[FileResult]) -> None:
+    """
+    Provide command line feedback for each of the provided file results.
+
+    Raises `BumpError` once all results have been reported if any of the files failed to bump.
+    """
+    n_results = n_failed = 0
+    for result in results:
+        n_results += 1
+        if result.error is not None:
+            n_failed += 1
+            print(f"{result.label} - Error: {result.error}")
+            continue
+
+        if result.binary:
+            print(f"{result.label} - Skipped binary file.")
+            continue
+
+        if not result.changed:
+            print(f"{result.label} - No changes.")
+            continue
+
+        if result.diff is not None:
+            print(result.diff)
+        else:
+            print(f"Bumped {result.label}")
+
+        _report_unmatched(result.label, result.rules, result.hits)
+
+    if n_failed:
+        raise BumpError(f"Failed to bump {n_failed} of {n_results} target file(s).")
+
+
+def attach_index(
+    jobs: list[_BumpJob],
+    root_dir: Path,
+    dry_run: bool,
+    index: "OccurrenceIndex | None" = None,
+) -> tuple[list[_BumpJob], "OccurrenceIndex | None"]:
+    """
+    Attach each job's occurrence index entry, if required.
+
+    The index is only used if any of the jobs enable `occurrence_index` & this isn't a dry run. If
+    an already loaded `index` isn't provided, the index beneath `root_dir` is loaded.
+    """
+    if dry_run or not any(job.options.occurrence_index for job in jobs):
+        return jobs, None
+
+    if index is None:
+        from bumper.index import OccurrenceIndex
+
+        index = OccurrenceIndex.load(root_dir / CACHE_DIR)
+
+    return [job._replace(index_entry=index.get(job.file)) for job in jobs], index
+
+
+def _is_transactional(jobs: list[_BumpJob], dry_run: bool) -> bool:
+    """Check whether any of the jobs enable `transactional` & this isn't a dry run."""
+    return not dry_run and any(job.options.transactional for job in jobs)
+
+
+def _stage_jobs(jobs: list[_BumpJob], root_dir: Path, dry_run: bool) -> tuple[list[_BumpJob], bool]:
+    """
+    Flag each job to stage its new contents, if the bump is transactional.
+
+    A bump is transactional if any of the jobs enable `transactional` & this isn't a dry run, in
+    which case every job is staged. A transaction interrupted by a previous bump is resolved first,
+    using its journal in the cache directory beneath `root_dir`; see `bumper.transaction.recover`.
+
+    Returns the jobs & whether the bump is transactional.
+    """
+    if not _is_transactional(jobs, dry_run):
+        return jobs, False
+
+    from bumper.transaction import recover
+
+    recover(root_dir / CACHE_DIR)
+    return [job._replace(stage=True) for job in jobs], True
+
+
+def _commit_staged(results: list[FileResult], root_dir: Path) -> list[FileResult]:
+    """
+    Move the staged files of a transactional bump into place in a single transaction.
+
+    Staged files are only moved into place if every file was bumped without error; otherwise they
+    are discarded & none of the target files are modified. Configuration files, identified by their
+    version rule, are moved into place last. The transaction's journal is kept in the cache
+    directory beneath `root_dir`; see `bumper.transaction.commit` for details.
+
+    Raises `BumpError` if the transaction fails, once its target files have been restored.
+    """
+    staged = [r for r in results if r.staged is not None]
+    if any(r.error is not None for r in results):
+        for result in staged:
+            t.cast(Path, result.staged).unlink(missing_ok=True)
+
+        return [
+            r._replace(changed=False, bytes_written=0, staged=None) if r.staged is not None else r
+            for r in results
+        ]
+
+    if not staged:
+        return results
+
+    from bumper.transaction import commit
+
+    staged.sort(key=lambda r: CONFIG_SEARCH in r.rules)
+    try:
+        commit([(r.file, t.cast(Path, r.staged)) for r in staged], root_dir / CACHE_DIR)
+    except OSError as e:
+        raise BumpError(f"Failed to commit the bump, no target files were modified: {e}") from e
+
+    return [r._replace(staged=None) for r in results]
+
+
+def _iter_results(
+    jobs: list[_BumpJob],
+    dry_run: bool,
+    n_workers: int,
+    processes: bool = False,
+    index: "OccurrenceIndex | None" = None,
+) -> t.Iterator[FileResult]:
+    """
+    Bump each of the provided jobs, yielding their results in the same order as `jobs`.
+
+    If an occurrence index is provided, it is updated with the refreshed entry of each file as its
+    result is yielded, then saved once iteration stops.
+    """
+    try:
+        for result in _map_files(jobs, dry_run, n_workers, processes=processes):
+            if index is not None:
+                index.update(result.file, result.index_entry)
+            yield result
+    finally:
+        if index is not None:
+            index.save()
+
+
+class BumpResult(t.NamedTuple):
+    """
+    Outcome of bumping a project, with the result of each of its target files.
+
+    `elapsed` is the wall-clock time, in seconds, spent processing the target files.
+    """
+
+    current_version: Version
+    new_version: Version
+    files: list[FileResult]
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """`True` if every target file was processed without error."""
+        return all(f.error is None for f in self.files)
+
+    @property
+    def bytes_written(self) -> int:  # noqa: D102
+        return sum(f.bytes_written for f in self.files)
+
+    def to_json(self) -> dict[str, t.Any]:  # noqa: D102
+        return {
+            "ok": self.ok,
+            "current_version": str(self.current_version),
+            "new_version": str(self.new_version),
+            "files": [f.to_json() for f in self.files],
+            "elapsed": self.elapsed,
+        }
+
+
+def phase(profile: "Profile | None", name: str) -> t.ContextManager[None]:
+    """
+    Attribute the enclosed block to the named phase of `profile`, if one is provided.
+
+    NOTE: This lives alongside the bumping API, rather than in `bumper.profiling`, so the profiling
+    module is only imported when a profile is actually requested.
+    """
+    if profile is None:
+        return contextlib.nullcontext()
+
+    return profile.phase(name)
+
+
+def collect_results(
+    current_version: Version,
+    next_version: Version,
+    jobs: list[_BumpJob],
+    dry_run: bool,
+    n_workers: int,
+    index: "OccurrenceIndex | None" = None,
+    profile: "Profile | None" = None,
+    root_dir: Path = CD,
+) -> BumpResult:
+    """
+    Bump the provided jobs, collecting their results.
+
+    If the bump is transactional, the staged files are moved into place once every job has been
+    processed; see `_commit_staged`.
+
+    If a `profile` is provided, each job's phases are timed & the file results are recorded by the
+    profile.
+    """
+    start = time.perf_counter()
+    if profile is not None:
+        jobs = [job._replace(profile=True) for job in jobs]
+
+    jobs, transactional = _stage_jobs(jobs, root_dir, dry_run)
+    with phase(profile, "bump"):
+        results = list(_iter_results(jobs, dry_run, n_workers, index=index))
+
+    if transactional:
+        with phase(profile, "commit"):
+            results = _commit_staged(results, root_dir)
+
+    if profile is not None:
+        profile.files = results
+
+    return BumpResult(current_version, next_version, results, time.perf_counter() - start)
+
+
+def _report_jobs(
+    current_version: Version,
+    next_version: Version,
+    jobs: list[_BumpJob],
+    dry_run: bool,
+    n_workers: int,
+    index: "OccurrenceIndex | None" = None,
+    profile: "Profile | None" = None,
+    root_dir: Path = CD,
 ) -> None:
     """
-    Bump the current version according to the provided rules in `files`.
+    Bump the provided jobs, printing the result of each of their files.
 
-    If `dry_run` is `True`, files will not be modified and a per-file diff will be printed to the
-    terminal instead.
+    Unless a `profile` is provided or the bump is transactional, each file's feedback, including its
+    diff for dry runs, is printed as soon as it & the files preceding it have been processed rather
+    than once all files have been processed.
+
+    Raises `BumpError` once all results have been reported if any of the files failed to bump.
+    """
+    if profile is None and not _is_transactional(jobs, dry_run):
+        report_results(_iter_results(jobs, dry_run, n_workers, index=index))
+        return
+
+    result = collect_results(
+        current_version, next_version, jobs, dry_run, n_workers, index, profile, root_dir
+    )
+    with phase(profile, "report"):
+        report_results(result.files)
+
+
+def _file_jobs(
+    current_version: Version,
+    next_version: Version,
+    files: list[BumperFile],
+    dry_run: bool,
+    options: BumperOptions,
+    profile: "Profile | None" = None,
+) -> tuple[list[_BumpJob], "OccurrenceIndex | None"]:
+    """
+    Build the bump jobs for the provided rules in `files`, along with the attached occurrence index.
+
+    See `bump_files` for details.
+    """
+    with phase(profile, "merge"):
+        # Merge so we handle each file all at once
+        file_operations, encodings, search_options = merge_targets(
+            files, use_git=options.use_git_ls_files
+        )
+        labels = file_labels(file_operations)
+        jobs = []
+        for target_file, rules in file_operations.items():
+            scoped = scoped_rules(
+                rules, search_options[target_file], current_version, next_version, target_file
+            )
+            jobs.append(
+                _BumpJob(
+                    file=target_file,
+                    label=labels[target_file],
+                    rules=rules,
+                    replacements=render_rules(rules, current_version, next_version),
+                    options=options,
+                    encoding=encodings.get(target_file),
+                    scoped=scoped if requires_scope(scoped) else None,
+                )
+            )
+
+        jobs = _group_archives(jobs)
+
+    with phase(profile, "index"):
+        return attach_index(jobs, CD, dry_run)
+
+
+def bump_files(
+    current_version: Version,
+    files: list[BumperFile],
+    bump_type: BumpType,
+    dry_run: bool = False,
+    options: BumperOptions = DEFAULT_OPTIONS,
+    profile: "Profile | None" = None,
+) -> BumpResult:
+    """
+    Bump the current version according to the provided rules in `files`, returning file results.
+
+    If `dry_run` is `True`, files will not be modified and the per-file diff of the requested
+    changes is included in each result instead.
 
     If using CalVer (`bump_type` == `BumpType.DATE`), if the user's current UTC month is the same as
     the current project version, then the Micro component is incremented. Otherwise, the date
     components are bumped to the user's current UTC month and Micro reset to `0`.
 
+    Target files are processed as raw bytes, without being decoded, unless a non-UTF-8 `encoding`
+    is declared for the file or the file starts with a UTF-16 or UTF-32 BOM. Line endings are
+    preserved; rules spanning multiple lines are matched using CRLF line endings if the file uses
+    them. Files without a declared encoding that appear to be binary are skipped.
+
+    If any rule for a target file declares search options, e.g. a regex search or a limited scope,
+    the file's rules are matched against its decoded text & only the prefix of the file required by
+    the rules is read if every rule is limited in scope. Otherwise, target files whose size meets
+    the `parallel_threshold` specified by `options` are split into line-aligned segments that are
+    processed concurrently by a pool of processes, one per CPU, when more than one is available.
+    Failing that, if every rule for a target file renders to a replacement of the same length as its
+    search string, the matches are patched into the file in place. Failing that, target files whose
+    size meets the `stream_threshold` specified by `options` are streamed to a temporary file in
+    chunks rather than being read into memory in full. Dry runs are always performed in memory.
+
+    If the `occurrence_index` is enabled by `options`, the offsets of each rule's occurrences are
+    persisted to the cache directory so that subsequent bumps of an unmodified file only need to
+    inspect these offsets rather than scanning the full file.
+
+    If `transactional` is enabled by `options`, the new contents of each target file are staged to
+    a temporary file alongside it, rather than modifying the file in place or using the occurrence
+    index. Once every file has been processed, the staged files are flushed to disk in a single pass
+    & moved into place, with the configuration file last, using a journal in the cache directory to
+    roll back an interrupted bump. If any file can't be bumped, no files are modified.
+
+    Target files are processed concurrently if more than one worker is specified by `options`;
+    results are always returned in the order that the files are declared. If any file can't be
+    bumped, the remaining files are still processed & the raised exception is included in the
+    file's result.
+
+    If a `profile` is provided, the time spent in each phase of the bump is recorded, along with the
+    per-phase timings, bytes read & written, and match counts of each target file.
+
+    No feedback is printed; target file paths are relative to the current directory. Raises
+    `BumperConfigError` if different encodings are declared for the same target file.
+
     NOTE: Ensure that the bumper configuration file is included in the rules passed to `files`.
 
     NOTE: It is assumed that `bump_type` is appropriate for the project's configured versioning
     type.
     """
-    next_version = _build_new_version(current_version, bump_type)
-    file_operations = _merge_bumpers(files)  # Merge so we handle each file all at once
+    next_version = build_new_version(current_version, bump_type)
+    jobs, index = _file_jobs(current_version, next_version, files, dry_run, options, profile)
+    return collect_results(
+        current_version, next_version, jobs, dry_run, options.workers, index, profile=profile
+    )
 
-    for target_file, rules in file_operations.items():
-        old = target_file.read_text()
-        new = copy.copy(old)
 
-        for r in rules:
-            new = new.replace(
-                r.replace("{current_version}", str(current_version)),
-                r.replace("{current_version}", str(next_version)),
-            )
+def bump_ver(
+    current_version: Version,
+    files: list[BumperFile],
+    bump_type: BumpType,
+    dry_run: bool,
+    options: BumperOptions = DEFAULT_OPTIONS,
+    profile: "Profile | None" = None,
+) -> None:
+    """
+    Bump the current version according to the provided rules in `files`, printing the results.
 
-        if new == old:
-            print(f"{target_file.name} - No changes.")
-            continue
+    See `bump_files` for details. If `dry_run` is `True`, the per-file diff is printed to the
+    terminal. Unless a `profile` is provided or the bump is transactional, each file's feedback is
+    printed as soon as it & the files preceding it have been processed. If any file can't be bumped,
+    a `BumpError` is raised once all files have been reported.
+    """
+    next_version = build_new_version(current_version, bump_type)
+    jobs, index = _file_jobs(current_version, next_version, files, dry_run, options, profile)
+    _report_jobs(
+        current_version, next_version, jobs, dry_run, options.workers, index, profile=profile
+    )
+
+
+class Project(t.NamedTuple):  # noqa: D101
+    cfg_path: Path
+    current_version: Version
+    files: list[BumperFile]
+    options: BumperOptions
+
+
+def _project_jobs(
+    projects: list[Project], next_versions: list[Version], root_dir: Path
+) -> list[_BumpJob]:
+    """
+    Build the bump jobs for each of the provided projects & their corresponding next versions.
 
-        if dry_run:
-            diff = difflib.unified_diff(
-                old.splitlines(), new.splitlines(), fromfile=target_file.name, n=0, lineterm=""
+    Each project's target files, including its configuration file, are resolved relative to the
+    directory containing its configuration file & rules are merged per resolved file. Jobs are
+    labeled with each file's path relative to `root_dir`.
+
+    Raises `BumperConfigError` if different encodings are declared for the same resolved file.
+    """
+    jobs: dict[Path, _BumpJob] = {}
+    scoped: dict[Path, "list[ScopedRule]"] = defaultdict(list)
+    for project, next_version in zip(projects, next_versions, strict=True):
+        project_dir = project.cfg_path.parent
+        files = [*project.files, BumperFile(file=Path(project.cfg_path.name), search=CONFIG_SEARCH)]
+        file_operations, encodings, search_options = merge_targets(
+            files, root_dir=project_dir, use_git=project.options.use_git_ls_files
+        )
+        for target_file, rules in file_operations.items():
+            resolved = Path(os.path.normpath(project_dir / target_file))
+            replacements = render_rules(rules, project.current_version, next_version)
+            if resolved not in jobs:
+                label = Path(os.path.relpath(resolved, root_dir)).as_posix()
+                jobs[resolved] = _BumpJob(resolved, label, [], [], project.options)
+
+            encoding = encodings.get(target_file)
+            if encoding is not None:
+                if jobs[resolved].encoding not in (None, encoding):
+                    raise BumperConfigError(
+                        f"Conflicting encodings declared for '{jobs[resolved].label}'"
+                    )
+                jobs[resolved] = jobs[resolved]._replace(encoding=encoding)
+
+            jobs[resolved].rules.extend(rules)
+            jobs[resolved].replacements.extend(replacements)
+            scoped[resolved].extend(
+                scoped_rules(
+                    rules,
+                    search_options[target_file],
+                    project.current_version,
+                    next_version,
+                    target_file,
+                )
             )
-            # Strip trailing whitespace to make testing easier
-            print("\n".join(line.rstrip() for line in diff))
-        else:
-            target_file.write_text(new)
-            print(f"Bumped {target_file.name}")
+
+    return [
+        (job._replace(scoped=scoped[resolved]) if requires_scope(scoped[resolved]) else job)
+        for resolved, job in jobs.items()
+    ]
+
+
+def labeled_project_jobs(project: Project, next_version: Version) -> list[_BumpJob]:
+    """
+    Build the bump jobs for a single project, labeled in the same manner as `bump_files`.
+
+    Target files are resolved relative to the directory containing the project's configuration file.
+    """
+    project_dir = project.cfg_path.parent
+    jobs = _project_jobs([project], [next_version], root_dir=project_dir)
+
+    labels = file_labels(Path(job.label) for job in jobs)
+    return _group_archives([job._replace(label=labels[Path(job.label)]) for job in jobs])
+
+
+def _prepared_project_jobs(
+    project: Project, next_version: Version, dry_run: bool, profile: "Profile | None" = None
+) -> tuple[list[_BumpJob], "OccurrenceIndex | None"]:
+    """Build the labeled bump jobs for the provided project, along with the attached index."""
+    with phase(profile, "merge"):
+        jobs = labeled_project_jobs(project, next_version)
+
+    with phase(profile, "index"):
+        return attach_index(jobs, project.cfg_path.parent, dry_run)
+
+
+def bump_project(
+    project: Project,
+    bump_type: BumpType,
+    dry_run: bool = False,
+    n_workers: int | None = None,
+    profile: "Profile | None" = None,
+) -> BumpResult:
+    """
+    Bump the provided parsed project, returning the result for each of its target files.
+
+    The project's target files, including its configuration file, are resolved relative to the
+    directory containing its configuration file, so the result does not depend on the current
+    directory. Files are processed using `n_workers` threads, defaulting to the project's configured
+    number of workers.
+
+    No feedback is printed; see `bump_files` for details, including profiling.
+
+    NOTE: It is assumed that `bump_type` is appropriate for the project's versioning type.
+    """
+    next_version = build_new_version(project.current_version, bump_type)
+    jobs, index = _prepared_project_jobs(project, next_version, dry_run, profile)
+    return collect_results(
+        project.current_version,
+        next_version,
+        jobs,
+        dry_run,
+        n_workers or project.options.workers,
+        index,
+        profile=profile,
+        root_dir=project.cfg_path.parent,
+    )
+
+
+def report_project(
+    project: Project,
+    bump_type: BumpType,
+    dry_run: bool = False,
+    n_workers: int | None = None,
+    profile: "Profile | None" = None,
+) -> None:
+    """
+    Bump the provided parsed project, printing the result for each of its target files.
+
+    See `bump_project` for details. Unless a `profile` is provided or the bump is transactional,
+    each file's feedback, including its diff for dry runs, is printed as soon as it & the files
+    preceding it have been processed. If any file can't be bumped, a `BumpError` is raised once all
+    files have been reported.
+    """
+    next_version = build_new_version(project.current_version, bump_type)
+    jobs, index = _prepared_project_jobs(project, next_version, dry_run, profile)
+    _report_jobs(
+        project.current_version,
+        next_version,
+        jobs,
+        dry_run,
+        n_workers or project.options.workers,
+        index,
+        profile=profile,
+        root_dir=project.cfg_path.parent,
+    )
+
+
+def bump_config(
+    cfg_path: Path,
+    bump_type: BumpType,
+    dry_run: bool = False,
+    n_workers: int | None = None,
+    profile: "Profile | None" = None,
+) -> BumpResult:
+    """
+    Parse & bump the project configured by `cfg_path`, returning the result for each target file.
+
+    See `bump_project` for details.
+
+    Raises `BumperConfigError` if the configuration is invalid, or `BumpError` if `bump_type` is not
+    valid for the project's versioning type.
+    """
+    with phase(profile, "parse_config"):
+        current_version, versioning_type, files, options = parse_config(cfg_path)
+
+    mismatch = bump_type_mismatch(versioning_type, bump_type)
+    if mismatch is not None:
+        raise BumpError(mismatch)
+
+    project = Project(cfg_path, current_version, files, options)
+    return bump_project(project, bump_type, dry_run=dry_run, n_workers=n_workers, profile=profile)
+
+
+def bump_projects(
+    projects: list[Project],
+    bump_type: BumpType,
+    dry_run: bool,
+    n_workers: int | None = None,
+    root_dir: Path = CD,
+    profile: "Profile | None" = None,
+) -> None:
+    """
+    Bump each of the provided projects in a single batch.
+
+    Each project's target files are resolved relative to the directory containing its configuration
+    file. Rules from all projects are merged per resolved file, so a file targeted by multiple
+    projects (e.g. a shared changelog) is read & written only once. Feedback is labeled with each
+    file's path relative to `root_dir`.
+
+    Target files are processed concurrently using a pool of `n_workers` processes, defaulting to the
+    number of available CPUs. Each file is processed using the options of the first project that
+    targets it. If any of these files enable the `occurrence_index`, a shared index is maintained in
+    the cache directory beneath `root_dir`. Likewise, if any of these files enable `transactional`,
+    the batch is bumped as a single transaction, journaled in the cache directory beneath
+    `root_dir`, & feedback is printed once all files have been processed.
+
+    If a `profile` is provided, the time spent in each phase of the batch is recorded, along with
+    the profile of each target file; feedback is then printed once all files have been processed.
+
+    NOTE: Each project's configuration file is bumped along with its declared target files.
+
+    NOTE: It is assumed that `bump_type` is appropriate for each project's configured versioning
+    type.
+    """
+    next_versions = [build_new_version(p.current_version, bump_type) for p in projects]
+    with phase(profile, "merge"):
+        jobs = _group_archives(_project_jobs(projects, next_versions, root_dir))
+
+    with phase(profile, "index"):
+        jobs, index = attach_index(jobs, root_dir, dry_run)
+
+    jobs, transactional = _stage_jobs(jobs, root_dir, dry_run)
+    n_workers = n_workers or os.cpu_count() or 1
+    if profile is None and not transactional:
+        report_results(_iter_results(jobs, dry_run, n_workers, processes=True, index=index))
+        return
+
+    if profile is not None:
+        jobs = [job._replace(profile=True) for job in jobs]
+
+    with phase(profile, "bump"):
+        results = list(_iter_results(jobs, dry_run, n_workers, processes=True, index=index))
+
+    if transactional:
+        with phase(profile, "commit"):
+            results = _commit_staged(results, root_dir)
+
+    if profile is not None:
+        profile.files = results
+
+    with phase(profile, "report"):
+        report_results(results)
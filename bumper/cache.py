@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import json
+import os
+import typing as t
+from pathlib import Path
+
+from bumper import CACHE_DIR
+from bumper.config import BumperFile, BumperOptions, PARSED_T, VersioningType, parse_config
+from bumper.version import Version
+
+CACHE_FORMAT = 3
+CONFIG_CACHE_FILENAME = "config.json"
+
+
+def read_cache(cache_dir: Path, filename: str) -> dict[str, t.Any]:
+    """
+    Read the entries of the provided cache file.
+
+    A missing, unreadable, or outdated cache file is treated as empty.
+    """
+    try:
+        raw = json.loads((cache_dir / filename).read_text())
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(raw, dict) or raw.get("format") != CACHE_FORMAT:
+        return {}
+
+    entries = raw.get("entries")
+    return entries if isinstance(entries, dict) else {}
+
+
+def write_cache(cache_dir: Path, filename: str, entries: dict[str, t.Any]) -> None:
+    """
+    Atomically write the provided entries to the cache file.
+
+    The cache directory is created along with a `.gitignore` if it does not already exist.
+    """
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    gitignore = cache_dir / ".gitignore"
+    if not gitignore.exists():
+        gitignore.write_text("# Automatically created by bumper\n*\n")
+
+    cache_path = cache_dir / filename
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps({"format": CACHE_FORMAT, "entries": entries}))
+    os.replace(tmp_path, cache_path)
+
+
+def _fingerprint(cfg_path: Path) -> list[int]:
+    st = cfg_path.stat()
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _dump_parsed(parsed: PARSED_T) -> dict[str, t.Any]:
+    current_version, versioning_type, files, options = parsed
+    return {
+        "current_version": str(current_version),
+        "versioning_type": str(versioning_type),
+        "files": [[f.file.as_posix(), f.search, f.encoding, *f.search_options] for f in files],
+        "options": options._asdict(),
+    }
+
+
+def _load_parsed(raw: dict[str, t.Any]) -> PARSED_T:
+    return (
+        Version(raw["current_version"]),
+        VersioningType(raw["versioning_type"]),
+        [BumperFile.from_toml(*f) for f in raw["files"]],
+        BumperOptions(**raw["options"]),
+    )
+
+
+class ConfigCache:
+    """
+    On-disk cache of validated bumper configurations, keyed by absolute path.
+
+    Each entry is fingerprinted using the configuration file's modification time & size; a cached
+    configuration is only used if its file's fingerprint is unchanged, allowing TOML parsing &
+    validation to be skipped entirely.
+
+    NOTE: Bumping a project modifies its configuration file, so the following invocation will
+    always re-parse the configuration.
+    """
+
+    def __init__(self, cache_dir: Path = CACHE_DIR) -> None:
+        self.cache_dir = cache_dir
+        self.entries: dict[str, t.Any] = {}
+        self._dirty = False
+
+    @classmethod
+    def load(cls, cache_dir: Path = CACHE_DIR) -> ConfigCache:  # noqa: D102
+        cache = cls(cache_dir)
+        cache.entries = read_cache(cache_dir, CONFIG_CACHE_FILENAME)
+        return cache
+
+    def parse(self, cfg_path: Path) -> PARSED_T:
+        """
+        Parse the provided configuration file, using its cached configuration if it is unchanged.
+
+        Raises `BumperConfigError` if the configuration is invalid; invalid configurations are not
+        cached.
+        """
+        key = os.path.abspath(cfg_path)
+        fingerprint = _fingerprint(cfg_path)
+        entry = self.entries.get(key)
+        if isinstance(entry, dict) and entry.get("fingerprint") == fingerprint:
+            try:
+                return _load_parsed(entry["config"])
+            except (KeyError, TypeError, ValueError):
+                pass
+
+        parsed = parse_config(cfg_path)
+        self.entries[key] = {"fingerprint": fingerprint, "config": _dump_parsed(parsed)}
+        self._dirty = True
+
+        return parsed
+
+    def save(self) -> None:
+        """Write the cache to disk, if any of its entries have changed."""
+        if self._dirty:
+            write_cache(self.cache_dir, CONFIG_CACHE_FILENAME, self.entries)
+            self._dirty = False
@@ -0,0 +1,382 @@
+import argparse
+import os
+import typing as t
+from pathlib import Path
+
+from bumper.config import (
+    BumperConfigError,
+    BumperFile,
+    CD,
+    CONFIG_SEARCH,
+    ConfigLocator,
+    parse_config,
+)
+from bumper.targets import (
+    PROBE_SIZE,
+    archive_part,
+    byte_rules,
+    decode_errors,
+    file_labels,
+    merge_targets,
+    read_archived,
+    read_scope,
+    render_rules,
+    requires_scope,
+    scoped_rules,
+    sniff_format,
+    text_rules,
+    text_scoped_rules,
+)
+from bumper.version import Version
+from bumper.walk import compile_glob, has_magic
+
+if t.TYPE_CHECKING:
+    from bumper.scoped import ScopedRule
+
+# Target files are searched in chunks so a file can be abandoned as soon as every rule has matched
+CHUNK_SIZE = 1 << 20
+
+
+class CheckResult(t.NamedTuple):  # noqa: D101
+    file: Path
+    label: str
+    rules: list[str]
+    matched: list[bool]
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:  # noqa: D102
+        return self.error is None and all(self.matched)
+
+    def to_json(self) -> dict[str, t.Any]:  # noqa: D102
+        return {
+            "file": self.file.as_posix(),
+            "label": self.label,
+            "rules": self.rules,
+            "matched": self.matched,
+            "error": None if self.error is None else str(self.error),
+        }
+
+
+def _find_searches(target_file: Path, searches: list[bytes]) -> set[bytes]:
+    """
+    Locate which of the provided search strings occur within `target_file`.
+
+    The file is read in chunks, each overlapping the previous by the length of the longest pending
+    search string, & reading stops as soon as every search string has been found.
+    """
+    pending = set(searches)
+    overlap = max((len(s) for s in pending), default=1) - 1
+    tail = b""
+    with target_file.open("rb") as f:
+        while pending:
+            chunk = f.read(CHUNK_SIZE)
+            if not chunk:
+                break
+
+            window = tail + chunk
+            pending = {s for s in pending if s not in window}
+            tail = window[-overlap:] if overlap else b""
+
+    return set(searches) - pending
+
+
+def _check_contents(
+    data: bytes, searches: list[str], encoding: str | None, scoped: "list[ScopedRule] | None"
+) -> list[bool]:
+    """Check whether each of the rendered search strings occurs within the provided contents."""
+    fmt = sniff_format(data[:PROBE_SIZE], encoding)
+    if fmt is None:
+        raise ValueError("Binary files can't be checked")
+
+    if scoped is not None:
+        from bumper.scoped import ScopedMatcher
+
+        text = data.decode(fmt.encoding, decode_errors(fmt))
+        _, hits = ScopedMatcher(text_scoped_rules(scoped, fmt)).apply(text)
+        return [bool(n) for n in hits]
+
+    if fmt.byte_level:
+        return [s in data for s, _ in byte_rules([(s, s) for s in searches], fmt)]
+
+    text = data.decode(fmt.encoding)
+    return [s in text for s, _ in text_rules([(s, s) for s in searches], fmt)]
+
+
+def _check_file(
+    target_file: Path,
+    label: str,
+    rules: list[str],
+    searches: list[str],
+    encoding: str | None = None,
+    scoped: "list[ScopedRule] | None" = None,
+) -> CheckResult:
+    """
+    Check whether each of the rendered search strings occurs at least once within `target_file`.
+
+    Unless a non-UTF-8 encoding is declared, or detected from the file's BOM, the search strings are
+    matched against the raw bytes of the file, stopping at the first occurrence of each. Otherwise,
+    the decoded text of the file is searched instead. Binary files can't be checked.
+
+    If `scoped` rules are provided, they are matched within their scope instead, reading only the
+    prefix of the file that their scopes require.
+
+    Gzip target files, & the members of zip archives, are decompressed & searched in full.
+
+    Any exception raised while processing the file is captured by the result rather than raised.
+    """
+    try:
+        decompressed = read_archived(target_file)
+        if decompressed is not None:
+            matched = _check_contents(decompressed, searches, encoding, scoped)
+            return CheckResult(target_file, label, rules, matched)
+
+        with target_file.open("rb") as f:
+            header = f.read(PROBE_SIZE)
+
+        fmt = sniff_format(header, encoding)
+        if fmt is None:
+            raise ValueError("Binary files can't be checked")
+
+        if scoped is not None:
+            from bumper.scoped import ScopedMatcher
+
+            matcher = ScopedMatcher(text_scoped_rules(scoped, fmt))
+            with target_file.open("rb") as f:
+                text, _, _ = read_scope(f, matcher, fmt)
+            _, hits = matcher.apply(text)
+            matched = [bool(n) for n in hits]
+        elif fmt.byte_level:
+            encoded = [s for s, _ in byte_rules([(s, s) for s in searches], fmt)]
+            found = _find_searches(target_file, encoded)
+            matched = [s in found for s in encoded]
+        else:
+            text = target_file.read_bytes().decode(fmt.encoding)
+            matched = [s in text for s, _ in text_rules([(s, s) for s in searches], fmt)]
+
+        return CheckResult(target_file, label, rules, matched)
+    except Exception as e:
+        return CheckResult(target_file, label, rules, [False] * len(rules), error=e)
+
+
+def _normalize(path: Path | str) -> str:
+    return Path(os.path.normpath(path)).as_posix()
+
+
+def affected_bumpers(files: list[BumperFile], changed_paths: t.Iterable[Path]) -> list[BumperFile]:
+    """
+    Select the bump specifications whose target file is one of the provided changed paths.
+
+    Specifications targeting a glob pattern are narrowed to the changed paths matching the pattern,
+    so the pattern does not need to be expanded.
+
+    NOTE: Changed paths are compared lexically, relative to the directory the rules are resolved
+    against, & are assumed to be tracked files, as passed by `pre-commit`; ignore files are not
+    consulted.
+    """
+    changed = {_normalize(p) for p in changed_paths}
+    affected: list[BumperFile] = []
+    for b in files:
+        # Archive members are affected by changes to their archive
+        pattern = archive_part(b.file)
+        member = b.file.as_posix().removeprefix(pattern)
+        if has_magic(pattern):
+            regex = compile_glob(pattern.removeprefix("./"))
+            affected.extend(
+                b._replace(file=Path(f"{p}{member}")) for p in sorted(changed) if regex.match(p)
+            )
+        elif _normalize(pattern) in changed:
+            affected.append(b)
+
+    return affected
+
+
+class CheckJob(t.NamedTuple):
+    """Rendered search rules of a single target file, to be checked by `check_job`."""
+
+    file: Path
+    label: str
+    rules: list[str]
+    searches: list[str]
+    encoding: str | None
+    scoped: "list[ScopedRule] | None"
+
+
+def check_jobs(
+    current_version: Version, files: list[BumperFile], root_dir: Path = CD, use_git: bool = False
+) -> list[CheckJob]:
+    """
+    Build the check jobs of the provided rules, merged per target file as for a bump.
+
+    Target files are resolved relative to `root_dir`. Raises `BumperConfigError` if different
+    encodings are declared for the same file.
+    """
+    file_operations, encodings, search_options = merge_targets(
+        files, root_dir=root_dir, use_git=use_git
+    )
+    labels = file_labels(file_operations)
+    jobs = []
+    for target_file, rules in file_operations.items():
+        rendered = render_rules(rules, current_version, current_version)
+        scoped = scoped_rules(
+            rules, search_options[target_file], current_version, current_version, target_file
+        )
+        jobs.append(
+            CheckJob(
+                root_dir / target_file,
+                labels[target_file],
+                rules,
+                [search for search, _ in rendered],
+                encodings.get(target_file),
+                scoped if requires_scope(scoped) else None,
+            )
+        )
+
+    return jobs
+
+
+def check_job(job: CheckJob) -> CheckResult:
+    """Check the job's target file; see `_check_file`."""
+    return _check_file(
+        job.file, job.label, job.rules, job.searches, encoding=job.encoding, scoped=job.scoped
+    )
+
+
+def check_rules(
+    current_version: Version,
+    files: list[BumperFile],
+    n_workers: int = 1,
+    root_dir: Path = CD,
+    use_git: bool = False,
+) -> list[CheckResult]:
+    """
+    Check that every search rule matches `current_version` within its target file.
+
+    Rules are merged per target file, as for a bump, & each file is read at most once. If more than
+    one worker is requested, files are checked concurrently using a bounded thread pool. Results
+    are returned in the same order as the merged target files.
+
+    Raises `BumperConfigError` if different encodings are declared for the same file.
+    """
+    jobs = check_jobs(current_version, files, root_dir=root_dir, use_git=use_git)
+
+    n_workers = min(n_workers, len(jobs))
+    if n_workers <= 1:
+        return [check_job(job) for job in jobs]
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=n_workers) as pool:
+        return list(pool.map(check_job, jobs))
+
+
+def check_project(
+    cfg_path: Path, paths: list[Path] | None = None, n_workers: int | None = None
+) -> list[CheckResult]:
+    """
+    Check that every search rule of the provided configuration matches its target file.
+
+    The configuration's own `current_version` declaration is checked along with its configured
+    rules. Target files are resolved relative to the directory containing the configuration file.
+    If `paths` are provided, only the rules targeting one of the paths are checked, unless the
+    configuration file is one of the paths, in which case every rule is checked. `paths` are
+    resolved relative to the current directory.
+
+    By default, files are checked using one worker per CPU.
+
+    Raises `BumperConfigError` if the configuration is invalid.
+    """
+    current_version, _, files, options = parse_config(cfg_path)
+    project_dir = cfg_path.parent
+
+    cfg_bumper = BumperFile(file=Path(cfg_path.name), search=CONFIG_SEARCH)
+    files.append(cfg_bumper)
+    if paths:
+        rebased = (
+            Path(os.path.relpath(os.path.abspath(p), os.path.abspath(project_dir))) for p in paths
+        )
+        affected = affected_bumpers(files, rebased)
+        if cfg_bumper not in affected:
+            files = affected
+
+    return check_rules(
+        current_version,
+        files,
+        n_workers=n_workers or os.cpu_count() or 1,
+        root_dir=project_dir,
+        use_git=options.use_git_ls_files,
+    )
+
+
+def report_failures(result: CheckResult) -> int:
+    """Provide command line feedback for each failed rule of the result, returning their count."""
+    if result.error is not None:
+        print(f"{result.label} - Error: {result.error}")
+        return len(result.rules)
+
+    n_failed = 0
+    for rule, matched in zip(result.rules, result.matched, strict=True):
+        if not matched:
+            n_failed += 1
+            print(f"{result.label} - No matches for '{rule}'")
+
+    return n_failed
+
+
+def report_check(results: list[CheckResult]) -> str | None:
+    """
+    Provide command line feedback for each rule that failed to match its target file.
+
+    Returns a summary of the failures, if there are any, otherwise `None`.
+    """
+    n_rules = n_failed = 0
+    for result in results:
+        n_rules += len(result.rules)
+        n_failed += report_failures(result)
+
+    if n_failed:
+        return f"{n_failed} of {n_rules} search rule(s) failed to match."
+
+    if n_rules:
+        print(f"All {n_rules} search rule(s) matched.")
+
+    return None
+
+
+def main(argv: t.Sequence[str] | None = None) -> int:
+    """
+    Lightweight entry point for `bumper check`, used by the provided `pre-commit` hook.
+
+    This is equivalent to `bumper check` but avoids the startup cost of the full CLI.
+    """
+    parser = argparse.ArgumentParser(
+        prog="bumper-check",
+        description="Check that every search rule matches the current version.",
+    )
+    parser.add_argument(
+        "paths", nargs="*", type=Path, help="Only check rules targeting these files."
+    )
+    parser.add_argument("--workers", type=int, help="Number of files to check concurrently.")
+    args = parser.parse_args(argv)
+
+    cfg_path = ConfigLocator().locate(CD)
+    if cfg_path is None:
+        print("Configuration file could not be located.")
+        return 1
+
+    try:
+        results = check_project(cfg_path, paths=args.paths, n_workers=args.workers)
+    except BumperConfigError as e:
+        print(e)
+        return 1
+
+    failure = report_check(results)
+    if failure is not None:
+        print(failure)
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
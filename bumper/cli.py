@@ -1,30 +1,247 @@
+import os
+import sys
 import typing as t
+from enum import StrEnum
+from pathlib import Path
 
 import typer
 
-from bumper import CONFIG_PRIORITY
-from bumper.bump import BumpType, bump_ver
+from bumper.bump import (
+    BumpError,
+    BumpType,
+    FileResult,
+    Project,
+    bump_projects,
+    bump_type_mismatch,
+    phase,
+    report_project,
+    report_results,
+)
+from bumper.client import (
+    DaemonUnavailableError,
+    SOCKET_ENVVAR,
+    request,
+    socket_path,
+)
 from bumper.config import (
     BumperConfigError,
-    BumperFile,
+    CD,
+    ConfigLocator,
     ExistingConfigError,
+    PARSED_T,
     VersioningType,
+    discover_configs,
     parse_config,
     write_default_config,
 )
 
+if t.TYPE_CHECKING:
+    from bumper.cache import ConfigCache
+    from bumper.profiling import Profile
+
 bumper_cli = typer.Typer(add_completion=False)
 
 
+class ProfileFormat(StrEnum):  # noqa: D101
+    TABLE = "table"
+    JSON = "json"
+
+
 def _abort_with_message(message: str, end: str = "\n") -> t.Never:
     print(message, end=end)
     raise typer.Abort()
 
 
+def _locate_config() -> Path:
+    """
+    Locate the configuration governing the current directory, aborting if there isn't one.
+
+    See `ConfigLocator` for details.
+    """
+    cfg_path = ConfigLocator().locate(CD)
+    if cfg_path is None:
+        _abort_with_message("Configuration file could not be located.")
+
+    return cfg_path
+
+
+def _load_config_cache(use_cache: bool, root_dir: Path) -> "ConfigCache | None":
+    """Load the configuration cache from the cache directory beneath `root_dir`, if enabled."""
+    if not use_cache:
+        return None
+
+    from bumper.cache import CACHE_DIR, ConfigCache
+
+    return ConfigCache.load(root_dir / CACHE_DIR)
+
+
+def _parse(cfg_path: Path, config_cache: "ConfigCache | None") -> PARSED_T:
+    """Parse the provided configuration file, using the configuration cache if provided."""
+    if config_cache is None:
+        return parse_config(cfg_path)
+
+    return config_cache.parse(cfg_path)
+
+
+def _forward_bump(
+    daemon_socket: Path, cfg_path: Path, bump_by: BumpType, dry_run: bool, workers: int | None
+) -> bool:
+    """
+    Forward the bump to the daemon listening on `daemon_socket` & report its results.
+
+    Returns `False` if the daemon can't be reached, in which case nothing has been bumped. If the
+    connection fails once the request may have been sent, the bump is aborted rather than falling
+    back to a local bump, as the daemon may already have applied it.
+    """
+    payload = {
+        "command": "bump",
+        "config": os.path.abspath(cfg_path),
+        "bump_by": str(bump_by),
+        "dry_run": dry_run,
+        "workers": workers,
+    }
+    try:
+        response = request(daemon_socket, payload)
+    except DaemonUnavailableError:
+        return False
+    except OSError as e:
+        _abort_with_message(f"Lost connection to the daemon, the bump may have been applied: {e}")
+
+    if "files" not in response:
+        _abort_with_message(response["error"])
+
+    try:
+        report_results(FileResult.from_json(raw) for raw in response["files"])
+    except BumpError as e:
+        _abort_with_message(str(e))
+
+    return True
+
+
+def _bump_recursive(
+    bump_by: BumpType,
+    dry_run: bool,
+    workers: int | None,
+    config_cache: "ConfigCache | None",
+    profile: "Profile | None" = None,
+) -> None:
+    """
+    Bump every bumper project located within the current directory tree.
+
+    All configurations are parsed before any files are bumped; an invalid configuration aborts the
+    entire batch. Projects whose versioning type does not support `bump_by` are skipped.
+    """
+    with phase(profile, "discover"):
+        cfg_paths = list(discover_configs(CD))
+
+    projects = []
+    for cfg_path in cfg_paths:
+        try:
+            with phase(profile, "parse_config"):
+                current_version, versioning_type, files, options = _parse(cfg_path, config_cache)
+        except BumperConfigError as e:
+            _abort_with_message(f"{cfg_path.as_posix()}: {e}")
+
+        mismatch = bump_type_mismatch(versioning_type, bump_by)
+        if mismatch is not None:
+            print(f"{cfg_path.as_posix()} - Skipped. {mismatch}")
+            continue
+
+        projects.append(Project(cfg_path, current_version, files, options))
+
+    if config_cache is not None:
+        config_cache.save()
+
+    if not projects:
+        _abort_with_message("No bumpable configuration files could be located.")
+
+    try:
+        bump_projects(
+            projects=projects,
+            bump_type=bump_by,
+            dry_run=dry_run,
+            n_workers=workers,
+            profile=profile,
+        )
+    except (BumpError, BumperConfigError) as e:
+        _abort_with_message(str(e))
+
+
+def _bump_local(
+    cfg_path: Path,
+    bump_by: BumpType,
+    dry_run: bool,
+    workers: int | None,
+    config_cache: "ConfigCache | None",
+    profile: "Profile | None" = None,
+) -> None:
+    """
+    Bump the project configured by `cfg_path` within the current process.
+
+    Target files are resolved relative to the directory containing the configuration file.
+    """
+    try:
+        with phase(profile, "parse_config"):
+            current_version, versioning_type, files, options = _parse(cfg_path, config_cache)
+    except BumperConfigError as e:
+        _abort_with_message(str(e))
+
+    if config_cache is not None:
+        config_cache.save()
+
+    # Check valid bump_by before we attempt to build a new version
+    mismatch = bump_type_mismatch(versioning_type, bump_by)
+    if mismatch is not None:
+        _abort_with_message(mismatch)
+
+    # The bump configuration is added to the project's files so it gets updated as well
+    project = Project(cfg_path, current_version, files, options)
+    try:
+        report_project(project, bump_by, dry_run, n_workers=workers, profile=profile)
+    except (BumpError, BumperConfigError) as e:
+        _abort_with_message(str(e))
+
+
+def _report_profile(
+    profile: "Profile", profile_format: ProfileFormat, cprofile_path: Path | None
+) -> None:
+    """Print the recorded profile to stderr & dump any `cProfile` statistics to `cprofile_path`."""
+    if profile_format == ProfileFormat.JSON:
+        import json
+
+        print(json.dumps(profile.to_json()), file=sys.stderr)
+    else:
+        print(profile.render_table(), file=sys.stderr)
+
+    if cprofile_path is not None:
+        profile.dump_stats(cprofile_path)
+        print(f"cProfile statistics written to {cprofile_path.as_posix()}", file=sys.stderr)
+
+
 @bumper_cli.command(name="bump")
 def bump_ver_cmd(
     bump_by: BumpType,
     dry_run: bool = typer.Option(False, help="Preview the requested diff."),
+    workers: int | None = typer.Option(
+        None, min=1, help="Number of files to process concurrently. Overrides the configuration."
+    ),
+    recursive: bool = typer.Option(
+        False, help="Bump every project configured within the current directory tree."
+    ),
+    cache: bool = typer.Option(
+        False, envvar="BUMPER_CACHE", help="Cache parsed configurations between invocations."
+    ),
+    daemon: bool = typer.Option(True, help="Forward the bump to a running bumper daemon, if any."),
+    profile: bool = typer.Option(False, help="Print the time spent in each phase of the bump."),
+    profile_format: ProfileFormat = typer.Option(
+        ProfileFormat.TABLE, help="Output format of the profile."
+    ),
+    cprofile: Path | None = typer.Option(
+        None, help="Write cProfile statistics of the bump to this path. Implies --profile."
+    ),
+    trace_memory: bool = typer.Option(
+        False, help="Trace memory allocations using tracemalloc. Implies --profile."
+    ),
 ) -> None:
     """
     Bump the requested version component.
@@ -38,29 +255,219 @@ def bump_ver_cmd(
 
     If `dry_run` is `True`, the requested diff will be displayed in the terminal & no file
     modifications will take place.
+
+    The configuration file is located by searching the current directory, then each of its parents
+    up to the root of the repository. Target files are resolved relative to the directory containing
+    the configuration file.
+
+    If `workers` is specified, it takes precedence over the number of workers in the configuration.
+
+    If `recursive` is `True`, all bumper configurations within the current directory tree are
+    located & bumped as a single batch. Each project's target files are resolved relative to its
+    configuration file & files targeted by multiple projects are only read & written once.
+
+    If `cache` is `True`, validated configurations are cached in the `.bumper-cache` directory
+    alongside the located configuration file, or within the current directory for recursive bumps, &
+    reused while their configuration file is unmodified.
+
+    If `daemon` is `True` & a `bumper serve` daemon is listening on the socket specified by the
+    `BUMPER_SOCKET` environment variable (Default: `.bumper-cache/bumper.sock`, alongside the
+    located configuration file), non-recursive bumps are forwarded to the daemon. If the daemon
+    can't be reached, the bump is run locally; if the connection to the daemon is lost once it's
+    been reached, the bump is aborted.
+
+    If `profile` is `True`, the wall-clock time of each phase of the bump is printed to stderr once
+    the bump is complete, along with the per-phase timings, bytes read & written, and match counts
+    of each target file, even if the bump fails. The run can additionally be captured using
+    `cProfile` and/or `tracemalloc`. Profiled bumps are always run locally.
     """
-    for cfg_path in CONFIG_PRIORITY:
-        if cfg_path.exists():
-            break
-    else:
-        _abort_with_message("Configuration file could not be located.")
+    run_profile = None
+    if profile or cprofile is not None or trace_memory:
+        from bumper.profiling import Profile
+
+        run_profile = Profile(cprofile=cprofile is not None, tracemalloc=trace_memory)
+
+    if run_profile is None:
+        if recursive:
+            config_cache = _load_config_cache(cache, CD)
+            _bump_recursive(bump_by, dry_run=dry_run, workers=workers, config_cache=config_cache)
+            return
+
+        cfg_path = _locate_config()
+        if daemon:
+            daemon_socket = socket_path(cfg_path.parent)
+            if daemon_socket.exists() and _forward_bump(
+                daemon_socket, cfg_path, bump_by=bump_by, dry_run=dry_run, workers=workers
+            ):
+                return
+
+        config_cache = _load_config_cache(cache, cfg_path.parent)
+        _bump_local(cfg_path, bump_by, dry_run=dry_run, workers=workers, config_cache=config_cache)
+        return
+
+    try:
+        with run_profile.capture():
+            if recursive:
+                _bump_recursive(
+                    bump_by,
+                    dry_run=dry_run,
+                    workers=workers,
+                    config_cache=_load_config_cache(cache, CD),
+                    profile=run_profile,
+                )
+            else:
+                with run_profile.phase("discover"):
+                    cfg_path = _locate_config()
+
+                _bump_local(
+                    cfg_path,
+                    bump_by,
+                    dry_run=dry_run,
+                    workers=workers,
+                    config_cache=_load_config_cache(cache, cfg_path.parent),
+                    profile=run_profile,
+                )
+    finally:
+        _report_profile(run_profile, profile_format, cprofile)
+
+
+@bumper_cli.command(name="bump-ref")
+def bump_ref_cmd(
+    bump_by: BumpType,
+    ref: str = typer.Argument(..., help="Git ref to bump, e.g. a branch name."),
+    repo: Path = typer.Option(Path(), help="Path to the git repository, which may be bare."),
+    message: str | None = typer.Option(None, help="Commit message for the bump commit."),
+    dry_run: bool = typer.Option(False, help="Preview the requested diff."),
+    update_ref: bool = typer.Option(
+        True, help="Update the branch named by REF to point to the bump commit."
+    ),
+) -> None:
+    """
+    Bump the requested version component directly against a git ref.
+
+    The configuration & target files are read from the root of REF's tree using git plumbing & the
+    bumped files are committed on top of REF without using a working tree, so REPO may be a bare
+    repository. If REF names a branch, it is updated to point to the new commit.
+
+    If `dry_run` is `True`, the requested diff will be displayed in the terminal & no objects will
+    be written.
+    """
+    from bumper.gitref import GitRefError, bump_ref
 
     try:
-        current_version, versioning_type, files = parse_config(cfg_path)
+        ref_result = bump_ref(
+            repo, ref, bump_by, dry_run=dry_run, message=message, update_ref=update_ref
+        )
+        report_results(ref_result.result.files)
+    except (BumpError, BumperConfigError, GitRefError) as e:
+        _abort_with_message(str(e))
+
+    if ref_result.commit is not None:
+        print(f"Created commit {ref_result.commit}")
+    if ref_result.ref is not None:
+        print(f"Updated {ref_result.ref}")
+
+
+@bumper_cli.command(name="check")
+def check_cmd(
+    paths: list[Path] | None = typer.Argument(
+        None, show_default=False, help="Only check the rules targeting these files."
+    ),
+    workers: int | None = typer.Option(
+        None, min=1, help="Number of files to check concurrently. Defaults to the number of CPUs."
+    ),
+) -> None:
+    """
+    Check that every search rule matches the current version within its target file.
+
+    Each target file is only read until every one of its rules has matched once; no files are
+    modified. Exits with a non-zero status if any rule does not match or any target file can't be
+    read.
+
+    If `paths` are provided, e.g. by `pre-commit`, only the rules targeting one of the paths are
+    checked. If the configuration file is one of the paths, every rule is checked.
+    """
+    from bumper.check import check_project, report_check
+
+    cfg_path = _locate_config()
+    try:
+        results = check_project(cfg_path, paths=paths, n_workers=workers)
     except BumperConfigError as e:
         _abort_with_message(str(e))
 
-    # Check valid bump_by before we attempt to build a new version
-    if versioning_type == VersioningType.SEMVER:
-        if bump_by == BumpType.DATE:
-            _abort_with_message("SemVer projects must bump by major, minor, or patch.")
-    elif versioning_type == VersioningType.CALVER:
-        if bump_by != BumpType.DATE:
-            _abort_with_message("CalVer projects must bump by date.")
-
-    # Add in the bump configuration so it gets updated as well
-    files.append(BumperFile(file=cfg_path, search='current_version = "{current_version}"'))
-    bump_ver(current_version=current_version, files=files, bump_type=bump_by, dry_run=dry_run)
+    failure = report_check(results)
+    if failure is not None:
+        _abort_with_message(failure)
+
+
+@bumper_cli.command(name="serve")
+def serve_cmd(
+    daemon_socket: Path | None = typer.Option(
+        None,
+        "--socket",
+        envvar=SOCKET_ENVVAR,
+        help="Unix domain socket to listen on.",
+        show_default=".bumper-cache/bumper.sock",
+    ),
+) -> None:
+    """
+    Run a bumper daemon, listening on a Unix domain socket.
+
+    The daemon keeps validated configurations & occurrence indices in memory between requests. Each
+    request is a single line of JSON, answered with a single line of JSON describing the result for
+    each target file. Concurrent requests against the same project are handled one at a time.
+
+    Unless a socket is specified, the daemon listens on `.bumper-cache/bumper.sock` alongside the
+    configuration file governing the current directory, or within the current directory if there
+    isn't one, which is where `bumper bump` looks for it.
+
+    While the daemon is running, `bumper bump` forwards non-recursive bumps to it. Send a
+    `{"command": "shutdown"}` request, or interrupt the process, to stop the daemon.
+
+    NOTE: Unix domain sockets are not available on all platforms.
+    """
+    from bumper.serve import DaemonRunningError, serve
+
+    if daemon_socket is None:
+        # Listen where `bumper bump` looks for the daemon, i.e. alongside the located configuration
+        cfg_path = ConfigLocator().locate(CD)
+        daemon_socket = socket_path(CD if cfg_path is None else cfg_path.parent)
+
+    print(f"Listening on {daemon_socket.as_posix()}")
+    try:
+        serve(daemon_socket)
+    except (DaemonRunningError, OSError) as e:
+        _abort_with_message(str(e))
+    except KeyboardInterrupt:
+        pass
+
+
+@bumper_cli.command(name="watch")
+def watch_cmd(
+    poll: bool = typer.Option(False, help="Poll for changes, rather than using inotify."),
+    interval: float = typer.Option(
+        1.0, min=0.01, help="Seconds between polls, when polling for changes."
+    ),
+) -> None:
+    """
+    Watch the project's target files, reporting version drift as soon as a file changes.
+
+    Every search rule is checked once up front, then only the target files that change are
+    rescanned. Changes are detected using inotify where available, otherwise the target files are
+    polled. If the configuration file changes, every search rule is checked again. Interrupt the
+    process to stop watching.
+
+    NOTE: Glob patterns are only expanded when the configuration is loaded.
+    """
+    from bumper.watch import watch
+
+    cfg_path = _locate_config()
+    try:
+        watch(cfg_path, use_polling=poll, interval=interval)
+    except BumperConfigError as e:
+        _abort_with_message(str(e))
+    except KeyboardInterrupt:
+        pass
 
 
 @bumper_cli.command()
@@ -0,0 +1,59 @@
+import os
+import typing as t
+from pathlib import Path
+
+from bumper import CACHE_DIR
+
+# Socket used by `bumper serve` & the CLI's thin client mode, relative to the project's directory
+DEFAULT_SOCKET = CACHE_DIR / "bumper.sock"
+SOCKET_ENVVAR = "BUMPER_SOCKET"
+
+
+class DaemonUnavailableError(OSError): ...  # noqa: D101
+
+
+def socket_path(root_dir: Path = Path()) -> Path:
+    """
+    Return the daemon's socket path, overridden by the `BUMPER_SOCKET` environment variable.
+
+    The default socket is located in the cache directory beneath `root_dir`, which should be the
+    directory containing the project's configuration file.
+    """
+    return Path(os.environ.get(SOCKET_ENVVAR) or root_dir / DEFAULT_SOCKET)
+
+
+def request(
+    socket_path: Path, payload: dict[str, t.Any], timeout: float | None = None
+) -> dict[str, t.Any]:
+    """
+    Send a single JSON request to the daemon listening on `socket_path` & return its response.
+
+    Requests & responses are each encoded as a single line of JSON.
+
+    Raises `DaemonUnavailableError` if the daemon can't be reached, in which case the request was
+    never sent. Raises `OSError` if the connection fails after it's been established, e.g. if the
+    daemon closes the connection without responding.
+    """
+    # Deferred so that CLI invocations without a running daemon don't pay for importing them
+    import json
+    import socket
+
+    if not hasattr(socket, "AF_UNIX"):
+        raise DaemonUnavailableError("Unix domain sockets are not supported on this platform.")
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        try:
+            sock.connect(os.fspath(socket_path))
+        except OSError as e:
+            raise DaemonUnavailableError(f"The daemon can't be reached: {e}") from e
+
+        sock.sendall(json.dumps(payload).encode() + b"\n")
+        with sock.makefile("rb") as f:
+            response = f.readline()
+
+    if not response:
+        raise ConnectionError("The daemon closed the connection without responding.")
+
+    loaded: dict[str, t.Any] = json.loads(response)
+    return loaded
@@ -1,26 +1,118 @@
 from __future__ import annotations
 
-import tomllib
+import codecs
+import os
+import re
 import typing as t
 from enum import StrEnum
 from pathlib import Path
 
-from packaging import version
+from bumper import CONFIG_PRIORITY
+from bumper.version import InvalidVersionError, Version
 
 BUMPER_REQUIRED_FIELDS = ("current_version", "versioning_type")
 REPLACEMENT_REQUIRED_FIELDS = ("file", "search")
 
+# Rules limited to the value of a key may omit their search string, which then matches the version
+KEY_SEARCH = "{current_version}"
+
+CD = Path()
+
+# Search rule used to bump the version declared by the configuration file itself
+CONFIG_SEARCH = 'current_version = "{current_version}"'
+
+# Directories never descended into when discovering configuration files
+DISCOVERY_SKIP_DIRS = frozenset(
+    (
+        ".bumper-cache",
+        ".git",
+        ".hg",
+        ".svn",
+        ".mypy_cache",
+        ".nox",
+        ".pytest_cache",
+        ".ruff_cache",
+        ".tox",
+        ".venv",
+        "__pycache__",
+        "node_modules",
+        "venv",
+    )
+)
+
 
 class BumperConfigError(Exception): ...  # noqa: D101
 
 
+class SearchOptions(t.NamedTuple):
+    """
+    Optional matching behavior of a search rule.
+
+    If `regex` is `True`, the search string is a regular expression & each occurrence of the current
+    version within its matches is replaced. Otherwise the search string is matched literally.
+
+    The scope of the search may be limited to the first `first_n_lines` lines of the target file,
+    and/or to the text following the first occurrence of the `start` anchor & preceding the next
+    occurrence of the `stop` anchor. At most `max_occurrences` matches are replaced.
+
+    Alternatively, the scope may be limited to the value at the dotted `key` path of a JSON, TOML,
+    or YAML target file, e.g. `tool.poetry.version`; see `bumper.keypath.KeyPath`.
+    """
+
+    regex: bool = False
+    max_occurrences: int | None = None
+    first_n_lines: int | None = None
+    start: str | None = None
+    stop: str | None = None
+    key: str | None = None
+
+    @property
+    def bounded(self) -> bool:
+        """`True` if scanning the target file may stop before reaching the end of the file."""
+        return (
+            self.max_occurrences is not None
+            or self.first_n_lines is not None
+            or self.stop is not None
+            or self.key is not None
+        )
+
+
+PLAIN_SEARCH = SearchOptions()
+
+
 class BumperFile(t.NamedTuple):  # noqa: D101
     file: Path
     search: str
+    encoding: str | None = None
+    search_options: SearchOptions = PLAIN_SEARCH
 
     @classmethod
-    def from_toml(cls, file: str, search: str) -> BumperFile:  # noqa: D102
-        return cls(file=Path(file), search=search)
+    def from_toml(  # noqa: D102
+        cls,
+        file: str,
+        search: str = KEY_SEARCH,
+        encoding: str | None = None,
+        regex: bool = False,
+        max_occurrences: int | None = None,
+        first_n_lines: int | None = None,
+        start: str | None = None,
+        stop: str | None = None,
+        key: str | None = None,
+    ) -> BumperFile:
+        search_options = SearchOptions(regex, max_occurrences, first_n_lines, start, stop, key)
+        return cls(file=Path(file), search=search, encoding=encoding, search_options=search_options)
+
+
+class BumperOptions(t.NamedTuple):  # noqa: D101
+    stream_threshold: int | None = None
+    workers: int = 1
+    use_git_ls_files: bool = False
+    occurrence_index: bool = False
+    transactional: bool = False
+    parallel_threshold: int | None = None
+
+
+DEFAULT_OPTIONS = BumperOptions()
 
 
 class VersioningType(StrEnum):  # noqa: D101
@@ -61,33 +153,347 @@ def _validate_config(cfg: dict) -> None:
 
     for file in cfg["tool"]["bumper"]["files"]:
         for rf in REPLACEMENT_REQUIRED_FIELDS:
-            if rf not in file:
+            if rf not in file and not (rf == "search" and "key" in file):
                 raise BumperConfigError(
                     f"File replacement declaration missing required field: '{rf}'"
                 )
 
+        if "encoding" in file:
+            _validate_encoding(file["encoding"])
+
+        _validate_search_options(file)
+
+
+def _validate_encoding(encoding: t.Any) -> None:
+    """Raise `BumperConfigError` if the provided file encoding is not a known text encoding."""
+    if not isinstance(encoding, str):
+        raise BumperConfigError("'encoding' must be a string")
+
+    try:
+        codecs.lookup(encoding)
+    except LookupError:
+        raise BumperConfigError(f"Unknown encoding: '{encoding}'") from None
+
+
+def _validate_search_options(file: dict) -> None:
+    """
+    Validate the optional search rule settings of the provided `[[tool.bumper.files]]` table.
+
+    Raises `BumperConfigError` if a declared setting has an invalid value, or if a regex search
+    string can't be compiled.
+    """
+    if not isinstance(file.get("regex", False), bool):
+        raise BumperConfigError("'regex' must be a boolean")
+
+    for key in ("max_occurrences", "first_n_lines"):
+        value = file.get(key, 1)
+        if isinstance(value, bool) or not isinstance(value, int):
+            raise BumperConfigError(f"'{key}' must be an integer")
+        if value < 1:
+            raise BumperConfigError(f"'{key}' must be at least 1")
+
+    for key in ("start", "stop"):
+        value = file.get(key, key)
+        if not isinstance(value, str) or not value:
+            raise BumperConfigError(f"'{key}' must be a non-empty string")
+
+    if file.get("regex", False):
+        # Rules with a key path may omit their search string
+        search = file.get("search", KEY_SEARCH)
+        try:
+            re.compile(search.replace("{current_version}", ""))
+        except re.error as e:
+            raise BumperConfigError(f"Invalid search regex '{search}': {e}") from None
+
+    if "key" in file:
+        _validate_key(file)
+
+
+def _validate_key(file: dict) -> None:
+    """
+    Validate the key path of the provided `[[tool.bumper.files]]` table.
+
+    Raises `BumperConfigError` if the key path is malformed, is combined with another means of
+    limiting the scope of the search, or its target file is not a JSON, TOML, or YAML file.
+    """
+    key = file["key"]
+    if not isinstance(key, str) or not key:
+        raise BumperConfigError("'key' must be a non-empty string")
+
+    for option in ("first_n_lines", "start", "stop"):
+        if option in file:
+            raise BumperConfigError(f"'key' can't be combined with '{option}'")
+
+    from bumper.keypath import KeyPath
+
+    try:
+        KeyPath.for_target(key, Path(file["file"]))
+    except ValueError as e:
+        raise BumperConfigError(str(e)) from None
+
+
+def _int_option(bumper_cfg: dict, key: str, minimum: int) -> t.Any:
+    """
+    Extract the integer setting `key` from the provided `[tool.bumper]` table.
+
+    If the setting is not declared, its default value is returned.
+
+    Raises `BumperConfigError` if the declared value is not an integer of at least `minimum`.
+    """
+    if key not in bumper_cfg:
+        return getattr(DEFAULT_OPTIONS, key)
+
+    value = bumper_cfg[key]
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise BumperConfigError(f"'{key}' must be an integer")
+    if value < minimum:
+        raise BumperConfigError(f"'{key}' must be at least {minimum}")
+
+    return value
+
+
+def _bool_option(bumper_cfg: dict, key: str) -> t.Any:
+    """
+    Extract the boolean setting `key` from the provided `[tool.bumper]` table.
+
+    If the setting is not declared, its default value is returned.
+
+    Raises `BumperConfigError` if the declared value is not a boolean.
+    """
+    if key not in bumper_cfg:
+        return getattr(DEFAULT_OPTIONS, key)
+
+    value = bumper_cfg[key]
+    if not isinstance(value, bool):
+        raise BumperConfigError(f"'{key}' must be a boolean")
+
+    return value
+
+
+def _parse_options(bumper_cfg: dict) -> BumperOptions:
+    """
+    Extract the optional settings from the provided `[tool.bumper]` table.
+
+    Settings not declared by the table fall back to their defaults.
+
+    Raises `BumperConfigError` if a declared setting has an invalid value.
+    """
+    return BumperOptions(
+        stream_threshold=_int_option(bumper_cfg, "stream_threshold", minimum=0),
+        workers=_int_option(bumper_cfg, "workers", minimum=1),
+        use_git_ls_files=_bool_option(bumper_cfg, "use_git_ls_files"),
+        occurrence_index=_bool_option(bumper_cfg, "occurrence_index"),
+        transactional=_bool_option(bumper_cfg, "transactional"),
+        parallel_threshold=_int_option(bumper_cfg, "parallel_threshold", minimum=0),
+    )
 
-PARSED_T: t.TypeAlias = tuple[version.Version, VersioningType, list[BumperFile]]
+
+PARSED_T: t.TypeAlias = tuple[Version, VersioningType, list[BumperFile], BumperOptions]
+
+
+HEADER_KEY_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-. \t")
+
+
+def _table_header(line: str) -> str | None:
+    """
+    Return the normalized key of the table or array of tables declared by `line`, if any.
+
+    Only headers composed of bare keys are recognized; whitespace surrounding the key's dots is
+    removed.
+    """
+    stripped = line.strip()
+    if not stripped.startswith("["):
+        return None
+
+    n_brackets = 2 if stripped.startswith("[[") else 1
+    key, close, trailing = stripped[n_brackets:].partition("]" * n_brackets)
+    trailing = trailing.strip()
+    if not close or (trailing and not trailing.startswith("#")):
+        return None
+    if not HEADER_KEY_CHARS.issuperset(key):
+        return None
+
+    return ".".join(part.strip() for part in key.split("."))
+
+
+def _extract_bumper_tables(raw: str) -> str | None:
+    """
+    Extract the `[tool.bumper]` table & its sub-tables from the provided TOML source.
+
+    The source is scanned line by line for table headers, & only the lines belonging to bumper's
+    tables are retained, so the remainder of the document doesn't need to be parsed.
+
+    `None` is returned if the bumper configuration may be declared in a form that can't be reliably
+    extracted by line, e.g. using multi-line strings, dotted keys, inline tables, or quoted keys.
+    """
+    if '"""' in raw or "'''" in raw:
+        return None
+
+    extracted = []
+    table = ""
+    in_bumper = False
+    for line in raw.splitlines():
+        header = _table_header(line)
+        if header is not None:
+            table = header
+            in_bumper = header == "tool.bumper" or header.startswith("tool.bumper.")
+        elif not in_bumper and "bumper" in line:
+            # Bumper may be configured using keys of the root or tool tables, or a quoted header
+            if table in ("", "tool") or line.lstrip().startswith("["):
+                return None
+
+        if in_bumper:
+            extracted.append(line)
+
+    return "\n".join(extracted)
 
 
 def parse_config(cfg_path: Path) -> PARSED_T:
     """
     Parse the provided configuration file for its relevant information.
 
-    Incoming information relevant to bumper is validated & extracted for downstream use.
+    See `parse_config_text` for details.
     """
     if not cfg_path.exists():
         raise ValueError(f"Configuration file does not exist: '{cfg_path}'")
 
-    with cfg_path.open("rb") as f:
-        loaded = tomllib.load(f)
+    return parse_config_text(cfg_path.read_bytes().decode())
+
+
+def parse_config_text(raw: str) -> PARSED_T:
+    """
+    Parse the provided configuration document for its relevant information.
+
+    Incoming information relevant to bumper is validated & extracted for downstream use. Where
+    possible, only the `[tool.bumper]` tables are parsed, rather than the full document.
+    """
+    # Deferred so that commands not parsing a configuration don't pay for importing it
+    import tomllib
+
+    # Attempt to parse only the bumper tables first, falling back to the full document if they
+    # can't be extracted in isolation
+    loaded = None
+    extracted = _extract_bumper_tables(raw)
+    if extracted is not None:
+        try:
+            loaded = tomllib.loads(extracted)
+            _validate_config(loaded)
+        except (tomllib.TOMLDecodeError, BumperConfigError):
+            loaded = None
+
+    if loaded is None:
+        loaded = tomllib.loads(raw)
+        _validate_config(loaded)
+
+    try:
+        current_version = Version(loaded["tool"]["bumper"]["current_version"])
+    except InvalidVersionError as e:
+        raise BumperConfigError(str(e)) from e
 
-    _validate_config(loaded)
-    current_version = version.parse(loaded["tool"]["bumper"]["current_version"])
     versioning_type = VersioningType(loaded["tool"]["bumper"]["versioning_type"])
     files = [BumperFile.from_toml(**f) for f in loaded["tool"]["bumper"]["files"]]
+    options = _parse_options(loaded["tool"]["bumper"])
+
+    return current_version, versioning_type, files, options
+
 
-    return current_version, versioning_type, files
+def _declares_bumper(cfg_path: Path) -> bool:
+    """Cheaply check whether the provided TOML file may contain a bumper configuration."""
+    return b"tool.bumper" in cfg_path.read_bytes()
+
+
+def discover_configs(root_dir: Path) -> list[Path]:
+    """
+    Locate all bumper configuration files within the provided directory tree.
+
+    The tree is walked once, skipping VCS, cache, & virtual environment directories. Within each
+    directory, configuration priority follows `CONFIG_PRIORITY`; a `pyproject.toml` file is only
+    considered if it appears to declare a `[tool.bumper]` table.
+    """
+    found = []
+    to_visit = [root_dir]
+    while to_visit:
+        current = to_visit.pop()
+        filenames = set()
+        with os.scandir(current) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in DISCOVERY_SKIP_DIRS:
+                        to_visit.append(Path(entry.path))
+                elif entry.is_file():
+                    filenames.add(entry.name)
+
+        for cfg_name in CONFIG_PRIORITY:
+            if cfg_name.name not in filenames:
+                continue
+
+            cfg_path = current / cfg_name.name
+            if cfg_name.name == ".bumper.toml" or _declares_bumper(cfg_path):
+                found.append(cfg_path)
+                break
+
+    return sorted(found)
+
+
+def _config_in(directory: Path) -> Path | None:
+    """
+    Locate the bumper configuration file within the provided directory, if any.
+
+    Configuration priority follows `CONFIG_PRIORITY`; a `pyproject.toml` file is only considered if
+    it appears to declare a `[tool.bumper]` table.
+    """
+    for cfg_name in CONFIG_PRIORITY:
+        cfg_path = directory / cfg_name.name
+        if not cfg_path.is_file():
+            continue
+
+        if cfg_name.name == ".bumper.toml" or _declares_bumper(cfg_path):
+            return cfg_path
+
+    return None
+
+
+class ConfigLocator:
+    """
+    Locate the bumper configuration governing a directory by searching upward from it.
+
+    Starting from the provided directory, each directory is checked for a configuration file
+    following `CONFIG_PRIORITY`, then its parent, until a configuration is found. The search stops
+    at the root of the repository, i.e. the first directory containing `.git`, or at the root of the
+    filesystem.
+
+    The outcome of each search is memoized for every directory it visits, so subsequent searches
+    starting from, or passing through, any of these directories don't need to repeat any file
+    system calls.
+
+    NOTE: Memoized locations are never invalidated; configurations created or removed after a search
+    are not seen by the locator that performed it.
+    """
+
+    def __init__(self) -> None:
+        self._resolved: dict[Path, Path | None] = {}
+
+    def locate(self, start_dir: Path = CD) -> Path | None:
+        """Return the absolute path to the configuration governing `start_dir`, if there is one."""
+        current = Path(os.path.abspath(start_dir))
+        visited: list[Path] = []
+        found = None
+        while True:
+            if current in self._resolved:
+                found = self._resolved[current]
+                break
+
+            visited.append(current)
+            found = _config_in(current)
+            if found is not None or (current / ".git").exists() or current.parent == current:
+                break
+
+            current = current.parent
+
+        for directory in visited:
+            self._resolved[directory] = found
+
+        return found
 
 
 class ExistingConfigError(Exception): ...  # noqa: D101
@@ -113,8 +519,6 @@ file = "./pyproject.toml"
 search = 'version = "{current_version}"'
 """
 
-CD = Path()
-
 
 def write_default_config(
     versioning_type: VersioningType = VersioningType.SEMVER,
@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import typing as t
+from collections import Counter
+
+if t.TYPE_CHECKING:
+    from bumper.replace import RuleMatcher
+    from bumper.scoped import ScopedMatcher
+
+# Line boundaries recognized by str.splitlines, aside from "\r\n" which is handled as "\r" & "\n"
+LINE_BREAKS = ("\n", "\r", "\v", "\f", "\x1c", "\x1d", "\x1e", "\x85", "\u2028", "\u2029")
+
+
+def _count_breaks(text: str, start: int, end: int, breaks: tuple[str, ...]) -> int:
+    """Count the line boundaries within `text[start:end]`, treating `"\\r\\n"` as one boundary."""
+    n_breaks = sum(text.count(c, start, end) for c in breaks)
+    if "\r" in breaks:
+        n_breaks -= text.count("\r\n", start, end)
+
+    return n_breaks
+
+
+def _line_start(text: str, pos: int, breaks: tuple[str, ...]) -> int:
+    """Locate the start of the line containing `text[pos]`."""
+    # Narrow the search using the most common boundary so that it doesn't scan the full text
+    start = text.rfind("\n", 0, pos) + 1
+    return max((text.rfind(c, start, pos) for c in breaks), default=-1) + 1 or start
+
+
+def _line_end(text: str, pos: int, breaks: tuple[str, ...]) -> int:
+    """Locate the end of the line containing `text[pos]`, excluding its line boundary."""
+    end = text.find("\n", pos)
+    if end == -1:
+        end = len(text)
+
+    ends = (text.find(c, pos, end) for c in breaks)
+    return min((e for e in ends if e != -1), default=end)
+
+
+def _break_end(text: str, pos: int) -> int:
+    """Return the offset following the line boundary, if any, starting at `text[pos]`."""
+    if text.startswith("\r\n", pos):
+        return pos + 2
+
+    return min(pos + 1, len(text))
+
+
+def _format_range(start: int, n_lines: int) -> str:
+    """Format a hunk range in the same manner as `difflib.unified_diff`."""
+    if n_lines == 1:
+        return f"{start + 1}"
+    if not n_lines:
+        return f"{start},0"
+
+    return f"{start + 1},{n_lines}"
+
+
+def _count_lines(text: str, line: str, breaks: tuple[str, ...], limit: int) -> int:
+    """
+    Count the lines of `text` equal to the non-empty `line`, stopping once `limit` is exceeded.
+
+    NOTE: `line` is assumed not to contain any line boundaries.
+    """
+    n_lines = 0
+    pos = text.find(line)
+    while pos != -1 and n_lines <= limit:
+        end = pos + len(line)
+        if (pos == 0 or text[pos - 1] in breaks) and (end == len(text) or text[end] in breaks):
+            n_lines += 1
+
+        pos = text.find(line, pos + 1)
+
+    return n_lines
+
+
+# Number of lines inspected for an unpopular line before a gap is assumed to be fully popular
+GAP_PROBES = 8
+
+
+class _Line(t.NamedTuple):
+    start: int  # Offset of the start of the line
+    end: int  # Offset of the end of the line, excluding its line boundary
+    occurrences: list[tuple[int, str, str]]
+
+
+def _splice(text: str, occurrences: list[tuple[int, str, str]], start: int = 0) -> str:
+    """
+    Replace the provided `(offset, found, replacement)` occurrences within `text`.
+
+    Offsets are relative to `start`, which is the offset of `text` within the full text.
+    """
+    chunks = []
+    pos = 0
+    for offset, found, replacement in occurrences:
+        chunks.append(text[pos : offset - start])
+        chunks.append(replacement)
+        pos = offset - start + len(found)
+
+    chunks.append(text[pos:])
+    return "".join(chunks)
+
+
+def _changed_lines(
+    text: str, occurrences: list[tuple[int, str, str]], breaks: tuple[str, ...]
+) -> list[_Line] | None:
+    """
+    Group the provided occurrences by the line containing them.
+
+    Returns `None` if any occurrence may add, remove, or merge a line boundary, i.e. if its search
+    string or replacement is empty or contains a line boundary.
+    """
+    changed: list[_Line] = []
+    for offset, found, replacement in occurrences:
+        if not (found and replacement) or any(c in found or c in replacement for c in LINE_BREAKS):
+            return None
+
+        if changed and changed[-1].end >= offset:
+            changed[-1].occurrences.append((offset, found, replacement))
+        else:
+            start = _line_start(text, offset, breaks)
+            end = _line_end(text, offset + len(found), breaks)
+            changed.append(_Line(start, end, [(offset, found, replacement)]))
+
+    return changed
+
+
+def _has_unpopular_line(
+    text: str, pos: int, stop: int, breaks: tuple[str, ...], limit: int
+) -> bool:
+    """
+    Check whether a line from `text[pos:stop]` occurs no more than `limit` times within `text`.
+
+    The lines are probed using their substring count, which bounds their number of occurrences, so
+    the check is conservative; only the first `GAP_PROBES` lines are inspected.
+    """
+    for _ in range(GAP_PROBES):
+        if pos >= stop:
+            break
+
+        end = _line_end(text, pos, breaks)
+        line = text[pos:end]
+        if line and text.count(line) <= limit:
+            return True
+
+        pos = _break_end(text, end)
+
+    return False
+
+
+def _line_diff(
+    text: str, occurrences: list[tuple[int, str, str]], breaks: tuple[str, ...], fromfile: str
+) -> list[str] | None:
+    """
+    Build the unified diff, with no context lines, of the line-preserving `occurrences` in `text`.
+
+    Every line containing an occurrence is emitted as a removal followed by its replaced
+    counterpart, with consecutive modified lines grouped into one hunk. This is only identical to
+    the output of `difflib` if its matcher aligns each unmodified line with itself, which is
+    guaranteed if:
+        * No occurrence adds, removes, or merges a line boundary
+        * No modified line also occurs as an unmodified line, & no replaced line occurs in `text`
+        * Each run of unmodified lines contains a line that `difflib` doesn't treat as popular,
+          which it only does for texts of at least 200 lines
+
+    Returns `None` if these can't be guaranteed.
+    """
+    changed = _changed_lines(text, occurrences, breaks)
+    if changed is None:
+        return None
+
+    # Line number, old & new contents, & location of each modified line
+    modified: list[tuple[int, str, str, _Line]] = []
+    line_no = pos = 0
+    for line in changed:
+        line_no += _count_breaks(text, pos, line.start, breaks)
+        pos = line.start
+        old = text[line.start : line.end]
+        new = _splice(old, line.occurrences, line.start)
+        if new != old:
+            modified.append((line_no, old, new, line))
+
+    if not modified:
+        return []
+
+    n_old = Counter(old for _, old, _, _ in modified)
+    for _, old, new, _ in modified:
+        if _count_lines(text, new, breaks, 0):
+            return None
+        if _count_lines(text, old, breaks, n_old[old]) > n_old[old]:
+            return None
+
+    n_lines = _count_breaks(text, 0, len(text), breaks) + int(text[-1] not in breaks)
+    if n_lines >= 200:
+        limit = n_lines // 100 + 1
+        prev_no, prev_end = -1, 0
+        for line_no, _, _, line in [*modified, (n_lines, "", "", _Line(len(text), len(text), []))]:
+            if line_no > prev_no + 1 and not _has_unpopular_line(
+                text, prev_end, line.start, breaks, limit
+            ):
+                return None
+
+            prev_no, prev_end = line_no, _break_end(text, line.end)
+
+    lines = [f"--- {fromfile}", "+++ "]
+    group: list[tuple[int, str, str, _Line]] = []
+    for entry in [*modified, None]:
+        if group and (entry is None or entry[0] != group[-1][0] + 1):
+            line_range = _format_range(group[0][0], len(group))
+            lines.append(f"@@ -{line_range} +{line_range} @@")
+            lines.extend(f"-{old}" for _, old, _, _ in group)
+            lines.extend(f"+{new}" for _, _, new, _ in group)
+            group = []
+
+        if entry is not None:
+            group.append(entry)
+
+    return lines
+
+
+def match_diff(
+    text: str, matcher: RuleMatcher[str] | ScopedMatcher, fromfile: str
+) -> tuple[list[str], list[int]]:
+    """
+    Build the unified diff, with no context lines, of applying the matcher's rules to `text`.
+
+    The output is identical to `difflib.unified_diff(..., fromfile=fromfile, n=0, lineterm="")` of
+    the full contents before & after replacement. Rather than diffing the full contents, hunks are
+    built directly from the locations of each match where the alignment of the diff is unambiguous;
+    see `_line_diff`. Aside from locating the matches, counting the line boundaries preceding each
+    modified line, & searching the text for each modified line, the cost of building the diff is
+    proportional to the number of modified lines rather than the size of the text.
+
+    NOTE: If a rule adds or removes line breaks, or a modified line is otherwise ambiguous, e.g. if
+    it's replaced by a line that also occurs elsewhere in the text, the full contents are diffed
+    using `difflib`.
+
+    Returns the diff's lines, which are empty if no modifications are made, along with a list of
+    per-rule hit counts, in the order the rules were provided.
+    """
+    hits = [0] * matcher.n_rules
+    occurrences = [
+        (offset, found, replacement)
+        for offset, found, replacement in matcher.locate(text, hits)
+        if replacement != found
+    ]
+    if not occurrences:
+        return [], hits
+
+    breaks = tuple(c for c in LINE_BREAKS if c in text)
+    lines = _line_diff(text, occurrences, breaks, fromfile)
+    if lines is None:
+        import difflib
+
+        new = _splice(text, occurrences)
+        lines = list(
+            difflib.unified_diff(
+                text.splitlines(), new.splitlines(), fromfile=fromfile, n=0, lineterm=""
+            )
+        )
+
+    return lines, hits
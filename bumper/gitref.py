@@ -0,0 +1,365 @@
+import posixpath
+import subprocess
+import time
+import typing as t
+from collections import defaultdict
+from pathlib import Path
+
+from bumper import CONFIG_PRIORITY
+from bumper.bump import (
+    BumpError,
+    BumpResult,
+    BumpType,
+    FileResult,
+    build_new_version,
+    bump_type_mismatch,
+)
+from bumper.config import (
+    BumperConfigError,
+    BumperFile,
+    CONFIG_SEARCH,
+    PARSED_T,
+    parse_config_text,
+)
+from bumper.targets import (
+    PROBE_SIZE,
+    SEARCH_OPTIONS_T,
+    contents_diff,
+    declare_rule,
+    file_labels,
+    is_gzip,
+    render_rules,
+    replace_contents,
+    requires_scope,
+    scoped_rules,
+    sniff_format,
+    split_member,
+    text_matcher,
+)
+from bumper.walk import compile_glob, has_magic
+
+if t.TYPE_CHECKING:
+    from bumper.scoped import ScopedRule
+
+
+class GitRefError(Exception): ...  # noqa: D101
+
+
+class TreeEntry(t.NamedTuple):  # noqa: D101
+    mode: str
+    type: str
+    sha: str
+
+
+class RefBumpResult(t.NamedTuple):
+    """
+    Outcome of bumping a project at a git ref.
+
+    `commit` is the hash of the created commit, which is `None` for dry runs or if no files were
+    changed or any file could not be bumped. `ref` is the fully qualified ref that was updated to
+    point to `commit`, if any.
+    """
+
+    result: BumpResult
+    commit: str | None = None
+    ref: str | None = None
+
+
+def _git(repo: Path, *args: str, stdin: bytes | None = None) -> bytes:
+    """Run the provided git command within `repo`, raising `GitRefError` if it fails."""
+    try:
+        proc = subprocess.run(
+            ["git", *args], cwd=repo, input=stdin, capture_output=True, check=True
+        )
+    except OSError as e:
+        raise GitRefError(f"Could not run git: {e}") from e
+    except subprocess.CalledProcessError as e:
+        message = e.stderr.decode(errors="replace").strip()
+        raise GitRefError(message or f"'git {args[0]}' failed") from e
+
+    return proc.stdout
+
+
+def _ls_tree(
+    repo: Path, treeish: str, paths: list[str] | None = None, recursive: bool = False
+) -> dict[str, TreeEntry]:
+    """List the entries of the provided tree, optionally limited to the provided `paths`."""
+    args = ["ls-tree", "-z", *(("-r",) if recursive else ()), treeish]
+    if paths is not None:
+        if not paths:
+            return {}
+        args.extend(("--", *paths))
+
+    entries = {}
+    for record in _git(repo, *args).decode().split("\0"):
+        if not record:
+            continue
+
+        meta, _, path = record.partition("\t")
+        mode, obj_type, sha = meta.split()
+        entries[path] = TreeEntry(mode, obj_type, sha)
+
+    return entries
+
+
+def _read_blobs(repo: Path, shas: t.Iterable[str]) -> dict[str, bytes]:
+    """Read the contents of the provided blobs using a single `git cat-file --batch` invocation."""
+    shas = list(dict.fromkeys(shas))
+    if not shas:
+        return {}
+
+    out = _git(repo, "cat-file", "--batch", stdin="".join(f"{sha}\n" for sha in shas).encode())
+
+    blobs = {}
+    pos = 0
+    for sha in shas:
+        header_end = out.index(b"\n", pos)
+        header = out[pos:header_end].split()
+        if header[-1] == b"missing":
+            raise GitRefError(f"Object could not be read: '{sha}'")
+
+        start = header_end + 1
+        size = int(header[2])
+        blobs[sha] = out[start : start + size]
+        pos = start + size + 1  # Contents are followed by a line feed
+
+    return blobs
+
+
+def _write_tree(repo: Path, tree_sha: str, changes: dict[str, str]) -> str:
+    """
+    Write a copy of the provided tree with the blobs of the changed paths replaced.
+
+    `changes` maps each changed path, relative to the tree, to its new blob. Only the trees along
+    the changed paths are listed & rewritten; the modes of all entries are preserved.
+    """
+    direct = {}
+    nested: dict[str, dict[str, str]] = defaultdict(dict)
+    for path, sha in changes.items():
+        head, sep, rest = path.partition("/")
+        if sep:
+            nested[head][rest] = sha
+        else:
+            direct[head] = sha
+
+    records = []
+    for name, entry in _ls_tree(repo, tree_sha).items():
+        sha = entry.sha
+        if name in direct:
+            sha = direct[name]
+        elif name in nested:
+            sha = _write_tree(repo, entry.sha, nested[name])
+
+        records.append(f"{entry.mode} {entry.type} {sha}\t{name}\0")
+
+    return _git(repo, "mktree", "-z", stdin="".join(records).encode()).decode().strip()
+
+
+def _read_config(repo: Path, commit: str) -> tuple[str, PARSED_T]:
+    """
+    Locate & parse the bumper configuration at the root of the provided commit's tree.
+
+    Configuration priority follows `CONFIG_PRIORITY`; a `pyproject.toml` file is only considered if
+    it appears to declare a `[tool.bumper]` table.
+    """
+    candidates = [cfg.as_posix() for cfg in CONFIG_PRIORITY]
+    entries = _ls_tree(repo, commit, candidates)
+    for cfg in candidates:
+        entry = entries.get(cfg)
+        if entry is None or entry.type != "blob":
+            continue
+
+        raw = _read_blobs(repo, [entry.sha])[entry.sha].decode()
+        if cfg == ".bumper.toml" or "tool.bumper" in raw:
+            return cfg, parse_config_text(raw)
+
+    raise GitRefError(f"Configuration file could not be located at '{commit}'.")
+
+
+def _target_rules(
+    repo: Path, commit: str, files: list[BumperFile]
+) -> tuple[dict[str, list[str]], dict[str, str], dict[str, SEARCH_OPTIONS_T]]:
+    """
+    Consolidate bump specifications per target path, relative to the root of the commit's tree.
+
+    Any `file` containing glob wildcards is expanded into the matching blobs of the commit's tree.
+    The encoding declared for each target path, if any, & the search options of its rules are
+    returned alongside its rules.
+
+    Raises `BumperConfigError` if a glob pattern doesn't match any blobs, or different encodings are
+    declared for the same path.
+    """
+    tracked: list[str] = []
+    if any(has_magic(b.file.as_posix()) for b in files):
+        listed = _ls_tree(repo, commit, recursive=True)
+        tracked = sorted(p for p, entry in listed.items() if entry.type == "blob")
+
+    file_operations: dict[str, list[str]] = defaultdict(list)
+    encodings: dict[str, str] = {}
+    search_options: dict[str, SEARCH_OPTIONS_T] = defaultdict(list)
+    for b in files:
+        pattern = b.file.as_posix()
+        if has_magic(pattern):
+            regex = compile_glob(pattern.removeprefix("./"))
+            targets = [p for p in tracked if regex.match(p)]
+            if not targets:
+                raise BumperConfigError(f"No files match the pattern '{pattern}'")
+        else:
+            targets = [posixpath.normpath(pattern)]
+
+        for target in targets:
+            declare_rule(file_operations[target], search_options[target], b)
+            if b.encoding is not None:
+                if encodings.setdefault(target, b.encoding) != b.encoding:
+                    raise BumperConfigError(f"Conflicting encodings declared for '{target}'")
+
+    return file_operations, encodings, search_options
+
+
+def _bump_blob(
+    path: str,
+    label: str,
+    rules: list[str],
+    replacements: list[tuple[str, str]],
+    entry: TreeEntry | None,
+    blobs: dict[str, bytes],
+    dry_run: bool,
+    encoding: str | None = None,
+    scoped: "list[ScopedRule] | None" = None,
+) -> tuple[FileResult, bytes | None]:
+    """
+    Apply the rendered replacements to the target blob in memory.
+
+    As for files in the working tree, blobs are processed as raw bytes unless a non-UTF-8 encoding
+    is declared or detected from the blob's BOM, & binary blobs are skipped. Archive members & gzip
+    compressed target files aren't supported.
+
+    Returns the file's result along with its new contents, which are `None` if the blob is unchanged
+    or if this is a dry run. Any exception raised while processing the blob is captured by the
+    result rather than raised.
+    """
+    start = time.perf_counter()
+    target_file = Path(path)
+    try:
+        if split_member(target_file) is not None or is_gzip(target_file):
+            raise GitRefError(f"Compressed target files can't be bumped within a git ref: '{path}'")
+        if entry is None:
+            raise GitRefError(f"File does not exist in the tree: '{path}'")
+        if entry.type != "blob":
+            raise GitRefError(f"Not a file: '{path}'")
+
+        old = blobs[entry.sha]
+        fmt = sniff_format(old[:PROBE_SIZE], encoding)
+        if fmt is None:
+            result = FileResult(
+                target_file, label, rules, [0] * len(rules), changed=False, binary=True
+            )
+            return result._replace(elapsed=time.perf_counter() - start), None
+
+        if dry_run:
+            matcher = text_matcher(replacements, scoped, fmt)
+            diff, hits = contents_diff(old, matcher, fmt, label)
+            result = FileResult(
+                target_file, label, rules, hits, changed=diff is not None, diff=diff
+            )
+            return result._replace(elapsed=time.perf_counter() - start), None
+
+        new, hits = replace_contents(old, replacements, fmt, scoped)
+        if new == old:
+            result = FileResult(target_file, label, rules, hits, changed=False)
+            return result._replace(elapsed=time.perf_counter() - start), None
+
+        result = FileResult(target_file, label, rules, hits, changed=True, bytes_written=len(new))
+        return result._replace(elapsed=time.perf_counter() - start), new
+    except Exception as e:
+        result = FileResult(target_file, label, rules, [0] * len(rules), changed=False, error=e)
+        return result._replace(elapsed=time.perf_counter() - start), None
+
+
+def bump_ref(
+    repo: Path,
+    ref: str,
+    bump_type: BumpType,
+    dry_run: bool = False,
+    message: str | None = None,
+    update_ref: bool = True,
+) -> RefBumpResult:
+    """
+    Bump the project configured at the root of `ref`'s tree without using a working tree.
+
+    The configuration & each target file are read from the commit's tree using git plumbing, so
+    `repo` may be a bare repository & only the target files are read. Replacements are applied in
+    memory, then the changed blobs are written along with only the trees containing them & a new
+    commit whose parent is `ref`'s commit. If `ref` names a branch & `update_ref` is `True`, the
+    branch is updated to point to the new commit, provided it hasn't moved in the meantime.
+
+    Target file paths, including glob patterns, are resolved relative to the root of the tree. Line
+    endings are preserved as committed.
+
+    If any target file can't be bumped, no commit is created. No feedback is printed.
+
+    Raises `GitRefError` if `ref` can't be resolved or any git command fails, `BumperConfigError` if
+    the configuration is invalid, or `BumpError` if `bump_type` is not valid for the project's
+    versioning type.
+
+    NOTE: If `ref` is the branch checked out by a non-bare repository, its working tree is left
+    untouched & will therefore appear to revert the bump until it is updated.
+    """
+    start = time.perf_counter()
+    commit = _git(repo, "rev-parse", "--verify", f"{ref}^{{commit}}").decode().strip()
+
+    cfg_path, (current_version, versioning_type, files, _) = _read_config(repo, commit)
+    mismatch = bump_type_mismatch(versioning_type, bump_type)
+    if mismatch is not None:
+        raise BumpError(mismatch)
+
+    next_version = build_new_version(current_version, bump_type)
+    file_operations, encodings, search_options = _target_rules(
+        repo, commit, [*files, BumperFile(file=Path(cfg_path), search=CONFIG_SEARCH)]
+    )
+
+    # Paths outside of the repository can't be listed, so they're reported as missing
+    in_tree = [p for p in file_operations if not (p.startswith("../") or p.startswith("/"))]
+    entries = _ls_tree(repo, commit, in_tree)
+    blobs = _read_blobs(repo, (e.sha for e in entries.values() if e.type == "blob"))
+
+    labels = file_labels(Path(p) for p in file_operations)
+    results = []
+    changes = {}
+    for path, rules in file_operations.items():
+        replacements = render_rules(rules, current_version, next_version)
+        scoped = scoped_rules(
+            rules, search_options[path], current_version, next_version, Path(path)
+        )
+        result, new = _bump_blob(
+            path,
+            labels[Path(path)],
+            rules,
+            replacements,
+            entries.get(path),
+            blobs,
+            dry_run,
+            encoding=encodings.get(path),
+            scoped=scoped if requires_scope(scoped) else None,
+        )
+        results.append(result)
+        if new is not None:
+            changes[path] = _git(repo, "hash-object", "-w", "--stdin", stdin=new).decode().strip()
+
+    bump_result = BumpResult(current_version, next_version, results)
+    if dry_run or not changes or not bump_result.ok:
+        return RefBumpResult(bump_result._replace(elapsed=time.perf_counter() - start))
+
+    message = message or f"Bump version: {current_version} -> {next_version}"
+    tree = _write_tree(repo, f"{commit}^{{tree}}", changes)
+    new_commit = _git(repo, "commit-tree", tree, "-p", commit, "-m", message).decode().strip()
+
+    updated = None
+    if update_ref:
+        full_ref = _git(repo, "rev-parse", "--symbolic-full-name", ref).decode().strip()
+        if full_ref.startswith("refs/heads/"):
+            _git(repo, "update-ref", "-m", message, full_ref, new_commit, commit)
+            updated = full_ref
+
+    bump_result = bump_result._replace(elapsed=time.perf_counter() - start)
+    return RefBumpResult(bump_result, commit=new_commit, ref=updated)
@@ -0,0 +1,344 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import typing as t
+from pathlib import Path
+
+from bumper import CACHE_DIR
+from bumper.cache import read_cache, write_cache
+from bumper.replace import RuleMatcher
+
+INDEX_FILENAME = "index.json"
+
+
+class FileEntry(t.NamedTuple):
+    """
+    Indexed state of a single target file.
+
+    Rather than indexing the search strings themselves, which change with every bump, the index
+    records the offsets of each rule's anchor: the literal text preceding its `{current_version}`
+    tag. Every occurrence of a rendered search string begins with an occurrence of its anchor, and
+    bumping a version never moves an anchor relative to the text preceding it, so the anchor offsets
+    can be carried forward from one bump to the next without rescanning the file.
+    """
+
+    size: int
+    mtime_ns: int
+    sha256: str | None
+    anchors: dict[str, list[int]]
+
+    def to_json(self) -> dict[str, t.Any]:  # noqa: D102
+        return self._asdict()
+
+    @classmethod
+    def from_json(cls, raw: dict[str, t.Any]) -> FileEntry:  # noqa: D102
+        return cls(
+            size=raw["size"],
+            mtime_ns=raw["mtime_ns"],
+            sha256=raw["sha256"],
+            anchors={a: list(offsets) for a, offsets in raw["anchors"].items()},
+        )
+
+
+class OccurrenceIndex:
+    """
+    On-disk index of rule anchor offsets within each target file, keyed by absolute path.
+
+    The index is stored as JSON in `cache_dir`, which is created along with a `.gitignore` on first
+    save if it does not already exist. A missing, unreadable, or outdated index is treated as empty.
+    """
+
+    def __init__(self, cache_dir: Path = CACHE_DIR) -> None:
+        self.cache_dir = cache_dir
+        self.entries: dict[str, FileEntry] = {}
+
+    @classmethod
+    def load(cls, cache_dir: Path = CACHE_DIR) -> OccurrenceIndex:  # noqa: D102
+        index = cls(cache_dir)
+        for key, raw in read_cache(cache_dir, INDEX_FILENAME).items():
+            try:
+                index.entries[key] = FileEntry.from_json(raw)
+            except (KeyError, TypeError, AttributeError):
+                continue
+
+        return index
+
+    def get(self, target_file: Path) -> FileEntry | None:  # noqa: D102
+        return self.entries.get(os.path.abspath(target_file))
+
+    def update(self, target_file: Path, entry: FileEntry | None) -> None:
+        """Record the provided entry for `target_file`; an entry of `None` evicts the file."""
+        key = os.path.abspath(target_file)
+        if entry is None:
+            self.entries.pop(key, None)
+        else:
+            self.entries[key] = entry
+
+    def save(self) -> None:
+        """Atomically write the index to disk."""
+        write_cache(
+            self.cache_dir, INDEX_FILENAME, {k: v.to_json() for k, v in self.entries.items()}
+        )
+
+
+def rule_anchor(rule: str) -> str:
+    """Return the literal text preceding the rule's `{current_version}` tag, if present."""
+    return rule.partition("{current_version}")[0]
+
+
+def _find_all(data: bytes, anchor: bytes) -> list[int]:
+    """Locate every, possibly overlapping, occurrence of `anchor` within `data`."""
+    offsets = []
+    pos = data.find(anchor)
+    while pos != -1:
+        offsets.append(pos)
+        pos = data.find(anchor, pos + 1)
+
+    return offsets
+
+
+def _is_fresh(target_file: Path, entry: FileEntry | None) -> bool:
+    """
+    Check whether the indexed entry still describes the current contents of `target_file`.
+
+    The entry is considered fresh if the file's size & modification time are unchanged. If only the
+    modification time differs, the file's content hash is compared with the indexed hash instead.
+    """
+    if entry is None:
+        return False
+
+    st = target_file.stat()
+    if st.st_size != entry.size:
+        return False
+    if st.st_mtime_ns == entry.mtime_ns:
+        return True
+    if entry.sha256 is None:
+        return False
+
+    return hashlib.sha256(target_file.read_bytes()).hexdigest() == entry.sha256
+
+
+def _resolve_overlaps(occurrences: list[tuple[int, bytes]]) -> list[tuple[int, bytes]]:
+    """
+    Drop any occurrences overlapping a preceding occurrence.
+
+    Occurrences at the same offset are resolved in favor of the longest, matching the behavior of a
+    full scan.
+    """
+    resolved: list[tuple[int, bytes]] = []
+    end = 0
+    for offset, found in sorted(occurrences, key=lambda o: (o[0], -len(o[1]))):
+        if offset >= end:
+            resolved.append((offset, found))
+            end = offset + len(found)
+
+    return resolved
+
+
+def _indexed_occurrences(
+    target_file: Path, matcher: RuleMatcher[bytes], anchors: dict[bytes, bytes], entry: FileEntry
+) -> list[tuple[int, bytes]] | None:
+    """
+    Locate occurrences of each search string by checking only the indexed anchor offsets.
+
+    `anchors` maps each search string to its rule's anchor. `None` is returned if any of the anchors
+    have not been indexed.
+    """
+    occurrences = []
+    with target_file.open("rb") as f:
+        for search in matcher.searches:
+            offsets = entry.anchors.get(anchors[search].decode())
+            if offsets is None:
+                return None
+
+            for offset in offsets:
+                f.seek(offset)
+                if f.read(len(search)) == search:
+                    occurrences.append((offset, search))
+
+    return _resolve_overlaps(occurrences)
+
+
+def _modified_region(found: bytes, replacement: bytes) -> tuple[int, int, int]:
+    """
+    Locate the portion of `found` modified by its `replacement`.
+
+    Returns the length of the common prefix, the length of the common suffix not overlapping the
+    prefix, and the length of the modified portion of `replacement`.
+    """
+    prefix_len = 0
+    for x, y in zip(found, replacement, strict=False):
+        if x != y:
+            break
+        prefix_len += 1
+
+    max_suffix = min(len(found), len(replacement)) - prefix_len
+    suffix_len = 0
+    while suffix_len < max_suffix and found[-1 - suffix_len] == replacement[-1 - suffix_len]:
+        suffix_len += 1
+
+    return prefix_len, suffix_len, len(replacement) - prefix_len - suffix_len
+
+
+def _read_windows(
+    target_file: Path, data: bytes | None, windows: list[tuple[int, int]]
+) -> list[bytes]:
+    """Read each `(start, stop)` window of the file's contents, slicing `data` if it's been read."""
+    if data is not None:
+        return [data[start:stop] for start, stop in windows]
+
+    chunks = []
+    with target_file.open("rb") as f:
+        for start, stop in windows:
+            f.seek(start)
+            chunks.append(f.read(stop - start))
+
+    return chunks
+
+
+def _shift_anchors(
+    anchor_offsets: dict[str, list[int]],
+    occurrences: list[tuple[int, bytes]],
+    matcher: RuleMatcher[bytes],
+    target_file: Path,
+    new_data: bytes | None,
+) -> dict[str, list[int]] | None:
+    """
+    Carry the provided anchor offsets forward past the replacement of `occurrences`.
+
+    Any anchor introduced by a replacement must overlap the modified portion of the replaced
+    occurrence, or straddle it if nothing was inserted, so only the bumped contents surrounding each
+    modified portion are searched for new anchors. These are read from `target_file`, unless the
+    bumped contents are provided by `new_data`.
+
+    `None` is returned if any anchor overlaps the modified portion of a replaced occurrence, or if
+    an anchor was introduced by a replacement, as the anchor positions then can't be determined
+    without rescanning the file.
+    """
+    # Build the modified region, before & after replacement, & the cumulative size change preceding
+    # each replaced occurrence
+    spans = []
+    delta = 0
+    for offset, found in occurrences:
+        replacement = matcher.replacement(found)
+        if replacement == found:
+            continue
+
+        prefix_len, suffix_len, n_inserted = _modified_region(found, replacement)
+        new_start = offset + prefix_len + delta
+        spans.append(
+            (offset + prefix_len, offset + len(found) - suffix_len, delta, new_start, n_inserted)
+        )
+        delta += len(replacement) - len(found)
+
+    anchors_b = {anchor: anchor.encode() for anchor in anchor_offsets}
+    max_len = max(map(len, anchors_b.values()), default=0)
+    windows = [
+        (max(new_start - max_len + 1, 0), new_start + n_inserted + max_len - 1)
+        for _, _, _, new_start, n_inserted in spans
+    ]
+    contents = _read_windows(target_file, new_data, windows)
+
+    shifted: dict[str, list[int]] = {}
+    for anchor, offsets in anchor_offsets.items():
+        anchor_b = anchors_b[anchor]
+        for (window_start, _), window, (*_, new_start, n_inserted) in zip(
+            windows, contents, spans, strict=True
+        ):
+            # Any occurrence wholly within this portion of the window overlaps the modified portion
+            lo = max(new_start - len(anchor_b) + 1 - window_start, 0)
+            hi = new_start + n_inserted + len(anchor_b) - 1 - window_start
+            if window.find(anchor_b, lo, hi) != -1:
+                return None
+
+        new_offsets = []
+        span_idx = 0
+        for offset in offsets:
+            while span_idx < len(spans) and spans[span_idx][1] <= offset:
+                span_idx += 1
+
+            if span_idx == len(spans):
+                new_offsets.append(offset + delta)
+                continue
+
+            modified_start, _, span_delta, *_ = spans[span_idx]
+            if offset + len(anchor_b) > modified_start:
+                return None
+            new_offsets.append(offset + span_delta)
+
+        shifted[anchor] = new_offsets
+
+    return shifted
+
+
+def bump_indexed(
+    target_file: Path,
+    rules: list[str],
+    replacements: list[tuple[bytes, bytes]],
+    entry: FileEntry | None,
+) -> tuple[list[int], FileEntry | None]:
+    """
+    Bump `target_file`, using the provided index entry to avoid a full scan where possible.
+
+    `replacements` must contain the UTF-8 encoded rendering of each of the `rules`, in the same
+    order.
+
+    If the entry is fresh & indexes the anchors of all of the `rules`, only the indexed anchor
+    offsets are inspected. Otherwise, the file is scanned in full & its anchors are re-indexed. If
+    every replacement is of equal length to its search string, matches are overwritten in place;
+    otherwise, the file is rewritten.
+
+    Returns a list of per-rule hit counts & the refreshed entry describing the bumped file, which is
+    `None` if the file could not be indexed.
+    """
+    matcher = RuleMatcher(replacements)
+
+    # Map each search string back to its rule's anchor
+    anchors: dict[bytes, bytes] = {}
+    for rule, (search, _) in zip(rules, replacements, strict=True):
+        if search:
+            anchors.setdefault(search, rule_anchor(rule).encode())
+
+    data = None
+    occurrences = None
+    anchor_offsets: dict[str, list[int]] | None = None
+    if _is_fresh(target_file, entry):
+        assert entry is not None
+        occurrences = _indexed_occurrences(target_file, matcher, anchors, entry)
+        anchor_offsets = entry.anchors
+
+    if occurrences is None:
+        data = target_file.read_bytes()
+        occurrences = [(m.start(), m.group()) for m in matcher.finditer(data)]
+        anchor_offsets = {a.decode(): _find_all(data, a) for a in set(anchors.values()) if a}
+
+    hits = [0] * matcher.n_rules
+    for _, found in occurrences:
+        matcher.credit(found, hits)
+
+    new_data = data
+    if matcher.changes(hits):
+        if all(len(matcher.replacement(s)) == len(s) for s in matcher.searches):
+            with target_file.open("r+b") as f:
+                for offset, found in occurrences:
+                    f.seek(offset)
+                    f.write(matcher.replacement(found))
+            new_data = None if data is None else matcher.splice(data, occurrences)
+        else:
+            if data is None:
+                data = target_file.read_bytes()
+            new_data = matcher.splice(data, occurrences)
+            target_file.write_bytes(new_data)
+
+    # Rules without an anchor can't be located without a full scan
+    if anchor_offsets is None or not all(anchors.values()):
+        return hits, None
+
+    shifted = _shift_anchors(anchor_offsets, occurrences, matcher, target_file, new_data)
+    if shifted is None:
+        return hits, None
+
+    st = target_file.stat()
+    sha256 = hashlib.sha256(new_data).hexdigest() if new_data is not None else None
+    return hits, FileEntry(st.st_size, st.st_mtime_ns, sha256, shifted)
@@ -0,0 +1,379 @@
+from __future__ import annotations
+
+import re
+import typing as t
+from enum import StrEnum
+from pathlib import Path
+
+# Parts of a key path are separated by dots, & may be quoted if they contain dots or whitespace
+_PATH_PART_RE = re.compile(r"""[ \t]*(?:"((?:[^"\\]|\\.)*)"|'([^']*)'|([^\s."']+))[ \t]*""")
+_ESCAPE_RE = re.compile(r"\\(.)")
+
+_JSON_TOKEN_RE = re.compile(r'\s*(?:("(?:[^"\\]|\\.)*")|([{}\[\]:,])|([^\s{}\[\]:,"]+))')
+_JSON_SKIP_RE = re.compile(r'"(?:[^"\\]|\\.)*"?|[{}\[\]]')
+
+_TOML_KEY_RE = re.compile(r"""[ \t]*(?:"((?:[^"\\\n]|\\.)*)"|'([^'\n]*)'|([A-Za-z0-9_-]+))[ \t]*""")
+_TOML_SPACE_RE = re.compile(r"(?:\s|#[^\n]*)*")
+_TOML_VALUE_RES = {
+    '"""': re.compile(r'"""(?:[^\\]|\\.)*?"{3,5}', re.DOTALL),
+    "'''": re.compile(r"'''.*?'{3,5}", re.DOTALL),
+    '"': re.compile(r'"(?:[^"\\\n]|\\.)*"'),
+    "'": re.compile(r"'[^'\n]*'"),
+}
+_TOML_SKIP_RE = re.compile(
+    r"""'''.*?'''|'[^'\n]*'|"(?:[^"\\\n]|\\.)*"|#[^\n]*|[\[\]{}]""", re.DOTALL
+)
+
+_YAML_KEY_RE = re.compile(
+    r"""(?:"((?:[^"\\]|\\.)*)"|'((?:[^']|'')*)'|((?:[^\s#'"{}\[\],:?|>-]|-(?=\S))[^\n]*?))"""
+    r"[ \t]*:(?:[ \t]+|$)"
+)
+_YAML_QUOTED_RES = {'"': re.compile(r'"(?:[^"\\]|\\.)*"'), "'": re.compile(r"'(?:[^']|'')*'")}
+_YAML_COMMENT_RE = re.compile(r"[ \t]+#")
+
+_SPAN_T: t.TypeAlias = tuple[int, int]
+
+
+class Syntax(StrEnum):  # noqa: D101
+    JSON = "json"
+    TOML = "toml"
+    YAML = "yaml"
+
+
+SUFFIX_SYNTAX = {
+    ".json": Syntax.JSON,
+    ".toml": Syntax.TOML,
+    ".yaml": Syntax.YAML,
+    ".yml": Syntax.YAML,
+}
+
+
+def _unescape(quoted: str) -> str:
+    return _ESCAPE_RE.sub(r"\1", quoted)
+
+
+def split_key(key: str) -> tuple[str, ...]:
+    """
+    Split the provided key path into its parts, e.g. `tool.poetry.version`.
+
+    Parts containing dots or whitespace may be quoted, e.g. `dependencies."@scope/pkg".version`.
+
+    Raises `ValueError` if the key path is malformed.
+    """
+    parts = []
+    pos = 0
+    while True:
+        match = _PATH_PART_RE.match(key, pos)
+        if match is None:
+            raise ValueError(f"Invalid key path: '{key}'")
+
+        basic, literal, bare = match.groups()
+        parts.append(_unescape(basic) if basic is not None else literal or bare or "")
+        pos = match.end()
+        if pos == len(key):
+            return tuple(parts)
+
+        if key[pos] != ".":
+            raise ValueError(f"Invalid key path: '{key}'")
+        pos += 1
+
+
+def target_syntax(target_file: Path) -> Syntax | None:
+    """
+    Determine the syntax of the provided target file from its suffix, if it's a structured file.
+
+    The suffix of a gzip compressed file's decompressed contents is used, e.g. `package.json.gz`.
+    """
+    name = target_file.as_posix().removesuffix(".gz")
+    return SUFFIX_SYNTAX.get(Path(name).suffix.lower())
+
+
+def _skip_json(text: str, pos: int) -> int | None:
+    """Locate the end of the JSON object or array starting at `pos`, if `text` contains it."""
+    depth = 0
+    for match in _JSON_SKIP_RE.finditer(text, pos):
+        token = match.group()
+        if token in "{[":
+            depth += 1
+        elif token in "}]":
+            depth -= 1
+            if not depth:
+                return match.end()
+
+    return None
+
+
+def _locate_json(text: str, parts: tuple[str, ...]) -> _SPAN_T | None:
+    """
+    Locate the span of the JSON value at the provided key path.
+
+    Objects & arrays that can't contain the key path are skipped over without being tokenized.
+    Elements of arrays can't be addressed by a key path. The first occurrence of a duplicated key
+    wins.
+    """
+    # Each open container is recorded along with whether it's an object & the key path leading to it
+    containers: list[tuple[bool, tuple[str | None, ...]]] = []
+    expect_key = False
+    key: str | None = None
+    pos = 0
+    while True:
+        match = _JSON_TOKEN_RE.match(text, pos)
+        if match is None:
+            return None
+
+        pos = match.end()
+        string, punct, scalar = match.groups()
+        start = match.start(t.cast(int, match.lastindex))
+        if punct in (",", ":"):
+            expect_key = punct == "," and containers[-1][0]
+            continue
+
+        if punct in ("}", "]"):
+            containers.pop()
+            if not containers:
+                return None
+            continue
+
+        if expect_key:
+            key = None if string is None else _unescape(string[1:-1])
+            expect_key = False
+            continue
+
+        path: tuple[str | None, ...] = ()
+        if containers:
+            is_object, parent = containers[-1]
+            path = (*parent, key if is_object else None)
+
+        if punct is not None:
+            if path == parts:
+                end = _skip_json(text, start)
+                return None if end is None else (start, end)
+
+            if parts[: len(path)] == path:
+                containers.append((punct == "{", path))
+                expect_key = punct == "{"
+                continue
+
+            skipped = _skip_json(text, start)
+            if skipped is None:
+                return None
+            pos = skipped
+            continue
+
+        if path == parts:
+            # A trailing scalar may have been truncated
+            if scalar is not None and pos == len(text):
+                return None
+            return start, pos
+
+
+def _toml_key(text: str, pos: int) -> tuple[tuple[str, ...], int] | None:
+    """Parse the dotted TOML key starting at `pos`, returning its parts & the following offset."""
+    keys = []
+    while True:
+        match = _TOML_KEY_RE.match(text, pos)
+        if match is None:
+            return None
+
+        basic, literal, bare = match.groups()
+        keys.append(_unescape(basic) if basic is not None else literal or bare or "")
+        pos = match.end()
+        if not text.startswith(".", pos):
+            return tuple(keys), pos
+        pos += 1
+
+
+def _toml_value_end(text: str, pos: int) -> int | None:
+    """Locate the end of the TOML value starting at `pos`, if `text` contains it."""
+    for opener in ('"""', "'''", '"', "'"):
+        if text.startswith(opener, pos):
+            match = _TOML_VALUE_RES[opener].match(text, pos)
+            return None if match is None else match.end()
+
+    if text.startswith(("[", "{"), pos):
+        depth = 0
+        for match in _TOML_SKIP_RE.finditer(text, pos):
+            token = match.group()
+            if token in "[{":
+                depth += 1
+            elif token in "]}":
+                depth -= 1
+                if not depth:
+                    return match.end()
+
+        return None
+
+    # Anything else is a scalar that extends up to a comment or the end of the line
+    line_end = text.find("\n", pos)
+    if line_end == -1:
+        line_end = len(text)
+    end = pos + len(text[pos:line_end].partition("#")[0].rstrip())
+    return end if end > pos else None
+
+
+def _locate_toml(text: str, parts: tuple[str, ...]) -> _SPAN_T | None:
+    """
+    Locate the span of the TOML value at the provided key path.
+
+    Key paths are resolved through table headers & dotted keys, but not into inline tables. Values
+    within arrays of tables can't be addressed by a key path.
+    """
+    table: tuple[str, ...] | None = ()
+    pos = 0
+    while True:
+        pos = t.cast(re.Match, _TOML_SPACE_RE.match(text, pos)).end()
+        if pos == len(text):
+            return None
+
+        if text.startswith("[[", pos):
+            table = None
+        elif text.startswith("[", pos):
+            header = _toml_key(text, pos + 1)
+            if header is None or not text.startswith("]", header[1]):
+                return None
+            table, pos = header[0], header[1] + 1
+        else:
+            parsed = _toml_key(text, pos)
+            if parsed is None or not text.startswith("=", parsed[1]):
+                return None
+
+            keys, pos = parsed
+            pos += 1
+            pos += len(text[pos:]) - len(text[pos:].lstrip(" \t"))
+            end = _toml_value_end(text, pos)
+            if end is None:
+                return None
+            if table is not None and (*table, *keys) == parts:
+                return pos, end
+            pos = end
+
+        line_end = text.find("\n", pos)
+        if line_end == -1:
+            return None
+        pos = line_end + 1
+
+
+def _yaml_value_len(value: str) -> int | None:
+    """Measure the YAML scalar at the start of `value`, excluding any trailing comment."""
+    if value[:1] in _YAML_QUOTED_RES:
+        match = _YAML_QUOTED_RES[value[:1]].match(value)
+        return None if match is None else match.end()
+
+    comment = _YAML_COMMENT_RE.search(value)
+    return len(value[: comment.start() if comment else None].rstrip())
+
+
+def _locate_yaml(text: str, parts: tuple[str, ...]) -> _SPAN_T | None:
+    """
+    Locate the span of the scalar YAML value at the provided key path, within the first document.
+
+    Key paths are resolved through block mappings, determined by indentation. Sequences, flow
+    collections, & block scalars can't be addressed by a key path, so are skipped along with any
+    lines nested beneath them.
+    """
+    # Indentation & key of each mapping enclosing the current line
+    enclosing: list[tuple[int, str]] = []
+    skip_indent: int | None = None
+    in_document = False
+    pos = 0
+    while pos < len(text):
+        line_start = pos
+        line_end = text.find("\n", pos)
+        if line_end == -1:
+            line_end = len(text)
+        pos = line_end + 1
+
+        line = text[line_start:line_end].rstrip("\r")
+        content = line.lstrip(" ")
+        indent = len(line) - len(content)
+        if not content.strip() or content.startswith("#"):
+            continue
+
+        if not indent and (content.startswith("---") or content.rstrip() == "..."):
+            if in_document:
+                return None
+            continue
+
+        in_document = True
+        if skip_indent is not None and indent > skip_indent:
+            continue
+        skip_indent = None
+
+        while enclosing and enclosing[-1][0] >= indent:
+            enclosing.pop()
+
+        match = _YAML_KEY_RE.match(content)
+        if match is None:
+            skip_indent = indent
+            continue
+
+        double, single, plain = match.groups()
+        if double is not None:
+            key = _unescape(double)
+        elif single is not None:
+            key = single.replace("''", "'")
+        else:
+            key = t.cast(str, plain)
+
+        value = content[match.end() :]
+        if not value or value.startswith("#"):
+            enclosing.append((indent, key))
+            continue
+
+        skip_indent = indent
+        if (*(k for _, k in enclosing), key) != parts or value[:1] in "|>[{":
+            continue
+
+        n_value = _yaml_value_len(value)
+        if n_value is None:
+            return None
+
+        start = line_start + indent + match.end()
+        return start, start + n_value
+
+    return None
+
+
+_LOCATORS: dict[Syntax, t.Callable[[str, tuple[str, ...]], _SPAN_T | None]] = {
+    Syntax.JSON: _locate_json,
+    Syntax.TOML: _locate_toml,
+    Syntax.YAML: _locate_yaml,
+}
+
+
+class KeyPath(t.NamedTuple):
+    """
+    Path of keys leading to a value within a JSON, TOML, or YAML target file.
+
+    Values are located using a lightweight tokenizer for the target file's syntax, which stops as
+    soon as the value is found, so only the prefix of the file preceding the value is scanned. The
+    document is never parsed in full or re-serialized.
+    """
+
+    syntax: Syntax
+    parts: tuple[str, ...]
+
+    @classmethod
+    def for_target(cls, key: str, target_file: Path) -> KeyPath:
+        """
+        Build the key path for the provided target file, using the syntax given by its suffix.
+
+        Raises `ValueError` if the key path is malformed, or the target file's syntax is unknown.
+        """
+        syntax = target_syntax(target_file)
+        if syntax is None:
+            raise ValueError(
+                f"Can't locate key '{key}' in '{target_file.as_posix()}', only JSON, TOML, & YAML "
+                "files are supported"
+            )
+
+        return cls(syntax, split_key(key))
+
+    def locate(self, text: str) -> _SPAN_T | None:
+        """
+        Locate the `(start, end)` span of the key's value within `text`.
+
+        Returns `None` if the value isn't found, or may extend beyond the end of `text`, which is
+        assumed to be a prefix of the target file's contents.
+        """
+        return _LOCATORS[self.syntax](text, self.parts)
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import contextlib
+import time
+import typing as t
+from pathlib import Path
+
+if t.TYPE_CHECKING:
+    import cProfile
+
+    from bumper.bump import FileResult
+
+
+class FileProfile(t.NamedTuple):
+    """
+    Profile of bumping a single target file.
+
+    `timings` maps each phase of the bump (e.g. `read`, `replace`, `diff`, `write`) to its
+    wall-clock time, in seconds. `bytes_read` is `None` if the number of bytes read can't be
+    determined, e.g. when the occurrence index is used.
+    """
+
+    timings: dict[str, float]
+    bytes_read: int | None = None
+
+    def to_json(self) -> dict[str, t.Any]:  # noqa: D102
+        return self._asdict()
+
+    @classmethod
+    def from_json(cls, raw: dict[str, t.Any]) -> FileProfile:  # noqa: D102
+        return cls(timings=raw["timings"], bytes_read=raw["bytes_read"])
+
+
+class FileProfiler:
+    """
+    Record the profile of bumping a single target file.
+
+    Each phase ends when the next begins; `lap` attributes the time elapsed since the previous lap
+    to the named phase.
+    """
+
+    def __init__(self) -> None:
+        self.timings: dict[str, float] = {}
+        self.bytes_read: int | None = None
+        self._last = time.perf_counter()
+
+    def lap(self, phase: str) -> None:  # noqa: D102
+        now = time.perf_counter()
+        self.timings[phase] = self.timings.get(phase, 0.0) + now - self._last
+        self._last = now
+
+    def finish(self) -> FileProfile:  # noqa: D102
+        return FileProfile(self.timings, self.bytes_read)
+
+
+class Profile:
+    """
+    Instrumentation of a bump run.
+
+    Passing a `Profile` to the bumping API records the wall-clock time of each phase of the run,
+    along with the results of each target file, which include their own per-phase timings, bytes
+    read & written, and match counts. Optionally, the run can also be captured using `cProfile`
+    and/or `tracemalloc` by wrapping it in `capture`.
+
+    NOTE: When no `Profile` is provided, no instrumentation is performed.
+    """
+
+    def __init__(self, cprofile: bool = False, tracemalloc: bool = False) -> None:
+        self.phases: dict[str, float] = {}
+        self.files: list[FileResult] = []
+        self.use_cprofile = cprofile
+        self.use_tracemalloc = tracemalloc
+
+        self.profiler: cProfile.Profile | None = None
+        self.peak_memory: int | None = None
+        self.top_allocations: list[str] = []
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> t.Iterator[None]:
+        """Attribute the wall-clock time of the enclosed block to the named phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
+
+    @contextlib.contextmanager
+    def capture(self, n_allocations: int = 10) -> t.Iterator[None]:
+        """
+        Capture the enclosed block using `cProfile` and/or `tracemalloc`, if enabled.
+
+        The `n_allocations` source lines allocating the most memory are retained when using
+        `tracemalloc`.
+        """
+        if self.use_tracemalloc:
+            import tracemalloc
+
+            tracemalloc.start()
+
+        if self.use_cprofile:
+            import cProfile
+
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+
+        try:
+            yield
+        finally:
+            if self.profiler is not None:
+                self.profiler.disable()
+
+            if self.use_tracemalloc:
+                snapshot = tracemalloc.take_snapshot()
+                _, self.peak_memory = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+
+                stats = snapshot.statistics("lineno")[:n_allocations]
+                self.top_allocations = [str(stat) for stat in stats]
+
+    def dump_stats(self, out_path: Path) -> None:
+        """Write the captured `cProfile` statistics to `out_path`, for use with `pstats`."""
+        if self.profiler is None:
+            raise ValueError("No cProfile capture was recorded.")
+
+        self.profiler.dump_stats(out_path)
+
+    def to_json(self) -> dict[str, t.Any]:  # noqa: D102
+        return {
+            "phases": self.phases,
+            "files": [
+                {
+                    "label": f.label,
+                    "elapsed": f.elapsed,
+                    "bytes_read": None if f.profile is None else f.profile.bytes_read,
+                    "bytes_written": f.bytes_written,
+                    "matches": dict(zip(f.rules, f.hits, strict=True)),
+                    "timings": {} if f.profile is None else f.profile.timings,
+                }
+                for f in self.files
+            ],
+            "peak_memory": self.peak_memory,
+            "top_allocations": self.top_allocations,
+        }
+
+    def render_table(self) -> str:
+        """Render a summary table of the recorded phases & target files, with times in ms."""
+        lines = [f"{'Phase':<20} {'Time (ms)':>10}"]
+        for name, elapsed in self.phases.items():
+            lines.append(f"{name:<20} {elapsed * 1000:>10.2f}")
+
+        if self.files:
+            width = max(20, *(len(f.label) for f in self.files))
+            header = (
+                f"{'File':<{width}} {'Time (ms)':>10} {'Read (B)':>10} {'Written (B)':>11} "
+                f"{'Matches':>8}  Phases (ms)"
+            )
+            lines.extend(("", header))
+            for f in self.files:
+                timings = {} if f.profile is None else f.profile.timings
+                bytes_read = None if f.profile is None else f.profile.bytes_read
+                phases = ", ".join(f"{name} {sec * 1000:.2f}" for name, sec in timings.items())
+                lines.append(
+                    f"{f.label:<{width}} {f.elapsed * 1000:>10.2f} "
+                    f"{'-' if bytes_read is None else bytes_read:>10} {f.bytes_written:>11} "
+                    f"{sum(f.hits):>8}  {phases}"
+                )
+
+        if self.peak_memory is not None:
+            lines.extend(("", f"Peak traced memory: {self.peak_memory} B", *self.top_allocations))
+
+        return "\n".join(lines)
@@ -0,0 +1,209 @@
+import mmap
+import re
+import typing as t
+from pathlib import Path
+
+STREAM_CHUNK_SIZE = 1 << 20  # Characters
+
+
+class RuleMatcher(t.Generic[t.AnyStr]):
+    """
+    Single-pass matcher for a collection of literal `(search, replace)` pairs.
+
+    Rules may be provided as either `str` or `bytes`, but not a mixture of both.
+
+    All search strings are compiled into one regex alternation, ordered longest first so that the
+    most specific rule wins when several rules match at the same position. The target text is
+    scanned once regardless of the number of rules, and the output is assembled with a single join.
+
+    Rules sharing an identical search string are collapsed; matches are credited to every rule
+    sharing the search string. Empty search strings never match.
+    """
+
+    def __init__(self, replacements: t.Sequence[tuple[t.AnyStr, t.AnyStr]]) -> None:
+        self.n_rules = len(replacements)
+        self._replacements: dict[t.AnyStr, t.AnyStr] = {}
+        self._is_change = [search != replace for search, replace in replacements]
+        self._rule_idx: dict[t.AnyStr, list[int]] = {}
+        for idx, (search, replace) in enumerate(replacements):
+            if not search:
+                continue
+
+            self._rule_idx.setdefault(search, []).append(idx)
+            self._replacements.setdefault(search, replace)
+
+        alternatives = sorted(self._rule_idx, key=len, reverse=True)
+        self.max_len = max((len(a) for a in alternatives), default=0)
+        self.pattern: re.Pattern[t.AnyStr] | None = None
+        if alternatives:
+            escaped = [re.escape(a) for a in alternatives]
+            if isinstance(alternatives[0], bytes):
+                self.pattern = re.compile(b"|".join(escaped))
+            else:
+                self.pattern = re.compile("|".join(escaped))
+
+    def finditer(self, text: t.AnyStr) -> t.Iterator[re.Match[t.AnyStr]]:
+        """Yield non-overlapping matches of any rule, scanning `text` from left to right."""
+        if self.pattern is None:
+            return
+
+        yield from self.pattern.finditer(text)
+
+    def locate(self, text: t.AnyStr, hits: list[int]) -> t.Iterator[tuple[int, t.AnyStr, t.AnyStr]]:
+        """
+        Yield the `(offset, found, replacement)` of each match within `text`, from left to right.
+
+        Each match is credited to the provided per-rule hit counts as it is yielded.
+        """
+        for match in self.finditer(text):
+            found = match.group()
+            self.credit(found, hits)
+            yield match.start(), found, self._replacements[found]
+
+    @property
+    def searches(self) -> list[t.AnyStr]:
+        """Unique, non-empty search strings, in the order the rules were provided."""
+        return list(self._rule_idx)
+
+    def replacement(self, found: t.AnyStr) -> t.AnyStr:
+        """Return the replacement for the provided matched search string."""
+        return self._replacements[found]
+
+    def credit(self, found: t.AnyStr, hits: list[int], n: int = 1) -> None:
+        """Credit `n` hits of the provided matched search string to each rule that declares it."""
+        for idx in self._rule_idx[found]:
+            hits[idx] += n
+
+    def changes(self, hits: t.Sequence[int]) -> bool:
+        """Check whether the provided per-rule hit counts correspond to a modified text."""
+        return any(n and self._is_change[idx] for idx, n in enumerate(hits))
+
+    def _sub(
+        self,
+        text: t.AnyStr,
+        write: t.Callable[[t.AnyStr], t.Any],
+        hits: list[int],
+        limit: int | None = None,
+    ) -> int:
+        """
+        Write the replaced contents of `text` using the provided `write` callable.
+
+        If `limit` is specified, replacement stops at the first match starting at or beyond `limit`
+        and only the text preceding that match is written, up to `limit`. Returns the index into
+        `text` up to which it has been consumed.
+        """
+        pos = 0
+        for match in self.finditer(text):
+            if limit is not None and match.start() >= limit:
+                break
+
+            found = match.group()
+            write(text[pos : match.start()])
+            write(self._replacements[found])
+            self.credit(found, hits)
+
+            pos = match.end()
+
+        end = len(text) if limit is None else max(pos, limit)
+        write(text[pos:end])
+        return end
+
+    def apply(self, text: t.AnyStr) -> tuple[t.AnyStr, list[int]]:
+        """
+        Apply all replacements to `text` in a single scan.
+
+        Returns the replaced text along with a list of per-rule hit counts, in the order the rules
+        were provided.
+        """
+        hits = [0] * self.n_rules
+        if self.pattern is None:
+            return text, hits
+
+        chunks: list[t.AnyStr] = []
+        self._sub(text, chunks.append, hits)
+        if len(chunks) == 1:
+            return text, hits
+
+        return text[:0].join(chunks), hits
+
+    def patch(self: "RuleMatcher[bytes]", buf: mmap.mmap) -> list[int]:
+        """
+        Overwrite all matches within the provided writable buffer in place.
+
+        Each rule's replacement must be of equal length to its search string.
+
+        Returns a list of per-rule hit counts, in the order the rules were provided.
+        """
+        hits = [0] * self.n_rules
+        if self.pattern is None:
+            return hits
+
+        # Locate everything up front so the buffer isn't modified while it's being scanned
+        spans = [(m.start(), m.end(), m.group()) for m in self.pattern.finditer(buf)]
+        for start, end, found in spans:
+            self.credit(found, hits)
+            replacement = self._replacements[found]
+            if replacement != found:
+                buf[start:end] = replacement
+
+        return hits
+
+    def splice(self, text: t.AnyStr, occurrences: t.Iterable[tuple[int, t.AnyStr]]) -> t.AnyStr:
+        """
+        Replace the provided, previously located, `(offset, search)` occurrences within `text`.
+
+        Occurrences must be sorted by offset & must not overlap.
+        """
+        chunks = []
+        pos = 0
+        for offset, found in occurrences:
+            chunks.append(text[pos:offset])
+            chunks.append(self._replacements[found])
+            pos = offset + len(found)
+
+        chunks.append(text[pos:])
+        return text[:0].join(chunks)
+
+    def stream(
+        self, src: t.IO[t.AnyStr], dst: t.IO[t.AnyStr], chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> list[int]:
+        """
+        Apply all replacements while streaming from `src` to `dst` in chunks of `chunk_size`.
+
+        A carry-over window of the longest search string is retained between chunks so that matches
+        spanning a chunk boundary are still located; peak memory is bounded by `chunk_size` rather
+        than the size of the source.
+
+        Returns a list of per-rule hit counts, in the order the rules were provided.
+        """
+        hits = [0] * self.n_rules
+        carry = src.read(0)
+        while True:
+            chunk = src.read(chunk_size)
+            buf = carry + chunk
+            if not chunk:
+                self._sub(buf, dst.write, hits)
+                return hits
+
+            # Matches starting before this point can't be extended by any subsequent chunk
+            safe_end = len(buf) - self.max_len + 1
+            consumed = self._sub(buf, dst.write, hits, limit=max(safe_end, 0))
+            carry = buf[consumed:]
+
+
+def patch_in_place(target_file: Path, matcher: RuleMatcher[bytes]) -> list[int]:
+    """
+    Patch the matches of the provided byte-level rules directly into `target_file`.
+
+    The file is memory mapped and only the byte ranges of each match are overwritten, so only the
+    pages containing a match are dirtied & flushed back to disk. Each rule's replacement must be of
+    equal length to its search string.
+
+    Returns a list of per-rule hit counts, in the order the rules were provided.
+    """
+    with target_file.open("r+b") as f, mmap.mmap(f.fileno(), 0) as mm:
+        hits = matcher.patch(mm)
+        if matcher.changes(hits):
+            mm.flush()
+
+    return hits
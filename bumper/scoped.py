@@ -0,0 +1,184 @@
+import functools
+import re
+import typing as t
+
+from bumper.config import SearchOptions
+
+if t.TYPE_CHECKING:
+    from bumper.keypath import KeyPath
+
+
+@functools.lru_cache(maxsize=None)
+def compile_search(search: str, regex: bool = False) -> re.Pattern[str]:
+    """
+    Compile the provided rendered search string, which is escaped unless it's a regex.
+
+    Regexes are compiled in multiline mode, so `^` & `$` match at line boundaries. Compiled patterns
+    are cached, so rules shared by many target files are only compiled once.
+    """
+    if regex:
+        return re.compile(search, re.MULTILINE)
+
+    return re.compile(re.escape(search))
+
+
+def _lines_end(text: str, n_lines: int) -> int | None:
+    """Locate the offset following the line feed of the `n_lines`-th line, if `text` contains it."""
+    pos = 0
+    for _ in range(n_lines):
+        pos = text.find("\n", pos) + 1
+        if not pos:
+            return None
+
+    return pos
+
+
+class ScopedRule(t.NamedTuple):
+    """
+    Rendered search rule matched by a `ScopedMatcher`.
+
+    For literal rules, each match of `search` is replaced by `replace`. For regex rules, `search` is
+    a regular expression & each occurrence of the `current` version within a match is replaced by
+    `replace`.
+
+    If the rule's options declare a `key`, `key` is its path within the target file & the rule is
+    only matched within the key's value.
+    """
+
+    search: str
+    replace: str
+    options: SearchOptions
+    current: str | None = None
+    key: "KeyPath | None" = None
+
+
+class ScopedMatcher:
+    """
+    Matcher for rules that are regexes and/or whose search is limited in scope.
+
+    Each rule is matched separately within its own scope, stopping as soon as the rule's scope ends
+    or its `max_occurrences` have been found. Where the matches of multiple rules overlap, the match
+    starting first wins, followed by the longest match.
+
+    Unlike `RuleMatcher`, rules are only matched against decoded text.
+    """
+
+    def __init__(self, rules: t.Sequence[ScopedRule]) -> None:
+        self.rules = list(rules)
+        self.n_rules = len(self.rules)
+        self._patterns = [compile_search(r.search, r.options.regex) for r in self.rules]
+
+    def _scan(self, text: str, idx: int) -> tuple[list[tuple[int, int]], bool]:
+        """
+        Locate the spans of the rule's matches within its scope.
+
+        Returns the spans along with whether the rule's scope, or its maximum number of matches, is
+        reached before the end of `text`, in which case any text following `text` can't affect the
+        rule's matches.
+        """
+        rule = self.rules[idx]
+        if rule.key is not None:
+            span = rule.key.locate(text)
+            if span is None:
+                return [], False
+            return self._find(text, idx, *span, bounded=True)
+
+        options = rule.options
+        end = len(text)
+        bounded = False
+        if options.first_n_lines is not None:
+            lines_end = _lines_end(text, options.first_n_lines)
+            if lines_end is not None:
+                end, bounded = lines_end, True
+
+        start = 0
+        if options.start is not None:
+            anchor = text.find(options.start, 0, end)
+            if anchor == -1:
+                return [], bounded
+            start = anchor + len(options.start)
+
+        if options.stop is not None:
+            anchor = text.find(options.stop, start, end)
+            if anchor != -1:
+                end, bounded = anchor, True
+
+        return self._find(text, idx, start, end, bounded)
+
+    def _find(
+        self, text: str, idx: int, start: int, end: int, bounded: bool
+    ) -> tuple[list[tuple[int, int]], bool]:
+        """Locate the spans of the rule's matches within `text[start:end]`; see `_scan`."""
+        spans = []
+        for match in self._patterns[idx].finditer(text, start, end):
+            if match.end() == match.start():
+                continue
+
+            spans.append(match.span())
+            if len(spans) == self.rules[idx].options.max_occurrences:
+                bounded = True
+                break
+
+        return spans, bounded
+
+    def covers(self, text: str) -> bool:
+        """
+        Check whether `text` is a sufficient prefix to match every rule.
+
+        This is the case if every rule's scope, or its maximum number of matches, is reached within
+        `text`, so none of the rules can match beyond it.
+        """
+        return all(self._scan(text, idx)[1] for idx in range(self.n_rules))
+
+    def replacement(self, idx: int, found: str) -> str:
+        """Return the replacement for the provided match of the indexed rule."""
+        rule = self.rules[idx]
+        if rule.current is None:
+            return rule.replace
+
+        return found.replace(rule.current, rule.replace)
+
+    def locate(self, text: str, hits: list[int]) -> t.Iterator[tuple[int, str, str]]:
+        """
+        Yield the `(offset, found, replacement)` of each match within `text`, from left to right.
+
+        Each match is credited to the provided per-rule hit counts as it is yielded; matches
+        overlapping an earlier match are discarded.
+        """
+        spans = [
+            (start, end, idx)
+            for idx in range(self.n_rules)
+            for start, end in self._scan(text, idx)[0]
+        ]
+        spans.sort(key=lambda span: (span[0], -span[1]))
+
+        pos = 0
+        for start, end, idx in spans:
+            if start < pos:
+                continue
+
+            hits[idx] += 1
+            found = text[start:end]
+            yield start, found, self.replacement(idx, found)
+            pos = end
+
+    def apply(self, text: str) -> tuple[str, list[int]]:
+        """
+        Apply all replacements to `text`.
+
+        Returns the replaced text along with a list of per-rule hit counts, in the order the rules
+        were provided.
+        """
+        hits = [0] * self.n_rules
+        chunks = []
+        pos = 0
+        for offset, found, replacement in self.locate(text, hits):
+            chunks.append(text[pos:offset])
+            chunks.append(replacement)
+            pos = offset + len(found)
+
+        if not chunks:
+            return text, hits
+
+        chunks.append(text[pos:])
+        return "".join(chunks), hits
@@ -0,0 +1,286 @@
+from __future__ import annotations
+
+import bisect
+import mmap
+import os
+import threading
+import typing as t
+from array import array
+from pathlib import Path
+
+from bumper.replace import RuleMatcher
+
+if t.TYPE_CHECKING:
+    from concurrent.futures import Executor, ProcessPoolExecutor
+
+_BYTE_RULES_T: t.TypeAlias = list[tuple[bytes, bytes]]
+_LOCATED_T: t.TypeAlias = tuple["array[int]", "array[int]"]
+
+# Every segmented bump shares a single pool of processes, which is started on first use
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+class Segment(t.NamedTuple):
+    """
+    Contiguous span, `[start, end)`, of a target file along with the matches starting within it.
+
+    Matches are stored as a pair of parallel arrays, `offsets` & `searches`, holding the offset of
+    each match & the index of its search string within `RuleMatcher.searches`, so they can be
+    passed between processes cheaply.
+    """
+
+    start: int
+    end: int
+    offsets: array[int]
+    searches: array[int]
+
+
+def segment_bounds(buf: t.Any, n_segments: int) -> list[tuple[int, int]]:
+    """
+    Split the provided buffer into up to `n_segments` contiguous `(start, end)` spans.
+
+    Each segment ends immediately after a line feed, or at the end of the buffer, so segments are
+    approximately, rather than exactly, equal in size. Fewer segments are returned if the buffer
+    does not contain enough lines.
+    """
+    size = len(buf)
+    bounds = []
+    start = 0
+    for idx in range(1, n_segments):
+        if start >= size:
+            break
+
+        end = buf.find(b"\n", max(start, size * idx // n_segments)) + 1 or size
+        bounds.append((start, end))
+        start = end
+
+    if start < size or not bounds:
+        bounds.append((start, size))
+
+    return bounds
+
+
+def _iter_scan(
+    buf: t.Any, matcher: RuleMatcher[bytes], start: int, end: int
+) -> t.Iterator[tuple[int, int]]:
+    """
+    Yield the offset & search index of each match starting within `buf[start:end]`, left to right.
+
+    The scan continues up to the length of the longest search string past `end`, so matches
+    starting within the span are never cut off.
+    """
+    if matcher.pattern is None:
+        return
+
+    search_idx = {search: idx for idx, search in enumerate(matcher.searches)}
+    for match in matcher.pattern.finditer(buf, start, min(end + matcher.max_len - 1, len(buf))):
+        if match.start() >= end:
+            return
+
+        yield match.start(), search_idx[match.group()]
+
+
+def _scan(buf: t.Any, matcher: RuleMatcher[bytes], start: int, end: int) -> _LOCATED_T:
+    offsets, searches = array("q"), array("I")
+    for offset, idx in _iter_scan(buf, matcher, start, end):
+        offsets.append(offset)
+        searches.append(idx)
+
+    return offsets, searches
+
+
+def _locate_segment(target_file: str, rules: _BYTE_RULES_T, start: int, end: int) -> _LOCATED_T:
+    matcher = RuleMatcher(rules)
+    with open(target_file, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return _scan(mm, matcher, start, end)
+
+
+def _patch_segment(target_file: str, rules: _BYTE_RULES_T, segment: Segment) -> None:
+    matcher = RuleMatcher(rules)
+    searches = matcher.searches
+    with open(target_file, "r+b") as f, mmap.mmap(f.fileno(), 0) as mm:
+        for offset, idx in zip(segment.offsets, segment.searches, strict=True):
+            search = searches[idx]
+            replacement = matcher.replacement(search)
+            if replacement != search:
+                mm[offset : offset + len(search)] = replacement
+        mm.flush()
+
+
+def _write_segment(
+    target_file: str, out_file: str, rules: _BYTE_RULES_T, segment: Segment, out_offset: int
+) -> None:
+    matcher = RuleMatcher(rules)
+    searches = matcher.searches
+    with (
+        open(target_file, "rb") as src,
+        mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+        memoryview(mm) as view,
+        open(out_file, "r+b") as dst,
+    ):
+        dst.seek(out_offset)
+        pos = segment.start
+        for offset, idx in zip(segment.offsets, segment.searches, strict=True):
+            search = searches[idx]
+            dst.write(view[pos:offset])
+            dst.write(matcher.replacement(search))
+            pos = offset + len(search)
+        dst.write(view[pos : segment.end])
+
+
+def shared_pool() -> ProcessPoolExecutor:
+    """
+    Return the pool of processes shared by every segmented bump, with one process per CPU.
+
+    Sharing the pool bounds the number of processes however many large files are bumped at once,
+    e.g. by the `--workers` thread pool or the daemon. The pool's processes are started using the
+    "forkserver" method where available, otherwise "spawn", so a process that may be running other
+    threads is never forked.
+
+    NOTE: The pool's processes don't follow changes to the working directory, so the paths passed
+    to them are always absolute.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            method = (
+                "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            )
+            _pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1, mp_context=multiprocessing.get_context(method)
+            )
+
+        return _pool
+
+
+def _run(pool: Executor, func: t.Callable[..., t.Any], calls: list[tuple]) -> list[t.Any]:
+    """Call `func` with each of the provided arguments, using the pool if there's more than one."""
+    if len(calls) == 1:
+        return [func(*calls[0])]
+
+    futures = [pool.submit(func, *args) for args in calls]
+    return [future.result() for future in futures]
+
+
+def _merge_segments(
+    buf: t.Any,
+    matcher: RuleMatcher[bytes],
+    bounds: list[tuple[int, int]],
+    located: list[_LOCATED_T],
+) -> list[Segment]:
+    """
+    Merge the matches located within each span into those of a single scan of the buffer.
+
+    Spans are scanned independently, so if the last match of a span extends into the next span,
+    e.g. for a rule spanning multiple lines, the next span's scan may have started within that
+    match. The next span is then rescanned from the end of that match until it reaches a match also
+    located by the span's own scan, from which point both scans agree.
+
+    Each returned segment is extended to cover the full extent of its last match, so the segments
+    partition the buffer with every match falling entirely within the segment in which it starts.
+    """
+    searches = matcher.searches
+    segments = []
+    pos = last_end = 0
+    for (start, end), (offsets, found) in zip(bounds, located, strict=True):
+        if last_end > start:
+            rescanned_offsets, rescanned_found = array("q"), array("I")
+            resync = len(offsets)
+            for offset, search_idx in _iter_scan(buf, matcher, last_end, end):
+                idx = bisect.bisect_left(offsets, offset)
+                if idx < len(offsets) and offsets[idx] == offset:
+                    resync = idx
+                    break
+
+                rescanned_offsets.append(offset)
+                rescanned_found.append(search_idx)
+
+            offsets = rescanned_offsets + offsets[resync:]
+            found = rescanned_found + found[resync:]
+
+        if offsets:
+            last_end = offsets[-1] + len(searches[found[-1]])
+
+        segment_end = max(end, last_end, pos)
+        segments.append(Segment(pos, segment_end, offsets, found))
+        pos = segment_end
+
+    return segments
+
+
+def locate(
+    target_file: Path, rules: _BYTE_RULES_T, n_segments: int, pool: Executor
+) -> list[Segment]:
+    """
+    Locate the matches of the provided byte-level rules within `target_file`.
+
+    The file is split into up to `n_segments` line-aligned segments, which are scanned concurrently
+    by the pool, with each process memory mapping the file for itself. The located matches are
+    identical to those of a single scan of the file from left to right, including for rules
+    spanning multiple lines; see `_merge_segments`.
+    """
+    matcher = RuleMatcher(rules)
+    with target_file.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        bounds = segment_bounds(mm, n_segments)
+        calls = [(os.path.abspath(target_file), rules, start, end) for start, end in bounds]
+        return _merge_segments(mm, matcher, bounds, _run(pool, _locate_segment, calls))
+
+
+def segment_hits(rules: _BYTE_RULES_T, segments: list[Segment]) -> list[int]:
+    """Tally the per-rule hit counts of the located matches, in the order the rules were given."""
+    matcher = RuleMatcher(rules)
+    hits = [0] * matcher.n_rules
+    for idx, search in enumerate(matcher.searches):
+        matcher.credit(search, hits, n=sum(s.searches.count(idx) for s in segments))
+
+    return hits
+
+
+def patch(target_file: Path, rules: _BYTE_RULES_T, segments: list[Segment], pool: Executor) -> None:
+    """
+    Concurrently patch the located matches of each segment into `target_file` in place.
+
+    Each rule's replacement must be of equal length to its search string.
+    """
+    calls = [(os.path.abspath(target_file), rules, segment) for segment in segments]
+    _run(pool, _patch_segment, calls)
+
+
+def write(
+    target_file: Path,
+    out_file: Path,
+    rules: _BYTE_RULES_T,
+    segments: list[Segment],
+    pool: Executor,
+) -> int:
+    """
+    Concurrently write the replaced contents of `target_file` to `out_file`.
+
+    The output file is sized up front, then each segment is replaced & written directly to its
+    offset within the output file, so the replaced segments are stitched together in order without
+    any further copying.
+
+    Returns the size of the output file.
+    """
+    matcher = RuleMatcher(rules)
+    deltas = [len(matcher.replacement(search)) - len(search) for search in matcher.searches]
+    out_offsets = []
+    out_offset = 0
+    for segment in segments:
+        out_offsets.append(out_offset)
+        delta = sum(segment.searches.count(idx) * d for idx, d in enumerate(deltas))
+        out_offset += segment.end - segment.start + delta
+
+    with out_file.open("r+b") as f:
+        f.truncate(out_offset)
+
+    calls = [
+        (os.path.abspath(target_file), os.path.abspath(out_file), rules, segment, offset)
+        for segment, offset in zip(segments, out_offsets, strict=True)
+    ]
+    _run(pool, _write_segment, calls)
+    return out_offset
@@ -0,0 +1,241 @@
+import json
+import os
+import socket
+import socketserver
+import threading
+import typing as t
+from contextlib import ExitStack
+from pathlib import Path
+
+from bumper import CACHE_DIR
+from bumper.bump import (
+    BumpResult,
+    BumpType,
+    Project,
+    attach_index,
+    build_new_version,
+    bump_type_mismatch,
+    collect_results,
+    labeled_project_jobs,
+)
+from bumper.cache import ConfigCache
+from bumper.check import check_rules
+from bumper.client import request
+from bumper.config import BumperFile, CONFIG_SEARCH
+from bumper.index import OccurrenceIndex
+from bumper.version import Version
+
+
+class RequestError(Exception): ...  # noqa: D101
+
+
+class DaemonRunningError(Exception): ...  # noqa: D101
+
+
+def _field(payload: dict[str, t.Any], key: str) -> t.Any:
+    try:
+        return payload[key]
+    except KeyError:
+        raise RequestError(f"Missing required request field: '{key}'") from None
+
+
+class BumperServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    Threaded bumper daemon, listening on a Unix domain socket.
+
+    Validated configurations are kept in memory between requests & are only re-parsed if their
+    configuration file is modified. Similarly, the occurrence index of each project enabling
+    `occurrence_index` is loaded once & kept up to date as its files are bumped.
+
+    Requests against the same project are serialized, as are requests against any target file
+    shared between projects; requests against unrelated projects are handled concurrently.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: Path) -> None:
+        super().__init__(os.fspath(socket_path), _RequestHandler)
+        self.socket_path = socket_path
+        self.config_cache = ConfigCache()
+
+        self._locks_lock = threading.Lock()
+        self._project_locks: dict[Path, threading.Lock] = {}
+        self._file_locks: dict[Path, threading.Lock] = {}
+        self._indexes: dict[Path, OccurrenceIndex] = {}
+
+    def _lock(self, locks: dict[Path, threading.Lock], key: Path) -> threading.Lock:
+        with self._locks_lock:
+            if key not in locks:
+                locks[key] = threading.Lock()
+
+            return locks[key]
+
+    def _index(self, project_dir: Path) -> OccurrenceIndex:
+        with self._locks_lock:
+            if project_dir not in self._indexes:
+                self._indexes[project_dir] = OccurrenceIndex.load(project_dir / CACHE_DIR)
+
+            return self._indexes[project_dir]
+
+    def _run(
+        self, project: Project, next_version: Version, dry_run: bool, workers: int | None
+    ) -> BumpResult:
+        """
+        Bump the project's target files to `next_version`.
+
+        The caller is expected to hold the project's lock; the lock of each target file is acquired
+        here, in a consistent order, for the duration of the bump.
+        """
+        project_dir = project.cfg_path.parent
+        jobs = labeled_project_jobs(project, next_version)
+        index = self._index(project_dir) if project.options.occurrence_index else None
+        jobs, index = attach_index(jobs, project_dir, dry_run, index=index)
+
+        with ExitStack() as stack:
+            for target_file in sorted({job.file for job in jobs}):
+                stack.enter_context(self._lock(self._file_locks, target_file))
+
+            n_workers = workers or project.options.workers
+            return collect_results(
+                project.current_version,
+                next_version,
+                jobs,
+                dry_run,
+                n_workers,
+                index=index,
+                root_dir=project_dir,
+            )
+
+    def bump(
+        self, cfg_path: Path, bump_type: BumpType, dry_run: bool, workers: int | None = None
+    ) -> dict[str, t.Any]:
+        """
+        Bump the project configured by `cfg_path`.
+
+        If `dry_run` is `True`, no files are modified & the diff of each target file is included in
+        its result instead.
+        """
+        cfg_path = cfg_path.resolve()
+        with self._lock(self._project_locks, cfg_path):
+            current_version, versioning_type, files, options = self.config_cache.parse(cfg_path)
+            mismatch = bump_type_mismatch(versioning_type, bump_type)
+            if mismatch is not None:
+                raise RequestError(mismatch)
+
+            next_version = build_new_version(current_version, bump_type)
+            project = Project(cfg_path, current_version, files, options)
+            result = self._run(project, next_version, dry_run, workers)
+
+        return result.to_json()
+
+    def check(self, cfg_path: Path) -> dict[str, t.Any]:
+        """
+        Check that every search rule of the project configured by `cfg_path` matches its file.
+
+        The response is only `ok` if every rule matches at least once.
+        """
+        cfg_path = cfg_path.resolve()
+        with self._lock(self._project_locks, cfg_path):
+            current_version, _, files, options = self.config_cache.parse(cfg_path)
+            files = [*files, BumperFile(file=Path(cfg_path.name), search=CONFIG_SEARCH)]
+            results = check_rules(
+                current_version,
+                files,
+                n_workers=options.workers,
+                root_dir=cfg_path.parent,
+                use_git=options.use_git_ls_files,
+            )
+
+        return {
+            "ok": all(r.ok for r in results),
+            "current_version": str(current_version),
+            "files": [r.to_json() for r in results],
+        }
+
+    def dispatch(self, payload: t.Any) -> dict[str, t.Any]:
+        """
+        Handle a single decoded request.
+
+        Supported commands are:
+          * `{"command": "bump", "config": ..., "bump_by": ..., "dry_run": ..., "workers": ...}`
+          * `{"command": "check", "config": ...}`
+          * `{"command": "ping"}`
+          * `{"command": "shutdown"}`
+
+        `config` must be the path to the project's configuration file; relative paths are resolved
+        against the daemon's working directory. `dry_run` & `workers` are optional.
+
+        Raises `RequestError` if the request is invalid.
+        """
+        if not isinstance(payload, dict):
+            raise RequestError("Requests must be JSON objects.")
+
+        command = payload.get("command")
+        if command == "bump":
+            try:
+                bump_type = BumpType(_field(payload, "bump_by"))
+            except ValueError:
+                raise RequestError(f"Invalid bump type: '{payload['bump_by']}'") from None
+
+            return self.bump(
+                cfg_path=Path(_field(payload, "config")),
+                bump_type=bump_type,
+                dry_run=bool(payload.get("dry_run", False)),
+                workers=payload.get("workers"),
+            )
+        elif command == "check":
+            return self.check(Path(_field(payload, "config")))
+        elif command in ("ping", "shutdown"):
+            return {"ok": True}
+
+        raise RequestError(f"Unknown command: '{command}'")
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    server: BumperServer
+
+    def handle(self) -> None:
+        """
+        Handle a single line of JSON, responding with a single line of JSON.
+
+        Any error raised while handling the request is reported to the client rather than raised.
+        """
+        payload = None
+        try:
+            payload = json.loads(self.rfile.readline())
+            response = self.server.dispatch(payload)
+        except Exception as e:
+            response = {"ok": False, "error": str(e)}
+
+        self.wfile.write(json.dumps(response).encode() + b"\n")
+        self.wfile.flush()
+
+        if isinstance(payload, dict) and payload.get("command") == "shutdown":
+            self.server.shutdown()
+
+
+def serve(socket_path: Path) -> None:
+    """
+    Serve requests on the provided Unix domain socket until a `shutdown` request is received.
+
+    A stale socket left behind by a daemon that did not shut down cleanly is replaced; if another
+    daemon is already listening on `socket_path`, `DaemonRunningError` is raised. The socket is
+    removed once the daemon shuts down.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        raise OSError("Unix domain sockets are not supported on this platform.")
+
+    if socket_path.exists():
+        try:
+            request(socket_path, {"command": "ping"}, timeout=1)
+        except OSError:
+            socket_path.unlink()
+        else:
+            raise DaemonRunningError(f"A daemon is already listening on '{socket_path}'")
+
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    with BumperServer(socket_path) as server:
+        try:
+            server.serve_forever()
+        finally:
+            socket_path.unlink(missing_ok=True)
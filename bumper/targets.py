@@ -0,0 +1,389 @@
+import codecs
+import re
+import typing as t
+from collections import Counter, defaultdict
+from pathlib import Path
+
+from bumper.config import BumperConfigError, BumperFile, CD, PLAIN_SEARCH, SearchOptions
+from bumper.diff import match_diff
+from bumper.replace import RuleMatcher
+from bumper.version import Version
+from bumper.walk import expand_globs, has_magic
+
+if t.TYPE_CHECKING:
+    from bumper.scoped import ScopedMatcher, ScopedRule
+
+
+# Search options of each of a target file's rules, in the same order as the rules
+SEARCH_OPTIONS_T: t.TypeAlias = list[SearchOptions]
+
+
+def declare_rule(rules: list[str], search_options: SEARCH_OPTIONS_T, b: BumperFile) -> None:
+    """
+    Add the provided specification's rule to its target file's rules, unless already declared.
+
+    Rules are identified by their search string together with their search options, so the same
+    search string may be declared more than once with different options, e.g. for different keys.
+    """
+    for search, options in zip(rules, search_options, strict=True):
+        if search == b.search and options == b.search_options:
+            return
+
+    rules.append(b.search)
+    search_options.append(b.search_options)
+
+
+# Separates the path of an archive from the name of a member within it, e.g. `pkg.zip::METADATA`
+MEMBER_SEP = "::"
+
+
+def split_member(target_file: Path) -> tuple[Path, str] | None:
+    """Split an archive member's target path into the archive's path & the member's name."""
+    archive, sep, member = target_file.as_posix().partition(MEMBER_SEP)
+    if not sep:
+        return None
+
+    return Path(archive), member
+
+
+def archive_part(target_file: Path) -> str:
+    """Return the path of the file on disk, which for an archive member is its archive's path."""
+    return target_file.as_posix().partition(MEMBER_SEP)[0]
+
+
+def is_gzip(target_file: Path) -> bool:
+    """Check whether the target file is a gzip file, rather than an archive member."""
+    return target_file.suffix == ".gz" and split_member(target_file) is None
+
+
+def read_archived(target_file: Path) -> bytes | None:
+    """
+    Read the decompressed contents of an archive member or gzip target file.
+
+    Returns `None` if the target file is neither.
+    """
+    member = split_member(target_file)
+    if member is not None:
+        from bumper.archive import read_members
+
+        archive, name = member
+        return read_members(archive, [name])[name]
+
+    if is_gzip(target_file):
+        from bumper.archive import read_gzip
+
+        return read_gzip(target_file)[0]
+
+    return None
+
+
+def merge_targets(
+    files: list[BumperFile], root_dir: Path = CD, use_git: bool = False
+) -> tuple[dict[Path, list[str]], dict[Path, str], dict[Path, SEARCH_OPTIONS_T]]:
+    """
+    Consolidate bump specifications per-file, along with each file's declared encoding & options.
+
+    Any `file` containing glob wildcards is expanded into the matching files beneath `root_dir`;
+    returned paths remain relative to `root_dir`. Files matched by multiple specifications are
+    consolidated, with duplicate rules only included once; see `declare_rule`. Files without a
+    declared encoding are omitted from the returned encodings. The search options of each file's
+    rules are returned alongside, in the same order as its rules.
+
+    Raises `BumperConfigError` if a glob pattern doesn't match any files, or different encodings are
+    declared for the same file.
+    """
+    # Only the archive portion of an archive member's path is expanded
+    patterns = [archive_part(b.file) for b in files if has_magic(archive_part(b.file))]
+    expanded = expand_globs(patterns, root_dir=root_dir, use_git=use_git) if patterns else {}
+
+    file_operations: dict[Path, list[str]] = defaultdict(list)
+    encodings: dict[Path, str] = {}
+    search_options: dict[Path, SEARCH_OPTIONS_T] = defaultdict(list)
+    for b in files:
+        pattern, sep, member = b.file.as_posix().partition(MEMBER_SEP)
+        matched = expanded.get(pattern)
+        if matched == []:
+            raise BumperConfigError(f"No files match the pattern '{b.file.as_posix()}'")
+
+        targets = [b.file] if matched is None else [Path(f"{m}{sep}{member}") for m in matched]
+        for target_file in targets:
+            declare_rule(file_operations[target_file], search_options[target_file], b)
+            if b.encoding is not None:
+                if encodings.setdefault(target_file, b.encoding) != b.encoding:
+                    raise BumperConfigError(
+                        f"Conflicting encodings declared for '{target_file.as_posix()}'"
+                    )
+
+    return file_operations, encodings, search_options
+
+
+def _target_name(target_file: Path) -> str:
+    """Name the target file, or archive member, e.g. `pkg.zip::pkg/METADATA`."""
+    member = split_member(target_file)
+    if member is None:
+        return target_file.name
+
+    archive, name = member
+    return f"{archive.name}{MEMBER_SEP}{name}"
+
+
+def file_labels(target_files: t.Iterable[Path]) -> dict[Path, str]:
+    """Label each file by its name, falling back to its full path if names are ambiguous."""
+    target_files = list(target_files)
+    names = {f: _target_name(f) for f in target_files}
+    name_counts = Counter(names.values())
+    return {f: (names[f] if name_counts[names[f]] == 1 else f.as_posix()) for f in target_files}
+
+
+def render_rules(
+    rules: list[str], current_version: Version, next_version: Version
+) -> list[tuple[str, str]]:
+    """Render each search template into its `(search, replace)` pair for the provided versions."""
+    current, new = str(current_version), str(next_version)
+    return [
+        (r.replace("{current_version}", current), r.replace("{current_version}", new))
+        for r in rules
+    ]
+
+
+def scoped_rules(
+    rules: list[str],
+    search_options: SEARCH_OPTIONS_T,
+    current_version: Version,
+    next_version: Version,
+    target_file: Path,
+) -> "list[ScopedRule]":
+    """
+    Render each search template, along with its search options, into a rule for a `ScopedMatcher`.
+
+    The current version is escaped when rendering regex templates. Key paths are resolved using the
+    syntax of `target_file`.
+
+    Raises `BumperConfigError` if a key path is declared for a target file that isn't a JSON, TOML,
+    or YAML file.
+    """
+    from bumper.scoped import ScopedRule
+
+    current, new = str(current_version), str(next_version)
+    scoped = []
+    for r, options in zip(rules, search_options, strict=True):
+        key = None
+        if options.key is not None:
+            from bumper.keypath import KeyPath
+
+            try:
+                key = KeyPath.for_target(options.key, target_file)
+            except ValueError as e:
+                raise BumperConfigError(str(e)) from None
+
+        if options.regex:
+            search = r.replace("{current_version}", re.escape(current))
+            scoped.append(ScopedRule(search, new, options, current=current, key=key))
+        else:
+            search, replace = r.replace("{current_version}", current), r.replace(
+                "{current_version}", new
+            )
+            scoped.append(ScopedRule(search, replace, options, key=key))
+
+    return scoped
+
+
+def requires_scope(scoped: "list[ScopedRule]") -> bool:
+    """Check whether any of the rules must be applied using a `ScopedMatcher`."""
+    return any(rule.options != PLAIN_SEARCH for rule in scoped)
+
+
+# Number of bytes read from the start of each target file to detect its encoding
+PROBE_SIZE = 8192
+
+
+# Target files starting with one of these BOMs are decoded using the corresponding encoding, unless
+# an encoding is declared. UTF-32 BOMs are checked first as they begin with a UTF-16 BOM
+BOM_ENCODINGS = (
+    (codecs.BOM_UTF32_LE, "utf-32-le"),
+    (codecs.BOM_UTF32_BE, "utf-32-be"),
+    (codecs.BOM_UTF16_LE, "utf-16-le"),
+    (codecs.BOM_UTF16_BE, "utf-16-be"),
+)
+
+
+BOMS = tuple(bom for bom, _ in BOM_ENCODINGS)
+
+
+# Encodings whose target files are processed as raw bytes rather than being decoded
+BYTE_LEVEL_ENCODINGS = frozenset(("utf-8", "utf-8-sig"))
+
+
+class TargetFormat(t.NamedTuple):
+    """How a target file is processed; see `sniff_format`."""
+
+    encoding: str
+    byte_level: bool
+    crlf: bool
+
+
+def _has_crlf(header: bytes) -> bool:
+    # Searching for a lone byte is much faster than a substring search when the file uses LF
+    return b"\r" in header and b"\r\n" in header
+
+
+def sniff_format(header: bytes, declared: str | None = None) -> TargetFormat | None:
+    """
+    Determine how to process a target file from the first `PROBE_SIZE` bytes of its contents.
+
+    A declared encoding always takes precedence. Otherwise, files starting with a UTF-16 or UTF-32
+    BOM are decoded using the corresponding encoding & all remaining files are assumed to be UTF-8
+    encoded. UTF-8 encoded files are processed as raw bytes, without being decoded.
+
+    Rules containing line feeds are matched using CRLF line endings if the header contains one.
+
+    `None` is returned if no encoding is declared & the header contains a null byte, which is taken
+    to indicate a binary file.
+    """
+    encoding = declared
+    if encoding is None:
+        if header.startswith(BOMS):
+            encoding = next(enc for bom, enc in BOM_ENCODINGS if header.startswith(bom))
+        elif b"\0" in header:
+            return None
+        else:
+            return TargetFormat("utf-8", byte_level=True, crlf=_has_crlf(header))
+
+    if codecs.lookup(encoding).name in BYTE_LEVEL_ENCODINGS:
+        return TargetFormat("utf-8", byte_level=True, crlf=_has_crlf(header))
+
+    crlf = "\r\n" in header.decode(encoding, errors="ignore")
+    return TargetFormat(encoding, byte_level=False, crlf=crlf)
+
+
+def text_rules(replacements: list[tuple[str, str]], fmt: TargetFormat) -> list[tuple[str, str]]:
+    """Adapt the line feeds of the rendered rules to the target file's line endings."""
+    if not fmt.crlf:
+        return replacements
+
+    def _to_crlf(text: str) -> str:
+        return text.replace("\r\n", "\n").replace("\n", "\r\n")
+
+    return [(_to_crlf(search), _to_crlf(replace)) for search, replace in replacements]
+
+
+def byte_rules(replacements: list[tuple[str, str]], fmt: TargetFormat) -> list[tuple[bytes, bytes]]:
+    """Encode the rendered rules, adapted to the target file's line endings, for byte matching."""
+    return [
+        (search.encode(fmt.encoding), replace.encode(fmt.encoding))
+        for search, replace in text_rules(replacements, fmt)
+    ]
+
+
+def text_scoped_rules(scoped: "list[ScopedRule]", fmt: TargetFormat) -> "list[ScopedRule]":
+    """Adapt the line feeds of literal scoped rules to the target file's line endings."""
+    if not fmt.crlf:
+        return scoped
+
+    adapted = []
+    for rule in scoped:
+        if rule.current is None:
+            ((search, replace),) = text_rules([(rule.search, rule.replace)], fmt)
+            rule = rule._replace(search=search, replace=replace)
+        adapted.append(rule)
+
+    return adapted
+
+
+def decode_errors(fmt: TargetFormat) -> str:
+    """Return the error handler for decoding the contents of a target file of the given format."""
+    # Undecodable bytes of files processed as raw bytes must survive a round trip unchanged
+    return "surrogateescape" if fmt.byte_level else "strict"
+
+
+def replace_contents(
+    data: bytes,
+    replacements: list[tuple[str, str]],
+    fmt: TargetFormat,
+    scoped: "list[ScopedRule] | None" = None,
+) -> tuple[bytes, list[int]]:
+    """
+    Apply the rendered rules to the provided file contents in a single scan.
+
+    Contents are only decoded, & re-encoded, if the target file is not processed as raw bytes or if
+    `scoped` rules are provided, which are always matched against decoded text.
+
+    Returns the replaced contents along with a list of per-rule hit counts.
+    """
+    if scoped is not None:
+        from bumper.scoped import ScopedMatcher
+
+        errors = decode_errors(fmt)
+        text = data.decode(fmt.encoding, errors)
+        new, hits = ScopedMatcher(text_scoped_rules(scoped, fmt)).apply(text)
+        return (data if new == text else new.encode(fmt.encoding, errors)), hits
+
+    if fmt.byte_level:
+        return RuleMatcher(byte_rules(replacements, fmt)).apply(data)
+
+    text = data.decode(fmt.encoding)
+    new, hits = RuleMatcher(text_rules(replacements, fmt)).apply(text)
+    return (data if new is text else new.encode(fmt.encoding)), hits
+
+
+def text_matcher(
+    replacements: list[tuple[str, str]], scoped: "list[ScopedRule] | None", fmt: TargetFormat
+) -> "RuleMatcher[str] | ScopedMatcher":
+    """Build the matcher of the rendered rules, adapted to the target file's line endings."""
+    if scoped is not None:
+        from bumper.scoped import ScopedMatcher
+
+        return ScopedMatcher(text_scoped_rules(scoped, fmt))
+
+    return RuleMatcher(text_rules(replacements, fmt))
+
+
+def contents_diff(
+    data: bytes, matcher: "RuleMatcher[str] | ScopedMatcher", fmt: TargetFormat, label: str
+) -> tuple[str | None, list[int]]:
+    """
+    Build the diff of applying the matcher's rules to the provided file contents.
+
+    The contents are decoded for display; any bytes that can't be decoded are replaced.
+
+    Returns the diff, which is `None` if no modifications are made, along with a list of per-rule
+    hit counts.
+    """
+    text = data.decode(fmt.encoding, errors="replace")
+    diff_lines, hits = match_diff(text, matcher, fromfile=label)
+    if not diff_lines:
+        return None, hits
+
+    # Strip trailing whitespace to make testing easier
+    return "\n".join(line.rstrip() for line in diff_lines), hits
+
+
+def read_scope(f: t.BinaryIO, matcher: "ScopedMatcher", fmt: TargetFormat) -> tuple[str, bool, int]:
+    """
+    Read & decode the prefix of the file that is required to apply the matcher's rules.
+
+    If every rule is bounded, the file is read in chunks of increasing size until the text read so
+    far, up to its last line feed, covers every rule's scope; see `ScopedMatcher.covers`. Otherwise,
+    the file is read in full.
+
+    Returns the decoded prefix, whether it spans the full file, & the number of bytes read.
+    """
+    decoder = codecs.getincrementaldecoder(fmt.encoding)(decode_errors(fmt))
+    bounded = all(rule.options.bounded for rule in matcher.rules)
+    text = ""
+    n_read = 0
+    size = PROBE_SIZE
+    while True:
+        chunk = f.read(size if bounded else -1)
+        n_read += len(chunk)
+        eof = not bounded or len(chunk) < size
+        text += decoder.decode(chunk, final=eof)
+        if eof:
+            return text, True, n_read
+
+        # Bounds are only evaluated over whole lines, so a match can't be cut off by the chunk
+        prefix = text[: text.rfind("\n") + 1]
+        if prefix and matcher.covers(prefix):
+            return prefix, False, n_read
+
+        size *= 2
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import os
+import shutil
+import typing as t
+from pathlib import Path
+
+from bumper.cache import read_cache, write_cache
+
+JOURNAL_FILENAME = "transaction.json"
+
+
+class JournalEntry(t.NamedTuple):
+    """
+    A target file moved into place by a transaction.
+
+    `staged` is the temporary file containing the target's new contents & `backup` is the link to
+    the target's original contents, which is created before the staged file is moved into place.
+    All paths are absolute, so the journal does not depend on the current directory.
+    """
+
+    target: str
+    staged: str
+    backup: str
+
+
+def _backup_path(target: Path) -> Path:
+    return target.with_name(f".{target.name}.bumper-backup")
+
+
+def _backup(entry: JournalEntry) -> None:
+    """
+    Preserve the original contents of the entry's target file.
+
+    The backup is a hard link to the target file, so no data is copied; the file is copied instead
+    if the filesystem does not support hard links.
+    """
+    backup = Path(entry.backup)
+    backup.unlink(missing_ok=True)
+    try:
+        os.link(entry.target, backup)
+    except OSError:
+        shutil.copy2(entry.target, backup)
+
+
+def _sync(paths: t.Iterable[str]) -> None:
+    """
+    Flush the provided files to disk.
+
+    A single `os.sync` is used where it is available, rather than flushing each file in turn.
+    Otherwise, each file is flushed individually.
+    """
+    if hasattr(os, "sync"):
+        os.sync()
+        return
+
+    for path in paths:
+        fd = os.open(path, os.O_RDWR | getattr(os, "O_BINARY", 0))
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+def _rollback(entries: list[JournalEntry]) -> None:
+    """Restore the original contents of each entry's target file & discard its staged file."""
+    for entry in entries:
+        if os.path.exists(entry.backup):
+            os.replace(entry.backup, entry.target)
+        Path(entry.staged).unlink(missing_ok=True)
+
+
+def _cleanup(entries: list[JournalEntry], cache_dir: Path) -> None:
+    for entry in entries:
+        Path(entry.backup).unlink(missing_ok=True)
+    (cache_dir / JOURNAL_FILENAME).unlink(missing_ok=True)
+
+
+def commit(staged: list[tuple[Path, Path]], cache_dir: Path) -> None:
+    """
+    Atomically move each of the provided `(target, staged)` files into place, in the order given.
+
+    The transaction is performed as follows:
+        1. A journal of the transaction is written to the cache directory
+        2. The journal & staged files are flushed to disk in a single pass
+        3. Each target file is linked to a backup, then replaced by its staged file
+        4. The replaced target files are flushed to disk in a single pass
+        5. The backups & journal are removed
+
+    If any target file can't be replaced, the target files replaced so far are restored from their
+    backups, the remaining staged files are discarded, & the exception is re-raised. If the process
+    is interrupted, the journal is used by `recover` to complete or roll back the transaction.
+    """
+    entries = [
+        JournalEntry(
+            str(target.absolute()), str(tmp.absolute()), str(_backup_path(target).absolute())
+        )
+        for target, tmp in staged
+    ]
+    try:
+        write_cache(cache_dir, JOURNAL_FILENAME, {"files": [list(entry) for entry in entries]})
+        _sync(entry.staged for entry in entries)
+
+        for entry in entries:
+            _backup(entry)
+            os.replace(entry.staged, entry.target)
+    except BaseException:
+        _rollback(entries)
+        _cleanup(entries, cache_dir)
+        raise
+
+    _sync(entry.target for entry in entries)
+    _cleanup(entries, cache_dir)
+
+
+def recover(cache_dir: Path) -> bool:
+    """
+    Resolve a transaction that was interrupted, if a journal of one remains in the cache directory.
+
+    If every staged file has been moved into place, the transaction had completed & only its backups
+    are removed. Otherwise, each target file is restored from its backup, if one was made, & the
+    remaining staged files are discarded.
+
+    Returns `True` if an interrupted transaction was rolled back.
+    """
+    files = read_cache(cache_dir, JOURNAL_FILENAME).get("files")
+    if not files:
+        return False
+
+    entries = [JournalEntry(*entry) for entry in files]
+    rolled_back = any(os.path.exists(entry.staged) for entry in entries)
+    if rolled_back:
+        _rollback(entries)
+
+    _cleanup(entries, cache_dir)
+    return rolled_back
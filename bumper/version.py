@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+IDENTIFIER_CHARS = frozenset("0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ-")
+
+
+class InvalidVersionError(ValueError): ...  # noqa: D101
+
+
+def _parse_release(raw: str, text: str) -> tuple[int, ...]:
+    components = raw.split(".")
+    for c in components:
+        if not (c.isascii() and c.isdigit()):
+            raise InvalidVersionError(f"Invalid version: '{text}'")
+
+    return tuple(int(c) for c in components)
+
+
+def _parse_identifiers(raw: str, text: str) -> tuple[str, ...]:
+    identifiers = tuple(raw.split("."))
+    for ident in identifiers:
+        if not ident or not IDENTIFIER_CHARS.issuperset(ident):
+            raise InvalidVersionError(f"Invalid version: '{text}'")
+
+    return identifiers
+
+
+def _prerelease_key(prerelease: tuple[str, ...]) -> tuple[tuple[int, int | str], ...]:
+    """
+    Build the comparison key for the provided pre-release identifiers.
+
+    Numeric identifiers are compared numerically & sort before alphanumeric identifiers, which are
+    compared lexically. A version without pre-release identifiers sorts after any pre-release of
+    the same release.
+    """
+    if not prerelease:
+        return ((2, 0),)
+
+    return tuple((0, int(i)) if i.isdigit() else (1, i) for i in prerelease)
+
+
+class Version:
+    """
+    Lightweight SemVer/CalVer version.
+
+    Versions are composed of a dot-separated release of non-negative integers, optionally followed
+    by SemVer pre-release (`-rc.1`) and build (`+build.5`) identifiers, e.g. `1.2.3-rc.1+build.5`. A
+    leading `v` is accepted & discarded.
+
+    Releases compare numerically with trailing zeros ignored, so `1.0` is equal to `1.0.0`.
+    Pre-release identifiers are ordered following SemVer precedence. Build metadata does not
+    contribute to ordering, but versions are only equal if their build metadata also matches.
+
+    NOTE: Leading zeros are not preserved; the release is always rendered in its integer form, e.g.
+    `2025.01.0` is rendered as `2025.1.0`.
+    """
+
+    __slots__ = ("release", "prerelease", "build", "_key", "_str")
+
+    release: tuple[int, ...]
+    prerelease: tuple[str, ...]
+    build: tuple[str, ...]
+    _key: tuple[tuple[int, ...], tuple[tuple[int, int | str], ...]]
+    _str: str | None
+
+    def __init__(self, version: str) -> None:
+        text = version.strip()
+        remainder = text[1:] if text[:1] in ("v", "V") else text
+
+        remainder, plus, build = remainder.partition("+")
+        remainder, dash, prerelease = remainder.partition("-")
+
+        self._set(
+            release=_parse_release(remainder, text),
+            prerelease=_parse_identifiers(prerelease, text) if dash else (),
+            build=_parse_identifiers(build, text) if plus else (),
+        )
+
+    def _set(
+        self, release: tuple[int, ...], prerelease: tuple[str, ...], build: tuple[str, ...]
+    ) -> None:
+        self.release = release
+        self.prerelease = prerelease
+        self.build = build
+
+        # Trailing zeros don't affect the release's ordering
+        n_significant = len(release)
+        while n_significant > 1 and release[n_significant - 1] == 0:
+            n_significant -= 1
+
+        self._key = (release[:n_significant], _prerelease_key(prerelease))
+        self._str = None
+
+    @classmethod
+    def from_parts(
+        cls,
+        release: tuple[int, ...],
+        prerelease: tuple[str, ...] = (),
+        build: tuple[str, ...] = (),
+    ) -> Version:
+        """Build a version directly from its components, without parsing."""
+        ver = cls.__new__(cls)
+        ver._set(release, prerelease, build)
+        return ver
+
+    def _component(self, idx: int) -> int:
+        return self.release[idx] if len(self.release) > idx else 0
+
+    @property
+    def major(self) -> int:  # noqa: D102
+        return self._component(0)
+
+    @property
+    def minor(self) -> int:  # noqa: D102
+        return self._component(1)
+
+    @property
+    def micro(self) -> int:  # noqa: D102
+        return self._component(2)
+
+    def __str__(self) -> str:
+        if self._str is None:
+            rendered = ".".join(str(c) for c in self.release)
+            if self.prerelease:
+                rendered = f"{rendered}-{'.'.join(self.prerelease)}"
+            if self.build:
+                rendered = f"{rendered}+{'.'.join(self.build)}"
+
+            self._str = rendered
+
+        return self._str
+
+    def __repr__(self) -> str:
+        return f"Version('{self}')"
+
+    def __hash__(self) -> int:
+        return hash((self._key, self.build))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Version):
+            return NotImplemented
+
+        return self._key == other._key and self.build == other.build
+
+    def __lt__(self, other: Version) -> bool:
+        return self._key < other._key
+
+    def __le__(self, other: Version) -> bool:
+        return self._key <= other._key
+
+    def __gt__(self, other: Version) -> bool:
+        return self._key > other._key
+
+    def __ge__(self, other: Version) -> bool:
+        return self._key >= other._key
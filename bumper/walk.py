@@ -0,0 +1,266 @@
+from __future__ import annotations
+
+import os
+import re
+import typing as t
+from pathlib import Path
+
+GLOB_CHARS = frozenset("*?[")
+
+# VCS metadata directories are never descended into
+VCS_DIRS = frozenset((".git", ".hg", ".svn"))
+
+
+def has_magic(pattern: str) -> bool:
+    """Check whether the provided path contains any glob wildcards."""
+    return not GLOB_CHARS.isdisjoint(pattern)
+
+
+def _translate(pattern: str) -> str:
+    """
+    Translate the provided glob pattern into an equivalent regular expression.
+
+    `*` and `?` do not match across path separators. `**/` matches zero or more directories, and a
+    trailing `**` matches everything beneath its parent directory.
+    """
+    out = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if pattern.startswith("**", i):
+            i += 2
+            if pattern.startswith("/", i):
+                out.append("(?:.*/)?")
+                i += 1
+            else:
+                out.append(".*")
+            continue
+
+        if c == "*":
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[" and (j := pattern.find("]", i + 2)) != -1:
+            contents = pattern[i + 1 : j].replace("\\", "\\\\")
+            if contents.startswith("!"):
+                contents = f"^{contents[1:]}"
+
+            out.append(f"[{contents}]")
+            i = j
+        else:
+            out.append(re.escape(c))
+
+        i += 1
+
+    return "".join(out)
+
+
+def compile_glob(pattern: str) -> re.Pattern[str]:
+    """Compile the provided glob pattern into a regex that must match an entire POSIX path."""
+    return re.compile(rf"(?s:{_translate(pattern)})\Z")
+
+
+class IgnoreRule(t.NamedTuple):  # noqa: D101
+    base: str
+    regex: re.Pattern[str]
+    negate: bool
+    dir_only: bool
+    anchored: bool
+
+    @classmethod
+    def from_line(cls, line: str, base: str) -> IgnoreRule | None:
+        """
+        Build an ignore rule from a line of a `.gitignore` file located in the `base` directory.
+
+        `None` is returned for blank lines & comments.
+        """
+        line = line.rstrip()
+        if not line or line.startswith("#"):
+            return None
+
+        negate = line.startswith("!")
+        if negate:
+            line = line[1:]
+
+        dir_only = line.endswith("/")
+        line = line.rstrip("/")
+        anchored = "/" in line
+        line = line.lstrip("/")
+        if not line:
+            return None
+
+        return cls(
+            base=base,
+            regex=compile_glob(line),
+            negate=negate,
+            dir_only=dir_only,
+            anchored=anchored,
+        )
+
+    def matches(self, rel_path: str, is_dir: bool) -> bool:
+        """Check whether the provided path, relative to the walk root, is matched by this rule."""
+        if self.dir_only and not is_dir:
+            return False
+
+        if self.base:
+            if not rel_path.startswith(f"{self.base}/"):
+                return False
+            rel_path = rel_path[len(self.base) + 1 :]
+
+        if not self.anchored:
+            rel_path = rel_path.rpartition("/")[2]
+
+        return self.regex.match(rel_path) is not None
+
+
+def _read_gitignore(gitignore: Path, base: str) -> list[IgnoreRule]:
+    """Parse the rules declared by the provided `.gitignore` file."""
+    try:
+        lines = gitignore.read_text(errors="replace").splitlines()
+    except OSError:
+        return []
+
+    rules = (IgnoreRule.from_line(line, base) for line in lines)
+    return [r for r in rules if r is not None]
+
+
+def _is_ignored(rel_path: str, is_dir: bool, rules: list[IgnoreRule]) -> bool:
+    """Check the provided path against the active ignore rules; the last matching rule wins."""
+    ignored = False
+    for rule in rules:
+        if rule.matches(rel_path, is_dir):
+            ignored = not rule.negate
+
+    return ignored
+
+
+def _join(parent: str, name: str) -> str:
+    return f"{parent}/{name}" if parent else name
+
+
+def walk_files(root_dir: Path, start: str = "", max_depth: int | None = None) -> t.Iterator[str]:
+    """
+    Yield the POSIX path, relative to `root_dir`, of every file beneath the `start` directory.
+
+    The tree is walked with `os.scandir`, loading `.gitignore` files as they are encountered.
+    Ignored directories & VCS metadata directories are pruned without being descended into. If
+    `max_depth` is specified, the walk descends at most this many directories below `start`.
+    """
+    rules: list[IgnoreRule] = []
+
+    # Ignore rules declared between the root & the start of the walk still apply to the walk
+    if start and not Path(start).is_absolute():
+        parent = ""
+        for part in start.split("/"):
+            rules = rules + _read_gitignore(root_dir / parent / ".gitignore", parent)
+            parent = _join(parent, part)
+
+    to_visit = [(start, rules, 0)]
+    while to_visit:
+        rel_dir, rules, depth = to_visit.pop()
+        try:
+            with os.scandir(root_dir / rel_dir) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+
+        if any(e.name == ".gitignore" for e in entries):
+            rules = rules + _read_gitignore(root_dir / rel_dir / ".gitignore", rel_dir)
+
+        subdirs = []
+        descend = max_depth is None or depth < max_depth
+        for entry in entries:
+            rel_path = _join(rel_dir, entry.name)
+            if entry.is_dir(follow_symlinks=False):
+                if not descend or entry.name in VCS_DIRS:
+                    continue
+                if not _is_ignored(rel_path, True, rules):
+                    subdirs.append((rel_path, rules, depth + 1))
+            elif entry.is_file() and not _is_ignored(rel_path, False, rules):
+                yield rel_path
+
+        to_visit.extend(reversed(subdirs))
+
+
+def git_ls_files(root_dir: Path, starts: t.Iterable[str]) -> list[str] | None:
+    """
+    List the tracked & untracked, but not ignored, files beneath the provided `starts` directories.
+
+    Returned paths are POSIX paths relative to `root_dir`. `None` is returned if `root_dir` is not
+    within a git work tree or git is not available.
+    """
+    import subprocess
+
+    cmd = ["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard", "--"]
+    try:
+        proc = subprocess.run(
+            [*cmd, *(s or "." for s in starts)], cwd=root_dir, capture_output=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    # Files deleted from the work tree are still listed if they're in the index
+    listed = proc.stdout.decode().split("\0")
+    return [p for p in dict.fromkeys(listed) if p and (root_dir / p).is_file()]
+
+
+def _walk_root(pattern: str) -> tuple[str, int | None]:
+    """
+    Determine the directory that must be walked to expand the provided pattern.
+
+    Returns the leading directory components of the pattern that contain no wildcards, along with
+    the number of directory levels below them that must be descended; this is `None` if the
+    pattern contains a recursive `**` wildcard.
+    """
+    parts = pattern.split("/")
+    n_literal = 0
+    for part in parts[:-1]:
+        if has_magic(part):
+            break
+        n_literal += 1
+
+    remainder = parts[n_literal:]
+    max_depth = None if any("**" in part for part in remainder) else len(remainder) - 1
+    return "/".join(parts[:n_literal]), max_depth
+
+
+def expand_globs(
+    patterns: t.Iterable[str], root_dir: Path, use_git: bool = False
+) -> dict[str, list[Path]]:
+    """
+    Expand the provided glob patterns into the files they match beneath `root_dir`.
+
+    Candidate files are gathered once for all patterns, walking only the literal directory prefixes
+    of the patterns & only as deep as the patterns require. Ignored files & VCS metadata are never
+    matched. If `use_git` is `True`, the candidates are listed using `git ls-files`, falling back to
+    walking the tree if this fails.
+
+    Returned paths are relative to `root_dir` & are sorted for each pattern.
+    """
+    compiled = {}
+    walks: dict[str, int | None] = {}
+    for pattern in patterns:
+        normalized = pattern.removeprefix("./")
+        compiled[pattern] = compile_glob(normalized)
+
+        start, max_depth = _walk_root(normalized)
+        if start not in walks:
+            walks[start] = max_depth
+        elif (depth := walks[start]) is not None:
+            walks[start] = None if max_depth is None else max(depth, max_depth)
+
+    # Recursive walks already cover any walk of their subdirectories
+    recursive = [s for s, depth in walks.items() if depth is None]
+    for start in list(walks):
+        if any(start != r and (not r or start.startswith(f"{r}/")) for r in recursive):
+            del walks[start]
+
+    candidates = git_ls_files(root_dir, walks) if use_git else None
+    if candidates is None:
+        candidates = [p for s, depth in walks.items() for p in walk_files(root_dir, s, depth)]
+
+    candidates = sorted(set(candidates))
+    return {
+        pattern: [Path(p) for p in candidates if regex.match(p)]
+        for pattern, regex in compiled.items()
+    }
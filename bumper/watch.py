@@ -0,0 +1,361 @@
+from __future__ import annotations
+
+import abc
+import os
+import select
+import struct
+import sys
+import time
+import typing as t
+from collections import defaultdict
+from pathlib import Path
+
+from bumper.check import (
+    CheckJob,
+    CheckResult,
+    check_job,
+    check_jobs,
+    report_check,
+    report_failures,
+)
+from bumper.config import BumperConfigError, BumperFile, CONFIG_SEARCH, parse_config
+from bumper.targets import archive_part
+
+if t.TYPE_CHECKING:
+    import threading
+    from types import TracebackType
+
+    from bumper.version import Version
+
+POLL_INTERVAL = 1.0  # Seconds
+
+# Changes are collected until none have been seen for this long, so a burst of writes to the same
+# file, e.g. by an editor, only triggers a single rescan
+DEBOUNCE = 0.05  # Seconds
+
+# Event flags of inotify(7)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_DELETE
+
+# Fixed size header of each `struct inotify_event`, followed by the null padded name
+EVENT_HEADER = struct.Struct("iIII")
+READ_SIZE = 1 << 16
+
+
+class Watcher(abc.ABC):
+    """
+    Base class for watching a set of file paths for modifications.
+
+    Watchers are context managers, closing any resources they hold on exit.
+    """
+
+    @abc.abstractmethod
+    def watch(self, paths: t.Iterable[Path]) -> None:
+        """Replace the set of watched paths; paths that don't yet exist may also be watched."""
+
+    @abc.abstractmethod
+    def wait(self, timeout: float) -> set[Path]:
+        """
+        Block until any of the watched paths are modified, or `timeout` seconds have elapsed.
+
+        Returns the modified paths, which is empty if the timeout elapsed.
+        """
+
+    def close(self) -> None:  # noqa: B027
+        """Release any resources held by the watcher; there are none by default."""
+
+    def __enter__(self) -> t.Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+class PollingWatcher(Watcher):
+    """
+    Watch paths by polling their status every `interval` seconds.
+
+    A path is modified if its modification time, size, or inode changes, or if it's created or
+    deleted.
+    """
+
+    def __init__(self, interval: float = POLL_INTERVAL) -> None:
+        self.interval = interval
+        self._stats: dict[Path, tuple[int, int, int] | None] = {}
+
+    @staticmethod
+    def _stat(path: Path) -> tuple[int, int, int] | None:
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+
+        return st.st_mtime_ns, st.st_size, st.st_ino
+
+    def watch(self, paths: t.Iterable[Path]) -> None:  # noqa: D102
+        self._stats = {path: self._stat(path) for path in paths}
+
+    def wait(self, timeout: float) -> set[Path]:  # noqa: D102
+        deadline = time.monotonic() + timeout
+        while True:
+            changed = set()
+            for path, before in self._stats.items():
+                after = self._stat(path)
+                if after != before:
+                    self._stats[path] = after
+                    changed.add(path)
+
+            remaining = deadline - time.monotonic()
+            if changed or remaining <= 0:
+                return changed
+
+            time.sleep(min(self.interval, remaining))
+
+
+class InotifyWatcher(Watcher):
+    """
+    Watch paths using the Linux inotify API, called through `ctypes`.
+
+    The parent directory of each path is watched rather than the path itself, so a file replaced by
+    moving a new file into place, as done by many editors & by bumper itself, remains watched. Paths
+    are compared in their absolute form.
+
+    Raises `OSError` if inotify is unavailable, or `AttributeError` if the C library doesn't
+    provide it.
+    """
+
+    def __init__(self) -> None:
+        import ctypes
+        import ctypes.util
+
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f"Failed to initialize inotify: {os.strerror(errno)}")
+
+        self._dirs: dict[int, Path] = {}
+        self._paths: set[Path] = set()
+
+    def watch(self, paths: t.Iterable[Path]) -> None:  # noqa: D102
+        self._paths = {path.absolute() for path in paths}
+        dirs = {path.parent for path in self._paths}
+        for wd, directory in list(self._dirs.items()):
+            if directory not in dirs:
+                self._libc.inotify_rm_watch(self._fd, wd)
+                del self._dirs[wd]
+
+        # Directories that don't exist can't be watched; their paths are picked up on a reload
+        for directory in dirs.difference(self._dirs.values()):
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), WATCH_MASK)
+            if wd >= 0:
+                self._dirs[wd] = directory
+
+    def _read_events(self) -> set[Path]:
+        """Drain the pending inotify events, returning the watched paths they refer to."""
+        try:
+            data = os.read(self._fd, READ_SIZE)
+        except BlockingIOError:
+            return set()
+
+        changed = set()
+        pos = 0
+        while pos < len(data):
+            wd, mask, _, name_len = EVENT_HEADER.unpack_from(data, pos)
+            pos += EVENT_HEADER.size
+            name = data[pos : pos + name_len].rstrip(b"\0")
+            pos += name_len
+            if mask & IN_Q_OVERFLOW:
+                # Events have been dropped, so any of the watched paths may have been modified
+                return set(self._paths)
+
+            directory = self._dirs.get(wd)
+            if directory is not None and name:
+                path = directory / os.fsdecode(name)
+                if path in self._paths:
+                    changed.add(path)
+
+        return changed
+
+    def wait(self, timeout: float) -> set[Path]:  # noqa: D102
+        changed: set[Path] = set()
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = max(deadline - time.monotonic(), 0)
+            ready, _, _ = select.select([self._fd], [], [], remaining)
+            if not ready:
+                return changed
+
+            found = self._read_events()
+            if found:
+                changed |= found
+                deadline = time.monotonic() + DEBOUNCE
+
+    def close(self) -> None:  # noqa: D102
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def open_watcher(use_polling: bool = False, interval: float = POLL_INTERVAL) -> Watcher:
+    """
+    Open a watcher using inotify, where available, otherwise falling back to polling.
+
+    If `use_polling` is `True`, a polling watcher is always used.
+    """
+    if not use_polling and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher()
+        except (OSError, AttributeError):
+            pass
+
+    return PollingWatcher(interval)
+
+
+class ConsistencyIndex:
+    """
+    Live index of whether each search rule of a project matches the project's current version.
+
+    The index holds the check result of each of the project's target files, including its
+    configuration file, keyed by the target file's path. Results are refreshed per target file, so
+    only the files that have changed are rescanned; if the configuration file changes, it's parsed
+    again & every target file is rescanned.
+
+    NOTE: Glob patterns are only expanded when the configuration is loaded.
+    """
+
+    def __init__(self, cfg_path: Path) -> None:
+        self.cfg_path = cfg_path.absolute()
+        self.current_version: Version
+        self.results: dict[Path, CheckResult] = {}
+        self._jobs: dict[Path, list[CheckJob]] = {}
+        self.reload()
+
+    def reload(self) -> list[CheckResult]:
+        """
+        Parse the configuration file & rescan every target file, returning their results.
+
+        Raises `BumperConfigError` if the configuration is invalid, `ValueError` if it can't be
+        parsed (e.g. it's malformed TOML or doesn't exist), or `OSError` if it can't be read; in
+        each case the index is left unchanged.
+        """
+        current_version, _, files, options = parse_config(self.cfg_path)
+        files = [*files, BumperFile(file=Path(self.cfg_path.name), search=CONFIG_SEARCH)]
+        jobs = check_jobs(
+            current_version,
+            files,
+            root_dir=self.cfg_path.parent,
+            use_git=options.use_git_ls_files,
+        )
+
+        # Archive members are rescanned whenever their archive changes
+        self._jobs = defaultdict(list)
+        for job in jobs:
+            self._jobs[Path(archive_part(job.file))].append(job)
+
+        self.current_version = current_version
+        self.results = {job.file: check_job(job) for job in jobs}
+        return list(self.results.values())
+
+    @property
+    def paths(self) -> set[Path]:
+        """Paths whose modification requires the index to be refreshed."""
+        return {self.cfg_path, *self._jobs}
+
+    @property
+    def ok(self) -> bool:  # noqa: D102
+        return all(result.ok for result in self.results.values())
+
+    def refresh(self, changed: t.Iterable[Path]) -> list[CheckResult]:
+        """
+        Rescan the target files affected by the provided modified paths, returning their results.
+
+        Results are returned in the order their target files are declared. If the configuration
+        file is one of the paths, the index is reloaded; see `reload`.
+        """
+        changed = {path.absolute() for path in changed}
+        if self.cfg_path in changed:
+            return self.reload()
+
+        refreshed = set()
+        for path in changed:
+            for job in self._jobs.get(path, []):
+                self.results[job.file] = check_job(job)
+                refreshed.add(job.file)
+
+        return [result for file, result in self.results.items() if file in refreshed]
+
+
+def _report_drift(previous: dict[Path, CheckResult], refreshed: list[CheckResult]) -> None:
+    """
+    Provide command line feedback for each of the refreshed target files.
+
+    Every failed rule of a refreshed file is reported, while files are only reported as consistent
+    if they weren't previously.
+    """
+    for result in refreshed:
+        if not result.ok:
+            report_failures(result)
+            continue
+
+        before = previous.get(result.file)
+        if before is None or not before.ok:
+            print(f"{result.label} - All search rule(s) matched.")
+
+
+def watch(
+    cfg_path: Path,
+    use_polling: bool = False,
+    interval: float = POLL_INTERVAL,
+    stop: threading.Event | None = None,
+) -> None:
+    """
+    Watch the project's target files, reporting any drift from its current version as it happens.
+
+    Every search rule is checked once up front, then each target file is rescanned as soon as it's
+    modified; see `ConsistencyIndex`. Modifications are detected using inotify where available,
+    otherwise the target files are polled every `interval` seconds; see `open_watcher`. If the
+    configuration file is modified, it's parsed again & every rule is rechecked. If the modified
+    configuration is invalid, malformed, or briefly missing, it's reported & the previous
+    configuration is retained.
+
+    Runs until interrupted, or until `stop` is set, which is checked at least every `interval`
+    seconds.
+
+    Raises `BumperConfigError` if the configuration is initially invalid.
+    """
+    index = ConsistencyIndex(cfg_path)
+    failure = report_check(list(index.results.values()))
+    if failure is not None:
+        print(failure)
+
+    with open_watcher(use_polling, interval) as watcher:
+        watcher.watch(index.paths)
+        print(f"Watching {len(index.paths)} file(s) for changes to version {index.current_version}")
+        while stop is None or not stop.is_set():
+            changed = watcher.wait(interval)
+            if not changed:
+                continue
+
+            previous = dict(index.results)
+            try:
+                refreshed = index.refresh(changed)
+            except (BumperConfigError, ValueError, OSError) as e:
+                # Editors may briefly remove, or partially write, the file while saving it
+                print(f"Invalid configuration, the previous configuration is retained: {e}")
+                continue
+
+            if index.cfg_path in changed:
+                watcher.watch(index.paths)
+                print(f"Reloaded configuration, current version is {index.current_version}")
+
+            _report_drift(previous, refreshed)
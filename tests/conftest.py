@@ -2,6 +2,11 @@ from pathlib import Path
 
 import pytest
 
+from bumper.bump import BumpType, FileResult, bump_files
+from bumper.config import BumperFile
+from bumper.profiling import Profile
+from bumper.version import Version
+
 SAMPLE_README = """\
 # bumper
 [![PyPI - Python Version](https://some.url/sco1-bumper/0.1.0?logo=python)]
@@ -28,6 +33,20 @@ requires = ["hatchling"]
 build-backend = "hatchling.build"
 """
 
+SAMPLE_PROJECT_CONFIG = """\
+[tool.bumper]
+current_version = "0.1.9"
+versioning_type = "semver"
+
+[[tool.bumper.files]]
+file = "./README.md"
+search = "rev: v{current_version}"
+
+[[tool.bumper.files]]
+file = "./VERSION"
+search = "{current_version}"
+"""
+
 
 @pytest.fixture
 def dummy_repo(tmp_path: Path) -> Path:
@@ -35,3 +54,26 @@ def dummy_repo(tmp_path: Path) -> Path:
     (tmp_path / "pyproject.toml").write_text(SAMPLE_PYPROJECT)
 
     return tmp_path
+
+
+@pytest.fixture
+def in_tmp_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Run the test from its temporary directory, so relative target paths resolve within it."""
+    monkeypatch.chdir(tmp_path)
+
+
+@pytest.fixture
+def project_dir(tmp_path: Path) -> Path:
+    """Build a `0.1.9` SemVer project targeting its `README.md` & `VERSION` files."""
+    (tmp_path / ".bumper.toml").write_text(SAMPLE_PROJECT_CONFIG)
+    (tmp_path / "README.md").write_text("rev: v0.1.9\nrev: v0.1.9\n")
+    (tmp_path / "VERSION").write_text("0.1.9")
+
+    return tmp_path
+
+
+def bump_minor(
+    files: list[BumperFile], dry_run: bool = False, profile: Profile | None = None
+) -> list[FileResult]:
+    """Bump the provided rules from `0.9.0` to `0.10.0`, returning the result of each file."""
+    return bump_files(Version("0.9.0"), files, BumpType.MINOR, dry_run, profile=profile).files
@@ -0,0 +1,229 @@
+import gzip
+import io
+import struct
+import typing as t
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from bumper.archive import rewrite_zip
+from bumper.bump import BumpType, Project, bump_files, bump_projects
+from bumper.check import affected_bumpers, check_rules
+from bumper.config import BumperFile, BumperOptions
+from bumper.version import Version
+from tests.conftest import bump_minor
+
+METADATA = "Name: pkg\nVersion: 0.9.0\n"
+INIT = '__version__ = "0.9.0"\n'
+
+
+pytestmark = pytest.mark.usefixtures("in_tmp_path")
+
+
+def _build_zip(path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("pkg/__init__.py", INIT, compress_type=zipfile.ZIP_DEFLATED)
+        zf.writestr("pkg/data.bin", bytes(range(256)) * 64, compress_type=zipfile.ZIP_STORED)
+        zf.writestr("pkg/METADATA", METADATA, compress_type=zipfile.ZIP_DEFLATED)
+        zf.comment = b"built by tests"
+
+
+def _raw_members(path: Path) -> dict[str, bytes]:
+    """Read the local header & compressed data of each member, as stored in the archive."""
+    data = path.read_bytes()
+    with zipfile.ZipFile(path) as zf:
+        infos = sorted(zf.infolist(), key=lambda info: info.header_offset)
+        # The central directory's offset is recorded by the end of central directory record
+        (directory,) = struct.unpack_from("<L", data, data.rindex(b"PK\x05\x06") + 16)
+        ends = [info.header_offset for info in infos[1:]] + [directory]
+        return {
+            info.filename: data[info.header_offset : end]
+            for info, end in zip(infos, ends, strict=True)
+        }
+
+
+def test_rewrite_zip(tmp_path: Path) -> None:
+    archive = tmp_path / "pkg.zip"
+    _build_zip(archive)
+
+    out_path = tmp_path / "out.zip"
+    with out_path.open("wb") as f:
+        rewrite_zip(archive, f, {"pkg/__init__.py": b'__version__ = "1.0.0"\n'})
+
+    with zipfile.ZipFile(out_path) as zf:
+        assert zf.testzip() is None
+        assert zf.namelist() == ["pkg/__init__.py", "pkg/data.bin", "pkg/METADATA"]
+        assert zf.read("pkg/__init__.py") == b'__version__ = "1.0.0"\n'
+        assert zf.getinfo("pkg/__init__.py").compress_type == zipfile.ZIP_DEFLATED
+        assert zf.comment == b"built by tests"
+
+    original, rewritten = _raw_members(archive), _raw_members(out_path)
+    assert rewritten["pkg/data.bin"] == original["pkg/data.bin"]
+    assert rewritten["pkg/METADATA"] == original["pkg/METADATA"]
+
+
+class _UnseekableBuffer(io.BytesIO):
+    def seekable(self) -> bool:
+        return False
+
+    def seek(self, *args: t.Any) -> int:
+        raise io.UnsupportedOperation("seek")
+
+
+def test_rewrite_zip_data_descriptors(tmp_path: Path) -> None:
+    # Archives written to an unseekable stream record each member's sizes in a data descriptor
+    buf = _UnseekableBuffer()
+    with zipfile.ZipFile(buf, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+        zf.writestr("pkg/METADATA", METADATA)
+        zf.writestr("pkg/data.txt", "data\n" * 1000)
+    archive = tmp_path / "pkg.zip"
+    archive.write_bytes(buf.getvalue())
+
+    out_path = tmp_path / "out.zip"
+    with out_path.open("wb") as f:
+        rewrite_zip(archive, f, {"pkg/METADATA": b"Name: pkg\nVersion: 1.0.0\n"})
+
+    with zipfile.ZipFile(out_path) as zf:
+        assert zf.testzip() is None
+        assert zf.read("pkg/METADATA") == b"Name: pkg\nVersion: 1.0.0\n"
+    assert _raw_members(out_path)["pkg/data.txt"] == _raw_members(archive)["pkg/data.txt"]
+
+
+def test_bump_zip_member() -> None:
+    archive = Path("dist/pkg.zip")
+    _build_zip(archive)
+    original = _raw_members(archive)
+
+    files = [BumperFile(Path("dist/pkg.zip::pkg/METADATA"), "Version: {current_version}")]
+    (result,) = bump_minor(files)
+    assert result.changed and result.hits == [1]
+    assert result.file == archive and result.label == "pkg.zip"
+    assert result.rules == ["pkg/METADATA::Version: {current_version}"]
+    assert result.bytes_written == archive.stat().st_size
+
+    with zipfile.ZipFile(archive) as zf:
+        assert zf.testzip() is None
+        assert zf.read("pkg/METADATA") == b"Name: pkg\nVersion: 0.10.0\n"
+
+    rewritten = _raw_members(archive)
+    assert rewritten["pkg/__init__.py"] == original["pkg/__init__.py"]
+    assert rewritten["pkg/data.bin"] == original["pkg/data.bin"]
+
+
+def test_bump_zip_members_rewritten_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    _build_zip(Path("dist/pkg.zip"))
+
+    from bumper import archive
+
+    n_rewrites = 0
+    real_rewrite = archive.rewrite_zip
+
+    def _count_rewrite(*args: object) -> None:
+        nonlocal n_rewrites
+        n_rewrites += 1
+        real_rewrite(*args)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(archive, "rewrite_zip", _count_rewrite)
+    files = [
+        BumperFile(Path("dist/*.zip::pkg/METADATA"), "Version: {current_version}"),
+        BumperFile(Path("dist/pkg.zip::pkg/__init__.py"), '__version__ = "{current_version}"'),
+    ]
+    (result,) = bump_files(Version("0.9.0"), files, BumpType.PATCH).files
+    assert result.changed and result.hits == [1, 1]
+    assert n_rewrites == 1
+
+    with zipfile.ZipFile("dist/pkg.zip") as zf:
+        assert zf.read("pkg/METADATA") == b"Name: pkg\nVersion: 0.9.1\n"
+        assert zf.read("pkg/__init__.py") == b'__version__ = "0.9.1"\n'
+
+
+def test_bump_zip_unchanged() -> None:
+    _build_zip(Path("pkg.zip"))
+    original = Path("pkg.zip").read_bytes()
+
+    files = [BumperFile(Path("pkg.zip::pkg/METADATA"), "Release: {current_version}")]
+    (result,) = bump_files(Version("0.9.0"), files, BumpType.PATCH).files
+    assert not result.changed and result.hits == [0]
+    assert Path("pkg.zip").read_bytes() == original
+
+
+def test_bump_zip_missing_member() -> None:
+    _build_zip(Path("pkg.zip"))
+
+    files = [BumperFile(Path("pkg.zip::pkg/missing.txt"), "{current_version}")]
+    (result,) = bump_files(Version("0.9.0"), files, BumpType.PATCH).files
+    assert isinstance(result.error, FileNotFoundError)
+    assert "pkg/missing.txt" in str(result.error)
+
+
+def test_bump_zip_dry_run() -> None:
+    _build_zip(Path("pkg.zip"))
+    original = Path("pkg.zip").read_bytes()
+
+    files = [
+        BumperFile(Path("pkg.zip::pkg/METADATA"), "Version: {current_version}"),
+        BumperFile(Path("pkg.zip::pkg/__init__.py"), '__version__ = "{current_version}"'),
+    ]
+    (result,) = bump_files(Version("0.9.0"), files, BumpType.PATCH, dry_run=True).files
+    assert result.changed and result.diff is not None
+    assert "--- pkg.zip::pkg/METADATA" in result.diff
+    assert "+Version: 0.9.1" in result.diff
+    assert '+__version__ = "0.9.1"' in result.diff
+    assert Path("pkg.zip").read_bytes() == original
+
+
+def test_bump_gzip() -> None:
+    target = Path("CHANGELOG.md.gz")
+    with gzip.GzipFile(target, "wb", mtime=1_234_567) as f:
+        f.write(b"# v0.9.0\n")
+
+    files = [BumperFile(target, "v{current_version}")]
+    (result,) = bump_files(Version("0.9.0"), files, BumpType.MAJOR).files
+    assert result.changed and not result.binary and result.hits == [1]
+    assert result.bytes_written == target.stat().st_size
+
+    with gzip.GzipFile(target, "rb") as f:
+        assert f.read() == b"# v1.0.0\n"
+        assert f.mtime == 1_234_567
+
+
+def test_bump_archives_transactional(tmp_path: Path) -> None:
+    (tmp_path / ".bumper.toml").write_text('current_version = "0.9.0"\n')
+    _build_zip(tmp_path / "dist" / "pkg.zip")
+    with gzip.open(tmp_path / "VERSION.gz", "wb") as f:
+        f.write(b"0.9.0\n")
+
+    files = [
+        BumperFile(Path("dist/pkg.zip::pkg/METADATA"), "Version: {current_version}"),
+        BumperFile(Path("VERSION.gz"), "{current_version}"),
+    ]
+    options = BumperOptions(transactional=True)
+    project = Project(tmp_path / ".bumper.toml", Version("0.9.0"), files, options)
+    bump_projects([project], BumpType.MINOR, dry_run=False, n_workers=1, root_dir=tmp_path)
+
+    with zipfile.ZipFile(tmp_path / "dist" / "pkg.zip") as zf:
+        assert zf.read("pkg/METADATA") == b"Name: pkg\nVersion: 0.10.0\n"
+    assert gzip.decompress((tmp_path / "VERSION.gz").read_bytes()) == b"0.10.0\n"
+    assert sorted(p.name for p in (tmp_path / "dist").iterdir()) == ["pkg.zip"]
+
+
+def test_check_archives(tmp_path: Path) -> None:
+    _build_zip(tmp_path / "pkg.zip")
+    (tmp_path / "VERSION.gz").write_bytes(gzip.compress(b"0.9.0\n"))
+
+    files = [
+        BumperFile(Path("pkg.zip::pkg/METADATA"), "Version: {current_version}"),
+        BumperFile(Path("pkg.zip::pkg/METADATA"), "Release: {current_version}"),
+        BumperFile(Path("VERSION.gz"), "{current_version}"),
+    ]
+    results = check_rules(Version("0.9.0"), files, root_dir=tmp_path)
+    assert [r.label for r in results] == ["pkg.zip::pkg/METADATA", "VERSION.gz"]
+    assert [r.matched for r in results] == [[True, False], [True]]
+
+
+def test_affected_bumpers_archive_member() -> None:
+    files = [BumperFile(Path("dist/*.zip::pkg/METADATA"), "Version: {current_version}")]
+    affected = affected_bumpers(files, [Path("dist/pkg.zip"), Path("README.md")])
+    assert [b.file.as_posix() for b in affected] == ["dist/pkg.zip::pkg/METADATA"]
@@ -0,0 +1,112 @@
+from pathlib import Path
+
+import pytest
+
+from bumper.bump import (
+    BumpError,
+    BumpType,
+    FileResult,
+    Project,
+    bump_config,
+    bump_files,
+    bump_project,
+    report_project,
+)
+from bumper.config import BumperFile, BumperOptions, CONFIG_SEARCH
+from bumper.version import Version
+
+
+def test_bump_config(project_dir: Path, capsys: pytest.CaptureFixture) -> None:
+    result = bump_config(project_dir / ".bumper.toml", BumpType.PATCH)
+    assert capsys.readouterr().out == ""
+
+    assert result.ok
+    assert (result.current_version, result.new_version) == (Version("0.1.9"), Version("0.1.10"))
+
+    files = {f.label: f for f in result.files}
+    assert list(files) == ["README.md", "VERSION", ".bumper.toml"]
+    assert all(f.changed and f.error is None and f.diff is None for f in files.values())
+    assert files["README.md"].hits == [2]
+    assert files["README.md"].bytes_written == len("rev: v0.1.10\nrev: v0.1.10\n")
+    assert files["VERSION"].bytes_written == len("0.1.10")
+    assert result.bytes_written == sum(f.bytes_written for f in files.values())
+    assert result.elapsed >= max(f.elapsed for f in files.values()) >= 0
+
+    assert (project_dir / "VERSION").read_text() == "0.1.10"
+
+
+def test_bump_config_in_place_bytes_written(project_dir: Path) -> None:
+    result = bump_config(project_dir / ".bumper.toml", BumpType.MINOR)
+
+    # Replacements of equal length are patched in place, so only the replaced bytes are written
+    files = {f.label: f for f in result.files}
+    assert files["README.md"].bytes_written == 2 * len("rev: v0.2.0")
+    assert (project_dir / "README.md").read_text() == "rev: v0.2.0\nrev: v0.2.0\n"
+
+
+def test_bump_config_dry_run(project_dir: Path) -> None:
+    result = bump_config(project_dir / ".bumper.toml", BumpType.PATCH, dry_run=True)
+
+    (readme,) = (f for f in result.files if f.label == "README.md")
+    assert readme.changed
+    assert readme.bytes_written == 0
+    assert readme.diff is not None
+    assert "+rev: v0.1.10" in readme.diff.splitlines()
+    assert (project_dir / "README.md").read_text() == "rev: v0.1.9\nrev: v0.1.9\n"
+
+
+def test_bump_config_bump_type_mismatch(project_dir: Path) -> None:
+    with pytest.raises(BumpError, match="SemVer"):
+        bump_config(project_dir / ".bumper.toml", BumpType.DATE)
+
+
+def test_bump_project_captures_errors(tmp_path: Path) -> None:
+    (tmp_path / ".bumper.toml").write_text('current_version = "1.0.0"\n')
+    files = [BumperFile(file=Path("missing.txt"), search="{current_version}")]
+    project = Project(tmp_path / ".bumper.toml", Version("1.0.0"), files, BumperOptions())
+
+    result = bump_project(project, BumpType.MAJOR)
+    assert not result.ok
+
+    missing, cfg = result.files
+    assert isinstance(missing.error, FileNotFoundError)
+    assert cfg.changed
+    assert (tmp_path / ".bumper.toml").read_text() == 'current_version = "2.0.0"\n'
+
+
+def test_report_project_dry_run(tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+    (tmp_path / ".bumper.toml").write_text('current_version = "1.0.0"\n')
+    (tmp_path / "VERSION").write_text("1.0.0\n")
+    files = [BumperFile(file=Path("VERSION"), search="{current_version}")]
+    project = Project(tmp_path / ".bumper.toml", Version("1.0.0"), files, BumperOptions())
+
+    report_project(project, BumpType.MAJOR, dry_run=True)
+    assert capsys.readouterr().out.splitlines()[:5] == [
+        "--- VERSION",
+        "+++",
+        "@@ -1 +1 @@",
+        "-1.0.0",
+        "+2.0.0",
+    ]
+    assert (tmp_path / "VERSION").read_text() == "1.0.0\n"
+
+
+def test_bump_files_relative_to_cwd(project_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(project_dir)
+    files = [
+        BumperFile(file=Path("VERSION"), search="{current_version}"),
+        BumperFile(file=Path(".bumper.toml"), search=CONFIG_SEARCH),
+    ]
+
+    result = bump_files(Version("0.1.9"), files, BumpType.MAJOR)
+    assert [f.file for f in result.files] == [Path("VERSION"), Path(".bumper.toml")]
+    assert (project_dir / "VERSION").read_text() == "1.0.0"
+
+
+def test_result_json_round_trip(project_dir: Path) -> None:
+    result = bump_config(project_dir / ".bumper.toml", BumpType.PATCH, dry_run=True)
+    serialized = result.to_json()
+
+    assert serialized["ok"]
+    assert serialized["new_version"] == "0.1.10"
+    assert [FileResult.from_json(f) for f in serialized["files"]] == result.files
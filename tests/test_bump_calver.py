@@ -2,9 +2,9 @@ import datetime as dt
 
 import pytest
 import time_machine
-from packaging.version import Version
 
-from bumper.bump import BumpType, _build_new_version
+from bumper.bump import BumpType, build_new_version
+from bumper.version import Version
 
 CALVER_TEST_CASES = (
     (Version("2025.1.0"), dt.date(year=2025, month=1, day=1), Version("2025.1.1")),
@@ -25,6 +25,6 @@ def test_calver_version_build(
     truth_out: Version,
 ) -> None:
     with time_machine.travel(current_date, tick=False):
-        new_ver = _build_new_version(current_version=current_version, bump_type=BumpType.DATE)
+        new_ver = build_new_version(current_version=current_version, bump_type=BumpType.DATE)
 
     assert new_ver == truth_out
@@ -0,0 +1,126 @@
+import codecs
+from pathlib import Path
+
+import pytest
+
+from bumper.bump import BumpType, FileResult, bump_files, bump_ver
+from bumper.check import check_rules
+from bumper.config import BumperConfigError, BumperFile, BumperOptions
+from bumper.version import Version
+from tests.conftest import bump_minor
+
+pytestmark = pytest.mark.usefixtures("in_tmp_path")
+
+
+def test_declared_encoding(tmp_path: Path) -> None:
+    target = tmp_path / "README.txt"
+    target.write_bytes("Versión: 0.9.0\n".encode("latin-1"))
+    files = [BumperFile(Path("README.txt"), "Versión: {current_version}", "latin-1")]
+
+    (result,) = bump_minor(files)
+    assert result.changed and result.hits == [1]
+    assert target.read_bytes() == "Versión: 0.10.0\n".encode("latin-1")
+
+
+@pytest.mark.parametrize("encoding", ("utf-16-le", "utf-16-be", "utf-32-le", "utf-32-be"))
+def test_bom_detected_encoding(tmp_path: Path, encoding: str) -> None:
+    target = tmp_path / "VERSION"
+    target.write_bytes("\ufeffversion = 0.9.0\r\n".encode(encoding))
+    files = [BumperFile(Path("VERSION"), "version = {current_version}")]
+
+    (result,) = bump_minor(files)
+    assert result.changed and result.hits == [1]
+    assert target.read_bytes() == "\ufeffversion = 0.10.0\r\n".encode(encoding)
+
+
+@pytest.mark.parametrize("stream_threshold", (None, 0))
+def test_bom_detected_encoding_in_place_length(
+    tmp_path: Path, stream_threshold: int | None
+) -> None:
+    target = tmp_path / "VERSION"
+    target.write_bytes("\ufeff0.9.0".encode("utf-16-le"))
+    files = [BumperFile(Path("VERSION"), "{current_version}")]
+
+    options = BumperOptions(stream_threshold=stream_threshold)
+    (result,) = bump_files(Version("0.9.0"), files, BumpType.PATCH, options=options).files
+    assert result.changed
+    assert target.read_bytes() == "\ufeff0.9.1".encode("utf-16-le")
+
+
+def test_binary_file_skipped(tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+    (tmp_path / "logo.png").write_bytes(b"\x89PNG\r\n\x1a\n\x00\x00\x000.9.0")
+    (tmp_path / "notes.txt").write_text("0.9.0\n")
+    files = [BumperFile(Path("./*"), "{current_version}")]
+
+    bump_ver(Version("0.9.0"), files, BumpType.MINOR, dry_run=False)
+    assert "logo.png - Skipped binary file." in capsys.readouterr().out
+    assert (tmp_path / "logo.png").read_bytes() == b"\x89PNG\r\n\x1a\n\x00\x00\x000.9.0"
+    assert (tmp_path / "notes.txt").read_text() == "0.10.0\n"
+
+
+def test_binary_file_result(tmp_path: Path) -> None:
+    (tmp_path / "data.bin").write_bytes(b"\x00\x01" + b"0.9.0")
+
+    (result,) = bump_minor([BumperFile(Path("data.bin"), "{current_version}")])
+    assert result.binary and not result.changed and result.error is None
+    assert FileResult.from_json(result.to_json()).binary
+
+
+def test_invalid_utf8_preserved(tmp_path: Path) -> None:
+    target = tmp_path / "legacy.txt"
+    target.write_bytes(b"caf\xe9 0.9.0\n")
+
+    (result,) = bump_minor([BumperFile(Path("legacy.txt"), "{current_version}")])
+    assert result.changed
+    assert target.read_bytes() == b"caf\xe9 0.10.0\n"
+
+
+def test_invalid_utf8_dry_run(tmp_path: Path) -> None:
+    (tmp_path / "legacy.txt").write_bytes(b"caf\xe9 0.9.0\n")
+
+    (result,) = bump_minor([BumperFile(Path("legacy.txt"), "{current_version}")], dry_run=True)
+    assert result.diff is not None
+    assert "+caf\ufffd 0.10.0" in result.diff.splitlines()
+
+
+@pytest.mark.parametrize("newline", ("\n", "\r\n"))
+def test_multiline_rule_line_endings(tmp_path: Path, newline: str) -> None:
+    target = tmp_path / "CHANGELOG.md"
+    target.write_bytes(f"# Changelog{newline}## 0.9.0{newline}".encode())
+    files = [BumperFile(Path("CHANGELOG.md"), "# Changelog\n## {current_version}")]
+
+    (result,) = bump_minor(files)
+    assert result.hits == [1]
+    assert target.read_bytes() == f"# Changelog{newline}## 0.10.0{newline}".encode()
+
+
+def test_utf8_bom_preserved(tmp_path: Path) -> None:
+    target = tmp_path / "VERSION"
+    target.write_bytes(codecs.BOM_UTF8 + b"0.9.0")
+
+    bump_minor([BumperFile(Path("VERSION"), "{current_version}")])
+    assert target.read_bytes() == codecs.BOM_UTF8 + b"0.10.0"
+
+
+def test_conflicting_encodings_raises(tmp_path: Path) -> None:
+    (tmp_path / "VERSION").write_text("0.9.0")
+    files = [
+        BumperFile(Path("VERSION"), "{current_version}", "latin-1"),
+        BumperFile(Path("VERSION"), "v{current_version}", "cp1252"),
+    ]
+
+    with pytest.raises(BumperConfigError, match="Conflicting encodings"):
+        bump_minor(files)
+
+
+def test_check_declared_encoding(tmp_path: Path) -> None:
+    (tmp_path / "README.txt").write_bytes("Versión: 0.9.0\n".encode("cp1252"))
+    (tmp_path / "data.bin").write_bytes(b"\x00\x01" + b"0.9.0")
+    files = [
+        BumperFile(Path("README.txt"), "Versión: {current_version}", "cp1252"),
+        BumperFile(Path("data.bin"), "{current_version}"),
+    ]
+
+    readme, data = check_rules(Version("0.9.0"), files)
+    assert readme.ok
+    assert not data.ok and "Binary" in str(data.error)
@@ -1,9 +1,10 @@
 from pathlib import Path
 
 import pytest
-from packaging.version import Version
 
-from bumper.bump import BumpType, BumperFile, bump_ver
+from bumper.bump import BumpError, BumpType, BumperFile, bump_ver
+from bumper.config import BumperOptions
+from bumper.version import Version
 
 
 def test_empty_diff_feedback_single_file(dummy_repo: Path, capsys: pytest.CaptureFixture) -> None:
@@ -78,3 +79,67 @@ def test_bumped_feedback_multi_file(dummy_repo: Path, capsys: pytest.CaptureFixt
     captured = capsys.readouterr()
     assert "Bumped pyproject.toml" in captured.out
     assert "Bumped README.md" in captured.out
+
+
+def test_unmatched_rule_feedback(dummy_repo: Path, capsys: pytest.CaptureFixture) -> None:
+    readme = dummy_repo / "README.md"
+    files = [
+        BumperFile(file=readme, search="sco1-bumper/{current_version}"),
+        BumperFile(file=readme, search="rev: {current_version}"),
+    ]
+
+    bump_ver(
+        current_version=Version("0.1.0"),
+        files=files,
+        bump_type=BumpType.MAJOR,
+        dry_run=False,
+    )
+
+    captured = capsys.readouterr()
+    assert "Bumped README.md" in captured.out
+    assert "README.md - No matches for 'rev: {current_version}'" in captured.out
+
+
+def test_parallel_feedback_declared_order(dummy_repo: Path, capsys: pytest.CaptureFixture) -> None:
+    targets = []
+    for idx in range(8):
+        target = dummy_repo / f"target_{idx}.txt"
+        target.write_text("version = 0.1.0\n")
+        targets.append(target)
+
+    files = [BumperFile(file=target, search="version = {current_version}") for target in targets]
+    bump_ver(
+        current_version=Version("0.1.0"),
+        files=files,
+        bump_type=BumpType.MINOR,
+        dry_run=False,
+        options=BumperOptions(workers=4),
+    )
+
+    captured = capsys.readouterr()
+    assert captured.out.splitlines() == [f"Bumped {target.name}" for target in targets]
+    assert all(target.read_text() == "version = 0.2.0\n" for target in targets)
+
+
+def test_failed_file_reported(dummy_repo: Path, capsys: pytest.CaptureFixture) -> None:
+    pyproject = dummy_repo / "pyproject.toml"
+    readme = dummy_repo / "README.md"
+    files = [
+        BumperFile(file=dummy_repo / "missing.md", search="sco1-bumper/{current_version}"),
+        BumperFile(file=pyproject, search='version = "{current_version}"'),
+        BumperFile(file=readme, search="sco1-bumper/{current_version}"),
+    ]
+
+    with pytest.raises(BumpError, match="1 of 3"):
+        bump_ver(
+            current_version=Version("0.1.0"),
+            files=files,
+            bump_type=BumpType.MAJOR,
+            dry_run=False,
+            options=BumperOptions(workers=2),
+        )
+
+    captured = capsys.readouterr()
+    assert "missing.md - Error" in captured.out
+    assert "Bumped pyproject.toml" in captured.out
+    assert "Bumped README.md" in captured.out
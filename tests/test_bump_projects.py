@@ -0,0 +1,82 @@
+from pathlib import Path
+
+import pytest
+
+from bumper.bump import BumpType, Project, bump_projects
+from bumper.config import BumperFile, BumperOptions
+from bumper.version import Version
+
+PROJECT_CONFIG = """\
+[tool.bumper]
+current_version = "{version}"
+versioning_type = "semver"
+"""
+
+
+@pytest.fixture
+def monorepo(tmp_path: Path) -> Path:
+    (tmp_path / "CHANGELOG.md").write_text("pkg_a 0.1.0\npkg_b 1.0.0\n")
+    for name, ver in (("pkg_a", "0.1.0"), ("pkg_b", "1.0.0")):
+        project_dir = tmp_path / "packages" / name
+        project_dir.mkdir(parents=True)
+        (project_dir / ".bumper.toml").write_text(PROJECT_CONFIG.format(version=ver))
+        (project_dir / "pyproject.toml").write_text(f'version = "{ver}"\n')
+
+    return tmp_path
+
+
+def _build_projects(monorepo: Path) -> list[Project]:
+    projects = []
+    for name, ver in (("pkg_a", "0.1.0"), ("pkg_b", "1.0.0")):
+        files = [
+            BumperFile(file=Path("./pyproject.toml"), search='version = "{current_version}"'),
+            BumperFile(file=Path("../../CHANGELOG.md"), search=f"{name} {{current_version}}"),
+        ]
+        cfg_path = monorepo / "packages" / name / ".bumper.toml"
+        projects.append(Project(cfg_path, Version(ver), files, BumperOptions()))
+
+    return projects
+
+
+@pytest.mark.parametrize("n_workers", (1, 2))
+def test_bump_projects(monorepo: Path, n_workers: int, capsys: pytest.CaptureFixture) -> None:
+    projects = _build_projects(monorepo)
+    bump_projects(
+        projects, bump_type=BumpType.PATCH, dry_run=False, n_workers=n_workers, root_dir=monorepo
+    )
+
+    assert (monorepo / "CHANGELOG.md").read_text() == "pkg_a 0.1.1\npkg_b 1.0.1\n"
+    for name, ver in (("pkg_a", "0.1.1"), ("pkg_b", "1.0.1")):
+        project_dir = monorepo / "packages" / name
+        assert (project_dir / "pyproject.toml").read_text() == f'version = "{ver}"\n'
+        assert (project_dir / ".bumper.toml").read_text() == PROJECT_CONFIG.format(version=ver)
+
+    captured = capsys.readouterr()
+    assert captured.out.splitlines() == [
+        "Bumped packages/pkg_a/pyproject.toml",
+        "Bumped CHANGELOG.md",
+        "Bumped packages/pkg_a/.bumper.toml",
+        "Bumped packages/pkg_b/pyproject.toml",
+        "Bumped packages/pkg_b/.bumper.toml",
+    ]
+
+
+TRUTH_SHARED_DIFF = """\
+--- CHANGELOG.md
++++
+@@ -1,2 +1,2 @@
+-pkg_a 0.1.0
+-pkg_b 1.0.0
++pkg_a 0.1.1
++pkg_b 1.0.1
+"""
+
+
+def test_bump_projects_shared_file_dry_run(monorepo: Path, capsys: pytest.CaptureFixture) -> None:
+    projects = _build_projects(monorepo)
+    bump_projects(projects, bump_type=BumpType.PATCH, dry_run=True, root_dir=monorepo)
+
+    assert (monorepo / "CHANGELOG.md").read_text() == "pkg_a 0.1.0\npkg_b 1.0.0\n"
+
+    captured = capsys.readouterr()
+    assert TRUTH_SHARED_DIFF in captured.out
@@ -0,0 +1,202 @@
+from pathlib import Path
+
+import pytest
+
+from bumper.bump import BumpType, bump_files
+from bumper.check import check_rules
+from bumper.config import BumperFile, SearchOptions
+from bumper.profiling import Profile
+from bumper.scoped import compile_search
+from bumper.targets import PROBE_SIZE
+from bumper.version import Version
+from tests.conftest import bump_minor
+
+pytestmark = pytest.mark.usefixtures("in_tmp_path")
+
+
+def _version_rule(search: str, options: SearchOptions) -> list[BumperFile]:
+    return [BumperFile(Path("VERSION"), search, search_options=options)]
+
+
+def test_regex_rule(tmp_path: Path) -> None:
+    target = tmp_path / "VERSION"
+    target.write_text('version = "0.9.0"\nversion_of_dep = "0.9.0"\nVersion: 0.9.0\n')
+
+    (result,) = bump_minor(
+        _version_rule(r'^version\s*=\s*"{current_version}"', SearchOptions(regex=True))
+    )
+    assert result.changed and result.hits == [1]
+    assert target.read_text() == 'version = "0.10.0"\nversion_of_dep = "0.9.0"\nVersion: 0.9.0\n'
+
+
+def test_regex_rule_escapes_version(tmp_path: Path) -> None:
+    target = tmp_path / "VERSION"
+    target.write_text("v0x9y0\nv0.9.0\n")
+
+    (result,) = bump_minor(_version_rule("v{current_version}", SearchOptions(regex=True)))
+    assert result.hits == [1]
+    assert target.read_text() == "v0x9y0\nv0.10.0\n"
+
+
+@pytest.mark.parametrize(
+    ("options", "truth_contents", "truth_hits"),
+    (
+        (SearchOptions(max_occurrences=2), "0.10.0\n0.10.0\n0.9.0\n0.9.0\n", 2),
+        (SearchOptions(first_n_lines=1), "0.10.0\n0.9.0\n0.9.0\n0.9.0\n", 1),
+        (SearchOptions(start="0.9.0\n0.9.0\n"), "0.9.0\n0.9.0\n0.10.0\n0.10.0\n", 2),
+        (SearchOptions(stop="\n0.9.0\n0.9.0"), "0.10.0\n0.9.0\n0.9.0\n0.9.0\n", 1),
+        (SearchOptions(start="\n", stop="\n0.9.0\n"), "0.9.0\n0.10.0\n0.9.0\n0.9.0\n", 1),
+        (SearchOptions(start="missing"), "0.9.0\n0.9.0\n0.9.0\n0.9.0\n", 0),
+    ),
+)
+def test_scoped_rule(
+    tmp_path: Path, options: SearchOptions, truth_contents: str, truth_hits: int
+) -> None:
+    target = tmp_path / "VERSION"
+    target.write_text("0.9.0\n0.9.0\n0.9.0\n0.9.0\n")
+
+    (result,) = bump_minor(_version_rule("{current_version}", options))
+    assert result.hits == [truth_hits]
+    assert target.read_text() == truth_contents
+
+
+@pytest.mark.parametrize("search", ("{current_version}", "0\\.{current_version}"))
+def test_bounded_rule_reads_prefix(tmp_path: Path, search: str) -> None:
+    target = tmp_path / "VERSION"
+    tail = "0.9.0 0.0.9.0\n" * 20_000
+    target.write_text(f"0.0.9.0\n{tail}")
+
+    profile = Profile()
+    (result,) = bump_minor(
+        _version_rule(search, SearchOptions(regex=True, first_n_lines=1)), profile=profile
+    )
+    assert result.changed and result.hits == [1]
+    assert result.profile is not None and result.profile.bytes_read == PROBE_SIZE
+    assert target.read_text() == f"0.0.10.0\n{tail}"
+
+
+def test_bounded_rule_same_length_in_place(tmp_path: Path) -> None:
+    target = tmp_path / "VERSION"
+    tail = "0.9.0\n" * 20_000
+    target.write_text(f"# 0.9.0\n{tail}")
+
+    files = [
+        BumperFile(
+            Path("VERSION"), "# {current_version}", search_options=SearchOptions(max_occurrences=1)
+        )
+    ]
+    (result,) = bump_files(Version("0.9.0"), files, BumpType.PATCH).files
+    assert result.changed and result.bytes_written <= PROBE_SIZE
+    assert target.read_text() == f"# 0.9.1\n{tail}"
+
+
+def test_bounded_rule_spanning_chunks(tmp_path: Path) -> None:
+    target = tmp_path / "VERSION"
+    target.write_text("x" * PROBE_SIZE + "\nVersion: 0.9.0\n0.9.0\n")
+
+    (result,) = bump_minor(
+        _version_rule("Version: {current_version}", SearchOptions(max_occurrences=1))
+    )
+    assert result.hits == [1]
+    assert target.read_text() == "x" * PROBE_SIZE + "\nVersion: 0.10.0\n0.9.0\n"
+
+
+def test_bounded_rule_utf16(tmp_path: Path) -> None:
+    target = tmp_path / "VERSION"
+    contents = "﻿version = 0.9.0\r\n" + "0.9.0\r\n" * 5_000
+    target.write_bytes(contents.encode("utf-16-le"))
+
+    (result,) = bump_minor(
+        _version_rule("version = {current_version}", SearchOptions(first_n_lines=1))
+    )
+    assert result.changed and result.hits == [1]
+    truth = contents.replace("version = 0.9.0", "version = 0.10.0")
+    assert target.read_bytes() == truth.encode("utf-16-le")
+
+
+def test_scoped_multiline_rule_crlf(tmp_path: Path) -> None:
+    target = tmp_path / "VERSION"
+    target.write_bytes(b"[project]\r\nversion = 0.9.0\r\n[dep]\r\nversion = 0.9.0\r\n")
+
+    (result,) = bump_minor(
+        _version_rule("[project]\nversion = {current_version}", SearchOptions(first_n_lines=2))
+    )
+    assert result.hits == [1]
+    assert target.read_bytes() == b"[project]\r\nversion = 0.10.0\r\n[dep]\r\nversion = 0.9.0\r\n"
+
+
+def test_scoped_rule_preserves_undecodable_bytes(tmp_path: Path) -> None:
+    target = tmp_path / "VERSION"
+    target.write_bytes(b"caf\xe9 0.9.0\n")
+
+    (result,) = bump_minor(_version_rule("{current_version}", SearchOptions(max_occurrences=1)))
+    assert result.changed
+    assert target.read_bytes() == b"caf\xe9 0.10.0\n"
+
+
+def test_scoped_rule_dry_run(tmp_path: Path) -> None:
+    target = tmp_path / "VERSION"
+    target.write_text("0.9.0\n0.9.0\n")
+
+    (result,) = bump_minor(
+        _version_rule("{current_version}", SearchOptions(max_occurrences=1)), dry_run=True
+    )
+    assert result.hits == [1]
+    # The unmodified second line is aligned with the original first line, as with difflib
+    assert result.diff == "--- VERSION\n+++\n@@ -0,0 +1 @@\n+0.10.0\n@@ -2 +2,0 @@\n-0.9.0"
+    assert target.read_text() == "0.9.0\n0.9.0\n"
+
+
+def test_scoped_rule_mixed_with_plain_rule(tmp_path: Path) -> None:
+    target = tmp_path / "VERSION"
+    target.write_text("v0.9.0\nv0.9.0\nrev: 0.9.0\n")
+    files = [
+        BumperFile(
+            Path("VERSION"), "v{current_version}", search_options=SearchOptions(max_occurrences=1)
+        ),
+        BumperFile(Path("VERSION"), "rev: {current_version}"),
+    ]
+
+    (result,) = bump_minor(files)
+    assert result.hits == [1, 1]
+    assert target.read_text() == "v0.10.0\nv0.9.0\nrev: 0.10.0\n"
+
+
+def test_search_declared_with_different_scopes(tmp_path: Path) -> None:
+    target = tmp_path / "VERSION"
+    target.write_text("0.9.0\n0.9.0\n[docs]\n0.9.0\n")
+    files = [
+        BumperFile(
+            Path("VERSION"), "{current_version}", search_options=SearchOptions(first_n_lines=1)
+        ),
+        BumperFile(
+            Path("VERSION"), "{current_version}", search_options=SearchOptions(start="[docs]")
+        ),
+        BumperFile(
+            Path("VERSION"), "{current_version}", search_options=SearchOptions(first_n_lines=1)
+        ),
+    ]
+
+    (result,) = bump_minor(files)
+    assert result.rules == ["{current_version}", "{current_version}"]
+    assert result.hits == [1, 1]
+    assert target.read_text() == "0.10.0\n0.9.0\n[docs]\n0.10.0\n"
+
+
+def test_check_scoped_rule(tmp_path: Path) -> None:
+    (tmp_path / "VERSION").write_text("header\n0.9.0\n")
+    files = [
+        BumperFile(
+            Path("VERSION"), "^{current_version}$", search_options=SearchOptions(regex=True)
+        ),
+        BumperFile(
+            Path("VERSION"), "{current_version}", search_options=SearchOptions(first_n_lines=1)
+        ),
+    ]
+
+    (result,) = check_rules(Version("0.9.0"), files)
+    assert result.matched == [True, False]
+
+
+def test_compile_search_cached() -> None:
+    assert compile_search(r"v\d+", regex=True) is compile_search(r"v\d+", regex=True)
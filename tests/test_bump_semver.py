@@ -1,10 +1,12 @@
+import codecs
 from pathlib import Path
 
 import pytest
-from packaging.version import Version
 
-from bumper.bump import BumpType, _build_new_version, _merge_bumpers, bump_ver
-from bumper.config import BumperFile
+from bumper.bump import BumpType, _merge_bumpers, build_new_version, bump_ver
+from bumper.config import BumperConfigError, BumperFile, BumperOptions
+from bumper.targets import TargetFormat, byte_rules, sniff_format
+from bumper.version import Version
 from tests.conftest import SAMPLE_PYPROJECT, SAMPLE_README
 
 VERSION_BUILD_TEST_CASES = (
@@ -25,7 +27,7 @@ VERSION_BUILD_TEST_CASES = (
 
 @pytest.mark.parametrize(("current_version", "bump_type", "truth_out"), VERSION_BUILD_TEST_CASES)
 def test_version_build(current_version: Version, bump_type: BumpType, truth_out: Version) -> None:
-    assert _build_new_version(current_version, bump_type) == truth_out
+    assert build_new_version(current_version, bump_type) == truth_out
 
 
 def test_merge_bumpers() -> None:
@@ -43,6 +45,30 @@ def test_merge_bumpers() -> None:
     assert _merge_bumpers(files) == truth_out
 
 
+def test_merge_bumpers_glob(dummy_repo: Path) -> None:
+    (dummy_repo / "docs").mkdir()
+    (dummy_repo / "docs" / "index.md").touch()
+    files = [
+        BumperFile(file=Path("./README.md"), search="sco1-bumper/{current_version}"),
+        BumperFile(file=Path("**/*.md"), search="sco1-bumper/{current_version}"),
+        BumperFile(file=Path("*.md"), search="rev: v{current_version}"),
+    ]
+
+    truth_out = {
+        Path("README.md"): ["sco1-bumper/{current_version}", "rev: v{current_version}"],
+        Path("docs/index.md"): ["sco1-bumper/{current_version}"],
+    }
+
+    assert _merge_bumpers(files, root_dir=dummy_repo) == truth_out
+
+
+def test_merge_bumpers_unmatched_glob_raises(dummy_repo: Path) -> None:
+    files = [BumperFile(file=Path("docs/*.md"), search="sco1-bumper/{current_version}")]
+
+    with pytest.raises(BumperConfigError, match="No files match the pattern 'docs/\\*.md'"):
+        _merge_bumpers(files, root_dir=dummy_repo)
+
+
 TRUTH_BUMPED_README = """\
 # bumper
 [![PyPI - Python Version](https://some.url/sco1-bumper/0.2.0?logo=python)]
@@ -152,3 +178,101 @@ def test_bump_ver_multi_replace_dry_run(dummy_repo: Path, capsys: pytest.Capture
 
     captured = capsys.readouterr()
     assert captured.out == TRUTH_MULTI_DIFF
+
+
+def test_bump_ver_streaming(dummy_repo: Path) -> None:
+    # Bump to a longer version string so the file can't be patched in place
+    pyproject = dummy_repo / "pyproject.toml"
+    readme = dummy_repo / "README.md"
+    pyproject.write_text(SAMPLE_PYPROJECT.replace("0.1.0", "0.9.0"))
+    readme.write_text(SAMPLE_README.replace("0.1.0", "0.9.0"))
+    files = [
+        BumperFile(file=pyproject, search='version = "{current_version}"'),
+        BumperFile(file=readme, search="sco1-bumper/{current_version}"),
+        BumperFile(file=readme, search="rev: v{current_version}"),
+    ]
+
+    bump_ver(
+        current_version=Version("0.9.0"),
+        files=files,
+        bump_type=BumpType.MINOR,
+        dry_run=False,
+        options=BumperOptions(stream_threshold=0),
+    )
+
+    assert pyproject.read_text() == TRUTH_BUMPED_PYPROJECT.replace("0.2.0", "0.10.0")
+    assert readme.read_text() == TRUTH_BUMPED_README.replace("0.2.0", "0.10.0")
+    assert sorted(p.name for p in dummy_repo.iterdir()) == ["README.md", "pyproject.toml"]
+
+
+def test_bump_ver_streaming_no_changes(dummy_repo: Path) -> None:
+    pyproject = dummy_repo / "pyproject.toml"
+    files = [
+        BumperFile(file=pyproject, search='version = "{current_version}"'),
+    ]
+
+    bump_ver(
+        current_version=Version("100.200.300"),
+        files=files,
+        bump_type=BumpType.MINOR,
+        dry_run=False,
+        options=BumperOptions(stream_threshold=0),
+    )
+
+    assert pyproject.read_text() == SAMPLE_PYPROJECT
+    assert sorted(p.name for p in dummy_repo.iterdir()) == ["README.md", "pyproject.toml"]
+
+
+SNIFF_FORMAT_TEST_CASES = (
+    (b"version = 0.1.0", None, TargetFormat("utf-8", byte_level=True, crlf=False)),
+    (b"version = 0.1.0\r\n", None, TargetFormat("utf-8", byte_level=True, crlf=True)),
+    (codecs.BOM_UTF8 + b"version = 0.1.0", None, TargetFormat("utf-8", True, False)),
+    (b"", None, TargetFormat("utf-8", byte_level=True, crlf=False)),
+    (b"version = 0.1.0", "UTF8", TargetFormat("utf-8", byte_level=True, crlf=False)),
+    (b"version = 0.1.0", "utf-8-sig", TargetFormat("utf-8", byte_level=True, crlf=False)),
+    (b"version = 0.1.0", "latin-1", TargetFormat("latin-1", byte_level=False, crlf=False)),
+    ("version\r\n".encode("utf-16-le"), None, None),
+    ("\ufeffversion\r\n".encode("utf-16-le"), None, TargetFormat("utf-16-le", False, True)),
+    ("\ufeffversion".encode("utf-16-be"), None, TargetFormat("utf-16-be", False, False)),
+    ("\ufeffversion".encode("utf-32-le"), None, TargetFormat("utf-32-le", False, False)),
+    ("version".encode("utf-16-le"), "utf-16-le", TargetFormat("utf-16-le", False, False)),
+    (b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR", None, None),
+)
+
+
+@pytest.mark.parametrize(("header", "declared", "truth_out"), SNIFF_FORMAT_TEST_CASES)
+def test_sniff_format(header: bytes, declared: str | None, truth_out: TargetFormat | None) -> None:
+    assert sniff_format(header, declared) == truth_out
+
+
+BYTE_RULES_TEST_CASES = (
+    ([("0.1.0", "0.1.1")], False, [(b"0.1.0", b"0.1.1")]),
+    ([("0.1.0\n", "0.1.1\n")], False, [(b"0.1.0\n", b"0.1.1\n")]),
+    ([("0.1.0\n", "0.1.1\n")], True, [(b"0.1.0\r\n", b"0.1.1\r\n")]),
+    ([("0.1.0\r\n", "0.1.1\r\n")], True, [(b"0.1.0\r\n", b"0.1.1\r\n")]),
+    (
+        [("ver\u00e9 0.1.0", "ver\u00e9 0.1.1")],
+        False,
+        [(b"ver\xc3\xa9 0.1.0", b"ver\xc3\xa9 0.1.1")],
+    ),
+)
+
+
+@pytest.mark.parametrize(("replacements", "crlf", "truth_out"), BYTE_RULES_TEST_CASES)
+def test_byte_rules(
+    replacements: list[tuple[str, str]], crlf: bool, truth_out: list[tuple[bytes, bytes]]
+) -> None:
+    fmt = TargetFormat("utf-8", byte_level=True, crlf=crlf)
+    assert byte_rules(replacements, fmt) == truth_out
+
+
+def test_bump_ver_in_place_preserves_line_endings(dummy_repo: Path) -> None:
+    pyproject = dummy_repo / "pyproject.toml"
+    pyproject.write_bytes(SAMPLE_PYPROJECT.replace("\n", "\r\n").encode())
+    files = [
+        BumperFile(file=pyproject, search='version = "{current_version}"'),
+    ]
+
+    bump_ver(current_version=Version("0.1.0"), files=files, bump_type=BumpType.MINOR, dry_run=False)
+
+    assert pyproject.read_bytes() == TRUTH_BUMPED_PYPROJECT.replace("\n", "\r\n").encode()
@@ -0,0 +1,141 @@
+from pathlib import Path
+
+import pytest
+
+from bumper import check
+from bumper.check import affected_bumpers, check_project, check_rules, main
+from bumper.config import BumperFile
+from bumper.version import Version
+
+README_RULE = "rev: v{current_version}"
+PYPROJECT_RULE = 'version = "{current_version}"'
+
+SAMPLE_CONFIG = f"""\
+[tool.bumper]
+current_version = "0.1.0"
+versioning_type = "semver"
+
+[[tool.bumper.files]]
+file = "./README.md"
+search = "{README_RULE}"
+
+[[tool.bumper.files]]
+file = "./pyproject.toml"
+search = '{PYPROJECT_RULE}'
+"""
+
+
+@pytest.fixture
+def project(dummy_repo: Path) -> Path:
+    (dummy_repo / ".bumper.toml").write_text(SAMPLE_CONFIG)
+    return dummy_repo
+
+
+def test_check_rules(project: Path) -> None:
+    files = [
+        BumperFile(file=Path("README.md"), search=README_RULE),
+        BumperFile(file=Path("README.md"), search="sco1-bumper/{current_version}"),
+        BumperFile(file=Path("README.md"), search="missing {current_version}"),
+        BumperFile(file=Path("pyproject.toml"), search=PYPROJECT_RULE),
+    ]
+    results = check_rules(Version("0.1.0"), files, root_dir=project)
+
+    matched = {r.label: r.matched for r in results}
+    assert matched == {"README.md": [True, True, False], "pyproject.toml": [True]}
+    assert [r.ok for r in results] == [False, True]
+
+
+def test_check_rules_missing_file(project: Path) -> None:
+    files = [BumperFile(file=Path("CHANGELOG.md"), search=README_RULE)]
+    (result,) = check_rules(Version("0.1.0"), files, root_dir=project)
+
+    assert not result.ok
+    assert isinstance(result.error, FileNotFoundError)
+
+
+@pytest.mark.parametrize("n_workers", (1, 2))
+def test_check_rules_chunk_boundary(
+    tmp_path: Path, n_workers: int, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(check, "CHUNK_SIZE", 8)
+    (tmp_path / "a.txt").write_text(f"{'x' * 6}rev: v1.2.3\n")
+    (tmp_path / "b.txt").write_text(f"{'x' * 30}rev: v1.2.4\n")
+
+    files = [BumperFile(file=Path(f), search=README_RULE) for f in ("a.txt", "b.txt")]
+    results = check_rules(Version("1.2.3"), files, n_workers=n_workers, root_dir=tmp_path)
+    assert [r.matched for r in results] == [[True], [False]]
+
+
+def test_check_rules_multiline(tmp_path: Path) -> None:
+    (tmp_path / "a.txt").write_text("[project]\nversion = 1.2.3\n")
+    files = [BumperFile(file=Path("a.txt"), search="[project]\nversion = {current_version}")]
+
+    (result,) = check_rules(Version("1.2.3"), files, root_dir=tmp_path)
+    assert result.matched == [True]
+
+
+AFFECTED_CASES: tuple[tuple[list[str], list[str]], ...] = (
+    (["README.md"], ["README.md"]),
+    (["./README.md", "other.py"], ["README.md"]),
+    (["docs/api.md", "docs/nested/deep.md", "src/a.py"], ["docs/api.md"]),
+    (["other.py"], []),
+)
+
+
+@pytest.mark.parametrize(("changed", "truth_files"), AFFECTED_CASES)
+def test_affected_bumpers(changed: list[str], truth_files: list[str]) -> None:
+    files = [
+        BumperFile(file=Path("./README.md"), search=README_RULE),
+        BumperFile(file=Path("./docs/*.md"), search=README_RULE),
+    ]
+    affected = affected_bumpers(files, (Path(p) for p in changed))
+    assert [b.file.as_posix() for b in affected] == truth_files
+
+
+def test_check_project_paths(project: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(project)
+    (project / "pyproject.toml").write_text("")
+
+    results = check_project(Path(".bumper.toml"), paths=[Path("README.md")])
+    assert [r.label for r in results] == ["README.md"]
+    assert all(r.ok for r in results)
+
+    # Modifying the configuration file may affect every rule
+    results = check_project(Path(".bumper.toml"), paths=[Path(".bumper.toml")])
+    assert [r.label for r in results] == ["README.md", "pyproject.toml", ".bumper.toml"]
+    assert [r.ok for r in results] == [True, False, True]
+
+
+def test_check_main(
+    project: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture
+) -> None:
+    monkeypatch.chdir(project)
+    assert main([]) == 0
+    assert capsys.readouterr().out == "All 3 search rule(s) matched.\n"
+
+    (project / "README.md").write_text("rev: v0.0.9\n")
+    assert main(["README.md", "--workers", "2"]) == 1
+    assert capsys.readouterr().out == (
+        "README.md - No matches for 'rev: v{current_version}'\n"
+        "1 of 1 search rule(s) failed to match.\n"
+    )
+
+
+def test_check_main_no_config(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / ".git").mkdir()
+    monkeypatch.chdir(tmp_path)
+    assert main([]) == 1
+
+
+def test_check_main_from_subdirectory(
+    project: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture
+) -> None:
+    (project / "docs").mkdir()
+    (project / "README.md").write_text("rev: v0.0.9\n")
+    monkeypatch.chdir(project / "docs")
+
+    assert main([str(Path("..", "README.md"))]) == 1
+    assert capsys.readouterr().out == (
+        "README.md - No matches for 'rev: v{current_version}'\n"
+        "1 of 1 search rule(s) failed to match.\n"
+    )
@@ -0,0 +1,78 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from bumper import CACHE_DIR, cache
+from bumper.cache import CONFIG_CACHE_FILENAME, ConfigCache
+from bumper.config import BumperConfigError, parse_config
+from tests import TEST_DATA_DIR
+
+
+@pytest.fixture
+def cfg_path(tmp_path: Path) -> Path:
+    cfg_path = tmp_path / ".bumper.toml"
+    cfg_path.write_text((TEST_DATA_DIR / "sample_config.toml").read_text())
+    return cfg_path
+
+
+def test_config_cache_hit_skips_parse(
+    cfg_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    config_cache = ConfigCache.load(tmp_path / CACHE_DIR)
+    parsed = config_cache.parse(cfg_path)
+    config_cache.save()
+
+    def _no_parse(cfg_path: Path) -> None:
+        raise AssertionError("Configuration parsed despite a cache hit")
+
+    monkeypatch.setattr(cache, "parse_config", _no_parse)
+    assert ConfigCache.load(tmp_path / CACHE_DIR).parse(cfg_path) == parsed
+    assert parsed == parse_config(cfg_path)
+
+
+def test_config_cache_search_options(cfg_path: Path, tmp_path: Path) -> None:
+    cfg_path.write_text(
+        f'{cfg_path.read_text()}\n[[tool.bumper.files]]\nfile = "./README.md"\n'
+        'search = "^v{current_version}"\nregex = true\nfirst_n_lines = 3\n'
+    )
+    config_cache = ConfigCache.load(tmp_path / CACHE_DIR)
+    config_cache.parse(cfg_path)
+    config_cache.save()
+
+    assert ConfigCache.load(tmp_path / CACHE_DIR).parse(cfg_path) == parse_config(cfg_path)
+
+
+def test_config_cache_modified_config_reparsed(cfg_path: Path, tmp_path: Path) -> None:
+    config_cache = ConfigCache.load(tmp_path / CACHE_DIR)
+    config_cache.parse(cfg_path)
+    config_cache.save()
+
+    cfg_path.write_text(cfg_path.read_text().replace('"0.1.0"', '"0.10.0"'))
+    st = cfg_path.stat()
+    os.utime(cfg_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    current_version, *_ = ConfigCache.load(tmp_path / CACHE_DIR).parse(cfg_path)
+    assert str(current_version) == "0.10.0"
+
+
+def test_config_cache_invalid_config_not_cached(tmp_path: Path) -> None:
+    cfg_path = tmp_path / ".bumper.toml"
+    cfg_path.write_text("[tool.bumper]\n")
+
+    config_cache = ConfigCache.load(tmp_path / CACHE_DIR)
+    with pytest.raises(BumperConfigError):
+        config_cache.parse(cfg_path)
+
+    config_cache.save()
+    assert not (tmp_path / CACHE_DIR).exists()
+
+
+def test_config_cache_corrupt_ignored(cfg_path: Path, tmp_path: Path) -> None:
+    cache_dir = tmp_path / CACHE_DIR
+    cache_dir.mkdir()
+    (cache_dir / CONFIG_CACHE_FILENAME).write_text('{"format": 1, "entries": []}')
+
+    config_cache = ConfigCache.load(cache_dir)
+    assert config_cache.entries == {}
+    assert config_cache.parse(cfg_path) == parse_config(cfg_path)
@@ -0,0 +1,142 @@
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from bumper import CACHE_DIR, cli, config
+from bumper.config import ConfigLocator, _config_in, discover_configs
+
+BUMPER_PYPROJECT = """\
+[tool.bumper]
+current_version = "0.1.0"
+"""
+
+NON_BUMPER_PYPROJECT = """\
+[tool.black]
+line-length = 100
+"""
+
+
+def test_discover_configs(tmp_path: Path) -> None:
+    for subdir in ("pkg_a", "pkg_b", "pkg_c", "pkg_d", ".git", "node_modules/pkg_e"):
+        (tmp_path / subdir).mkdir(parents=True)
+
+    (tmp_path / "pkg_a" / ".bumper.toml").touch()
+    (tmp_path / "pkg_b" / "pyproject.toml").write_text(BUMPER_PYPROJECT)
+    (tmp_path / "pkg_c" / "pyproject.toml").write_text(NON_BUMPER_PYPROJECT)
+    (tmp_path / "pkg_d" / ".bumper.toml").touch()
+    (tmp_path / "pkg_d" / "pyproject.toml").write_text(BUMPER_PYPROJECT)
+    (tmp_path / ".git" / ".bumper.toml").touch()
+    (tmp_path / "node_modules" / "pkg_e" / ".bumper.toml").touch()
+
+    assert discover_configs(tmp_path) == [
+        tmp_path / "pkg_a" / ".bumper.toml",
+        tmp_path / "pkg_b" / "pyproject.toml",
+        tmp_path / "pkg_d" / ".bumper.toml",
+    ]
+
+
+def test_discover_configs_none_found(tmp_path: Path) -> None:
+    assert discover_configs(tmp_path) == []
+
+
+def test_locate_from_subdirectory(tmp_path: Path) -> None:
+    (tmp_path / ".git").mkdir()
+    (tmp_path / "src" / "pkg").mkdir(parents=True)
+    (tmp_path / ".bumper.toml").touch()
+
+    assert ConfigLocator().locate(tmp_path / "src" / "pkg") == tmp_path / ".bumper.toml"
+
+
+def test_locate_priority(tmp_path: Path) -> None:
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".bumper.toml").touch()
+    (tmp_path / "pyproject.toml").write_text(BUMPER_PYPROJECT)
+
+    assert ConfigLocator().locate(tmp_path) == tmp_path / ".bumper.toml"
+
+
+def test_locate_skips_non_bumper_pyproject(tmp_path: Path) -> None:
+    (tmp_path / ".git").mkdir()
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pyproject.toml").write_text(BUMPER_PYPROJECT)
+    (tmp_path / "pkg" / "pyproject.toml").write_text(NON_BUMPER_PYPROJECT)
+
+    assert ConfigLocator().locate(tmp_path / "pkg") == tmp_path / "pyproject.toml"
+
+
+def test_locate_stops_at_repo_root(tmp_path: Path) -> None:
+    (tmp_path / "repo" / ".git").mkdir(parents=True)
+    (tmp_path / ".bumper.toml").touch()
+
+    assert ConfigLocator().locate(tmp_path / "repo") is None
+
+
+def test_locate_memoized(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / ".git").mkdir()
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    (tmp_path / ".bumper.toml").touch()
+
+    searched = []
+
+    def _spy(directory: Path) -> Path | None:
+        searched.append(directory)
+        return _config_in(directory)
+
+    monkeypatch.setattr(config, "_config_in", _spy)
+    locator = ConfigLocator()
+
+    assert locator.locate(tmp_path / "a" / "b") == tmp_path / ".bumper.toml"
+    assert searched == [tmp_path / "a" / "b", tmp_path / "a", tmp_path]
+
+    searched.clear()
+    assert locator.locate(tmp_path / "a") == tmp_path / ".bumper.toml"
+    assert locator.locate(tmp_path / "a" / "b") == tmp_path / ".bumper.toml"
+    assert searched == []
+
+
+SAMPLE_CONFIG = """\
+[tool.bumper]
+current_version = "0.1.0"
+versioning_type = "semver"
+
+[[tool.bumper.files]]
+file = "./README.md"
+search = "rev: v{current_version}"
+"""
+
+
+def test_cli_bump_from_subdirectory(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / ".git").mkdir()
+    (tmp_path / "docs").mkdir()
+    (tmp_path / ".bumper.toml").write_text(SAMPLE_CONFIG)
+    (tmp_path / "README.md").write_text("rev: v0.1.0\n")
+    monkeypatch.chdir(tmp_path / "docs")
+
+    result = CliRunner().invoke(cli.bumper_cli, ["bump", "patch", "--no-daemon"])
+    assert result.exit_code == 0
+    assert (tmp_path / "README.md").read_text() == "rev: v0.1.1\n"
+    assert 'current_version = "0.1.1"' in (tmp_path / ".bumper.toml").read_text()
+    assert not (tmp_path / "docs" / "README.md").exists()
+
+
+def test_cli_cache_beside_config(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / ".git").mkdir()
+    (tmp_path / "docs").mkdir()
+    (tmp_path / ".bumper.toml").write_text(SAMPLE_CONFIG)
+    (tmp_path / "README.md").write_text("rev: v0.1.0\n")
+    monkeypatch.chdir(tmp_path / "docs")
+
+    result = CliRunner().invoke(cli.bumper_cli, ["bump", "patch", "--no-daemon", "--cache"])
+    assert result.exit_code == 0
+    assert (tmp_path / CACHE_DIR).is_dir()
+    assert not (tmp_path / "docs" / CACHE_DIR).exists()
+
+
+def test_cli_no_config(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / ".git").mkdir()
+    monkeypatch.chdir(tmp_path)
+
+    result = CliRunner().invoke(cli.bumper_cli, ["bump", "patch"])
+    assert result.exit_code == 1
+    assert "Configuration file could not be located." in result.stdout
@@ -1,17 +1,22 @@
 import tomllib
+import typing as t
 from pathlib import Path
 
 import pytest
-from packaging import version
 
 from bumper.config import (
     BumperConfigError,
     BumperFile,
+    BumperOptions,
     PARSED_T,
+    SearchOptions,
     VersioningType,
+    _extract_bumper_tables,
+    _parse_options,
     _validate_config,
     parse_config,
 )
+from bumper.version import Version
 from tests import TEST_DATA_DIR
 
 TOML_NO_TOOLS = """\
@@ -87,33 +92,37 @@ def test_nonexistent_config_raises() -> None:
 
 
 TRUTH_SINGLE_REPLACE_SEMVER = (
-    version.Version("0.1.0"),
+    Version("0.1.0"),
     VersioningType.SEMVER,
     [BumperFile(file=Path("./pyproject.toml"), search='version = "{current_version}"')],
+    BumperOptions(),
 )
 TRUTH_SINGLE_REPLACE_CALVER = (
-    version.Version("2025.1.0"),
+    Version("2025.1.0"),
     VersioningType.CALVER,
     [BumperFile(file=Path("./pyproject.toml"), search='version = "{current_version}"')],
+    BumperOptions(),
 )
 
 TRUTH_MULTI_REPLACE_SEMVER = (
-    version.Version("0.1.0"),
+    Version("0.1.0"),
     VersioningType.SEMVER,
     [
         BumperFile(file=Path("./pyproject.toml"), search='version = "{current_version}"'),
         BumperFile(file=Path("./README.md"), search="sco1-bumper/{current_version}"),
         BumperFile(file=Path("./README.md"), search="rev: v{current_version}"),
     ],
+    BumperOptions(),
 )
 TRUTH_MULTI_REPLACE_CALVER = (
-    version.Version("2025.1.0"),
+    Version("2025.1.0"),
     VersioningType.CALVER,
     [
         BumperFile(file=Path("./pyproject.toml"), search='version = "{current_version}"'),
         BumperFile(file=Path("./README.md"), search="sco1-bumper/{current_version}"),
         BumperFile(file=Path("./README.md"), search="rev: v{current_version}"),
     ],
+    BumperOptions(),
 )
 
 CONFIG_PARSER_TEST_CASES = (
@@ -129,3 +138,237 @@ CONFIG_PARSER_TEST_CASES = (
 @pytest.mark.parametrize(("cfg_path", "truth_parsed"), CONFIG_PARSER_TEST_CASES)
 def test_config_parse(cfg_path: Path, truth_parsed: PARSED_T) -> None:
     assert parse_config(cfg_path) == truth_parsed
+
+
+def test_parse_options_defaults() -> None:
+    assert _parse_options({}) == BumperOptions()
+
+
+def test_parse_options_stream_threshold() -> None:
+    assert _parse_options({"stream_threshold": 1024}) == BumperOptions(stream_threshold=1024)
+
+
+def test_parse_options_workers() -> None:
+    assert _parse_options({"workers": 4}) == BumperOptions(workers=4)
+
+
+def test_parse_options_use_git_ls_files() -> None:
+    assert _parse_options({"use_git_ls_files": True}) == BumperOptions(use_git_ls_files=True)
+
+
+INVALID_OPTIONS = (
+    ("stream_threshold", -1),
+    ("stream_threshold", 1.5),
+    ("stream_threshold", "1024"),
+    ("stream_threshold", True),
+    ("workers", 0),
+    ("workers", 2.0),
+    ("workers", False),
+    ("use_git_ls_files", 1),
+    ("use_git_ls_files", "true"),
+    ("occurrence_index", 1),
+    ("transactional", "yes"),
+    ("parallel_threshold", -1),
+)
+
+
+@pytest.mark.parametrize(("key", "value"), INVALID_OPTIONS)
+def test_parse_options_invalid_value_raises(key: str, value: t.Any) -> None:
+    with pytest.raises(BumperConfigError, match=key):
+        _parse_options({key: value})
+
+
+def test_parse_options_occurrence_index() -> None:
+    assert _parse_options({"occurrence_index": True}) == BumperOptions(occurrence_index=True)
+
+
+def test_parse_options_parallel_threshold() -> None:
+    truth_options = BumperOptions(parallel_threshold=1 << 30)
+    assert _parse_options({"parallel_threshold": 1 << 30}) == truth_options
+
+
+def test_parse_options_transactional() -> None:
+    assert _parse_options({"transactional": True}) == BumperOptions(transactional=True)
+
+
+def test_parse_config_invalid_version_raises(tmp_path: Path) -> None:
+    cfg_path = tmp_path / ".bumper.toml"
+    cfg_path.write_text(
+        '[tool.bumper]\ncurrent_version = "one"\nversioning_type = "semver"\n\n'
+        '[[tool.bumper.files]]\nfile = "./README.md"\nsearch = "{current_version}"\n'
+    )
+
+    with pytest.raises(BumperConfigError, match="Invalid version"):
+        parse_config(cfg_path)
+
+
+UNEXTRACTABLE_TOML = (
+    '[tool]\nbumper.current_version = "0.1.0"\n',
+    'tool.bumper.current_version = "0.1.0"\n',
+    '["tool"."bumper"]\ncurrent_version = "0.1.0"\n',
+    '[tool.bumper]\ncurrent_version = """0.1.0"""\n',
+)
+
+
+@pytest.mark.parametrize("raw", UNEXTRACTABLE_TOML)
+def test_extract_bumper_tables_unextractable(raw: str) -> None:
+    assert _extract_bumper_tables(raw) is None
+
+
+def test_extract_bumper_tables() -> None:
+    raw = (
+        '[project]\nname = "sco1-bumper"\n\n[project.scripts]\nbumper = "bumper.cli:bumper_cli"\n\n'
+        '[ tool . bumper ]\ncurrent_version = "0.1.0"\n\n'
+        '[[tool.bumper.files]]  # Comment\nfile = "./README.md"\nsearch = "{current_version}"\n\n'
+        "[tool.black]\nline-length = 100\n"
+    )
+
+    assert _extract_bumper_tables(raw) == (
+        '[ tool . bumper ]\ncurrent_version = "0.1.0"\n\n'
+        '[[tool.bumper.files]]  # Comment\nfile = "./README.md"\nsearch = "{current_version}"\n'
+    )
+
+
+def test_parse_config_dotted_keys(tmp_path: Path) -> None:
+    cfg_path = tmp_path / "pyproject.toml"
+    cfg_path.write_text(
+        '[tool]\nbumper.current_version = "0.1.0"\nbumper.versioning_type = "semver"\n'
+        'bumper.files = [{file = "./pyproject.toml", search = \'version = "{current_version}"\'}]\n'
+    )
+
+    assert parse_config(cfg_path) == TRUTH_SINGLE_REPLACE_SEMVER
+
+
+TOML_FILE_ENCODING = """\
+[tool.bumper]
+current_version = "0.1.0"
+versioning_type = "semver"
+
+[[tool.bumper.files]]
+file = "./README.md"
+search = "{current_version}"
+encoding = "latin-1"
+"""
+
+
+def test_parse_config_file_encoding(tmp_path: Path) -> None:
+    cfg_path = tmp_path / ".bumper.toml"
+    cfg_path.write_text(TOML_FILE_ENCODING)
+
+    _, _, files, _ = parse_config(cfg_path)
+    assert files == [BumperFile(Path("./README.md"), "{current_version}", encoding="latin-1")]
+
+
+@pytest.mark.parametrize(
+    ("encoding", "match"), (('"not-a-codec"', "Unknown encoding"), ("8", "must be a string"))
+)
+def test_parse_config_invalid_file_encoding_raises(
+    tmp_path: Path, encoding: str, match: str
+) -> None:
+    cfg_path = tmp_path / ".bumper.toml"
+    cfg_path.write_text(TOML_FILE_ENCODING.replace('"latin-1"', encoding))
+
+    with pytest.raises(BumperConfigError, match=match):
+        parse_config(cfg_path)
+
+
+TOML_SEARCH_OPTIONS = """\
+[tool.bumper]
+current_version = "0.1.0"
+versioning_type = "semver"
+
+[[tool.bumper.files]]
+file = "./README.md"
+search = '^version = "{current_version}"'
+regex = true
+max_occurrences = 1
+first_n_lines = 10
+start = "[project]"
+stop = "["
+"""
+
+
+def test_parse_config_search_options(tmp_path: Path) -> None:
+    cfg_path = tmp_path / ".bumper.toml"
+    cfg_path.write_text(TOML_SEARCH_OPTIONS)
+
+    _, _, files, _ = parse_config(cfg_path)
+    truth_options = SearchOptions(
+        regex=True, max_occurrences=1, first_n_lines=10, start="[project]", stop="["
+    )
+    assert files == [
+        BumperFile(
+            Path("./README.md"), '^version = "{current_version}"', search_options=truth_options
+        )
+    ]
+
+
+INVALID_SEARCH_OPTIONS = (
+    ("regex = true", "regex = 1", "'regex' must be a boolean"),
+    ("max_occurrences = 1", "max_occurrences = 0", "'max_occurrences' must be at least 1"),
+    ("first_n_lines = 10", 'first_n_lines = "10"', "'first_n_lines' must be an integer"),
+    ('start = "[project]"', 'start = ""', "'start' must be a non-empty string"),
+    ('stop = "["', "stop = 1", "'stop' must be a non-empty string"),
+    ("^version", "(version", "Invalid search regex"),
+)
+
+
+@pytest.mark.parametrize(("old", "new", "match"), INVALID_SEARCH_OPTIONS)
+def test_parse_config_invalid_search_options_raises(
+    tmp_path: Path, old: str, new: str, match: str
+) -> None:
+    cfg_path = tmp_path / ".bumper.toml"
+    cfg_path.write_text(TOML_SEARCH_OPTIONS.replace(old, new))
+
+    with pytest.raises(BumperConfigError, match=match):
+        parse_config(cfg_path)
+
+
+TOML_KEY_RULE = """\
+[tool.bumper]
+current_version = "0.1.0"
+versioning_type = "semver"
+
+[[tool.bumper.files]]
+file = "./package.json"
+key = 'dependencies."@scope/pkg".version'
+"""
+
+
+def test_parse_config_key(tmp_path: Path) -> None:
+    cfg_path = tmp_path / ".bumper.toml"
+    cfg_path.write_text(TOML_KEY_RULE)
+
+    _, _, files, _ = parse_config(cfg_path)
+    truth_options = SearchOptions(key='dependencies."@scope/pkg".version')
+    assert files == [
+        BumperFile(Path("./package.json"), "{current_version}", search_options=truth_options)
+    ]
+
+
+def test_parse_config_key_regex_default_search(tmp_path: Path) -> None:
+    cfg_path = tmp_path / ".bumper.toml"
+    cfg_path.write_text(f"{TOML_KEY_RULE}regex = true\n")
+
+    _, _, files, _ = parse_config(cfg_path)
+    truth_options = SearchOptions(regex=True, key='dependencies."@scope/pkg".version')
+    assert files == [
+        BumperFile(Path("./package.json"), "{current_version}", search_options=truth_options)
+    ]
+
+
+INVALID_KEY_RULES = (
+    ("key = 'dependencies", 'key = "" #', "'key' must be a non-empty string"),
+    ("key = 'dependencies", "first_n_lines = 1\nkey = 'dependencies", "can't be combined"),
+    ("package.json", "package.txt", "only JSON, TOML, & YAML files are supported"),
+    ('"@scope/pkg"', '"@scope/pkg', "Invalid key path"),
+)
+
+
+@pytest.mark.parametrize(("old", "new", "match"), INVALID_KEY_RULES)
+def test_parse_config_invalid_key_raises(tmp_path: Path, old: str, new: str, match: str) -> None:
+    cfg_path = tmp_path / ".bumper.toml"
+    cfg_path.write_text(TOML_KEY_RULE.replace(old, new))
+
+    with pytest.raises(BumperConfigError, match=match):
+        parse_config(cfg_path)
@@ -0,0 +1,114 @@
+import difflib
+import random
+
+import pytest
+
+from bumper.diff import _line_diff, match_diff
+from bumper.replace import RuleMatcher
+
+RULES = [("v1.0.0", "v1.0.1"), ('version = "1.0.0"', 'version = "1.0.1"')]
+
+DIFF_TEST_CASES = (
+    "No matches here\n",
+    "v1.0.0\n",
+    "v1.0.0",
+    "Some text\nv1.0.0\nMore text\n",
+    "v1.0.0 and v1.0.0 again\n",
+    "v1.0.0\nv1.0.0\n\nv1.0.0\n",
+    "Line\r\nv1.0.0\r\nLine\r\n",
+    "Line\rv1.0.0\rLine\r",
+    "Line v1.0.0\x0cLine\n",
+    'version = "1.0.0"\nv1.0.0\nText\nText\nversion = "1.0.0"',
+    "\n\n\nv1.0.0\n\n\n",
+    "x v1.0.0\nx v1.0.1\n",
+    "x v1.0.1\nx v1.0.0\n",
+    "v1.0.0\nv1.0.1\nv1.0.0\n",
+    "a\nv1.0.0\nb\nv1.0.0\na\n",
+    "v1.0.0 v1.0.1\nv1.0.1 v1.0.1\n",
+)
+
+
+@pytest.mark.parametrize("text", DIFF_TEST_CASES)
+def test_match_diff_matches_difflib(text: str) -> None:
+    matcher = RuleMatcher(RULES)
+    new, truth_hits = matcher.apply(text)
+    truth_diff = list(
+        difflib.unified_diff(text.splitlines(), new.splitlines(), fromfile="f", n=0, lineterm="")
+    )
+
+    diff, hits = match_diff(text, matcher, fromfile="f")
+    assert diff == truth_diff
+    assert hits == truth_hits
+
+
+MULTILINE_TEST_CASES = (
+    ("[project]\nversion = 1.0.0", "[project]\nversion = 1.0.1"),
+    ("version = 1.0.0", "version = 1.0.1\nrelease = 2025"),
+    ("[project]\nversion = 1.0.0\n", "version = 1.0.1 "),
+)
+
+
+@pytest.mark.parametrize(("search", "replace"), MULTILINE_TEST_CASES)
+def test_match_diff_multiline_rule(search: str, replace: str) -> None:
+    text = "a\n[project]\nversion = 1.0.0\nb\nc\n[project]\nversion = 1.0.0\n"
+    matcher = RuleMatcher([(search, replace)])
+    new, _ = matcher.apply(text)
+    truth_diff = list(
+        difflib.unified_diff(text.splitlines(), new.splitlines(), fromfile="f", n=0, lineterm="")
+    )
+
+    diff, hits = match_diff(text, matcher, fromfile="f")
+    assert diff == truth_diff
+    assert hits == [2]
+
+
+def test_match_diff_unchanged_rule() -> None:
+    matcher = RuleMatcher([("v1.0.0", "v1.0.0")])
+    assert match_diff("v1.0.0\n", matcher, fromfile="f") == ([], [1])
+
+
+def _truth_diff(text: str, matcher: RuleMatcher[str]) -> list[str]:
+    new, _ = matcher.apply(text)
+    return list(
+        difflib.unified_diff(text.splitlines(), new.splitlines(), fromfile="f", n=0, lineterm="")
+    )
+
+
+def test_match_diff_line_diff_used() -> None:
+    text = (
+        '[project]\nname = "foo"\nversion = "1.0.0"\n\n[tool.bumper]\ncurrent_version = "1.0.0"\n'
+    )
+    matcher = RuleMatcher(RULES)
+    occurrences = [(o, f, r) for o, f, r in matcher.locate(text, [0, 0])]
+
+    assert _line_diff(text, occurrences, ("\n",), "f") == _truth_diff(text, matcher)
+
+
+def test_match_diff_popular_gap() -> None:
+    # difflib ignores lines occurring in more than 1% of a text of at least 200 lines, so the
+    # unmodified lines between these matches aren't aligned & the modified lines form one hunk
+    text = "v1.0.0\n" + "pass\n" * 3 + "v1.0.0\n" + "pass\n" * 300 + "end\n"
+    matcher = RuleMatcher(RULES)
+
+    diff, _ = match_diff(text, matcher, fromfile="f")
+    assert diff == _truth_diff(text, matcher)
+    assert diff[2] == "@@ -1,5 +1,5 @@"
+
+
+FUZZ_LINES = ("x v1.0.0", "x v1.0.1", "v1.0.0 v1.0.0", 'version = "1.0.0"', "a", "b", "", "}")
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_match_diff_matches_difflib_random(seed: int) -> None:
+    rng = random.Random(seed)
+    n_lines = rng.choice((3, 10, 50, 250))
+    lines = [
+        rng.choice(FUZZ_LINES) if rng.random() < 0.7 else f"line {idx}" for idx in range(n_lines)
+    ]
+    sep = rng.choice(("\n", "\r\n", "\r"))
+    text = sep.join(lines) + rng.choice(("", sep))
+    matcher = RuleMatcher(rng.choice((RULES, [("v1.0.0", "")], [("1.0.0\n", "1.0.1")])))
+
+    diff, hits = match_diff(text, matcher, fromfile="f")
+    assert diff == _truth_diff(text, matcher)
+    assert hits == matcher.apply(text)[1]
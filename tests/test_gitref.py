@@ -0,0 +1,189 @@
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from bumper.bump import BumpError, BumpType
+from bumper.config import BumperConfigError
+from bumper.gitref import GitRefError, bump_ref
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git is not available")
+
+SAMPLE_CONFIG = """\
+[tool.bumper]
+current_version = "0.1.0"
+versioning_type = "semver"
+
+[[tool.bumper.files]]
+file = "./README.md"
+search = "rev: v{current_version}"
+
+[[tool.bumper.files]]
+file = "./src/pkg/*.py"
+search = '__version__ = "{current_version}"'
+"""
+
+
+def _git(repo: Path, *args: str) -> str:
+    proc = subprocess.run(["git", *args], cwd=repo, capture_output=True, check=True, text=True)
+    return proc.stdout.strip()
+
+
+@pytest.fixture
+def repo(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    for var in ("GIT_AUTHOR", "GIT_COMMITTER"):
+        monkeypatch.setenv(f"{var}_NAME", "bumper")
+        monkeypatch.setenv(f"{var}_EMAIL", "bumper@example.com")
+
+    repo = tmp_path / "repo"
+    (repo / "src" / "pkg").mkdir(parents=True)
+    (repo / ".bumper.toml").write_text(SAMPLE_CONFIG)
+    (repo / "README.md").write_text("rev: v0.1.0\r\n")
+    (repo / "src" / "pkg" / "__init__.py").write_text('__version__ = "0.1.0"\n')
+    (repo / "src" / "pkg" / "cli.py").write_text('__version__ = "0.1.0"\n')
+    (repo / "src" / "pkg" / "cli.py").chmod(0o755)
+    (repo / "other.txt").write_text("rev: v0.1.0\n")
+
+    _git(repo, "init", "-q", "-b", "main")
+    _git(repo, "config", "core.autocrlf", "false")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-q", "-m", "Initial commit")
+
+    return repo
+
+
+def test_bump_ref(repo: Path) -> None:
+    base = _git(repo, "rev-parse", "main")
+    ref_result = bump_ref(repo, "main", BumpType.PATCH)
+
+    assert ref_result.result.ok
+    assert ref_result.ref == "refs/heads/main"
+    assert ref_result.commit == _git(repo, "rev-parse", "main")
+    assert _git(repo, "rev-parse", "main^") == base
+    assert _git(repo, "log", "-1", "--format=%s", "main") == "Bump version: 0.1.0 -> 0.1.1"
+
+    labels = [f.label for f in ref_result.result.files]
+    assert labels == ["README.md", "__init__.py", "cli.py", ".bumper.toml"]
+    assert all(f.changed for f in ref_result.result.files)
+
+    # Line endings & file modes should be preserved
+    readme = subprocess.run(
+        ["git", "cat-file", "-p", "main:README.md"], cwd=repo, capture_output=True
+    )
+    assert readme.stdout == b"rev: v0.1.1\r\n"
+    assert _git(repo, "ls-tree", "main", "src/pkg/cli.py").startswith("100755")
+    assert 'current_version = "0.1.1"' in _git(repo, "cat-file", "-p", "main:.bumper.toml")
+
+    # Only the targets should differ from the base commit
+    changed = _git(repo, "diff", "--name-only", base, "main").splitlines()
+    assert changed == [".bumper.toml", "README.md", "src/pkg/__init__.py", "src/pkg/cli.py"]
+
+    # The working tree is never touched
+    assert (repo / "README.md").read_bytes() == b"rev: v0.1.0\r\n"
+
+
+def test_bump_ref_bare(repo: Path, tmp_path: Path) -> None:
+    bare = tmp_path / "bare.git"
+    subprocess.run(["git", "clone", "-q", "--bare", repo, bare], check=True, capture_output=True)
+
+    ref_result = bump_ref(bare, "main", BumpType.MINOR, message="Release 0.2.0")
+    assert ref_result.ref == "refs/heads/main"
+    assert _git(bare, "log", "-1", "--format=%s", "main") == "Release 0.2.0"
+    assert _git(bare, "cat-file", "-p", "main:src/pkg/__init__.py") == '__version__ = "0.2.0"'
+
+
+def test_bump_ref_dry_run(repo: Path) -> None:
+    base = _git(repo, "rev-parse", "main")
+    ref_result = bump_ref(repo, "main", BumpType.PATCH, dry_run=True)
+
+    assert ref_result.commit is None
+    assert _git(repo, "rev-parse", "main") == base
+
+    readme = ref_result.result.files[0]
+    assert readme.diff == "--- README.md\n+++\n@@ -1 +1 @@\n-rev: v0.1.0\n+rev: v0.1.1"
+
+
+def test_bump_ref_commit_hash(repo: Path) -> None:
+    base = _git(repo, "rev-parse", "main")
+    ref_result = bump_ref(repo, base, BumpType.PATCH)
+
+    # A detached commit has no branch to update
+    assert ref_result.commit is not None
+    assert ref_result.ref is None
+    assert _git(repo, "rev-parse", "main") == base
+    assert _git(repo, "rev-parse", f"{ref_result.commit}^") == base
+
+
+def test_bump_ref_missing_target(repo: Path) -> None:
+    config = (
+        SAMPLE_CONFIG
+        + '\n[[tool.bumper.files]]\nfile = "./missing.md"\nsearch = "v{current_version}"\n'
+    )
+    (repo / ".bumper.toml").write_text(config)
+    _git(repo, "commit", "-q", "-am", "Add missing target")
+    base = _git(repo, "rev-parse", "main")
+
+    ref_result = bump_ref(repo, "main", BumpType.PATCH)
+    assert not ref_result.result.ok
+    assert ref_result.commit is None
+    assert _git(repo, "rev-parse", "main") == base
+
+    (missing,) = (f for f in ref_result.result.files if f.label == "missing.md")
+    assert isinstance(missing.error, GitRefError)
+
+
+@pytest.mark.parametrize("target", ("dist/pkg.zip::pkg/METADATA", "VERSION.gz"))
+def test_bump_ref_compressed_target(repo: Path, target: str) -> None:
+    config = f'{SAMPLE_CONFIG}\n[[tool.bumper.files]]\nfile = "{target}"\nsearch = "{{current_version}}"\n'
+    (repo / ".bumper.toml").write_text(config)
+    _git(repo, "commit", "-q", "-am", "Add compressed target")
+
+    ref_result = bump_ref(repo, "main", BumpType.PATCH)
+    assert not ref_result.result.ok
+    assert ref_result.commit is None
+
+    (compressed,) = (f for f in ref_result.result.files if f.file == Path(target))
+    assert isinstance(compressed.error, GitRefError)
+    assert "Compressed target files can't be bumped within a git ref" in str(compressed.error)
+
+
+def test_bump_ref_unmatched_glob_raises(repo: Path) -> None:
+    (repo / ".bumper.toml").write_text(SAMPLE_CONFIG.replace("src/pkg/*.py", "docs/*.md"))
+    _git(repo, "commit", "-q", "-am", "Target docs")
+
+    with pytest.raises(BumperConfigError, match="No files match the pattern 'docs/\\*.md'"):
+        bump_ref(repo, "main", BumpType.PATCH)
+
+
+def test_bump_ref_invalid_ref(repo: Path) -> None:
+    with pytest.raises(GitRefError):
+        bump_ref(repo, "nope", BumpType.PATCH)
+
+
+def test_bump_ref_bump_type_mismatch(repo: Path) -> None:
+    with pytest.raises(BumpError):
+        bump_ref(repo, "main", BumpType.DATE)
+
+
+def test_bump_ref_no_config(repo: Path) -> None:
+    _git(repo, "rm", "-q", ".bumper.toml")
+    _git(repo, "commit", "-q", "-m", "Remove config")
+
+    with pytest.raises(GitRefError, match="Configuration file could not be located"):
+        bump_ref(repo, "main", BumpType.PATCH)
+
+
+def test_bump_ref_scoped_rule(repo: Path) -> None:
+    (repo / ".bumper.toml").write_text(
+        SAMPLE_CONFIG.replace(
+            'search = "rev: v{current_version}"',
+            'search = "^rev: v{current_version}"\nregex = true\nmax_occurrences = 1',
+        )
+    )
+    (repo / "README.md").write_text("rev: v0.1.0\nrev: v0.1.0\n")
+    _git(repo, "commit", "-q", "-am", "Scope README rule")
+
+    ref_result = bump_ref(repo, "main", BumpType.PATCH)
+    assert ref_result.result.files[0].hits == [1]
+    assert _git(repo, "cat-file", "-p", "main:README.md") == "rev: v0.1.1\nrev: v0.1.0"
@@ -0,0 +1,180 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from bumper import CACHE_DIR, index
+from bumper.bump import BumpType, bump_ver
+from bumper.config import BumperFile, BumperOptions
+from bumper.index import FileEntry, OccurrenceIndex, bump_indexed, rule_anchor
+from bumper.version import Version
+
+RULES = ['version = "{current_version}"', "v{current_version}"]
+SAMPLE_TEXT = 'version = "0.9.0"\n\nSome text\n\nv0.9.0 is the latest, but v0.9.0rc1 is older\n'
+
+
+def _encode(rules: list[str], current: str, new: str) -> list[tuple[bytes, bytes]]:
+    return [
+        (
+            r.replace("{current_version}", current).encode(),
+            r.replace("{current_version}", new).encode(),
+        )
+        for r in rules
+    ]
+
+
+def test_rule_anchor() -> None:
+    assert rule_anchor('version = "{current_version}"') == 'version = "'
+    assert rule_anchor("{current_version} release") == ""
+
+
+def test_bump_indexed_cold(tmp_path: Path) -> None:
+    target = tmp_path / "README.md"
+    target.write_text(SAMPLE_TEXT)
+
+    hits, entry = bump_indexed(target, RULES, _encode(RULES, "0.9.0", "0.10.0"), None)
+
+    assert hits == [1, 2]
+    assert target.read_text() == SAMPLE_TEXT.replace("0.9.0", "0.10.0")
+    assert entry is not None
+    bumped = target.read_text()
+    assert entry.anchors == {
+        'version = "': [0],
+        "v": [i for i, c in enumerate(bumped) if c == "v"],
+    }
+    assert entry.size == target.stat().st_size
+
+
+def test_bump_indexed_warm_skips_scan(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    target = tmp_path / "README.md"
+    target.write_text(SAMPLE_TEXT)
+    _, entry = bump_indexed(target, RULES, _encode(RULES, "0.9.0", "0.10.0"), None)
+
+    def _no_scan(*args: object) -> list[int]:
+        raise AssertionError("Full scan performed for a fresh index entry")
+
+    monkeypatch.setattr(index, "_find_all", _no_scan)
+    for current, new in (("0.10.0", "0.10.1"), ("0.10.1", "1.0.0"), ("1.0.0", "10.0.0")):
+        hits, entry = bump_indexed(target, RULES, _encode(RULES, current, new), entry)
+        assert hits == [1, 2]
+        assert target.read_text() == SAMPLE_TEXT.replace("0.9.0", new)
+        assert entry is not None
+
+
+def test_bump_indexed_anchor_sharing_inserted_bytes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    target = tmp_path / "README.md"
+    target.write_text("https://some.url/sco1-bumper/0.1.0?logo=python\n")
+    rules = ["sco1-bumper/{current_version}"]
+    _, entry = bump_indexed(target, rules, _encode(rules, "0.1.0", "0.1.1"), None)
+
+    def _no_scan(*args: object) -> list[int]:
+        raise AssertionError("Full scan performed for a fresh index entry")
+
+    # The anchor contains the inserted digit, but doesn't occur near the modified version
+    monkeypatch.setattr(index, "_find_all", _no_scan)
+    for current, new in (("0.1.1", "0.1.2"), ("0.1.2", "0.1.11")):
+        _, entry = bump_indexed(target, rules, _encode(rules, current, new), entry)
+        assert entry is not None
+        assert entry.anchors == {"sco1-bumper/": [17]}
+
+
+@pytest.mark.parametrize("in_place", (True, False))
+def test_bump_indexed_introduced_anchor_evicted(tmp_path: Path, in_place: bool) -> None:
+    target = tmp_path / "README.md"
+    target.write_text("v1.0.0 v1.0.0\n")
+    rules = ["1.{current_version}"]
+    _, entry = bump_indexed(target, rules, _encode(rules, "0.0", "0.0"), None)
+    assert entry is not None
+
+    # Bumping 1.0.0 to 1.1.0 introduces a new occurrence of the "1." anchor
+    new = "1.0" if in_place else "1.00"
+    _, entry = bump_indexed(target, rules, _encode(rules, "0.0", new), entry)
+    assert target.read_text() == f"v1.{new} v1.{new}\n"
+    assert entry is None
+
+
+def test_bump_indexed_modified_file_rescanned(tmp_path: Path) -> None:
+    target = tmp_path / "README.md"
+    target.write_text(SAMPLE_TEXT)
+    _, entry = bump_indexed(target, RULES, _encode(RULES, "0.9.0", "0.9.1"), None)
+
+    target.write_text(f"Prepended v0.9.1\n{target.read_text()}")
+    hits, _ = bump_indexed(target, RULES, _encode(RULES, "0.9.1", "0.9.2"), entry)
+
+    assert hits == [1, 3]
+    assert target.read_text() == f"Prepended v0.9.2\n{SAMPLE_TEXT.replace('0.9.0', '0.9.2')}"
+
+
+def test_bump_indexed_touched_file_hash_fallback(tmp_path: Path) -> None:
+    target = tmp_path / "README.md"
+    target.write_text(SAMPLE_TEXT)
+    _, entry = bump_indexed(target, RULES, _encode(RULES, "0.9.0", "0.10.0"), None)
+    assert entry is not None and entry.sha256 is not None
+
+    st = target.stat()
+    os.utime(target, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    hits, _ = bump_indexed(target, RULES, _encode(RULES, "0.10.0", "0.10.1"), entry)
+    assert hits == [1, 2]
+    assert target.read_text() == SAMPLE_TEXT.replace("0.9.0", "0.10.1")
+
+
+def test_bump_indexed_unanchored_rule_not_indexed(tmp_path: Path) -> None:
+    target = tmp_path / "README.md"
+    target.write_text("0.1.0 release\n")
+    rules = ["{current_version} release"]
+
+    hits, entry = bump_indexed(target, rules, _encode(rules, "0.1.0", "0.2.0"), None)
+
+    assert hits == [1]
+    assert target.read_text() == "0.2.0 release\n"
+    assert entry is None
+
+
+def test_occurrence_index_roundtrip(tmp_path: Path) -> None:
+    cache_dir = tmp_path / CACHE_DIR
+    idx = OccurrenceIndex(cache_dir)
+    entry = FileEntry(size=10, mtime_ns=1, sha256=None, anchors={"v": [0, 5]})
+    idx.update(tmp_path / "README.md", entry)
+    idx.save()
+
+    assert (cache_dir / ".gitignore").exists()
+    assert OccurrenceIndex.load(cache_dir).get(tmp_path / "README.md") == entry
+
+    idx.update(tmp_path / "README.md", None)
+    assert idx.get(tmp_path / "README.md") is None
+
+
+def test_occurrence_index_corrupt_ignored(tmp_path: Path) -> None:
+    cache_dir = tmp_path / CACHE_DIR
+    cache_dir.mkdir()
+    (cache_dir / index.INDEX_FILENAME).write_text("{not json")
+
+    assert OccurrenceIndex.load(cache_dir).entries == {}
+
+
+def test_bump_ver_occurrence_index(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    Path("README.md").write_text(SAMPLE_TEXT)
+    files = [BumperFile(file=Path("./README.md"), search=r) for r in RULES]
+    options = BumperOptions(occurrence_index=True)
+
+    bump_ver(Version("0.9.0"), files, BumpType.MINOR, dry_run=False, options=options)
+    bump_ver(Version("0.10.0"), files, BumpType.MINOR, dry_run=False, options=options)
+
+    assert Path("README.md").read_text() == SAMPLE_TEXT.replace("0.9.0", "0.11.0")
+    assert OccurrenceIndex.load(CACHE_DIR).get(Path("README.md")) is not None
+
+
+def test_bump_ver_occurrence_index_dry_run(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    Path("README.md").write_text(SAMPLE_TEXT)
+    files = [BumperFile(file=Path("./README.md"), search=r) for r in RULES]
+    options = BumperOptions(occurrence_index=True)
+
+    bump_ver(Version("0.9.0"), files, BumpType.MINOR, dry_run=True, options=options)
+
+    assert Path("README.md").read_text() == SAMPLE_TEXT
+    assert not CACHE_DIR.exists()
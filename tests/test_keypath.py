@@ -0,0 +1,228 @@
+from pathlib import Path
+
+import pytest
+
+from bumper.bump import BumpType, bump_files
+from bumper.check import check_rules
+from bumper.config import BumperConfigError, BumperFile, SearchOptions
+from bumper.keypath import KeyPath, split_key, target_syntax
+from bumper.profiling import Profile
+from bumper.version import Version
+from tests.conftest import bump_minor
+
+SAMPLE_JSON = """\
+{
+  "name": "pkg",
+  "dependencies": {"dep": {"version": "0.9.0"}, "other": [1, {"version": "0.9.0"}]},
+  "packages": {"": {"version": "0.9.0", "n": 12}},
+  "escaped\\"key": "0.9.0",
+  "version": "0.9.0"
+}
+"""
+
+SAMPLE_TOML = """\
+[project]
+name = "pkg"
+dependencies = [
+  "dep == 0.9.0",  # version = "0.9.0"
+]
+version = "0.9.0"  # The version
+description = '''
+version = 0.9.0
+'''
+
+[[tool.bumper.files]]
+search = "0.9.0"
+
+[tool]
+poetry.version = '0.9.0'
+"dotted.key" = 0.9
+"""
+
+SAMPLE_YAML = """\
+# A chart
+apiVersion: v2
+version: 0.9.0 # The version
+image:
+  repository: "pkg"
+  tag: "0.9.0"
+dependencies:
+  - name: dep
+    version: 0.9.0
+description: |
+  version: 0.9.0
+"quoted key":
+  'nested': '0.9.0'
+---
+version: 1.0.0
+"""
+
+LOCATE_CASES = (
+    ("package.json", SAMPLE_JSON, "version", '"0.9.0"'),
+    ("package.json", SAMPLE_JSON, "dependencies.dep.version", '"0.9.0"'),
+    ("package.json", SAMPLE_JSON, 'packages."".version', '"0.9.0"'),
+    ("package.json", SAMPLE_JSON, 'packages."".n', "12"),
+    ("package.json", SAMPLE_JSON, '"escaped\\"key"', '"0.9.0"'),
+    ("package.json", SAMPLE_JSON, "dependencies.dep", '{"version": "0.9.0"}'),
+    ("package.json", SAMPLE_JSON, "dependencies.other.version", None),
+    ("package.json", SAMPLE_JSON, "missing", None),
+    ("pyproject.toml", SAMPLE_TOML, "project.version", '"0.9.0"'),
+    ("pyproject.toml", SAMPLE_TOML, "project.dependencies", '[\n  "dep == 0.9.0",'),
+    ("pyproject.toml", SAMPLE_TOML, "project.description", "'''\nversion = 0.9.0\n'''"),
+    ("pyproject.toml", SAMPLE_TOML, "tool.bumper.files.search", None),
+    ("pyproject.toml", SAMPLE_TOML, "tool.poetry.version", "'0.9.0'"),
+    ("pyproject.toml", SAMPLE_TOML, 'tool."dotted.key"', "0.9"),
+    ("Chart.yaml", SAMPLE_YAML, "version", "0.9.0"),
+    ("Chart.yaml", SAMPLE_YAML, "image.tag", '"0.9.0"'),
+    ("Chart.yaml", SAMPLE_YAML, '"quoted key".nested', "'0.9.0'"),
+    ("Chart.yaml", SAMPLE_YAML, "dependencies.version", None),
+    ("Chart.yaml", SAMPLE_YAML, "description", None),
+    ("Chart.yaml", SAMPLE_YAML.replace("version: 0.9.0 #", "versions: 0.9.0 #"), "version", None),
+)
+
+
+@pytest.mark.parametrize(("target", "text", "key", "truth_value"), LOCATE_CASES)
+def test_locate(target: str, text: str, key: str, truth_value: str | None) -> None:
+    span = KeyPath.for_target(key, Path(target)).locate(text)
+    if truth_value is None:
+        assert span is None
+    elif truth_value.endswith(","):
+        assert span is not None and text[span[0] :].startswith(truth_value)
+    else:
+        assert span is not None and text[span[0] : span[1]] == truth_value
+
+
+TRUNCATED_CASES = (
+    ("package.json", '{"version": "0.9', "version"),
+    ("package.json", '{"n": 12', "n"),
+    ("package.json", '{"deps": {"a": "0.9.0", "b": ["x"', "deps"),
+    ("pyproject.toml", 'version = """0.9.0\n', "version"),
+    ("pyproject.toml", "deps = [\n  1,\n", "deps"),
+    ("Chart.yaml", 'version: "0.9.0\n', "version"),
+)
+
+
+@pytest.mark.parametrize(("target", "text", "key"), TRUNCATED_CASES)
+def test_locate_truncated(target: str, text: str, key: str) -> None:
+    assert KeyPath.for_target(key, Path(target)).locate(text) is None
+
+
+SPLIT_KEY_CASES = (
+    ("version", ("version",)),
+    ("tool.poetry.version", ("tool", "poetry", "version")),
+    ('dependencies."@scope/pkg".version', ("dependencies", "@scope/pkg", "version")),
+    ("packages.'a.b' . version", ("packages", "a.b", "version")),
+    ('packages."".version', ("packages", "", "version")),
+)
+
+
+@pytest.mark.parametrize(("key", "truth_parts"), SPLIT_KEY_CASES)
+def test_split_key(key: str, truth_parts: tuple[str, ...]) -> None:
+    assert split_key(key) == truth_parts
+
+
+@pytest.mark.parametrize("key", ("", "a.", ".a", "a..b", 'a."b', "a b"))
+def test_split_key_invalid_raises(key: str) -> None:
+    with pytest.raises(ValueError, match="Invalid key path"):
+        split_key(key)
+
+
+@pytest.mark.parametrize(
+    ("target", "truth_syntax"),
+    (
+        ("package.json", "json"),
+        ("pyproject.TOML", "toml"),
+        ("values.yml", "yaml"),
+        ("dist/pkg.zip::pkg/package.json", "json"),
+        ("package.json.gz", "json"),
+        ("README.md", None),
+    ),
+)
+def test_target_syntax(target: str, truth_syntax: str | None) -> None:
+    assert target_syntax(Path(target)) == truth_syntax
+
+
+pytestmark = pytest.mark.usefixtures("in_tmp_path")
+
+
+def _key_rule(target: str, key: str) -> list[BumperFile]:
+    return [BumperFile(Path(target), "{current_version}", search_options=SearchOptions(key=key))]
+
+
+@pytest.mark.parametrize(
+    ("target", "text", "key"),
+    (
+        ("package.json", SAMPLE_JSON, 'packages."".version'),
+        ("pyproject.toml", SAMPLE_TOML, "project.version"),
+        ("Chart.yaml", SAMPLE_YAML, "image.tag"),
+    ),
+)
+def test_bump_key(tmp_path: Path, target: str, text: str, key: str) -> None:
+    (tmp_path / target).write_text(text)
+
+    (result,) = bump_minor(_key_rule(target, key))
+    assert result.changed and result.hits == [1]
+
+    span = KeyPath.for_target(key, Path(target)).locate(text)
+    assert span is not None
+    start, end = span
+    truth = f"{text[:start]}{text[start:end].replace('0.9.0', '0.10.0')}{text[end:]}"
+    assert (tmp_path / target).read_text() == truth
+
+
+def test_bump_multiple_keys(tmp_path: Path) -> None:
+    (tmp_path / "Chart.yaml").write_text("version: 0.9.0\nappVersion: 0.9.0\nkubeVersion: 0.9.0\n")
+    files = [
+        BumperFile(Path("Chart.yaml"), "{current_version}", search_options=SearchOptions(key=key))
+        for key in ("version", "appVersion")
+    ]
+
+    (result,) = bump_minor(files)
+    assert result.hits == [1, 1]
+    assert (tmp_path / "Chart.yaml").read_text() == (
+        "version: 0.10.0\nappVersion: 0.10.0\nkubeVersion: 0.9.0\n"
+    )
+
+
+def test_bump_key_reads_prefix(tmp_path: Path) -> None:
+    target = tmp_path / "package.json"
+    filler = ",\n".join(f'  "dep{idx}": "0.9.0"' for idx in range(5_000))
+    target.write_text(f'{{\n  "version": "0.9.0",\n{filler}\n}}\n')
+
+    options = SearchOptions(key="version")
+    files = [BumperFile(Path("package.json"), '"{current_version}"', search_options=options)]
+    profile = Profile()
+    (result,) = bump_files(Version("0.9.0"), files, BumpType.PATCH, profile=profile).files
+    assert result.hits == [1]
+    assert result.profile is not None and result.profile.bytes_read is not None
+    assert result.profile.bytes_read < target.stat().st_size // 10
+    assert target.read_text().startswith('{\n  "version": "0.9.1",\n  "dep0": "0.9.0"')
+
+
+def test_bump_key_dry_run(tmp_path: Path) -> None:
+    (tmp_path / "Chart.yaml").write_text(SAMPLE_YAML)
+
+    (result,) = bump_minor(_key_rule("Chart.yaml", "version"), dry_run=True)
+    assert result.diff is not None and result.hits == [1]
+    assert "+version: 0.10.0 # The version" in result.diff
+    assert (tmp_path / "Chart.yaml").read_text() == SAMPLE_YAML
+
+
+def test_bump_key_unsupported_target_raises(tmp_path: Path) -> None:
+    (tmp_path / "VERSION").write_text("0.9.0\n")
+
+    with pytest.raises(BumperConfigError, match="only JSON, TOML, & YAML"):
+        bump_minor(_key_rule("VERSION", "version"))
+
+
+def test_check_key(tmp_path: Path) -> None:
+    (tmp_path / "package.json").write_text(SAMPLE_JSON)
+    files = [
+        BumperFile(
+            Path("package.json"), "{current_version}", search_options=SearchOptions(key="version")
+        ),
+        BumperFile(Path("package.json"), "0.9", search_options=SearchOptions(key="name")),
+    ]
+
+    (result,) = check_rules(Version("0.9.0"), files, root_dir=tmp_path)
+    assert result.matched == [True, False]
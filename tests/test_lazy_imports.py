@@ -0,0 +1,48 @@
+import subprocess
+import sys
+
+import pytest
+
+# Modules only required by specific code paths, which shouldn't be paid for at import time
+DEFERRED_MODULES = (
+    "bumper.archive",
+    "bumper.index",
+    "bumper.keypath",
+    "bumper.profiling",
+    "bumper.scoped",
+    "bumper.segments",
+    "bumper.transaction",
+    "bumper.watch",
+    "concurrent.futures",
+    "ctypes",
+    "datetime",
+    "difflib",
+    "hashlib",
+    "json",
+    "packaging",
+    "socket",
+    "subprocess",
+    "tempfile",
+    "typer",
+)
+
+
+@pytest.mark.parametrize(
+    ("module", "preloaded"),
+    (
+        ("bumper.bump", ()),
+        ("bumper.check", ()),
+        ("bumper.config", ()),
+        ("bumper.walk", ()),
+        # The CLI requires typer, so only the modules it doesn't import itself are checked
+        ("bumper.cli", ("typer",)),
+    ),
+)
+def test_deferred_imports(module: str, preloaded: tuple[str, ...]) -> None:
+    check = (
+        f"import sys; {''.join(f'import {m}; ' for m in preloaded)}loaded = set(sys.modules); "
+        f"import {module}; "
+        f"print(*(m for m in {DEFERRED_MODULES!r} if m in sys.modules and m not in loaded))"
+    )
+    proc = subprocess.run((sys.executable, "-c", check), capture_output=True, text=True, check=True)
+    assert proc.stdout.split() == []
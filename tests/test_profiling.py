@@ -0,0 +1,162 @@
+import json
+import pstats
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from bumper import cli
+from bumper.bump import BumpType, FileResult, bump_config, bump_files, phase
+from bumper.config import BumperFile, BumperOptions
+from bumper.profiling import FileProfile, Profile
+from bumper.version import Version
+
+
+def test_no_profile_not_instrumented(project_dir: Path) -> None:
+    result = bump_config(project_dir / ".bumper.toml", BumpType.PATCH)
+    assert all(f.profile is None for f in result.files)
+
+
+def test_profile_phases(project_dir: Path) -> None:
+    profile = Profile()
+    result = bump_config(project_dir / ".bumper.toml", BumpType.PATCH, profile=profile)
+
+    assert list(profile.phases) == ["parse_config", "merge", "index", "bump"]
+    assert all(elapsed >= 0 for elapsed in profile.phases.values())
+    assert profile.files == result.files
+
+
+def test_profile_in_memory_file_phases(project_dir: Path) -> None:
+    profile = Profile()
+    result = bump_config(project_dir / ".bumper.toml", BumpType.PATCH, profile=profile)
+
+    # Version length changes, so files are bumped in memory
+    readme = next(f for f in result.files if f.label == "README.md")
+    assert readme.profile is not None
+    assert list(readme.profile.timings) == ["probe", "read", "replace", "write"]
+    assert readme.profile.bytes_read == len("rev: v0.1.9\nrev: v0.1.9\n")
+    assert readme.bytes_written == len("rev: v0.1.10\nrev: v0.1.10\n")
+
+
+def test_profile_in_place_file_phases(project_dir: Path) -> None:
+    profile = Profile()
+    result = bump_config(project_dir / ".bumper.toml", BumpType.MAJOR, profile=profile)
+
+    readme = next(f for f in result.files if f.label == "README.md")
+    assert readme.profile is not None
+    assert list(readme.profile.timings) == ["probe", "patch"]
+
+
+def test_profile_dry_run_file_phases(project_dir: Path) -> None:
+    profile = Profile()
+    result = bump_config(project_dir / ".bumper.toml", BumpType.PATCH, True, profile=profile)
+
+    readme = next(f for f in result.files if f.label == "README.md")
+    assert readme.profile is not None
+    assert list(readme.profile.timings) == ["read", "probe", "diff"]
+
+
+def test_profile_failed_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    profile = Profile()
+    files = [BumperFile(file=Path("./missing.txt"), search="{current_version}")]
+    result = bump_files(Version("1.0.0"), files, BumpType.PATCH, profile=profile)
+
+    assert not result.ok
+    assert result.files[0].profile == FileProfile(timings={}, bytes_read=None)
+
+
+def test_profile_to_json(project_dir: Path) -> None:
+    profile = Profile()
+    bump_config(project_dir / ".bumper.toml", BumpType.MINOR, profile=profile)
+
+    raw = json.loads(json.dumps(profile.to_json()))
+    assert list(raw["phases"]) == list(profile.phases)
+    readme = next(f for f in raw["files"] if f["label"] == "README.md")
+    assert readme["matches"] == {"rev: v{current_version}": 2}
+    assert readme["bytes_read"] == len("rev: v0.1.9\nrev: v0.1.9\n")
+    assert raw["peak_memory"] is None
+
+
+def test_file_result_json_roundtrip_profile(project_dir: Path) -> None:
+    profile = Profile()
+    result = bump_config(project_dir / ".bumper.toml", BumpType.MINOR, profile=profile)
+
+    for f in result.files:
+        assert FileResult.from_json(json.loads(json.dumps(f.to_json()))).profile == f.profile
+
+
+def test_render_table(project_dir: Path) -> None:
+    profile = Profile()
+    bump_config(project_dir / ".bumper.toml", BumpType.MINOR, profile=profile)
+
+    table = profile.render_table()
+    assert table.splitlines()[0].split() == ["Phase", "Time", "(ms)"]
+    assert "README.md" in table
+    assert "Peak traced memory" not in table
+
+
+def test_capture(project_dir: Path, tmp_path: Path) -> None:
+    profile = Profile(cprofile=True, tracemalloc=True)
+    with profile.capture(n_allocations=3):
+        bump_config(project_dir / ".bumper.toml", BumpType.MINOR, profile=profile)
+
+    assert profile.peak_memory is not None and profile.peak_memory > 0
+    assert len(profile.top_allocations) <= 3
+    assert "Peak traced memory" in profile.render_table()
+
+    stats_path = tmp_path / "bump.prof"
+    profile.dump_stats(stats_path)
+    assert pstats.Stats(str(stats_path)).get_stats_profile().func_profiles
+
+
+def test_dump_stats_without_capture_raises(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="No cProfile"):
+        Profile().dump_stats(tmp_path / "bump.prof")
+
+
+def test_phase_without_profile() -> None:
+    with phase(None, "anything"):
+        pass
+
+
+def test_profile_multiple_workers(project_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(project_dir)
+    profile = Profile()
+    files = [BumperFile(file=Path("./VERSION"), search="{current_version}")]
+    options = BumperOptions(workers=2)
+
+    result = bump_files(Version("0.1.9"), files, BumpType.MINOR, options=options, profile=profile)
+
+    assert result.files[0].profile is not None
+    assert result.files[0].profile.bytes_read == len("0.1.9")
+
+
+RUNNER = CliRunner()
+
+
+def test_cli_profile_json(project_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(project_dir)
+
+    result = RUNNER.invoke(cli.bumper_cli, ["bump", "minor", "--profile-format", "json"])
+    assert result.exit_code == 0
+    assert result.stderr == ""
+
+    result = RUNNER.invoke(
+        cli.bumper_cli, ["bump", "minor", "--profile", "--profile-format", "json"]
+    )
+    assert result.exit_code == 0
+    assert "Bumped README.md" in result.stdout
+
+    raw = json.loads(result.stderr)
+    assert list(raw["phases"]) == ["discover", "parse_config", "merge", "index", "bump", "report"]
+    assert {f["label"] for f in raw["files"]} == {"README.md", "VERSION", ".bumper.toml"}
+
+
+def test_cli_cprofile_implies_profile(project_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(project_dir)
+
+    result = RUNNER.invoke(cli.bumper_cli, ["bump", "minor", "--cprofile", "bump.prof"])
+    assert result.exit_code == 0
+    assert result.stderr.startswith("Phase")
+    assert (project_dir / "bump.prof").exists()
@@ -0,0 +1,119 @@
+import io
+
+import pytest
+
+from bumper.config import SearchOptions
+from bumper.replace import RuleMatcher
+from bumper.scoped import ScopedMatcher, ScopedRule
+
+SAMPLE_TEXT = """\
+version = "0.1.0"
+rev: v0.1.0
+sco1-bumper/0.1.0
+"""
+
+
+def test_matcher_hit_counts() -> None:
+    matcher = RuleMatcher(
+        [
+            ('version = "0.1.0"', 'version = "0.2.0"'),
+            ("v0.1.0", "v0.2.0"),
+            ("not/0.1.0", "not/0.2.0"),
+        ]
+    )
+    new, hits = matcher.apply(SAMPLE_TEXT)
+
+    assert new == SAMPLE_TEXT.replace('version = "0.1.0"', 'version = "0.2.0"').replace(
+        "v0.1.0", "v0.2.0"
+    )
+    assert hits == [1, 1, 0]
+
+
+def test_matcher_longest_rule_wins() -> None:
+    matcher = RuleMatcher([("0.1.0", "0.2.0"), ("rev: v0.1.0", "rev: v1.0.0")])
+    new, hits = matcher.apply(SAMPLE_TEXT)
+
+    assert "rev: v1.0.0" in new
+    assert hits == [2, 1]
+
+
+def test_matcher_single_pass_no_cascade() -> None:
+    # Output of one rule must not be rescanned by another rule
+    matcher = RuleMatcher([("0.1.0", "0.2.0"), ("0.2.0", "0.3.0")])
+    new, hits = matcher.apply("0.1.0 0.2.0")
+
+    assert new == "0.2.0 0.3.0"
+    assert hits == [1, 1]
+
+
+def test_matcher_duplicate_rules_share_hits() -> None:
+    matcher = RuleMatcher([("v0.1.0", "v0.2.0"), ("v0.1.0", "v0.2.0")])
+    _, hits = matcher.apply(SAMPLE_TEXT)
+
+    assert hits == [1, 1]
+
+
+def test_matcher_no_rules_passthrough() -> None:
+    matcher = RuleMatcher([("", "")])
+    new, hits = matcher.apply(SAMPLE_TEXT)
+
+    assert new is SAMPLE_TEXT
+    assert hits == [0]
+
+
+STREAM_CHUNK_SIZES = (1, 2, 3, 5, 7, 64)
+
+
+@pytest.mark.parametrize("chunk_size", STREAM_CHUNK_SIZES)
+def test_matcher_stream_matches_apply(chunk_size: int) -> None:
+    matcher = RuleMatcher(
+        [
+            ('version = "0.1.0"', 'version = "0.2.0"'),
+            ("rev: v0.1.0", "rev: v0.2.0"),
+            ("sco1-bumper/0.1.0", "sco1-bumper/0.2.0"),
+        ]
+    )
+    truth_out, truth_hits = matcher.apply(SAMPLE_TEXT)
+
+    dst = io.StringIO()
+    hits = matcher.stream(io.StringIO(SAMPLE_TEXT), dst, chunk_size=chunk_size)
+
+    assert dst.getvalue() == truth_out
+    assert hits == truth_hits
+
+
+def test_matcher_stream_no_rules_passthrough() -> None:
+    matcher = RuleMatcher([])
+
+    dst = io.StringIO()
+    hits = matcher.stream(io.StringIO(SAMPLE_TEXT), dst, chunk_size=4)
+
+    assert dst.getvalue() == SAMPLE_TEXT
+    assert hits == []
+
+
+def test_matcher_changes() -> None:
+    matcher = RuleMatcher([("0.1.0", "0.2.0"), ("static", "static")])
+
+    assert matcher.changes([1, 0])
+    assert not matcher.changes([0, 3])
+
+
+def test_scoped_matcher_overlap_first_longest_wins() -> None:
+    matcher = ScopedMatcher(
+        [
+            ScopedRule("0.1.0", "0.2.0", SearchOptions()),
+            ScopedRule(r"rev: v\d\.\d\.\d", "0.2.0", SearchOptions(regex=True), current="0.1.0"),
+        ]
+    )
+    new, hits = matcher.apply(SAMPLE_TEXT)
+
+    assert new == SAMPLE_TEXT.replace("0.1.0", "0.2.0")
+    assert hits == [2, 1]
+
+
+def test_scoped_matcher_covers() -> None:
+    matcher = ScopedMatcher([ScopedRule("0.1.0", "0.2.0", SearchOptions(max_occurrences=2))])
+
+    assert not matcher.covers(SAMPLE_TEXT.splitlines(keepends=True)[0])
+    assert matcher.covers(SAMPLE_TEXT)
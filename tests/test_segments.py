@@ -0,0 +1,158 @@
+import multiprocessing
+import os
+import typing as t
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from bumper import segments
+from bumper.bump import BumpType, bump_files
+from bumper.config import BumperFile, BumperOptions
+from bumper.profiling import Profile
+from bumper.replace import RuleMatcher
+from bumper.segments import _locate_segment, _merge_segments, segment_bounds
+from bumper.version import Version
+
+pytestmark = pytest.mark.usefixtures("in_tmp_path")
+
+
+SEGMENT_BOUNDS_CASES = (
+    (b"", 4, [(0, 0)]),
+    (b"abc", 4, [(0, 3)]),
+    (b"a\nb\nc\nd\n", 1, [(0, 8)]),
+    (b"a\nb\nc\nd\n", 2, [(0, 6), (6, 8)]),
+    (b"a\nb\nc\nd\n", 4, [(0, 4), (4, 6), (6, 8)]),
+    (b"aaaaaaaa\nb\n", 4, [(0, 9), (9, 11)]),
+)
+
+
+@pytest.mark.parametrize(("buf", "n_segments", "truth_bounds"), SEGMENT_BOUNDS_CASES)
+def test_segment_bounds(buf: bytes, n_segments: int, truth_bounds: list[tuple[int, int]]) -> None:
+    assert segment_bounds(buf, n_segments) == truth_bounds
+
+
+REPLACEMENTS = (
+    [(b"0.9.0", b"0.10.0")],
+    [(b"a\na", b"b\nb")],
+    [(b"\na\n", b"X"), (b"a", b"b")],
+    [(b"a\na\na\na\na\na", b"Z"), (b"\na", b"Y")],
+)
+SAMPLE_DATA = b"a\n" * 50 + b"0.9.0 a\n" * 10 + b"a\n" * 50
+
+
+@pytest.mark.parametrize("rules", REPLACEMENTS)
+@pytest.mark.parametrize("n_segments", (2, 3, 7))
+def test_merge_segments_matches_single_scan(
+    tmp_path: Path, rules: list[tuple[bytes, bytes]], n_segments: int
+) -> None:
+    target = tmp_path / "VERSION"
+    target.write_bytes(SAMPLE_DATA)
+
+    matcher = RuleMatcher(rules)
+    bounds = segment_bounds(SAMPLE_DATA, n_segments)
+    located = [_locate_segment(str(target), rules, start, end) for start, end in bounds]
+    merged = _merge_segments(SAMPLE_DATA, matcher, bounds, located)
+
+    assert merged[0].start == 0 and merged[-1].end == len(SAMPLE_DATA)
+    assert all(prev.end == seg.start for prev, seg in zip(merged, merged[1:], strict=False))
+
+    searches = matcher.searches
+    truth = [(m.start(), m.group()) for m in matcher.finditer(SAMPLE_DATA)]
+    located_matches = [
+        (offset, searches[idx])
+        for segment in merged
+        for offset, idx in zip(segment.offsets, segment.searches, strict=True)
+    ]
+    assert located_matches == truth
+
+
+@pytest.fixture(scope="module")
+def pool() -> t.Iterator[ProcessPoolExecutor]:
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        yield pool
+
+
+@pytest.mark.parametrize("rules", REPLACEMENTS)
+def test_write_segments(
+    tmp_path: Path, rules: list[tuple[bytes, bytes]], pool: ProcessPoolExecutor
+) -> None:
+    target = tmp_path / "VERSION"
+    target.write_bytes(SAMPLE_DATA)
+    out_file = tmp_path / "out"
+    out_file.write_bytes(b"stale contents")
+
+    located = segments.locate(target, rules, 3, pool)
+    truth, truth_hits = RuleMatcher(rules).apply(SAMPLE_DATA)
+    assert segments.segment_hits(rules, located) == truth_hits
+    assert segments.write(target, out_file, rules, located, pool) == len(truth)
+    assert out_file.read_bytes() == truth
+
+
+def test_patch_segments(tmp_path: Path, pool: ProcessPoolExecutor) -> None:
+    target = tmp_path / "VERSION"
+    target.write_bytes(SAMPLE_DATA)
+    rules = [(b"0.9.0", b"0.9.1"), (b"a\na", b"b\nb")]
+
+    located = segments.locate(target, rules, 4, pool)
+    segments.patch(target, rules, located, pool)
+    assert target.read_bytes() == RuleMatcher(rules).apply(SAMPLE_DATA)[0]
+
+
+@pytest.mark.parametrize("transactional", (False, True))
+@pytest.mark.parametrize(
+    ("bump_type", "new_version"), ((BumpType.PATCH, "0.9.1"), (BumpType.MINOR, "0.10.0"))
+)
+def test_bump_segmented(
+    bump_type: BumpType, new_version: str, transactional: bool, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(os, "cpu_count", lambda: 4)
+    target = Path("VERSION")
+    target.write_text("version = 0.9.0\nother = 0.9.0\n" * 1_000)
+
+    files = [BumperFile(target, "version = {current_version}")]
+    options = BumperOptions(parallel_threshold=0, transactional=transactional)
+    (result,) = bump_files(
+        Version("0.9.0"), files, bump_type, options=options, profile=Profile()
+    ).files
+    assert result.changed and result.hits == [1_000]
+    assert result.profile is not None and "segments" in result.profile.timings
+    assert target.read_text() == f"version = {new_version}\nother = 0.9.0\n" * 1_000
+
+
+@pytest.mark.parametrize(("n_cpus", "parallel_threshold"), ((4, 1_000), (1, 0)))
+def test_bump_not_segmented(
+    n_cpus: int, parallel_threshold: int, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(os, "cpu_count", lambda: n_cpus)
+    target = Path("VERSION")
+    target.write_text("0.9.0\n")
+
+    files = [BumperFile(target, "{current_version}")]
+    options = BumperOptions(parallel_threshold=parallel_threshold)
+    (result,) = bump_files(
+        Version("0.9.0"), files, BumpType.PATCH, options=options, profile=Profile()
+    ).files
+    assert result.hits == [1]
+    assert result.profile is not None and "segments" not in result.profile.timings
+
+
+def test_bump_not_segmented_in_worker_process(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(os, "cpu_count", lambda: 4)
+    monkeypatch.setattr(multiprocessing, "parent_process", lambda: object())
+    target = Path("VERSION")
+    target.write_text("0.9.0\n")
+
+    files = [BumperFile(target, "{current_version}")]
+    options = BumperOptions(parallel_threshold=0)
+    (result,) = bump_files(
+        Version("0.9.0"), files, BumpType.PATCH, options=options, profile=Profile()
+    ).files
+    assert result.hits == [1]
+    assert result.profile is not None and "segments" not in result.profile.timings
+
+
+def test_shared_pool() -> None:
+    pool = segments.shared_pool()
+    assert segments.shared_pool() is pool
+    assert pool.submit(os.getpid).result() != os.getpid()
@@ -0,0 +1,264 @@
+import contextlib
+import socket
+import threading
+import time
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from bumper import cli
+from bumper.client import DEFAULT_SOCKET, SOCKET_ENVVAR, request
+from bumper.serve import DaemonRunningError, serve
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="Unix domain sockets are not supported"
+)
+
+SAMPLE_CONFIG = """\
+[tool.bumper]
+current_version = "0.1.0"
+versioning_type = "semver"
+
+[[tool.bumper.files]]
+file = "./README.md"
+search = "rev: v{current_version}"
+"""
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    (project_dir / ".bumper.toml").write_text(SAMPLE_CONFIG)
+    (project_dir / "README.md").write_text("rev: v0.1.0\n")
+
+    return project_dir
+
+
+@contextlib.contextmanager
+def _serving(socket_path: Path) -> t.Iterator[Path]:
+    thread = threading.Thread(target=serve, args=(socket_path,), daemon=True)
+    thread.start()
+
+    deadline = time.monotonic() + 5
+    while not socket_path.exists():
+        assert time.monotonic() < deadline, "Daemon did not start"
+        time.sleep(0.01)
+
+    yield socket_path
+
+    request(socket_path, {"command": "shutdown"})
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    assert not socket_path.exists()
+
+
+@pytest.fixture
+def daemon(tmp_path: Path) -> t.Iterator[Path]:
+    with _serving(tmp_path / "bumper.sock") as socket_path:
+        yield socket_path
+
+
+def _bump(daemon: Path, project: Path, dry_run: bool = False) -> dict[str, t.Any]:
+    payload = {
+        "command": "bump",
+        "config": str(project / ".bumper.toml"),
+        "bump_by": "patch",
+        "dry_run": dry_run,
+    }
+    return request(daemon, payload)
+
+
+def test_serve_ping(daemon: Path) -> None:
+    assert request(daemon, {"command": "ping"}) == {"ok": True}
+
+
+def test_serve_bump(daemon: Path, project: Path) -> None:
+    response = _bump(daemon, project)
+    assert response["ok"]
+    assert response["current_version"] == "0.1.0"
+    assert response["new_version"] == "0.1.1"
+
+    results = {r["label"]: r for r in response["files"]}
+    assert results["README.md"]["changed"]
+    assert results["README.md"]["hits"] == [1]
+    assert (project / "README.md").read_text() == "rev: v0.1.1\n"
+
+    # The modified configuration should be re-parsed by the following request
+    assert _bump(daemon, project)["new_version"] == "0.1.2"
+
+
+def test_serve_dry_run(daemon: Path, project: Path) -> None:
+    response = _bump(daemon, project, dry_run=True)
+    assert response["ok"]
+
+    results = {r["label"]: r for r in response["files"]}
+    assert (
+        results["README.md"]["diff"]
+        == "--- README.md\n+++\n@@ -1 +1 @@\n-rev: v0.1.0\n+rev: v0.1.1"
+    )
+    assert (project / "README.md").read_text() == "rev: v0.1.0\n"
+
+
+def test_serve_bump_type_mismatch(daemon: Path, project: Path) -> None:
+    payload = {"command": "bump", "config": str(project / ".bumper.toml"), "bump_by": "date"}
+    response = request(daemon, payload)
+    assert response == {
+        "ok": False,
+        "error": "SemVer projects must bump by major, minor, or patch.",
+    }
+
+
+def test_serve_check(daemon: Path, project: Path) -> None:
+    payload = {"command": "check", "config": str(project / ".bumper.toml")}
+    response = request(daemon, payload)
+    assert response["ok"]
+    assert all(all(r["matched"]) for r in response["files"])
+
+    (project / "README.md").write_text("rev: v0.0.9\n")
+    response = request(daemon, payload)
+    assert not response["ok"]
+    assert {r["label"]: r["matched"] for r in response["files"]}["README.md"] == [False]
+
+
+def test_serve_concurrent_bumps_serialized(daemon: Path, project: Path) -> None:
+    n_requests = 8
+    with ThreadPoolExecutor(max_workers=n_requests) as pool:
+        responses = list(pool.map(lambda _: _bump(daemon, project), range(n_requests)))
+
+    assert all(r["ok"] for r in responses)
+    assert sorted(r["new_version"] for r in responses) == [f"0.1.{i}" for i in range(1, 9)]
+    assert (project / "README.md").read_text() == "rev: v0.1.8\n"
+
+
+INVALID_REQUESTS = (
+    (b"not json\n", "Expecting value"),
+    (b"[]\n", "Requests must be JSON objects."),
+    (b'{"command": "frobnicate"}\n', "Unknown command: 'frobnicate'"),
+    (b'{"command": "bump", "bump_by": "patch"}\n', "Missing required request field: 'config'"),
+    (b'{"command": "bump", "config": "a", "bump_by": "huge"}\n', "Invalid bump type: 'huge'"),
+)
+
+
+@pytest.mark.parametrize(("raw", "error"), INVALID_REQUESTS)
+def test_serve_invalid_request(daemon: Path, raw: bytes, error: str) -> None:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(daemon))
+        sock.sendall(raw)
+        with sock.makefile("rb") as f:
+            response = f.readline()
+
+    assert b'"ok": false' in response
+    assert error.encode() in response
+
+    # The daemon should continue serving following an invalid request
+    assert request(daemon, {"command": "ping"}) == {"ok": True}
+
+
+def test_serve_already_running(daemon: Path) -> None:
+    with pytest.raises(DaemonRunningError):
+        serve(daemon)
+
+
+def test_serve_replaces_stale_socket(tmp_path: Path) -> None:
+    socket_path = tmp_path / "bumper.sock"
+    socket_path.write_text("")
+
+    thread = threading.Thread(target=serve, args=(socket_path,), daemon=True)
+    thread.start()
+
+    deadline = time.monotonic() + 5
+    while True:
+        try:
+            assert request(socket_path, {"command": "shutdown"}) == {"ok": True}
+            break
+        except OSError:
+            assert time.monotonic() < deadline, "Daemon did not start"
+            time.sleep(0.01)
+
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+
+
+RUNNER = CliRunner()
+
+
+def test_cli_forwards_to_daemon(
+    daemon: Path, project: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def _no_local_bump(*args: t.Any, **kwargs: t.Any) -> None:
+        raise AssertionError("Bump run locally despite a running daemon")
+
+    monkeypatch.setattr(cli, "report_project", _no_local_bump)
+    monkeypatch.setenv(SOCKET_ENVVAR, str(daemon))
+    monkeypatch.chdir(project)
+
+    result = RUNNER.invoke(cli.bumper_cli, ["bump", "patch"])
+    assert result.exit_code == 0
+    assert "Bumped README.md" in result.output
+    assert (project / "README.md").read_text() == "rev: v0.1.1\n"
+
+
+def test_cli_default_socket_from_subdirectory(
+    project: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def _no_local_bump(*args: t.Any, **kwargs: t.Any) -> None:
+        raise AssertionError("Bump run locally despite a running daemon")
+
+    (project / ".git").mkdir()
+    (project / "docs").mkdir()
+    monkeypatch.setattr(cli, "report_project", _no_local_bump)
+    monkeypatch.delenv(SOCKET_ENVVAR, raising=False)
+    monkeypatch.chdir(project / "docs")
+
+    with _serving(project / DEFAULT_SOCKET):
+        result = RUNNER.invoke(cli.bumper_cli, ["bump", "patch"])
+
+    assert result.exit_code == 0
+    assert (project / "README.md").read_text() == "rev: v0.1.1\n"
+
+
+def test_cli_unreachable_daemon_runs_locally(
+    tmp_path: Path, project: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    stale_socket = tmp_path / "bumper.sock"
+    stale_socket.write_text("")
+    monkeypatch.setenv(SOCKET_ENVVAR, str(stale_socket))
+    monkeypatch.chdir(project)
+
+    result = RUNNER.invoke(cli.bumper_cli, ["bump", "patch"])
+    assert result.exit_code == 0
+    assert (project / "README.md").read_text() == "rev: v0.1.1\n"
+
+
+def test_cli_lost_daemon_connection_aborts(
+    tmp_path: Path, project: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    socket_path = tmp_path / "bumper.sock"
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(socket_path))
+    server.listen(1)
+
+    def _drop_connection() -> None:
+        # Accept the request, then close the connection without responding
+        conn, _ = server.accept()
+        with conn, conn.makefile("rb") as f:
+            f.readline()
+
+    thread = threading.Thread(target=_drop_connection, daemon=True)
+    thread.start()
+    monkeypatch.setenv(SOCKET_ENVVAR, str(socket_path))
+    monkeypatch.chdir(project)
+
+    try:
+        result = RUNNER.invoke(cli.bumper_cli, ["bump", "patch"])
+    finally:
+        thread.join(timeout=5)
+        server.close()
+
+    assert result.exit_code != 0
+    assert "Lost connection to the daemon, the bump may have been applied" in result.output
+    assert (project / "README.md").read_text() == "rev: v0.1.0\n"
@@ -0,0 +1,206 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from bumper import CACHE_DIR, transaction
+from bumper.bump import BumpError, BumpType, Project, bump_files, bump_projects
+from bumper.config import BumperFile, BumperOptions, CONFIG_SEARCH, SearchOptions
+from bumper.transaction import JOURNAL_FILENAME, JournalEntry, commit, recover
+from bumper.version import Version
+
+TRANSACTIONAL = BumperOptions(transactional=True)
+
+
+pytestmark = pytest.mark.usefixtures("in_tmp_path")
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> list[BumperFile]:
+    (tmp_path / ".bumper.toml").write_text('current_version = "0.9.0"\n')
+    (tmp_path / "README.md").write_text("v0.9.0\n")
+    (tmp_path / "VERSION").write_text("0.9.0\n")
+
+    return [
+        BumperFile(Path("README.md"), "v{current_version}"),
+        BumperFile(Path("VERSION"), "{current_version}"),
+        BumperFile(Path(".bumper.toml"), CONFIG_SEARCH),
+    ]
+
+
+def _leftovers(directory: Path) -> list[str]:
+    return sorted(p.name for p in directory.glob(".*") if p.name.endswith((".tmp", "-backup")))
+
+
+def test_transactional_bump(tmp_path: Path, project: list[BumperFile]) -> None:
+    (tmp_path / "VERSION").chmod(0o640)
+
+    result = bump_files(Version("0.9.0"), project, BumpType.MINOR, options=TRANSACTIONAL)
+    assert result.ok and all(f.changed and f.staged is None for f in result.files)
+    assert result.bytes_written == sum(len(f.file.read_bytes()) for f in result.files)
+
+    assert (tmp_path / "README.md").read_text() == "v0.10.0\n"
+    assert (tmp_path / "VERSION").read_text() == "0.10.0\n"
+    assert (tmp_path / ".bumper.toml").read_text() == 'current_version = "0.10.0"\n'
+    assert (tmp_path / "VERSION").stat().st_mode & 0o777 == 0o640
+
+    assert _leftovers(tmp_path) == []
+    assert not (tmp_path / CACHE_DIR / JOURNAL_FILENAME).exists()
+
+
+def test_transactional_bump_config_last(
+    project: list[BumperFile], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    replaced = []
+    real_replace = os.replace
+
+    def _record_replace(src: str, dst: str) -> None:
+        if Path(dst).name != JOURNAL_FILENAME:
+            replaced.append(Path(dst).name)
+        real_replace(src, dst)
+
+    monkeypatch.setattr(transaction.os, "replace", _record_replace)
+    bump_files(Version("0.9.0"), project[::-1], BumpType.MINOR, options=TRANSACTIONAL)
+    assert replaced == ["VERSION", "README.md", ".bumper.toml"]
+
+
+def test_transactional_bump_failed_file_modifies_nothing(
+    tmp_path: Path, project: list[BumperFile]
+) -> None:
+    files = [*project, BumperFile(Path("missing.txt"), "{current_version}")]
+
+    result = bump_files(Version("0.9.0"), files, BumpType.MINOR, options=TRANSACTIONAL)
+    assert not result.ok
+    assert not any(f.changed for f in result.files)
+
+    assert (tmp_path / "README.md").read_text() == "v0.9.0\n"
+    assert (tmp_path / ".bumper.toml").read_text() == 'current_version = "0.9.0"\n'
+    assert _leftovers(tmp_path) == []
+
+
+def test_transactional_bump_failed_commit_rolls_back(
+    tmp_path: Path, project: list[BumperFile], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    real_replace = os.replace
+
+    def _failing_replace(src: str, dst: str) -> None:
+        if Path(dst).name == ".bumper.toml" and Path(src).suffix == ".tmp":
+            raise PermissionError("Access denied")
+        real_replace(src, dst)
+
+    monkeypatch.setattr(transaction.os, "replace", _failing_replace)
+    with pytest.raises(BumpError, match="no target files were modified"):
+        bump_files(Version("0.9.0"), project, BumpType.MINOR, options=TRANSACTIONAL)
+
+    assert (tmp_path / "README.md").read_text() == "v0.9.0\n"
+    assert (tmp_path / "VERSION").read_text() == "0.9.0\n"
+    assert (tmp_path / ".bumper.toml").read_text() == 'current_version = "0.9.0"\n'
+    assert _leftovers(tmp_path) == []
+    assert not (tmp_path / CACHE_DIR / JOURNAL_FILENAME).exists()
+
+
+def test_transactional_bump_dry_run_stages_nothing(
+    tmp_path: Path, project: list[BumperFile]
+) -> None:
+    result = bump_files(Version("0.9.0"), project, BumpType.MINOR, True, options=TRANSACTIONAL)
+    assert all(f.diff is not None and f.staged is None for f in result.files)
+    assert (tmp_path / "VERSION").read_text() == "0.9.0\n"
+    assert not (tmp_path / CACHE_DIR).exists()
+
+
+@pytest.mark.parametrize(
+    "options",
+    (
+        BumperOptions(transactional=True, stream_threshold=0),
+        BumperOptions(transactional=True, occurrence_index=True),
+    ),
+)
+def test_transactional_bump_write_paths(
+    tmp_path: Path, project: list[BumperFile], options: BumperOptions
+) -> None:
+    result = bump_files(Version("0.9.0"), project, BumpType.PATCH, options=options)
+    assert result.ok
+    assert (tmp_path / "README.md").read_text() == "v0.9.1\n"
+    assert _leftovers(tmp_path) == []
+
+
+def test_transactional_bump_scoped_rule(tmp_path: Path) -> None:
+    target = tmp_path / "VERSION"
+    target.write_text("0.9.0\n" * 20_000)
+    files = [
+        BumperFile(
+            Path("VERSION"), "{current_version}", search_options=SearchOptions(max_occurrences=1)
+        )
+    ]
+
+    (result,) = bump_files(Version("0.9.0"), files, BumpType.PATCH, options=TRANSACTIONAL).files
+    assert result.changed and result.bytes_written == target.stat().st_size
+    assert target.read_text() == "0.9.1\n" + "0.9.0\n" * 19_999
+    assert _leftovers(tmp_path) == []
+
+
+def test_transactional_bump_projects(tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+    projects = []
+    for name in ("pkg_a", "pkg_b"):
+        project_dir = tmp_path / name
+        project_dir.mkdir()
+        (project_dir / ".bumper.toml").write_text('current_version = "0.9.0"\n')
+        (project_dir / "VERSION").write_text("0.9.0\n")
+        files = [BumperFile(Path("VERSION"), "{current_version}")]
+        projects.append(
+            Project(project_dir / ".bumper.toml", Version("0.9.0"), files, TRANSACTIONAL)
+        )
+
+    bump_projects(projects, BumpType.MAJOR, dry_run=False, n_workers=2, root_dir=tmp_path)
+    assert (tmp_path / "pkg_b" / "VERSION").read_text() == "1.0.0\n"
+    assert (tmp_path / "pkg_a" / ".bumper.toml").read_text() == 'current_version = "1.0.0"\n'
+    assert "Bumped pkg_a/VERSION" in capsys.readouterr().out
+
+
+def _journal_interrupted(tmp_path: Path, n_replaced: int) -> Path:
+    entries = []
+    for idx, name in enumerate(("README.md", "VERSION")):
+        target = tmp_path / name
+        staged = tmp_path / f".{name}.abc.tmp"
+        backup = tmp_path / f".{name}.bumper-backup"
+        backup.write_text("old\n")
+        if idx < n_replaced:
+            target.write_text("new\n")
+        else:
+            target.write_text("old\n")
+            staged.write_text("new\n")
+        entries.append(list(JournalEntry(str(target), str(staged), str(backup))))
+
+    cache_dir = tmp_path / CACHE_DIR
+    transaction.write_cache(cache_dir, JOURNAL_FILENAME, {"files": entries})
+    return cache_dir
+
+
+@pytest.mark.parametrize(("n_replaced", "truth_contents"), ((1, "old\n"), (2, "new\n")))
+def test_recover(tmp_path: Path, n_replaced: int, truth_contents: str) -> None:
+    cache_dir = _journal_interrupted(tmp_path, n_replaced)
+
+    assert recover(cache_dir) is (n_replaced < 2)
+    assert (tmp_path / "README.md").read_text() == truth_contents
+    assert (tmp_path / "VERSION").read_text() == truth_contents
+    assert _leftovers(tmp_path) == []
+    assert not (cache_dir / JOURNAL_FILENAME).exists()
+
+
+def test_recover_without_journal(tmp_path: Path) -> None:
+    assert recover(tmp_path / CACHE_DIR) is False
+
+
+def test_transactional_bump_recovers_interrupted(tmp_path: Path, project: list[BumperFile]) -> None:
+    _journal_interrupted(tmp_path, n_replaced=1)
+    (tmp_path / ".README.md.bumper-backup").write_text("v0.9.0\n")
+
+    result = bump_files(Version("0.9.0"), project, BumpType.PATCH, options=TRANSACTIONAL)
+    assert result.ok and result.files[0].hits == [1]
+    assert (tmp_path / "README.md").read_text() == "v0.9.1\n"
+    assert _leftovers(tmp_path) == []
+
+
+def test_commit_empty(tmp_path: Path) -> None:
+    commit([], tmp_path / CACHE_DIR)
+    assert not (tmp_path / CACHE_DIR / JOURNAL_FILENAME).exists()
@@ -0,0 +1,103 @@
+import pytest
+
+from bumper.version import InvalidVersionError, Version
+
+PARSE_TEST_CASES = (
+    ("0.1.0", (0, 1, 0), (), ()),
+    ("v1.2.3", (1, 2, 3), (), ()),
+    ("1.0", (1, 0), (), ()),
+    ("2025.01.0", (2025, 1, 0), (), ()),
+    ("1.0.0-rc.1", (1, 0, 0), ("rc", "1"), ()),
+    ("1.0.0+build.5", (1, 0, 0), (), ("build", "5")),
+    (
+        "1.0.0-alpha-beta.2+exp.sha.5114f85",
+        (1, 0, 0),
+        ("alpha-beta", "2"),
+        ("exp", "sha", "5114f85"),
+    ),
+)
+
+
+@pytest.mark.parametrize(("raw", "release", "prerelease", "build"), PARSE_TEST_CASES)
+def test_version_parse(
+    raw: str, release: tuple[int, ...], prerelease: tuple[str, ...], build: tuple[str, ...]
+) -> None:
+    ver = Version(raw)
+    assert ver.release == release
+    assert ver.prerelease == prerelease
+    assert ver.build == build
+
+
+INVALID_VERSIONS = (
+    "",
+    "v",
+    "1..0",
+    "1.a.0",
+    "1.0.0-",
+    "1.0.0+",
+    "1.0.0-rc..1",
+    "1.0.0-rc_1",
+    "1.0.0rc1",
+)
+
+
+@pytest.mark.parametrize("raw", INVALID_VERSIONS)
+def test_version_parse_invalid_raises(raw: str) -> None:
+    with pytest.raises(InvalidVersionError):
+        Version(raw)
+
+
+RENDER_TEST_CASES = (
+    ("0.1.0", "0.1.0"),
+    ("v1.2.3", "1.2.3"),
+    ("1.0", "1.0"),
+    ("2025.01.0", "2025.1.0"),
+    ("1.0.0-rc.1+build.5", "1.0.0-rc.1+build.5"),
+)
+
+
+@pytest.mark.parametrize(("raw", "truth_rendered"), RENDER_TEST_CASES)
+def test_version_str(raw: str, truth_rendered: str) -> None:
+    assert str(Version(raw)) == truth_rendered
+
+
+def test_version_components() -> None:
+    ver = Version("2025.1")
+    assert (ver.major, ver.minor, ver.micro) == (2025, 1, 0)
+
+
+def test_version_from_parts() -> None:
+    assert Version.from_parts((1, 2, 3), ("rc", "1")) == Version("1.2.3-rc.1")
+
+
+def test_version_equality() -> None:
+    assert Version("1.0") == Version("1.0.0")
+    assert hash(Version("1.0")) == hash(Version("1.0.0"))
+    assert Version("1.0.0+a") != Version("1.0.0+b")
+    assert Version("1.0.0") != "1.0.0"
+
+
+# SemVer precedence example, in ascending order
+PRECEDENCE = (
+    "1.0.0-alpha",
+    "1.0.0-alpha.1",
+    "1.0.0-alpha.beta",
+    "1.0.0-beta",
+    "1.0.0-beta.2",
+    "1.0.0-beta.11",
+    "1.0.0-rc.1",
+    "1.0.0",
+    "1.0.1",
+    "1.1.0",
+    "2.0.0",
+)
+
+
+def test_version_ordering() -> None:
+    versions = [Version(v) for v in PRECEDENCE]
+    shuffled = versions[5:] + versions[:5]
+    assert sorted(shuffled) == versions
+    assert all(
+        a < b and a <= b and b > a and b >= a for a, b in zip(versions, versions[1:], strict=False)
+    )
+    assert Version("1.0.0+a") <= Version("1.0.0+b") <= Version("1.0.0+a")
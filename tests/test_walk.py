@@ -0,0 +1,143 @@
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from bumper.walk import IgnoreRule, compile_glob, expand_globs, has_magic, walk_files
+
+HAS_MAGIC_TEST_CASES = (
+    ("./pyproject.toml", False),
+    ("src/**/*.py", True),
+    ("charts/?/Chart.yaml", True),
+    ("data/[ab].json", True),
+)
+
+
+@pytest.mark.parametrize(("pattern", "truth_out"), HAS_MAGIC_TEST_CASES)
+def test_has_magic(pattern: str, truth_out: bool) -> None:
+    assert has_magic(pattern) == truth_out
+
+
+GLOB_MATCH_TEST_CASES = (
+    ("*.py", "setup.py", True),
+    ("*.py", "src/setup.py", False),
+    ("src/**/*.py", "src/a.py", True),
+    ("src/**/*.py", "src/pkg/sub/a.py", True),
+    ("src/**/*.py", "tests/a.py", False),
+    ("charts/*/Chart.yaml", "charts/api/Chart.yaml", True),
+    ("charts/*/Chart.yaml", "charts/api/sub/Chart.yaml", False),
+    ("data/?.json", "data/a.json", True),
+    ("data/?.json", "data/ab.json", False),
+    ("data/[ab].json", "data/b.json", True),
+    ("data/[!ab].json", "data/b.json", False),
+    ("data/[!ab].json", "data/c.json", True),
+    ("build/**", "build/lib/a.py", True),
+)
+
+
+@pytest.mark.parametrize(("pattern", "path", "truth_out"), GLOB_MATCH_TEST_CASES)
+def test_compile_glob(pattern: str, path: str, truth_out: bool) -> None:
+    assert bool(compile_glob(pattern).match(path)) == truth_out
+
+
+IGNORE_RULE_TEST_CASES = (
+    ("# comment", "", None),
+    ("", "", None),
+    ("build/", "", ("", False, True, False)),
+    ("/dist", "", ("", False, False, True)),
+    ("!keep.txt", "src", ("src", True, False, False)),
+    ("docs/*.md", "", ("", False, False, True)),
+)
+
+
+@pytest.mark.parametrize(("line", "base", "truth_out"), IGNORE_RULE_TEST_CASES)
+def test_ignore_rule_from_line(
+    line: str, base: str, truth_out: tuple[str, bool, bool, bool] | None
+) -> None:
+    rule = IgnoreRule.from_line(line, base)
+    if truth_out is None:
+        assert rule is None
+    else:
+        assert rule is not None
+        assert (rule.base, rule.negate, rule.dir_only, rule.anchored) == truth_out
+
+
+@pytest.fixture
+def sample_tree(tmp_path: Path) -> Path:
+    for rel_path in (
+        "README.md",
+        "src/pkg/__init__.py",
+        "src/pkg/sub/__init__.py",
+        "src/pkg/debug.log",
+        "src/pkg/keep.log",
+        "build/lib/pkg/__init__.py",
+        ".git/config",
+        "charts/api/Chart.yaml",
+        "charts/web/Chart.yaml",
+        "charts/web/templates/Chart.yaml",
+    ):
+        (tmp_path / rel_path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel_path).touch()
+
+    (tmp_path / ".gitignore").write_text("build/\n*.log\n")
+    (tmp_path / "src" / ".gitignore").write_text("!keep.log\n")
+    return tmp_path
+
+
+def test_walk_files_prunes_ignored(sample_tree: Path) -> None:
+    assert sorted(walk_files(sample_tree)) == [
+        ".gitignore",
+        "README.md",
+        "charts/api/Chart.yaml",
+        "charts/web/Chart.yaml",
+        "charts/web/templates/Chart.yaml",
+        "src/.gitignore",
+        "src/pkg/__init__.py",
+        "src/pkg/keep.log",
+        "src/pkg/sub/__init__.py",
+    ]
+
+
+def test_walk_files_start_applies_parent_ignores(sample_tree: Path) -> None:
+    assert sorted(walk_files(sample_tree, "src/pkg")) == [
+        "src/pkg/__init__.py",
+        "src/pkg/keep.log",
+        "src/pkg/sub/__init__.py",
+    ]
+
+
+def test_walk_files_max_depth(sample_tree: Path) -> None:
+    assert sorted(walk_files(sample_tree, "charts", max_depth=1)) == [
+        "charts/api/Chart.yaml",
+        "charts/web/Chart.yaml",
+    ]
+
+
+def test_expand_globs(sample_tree: Path) -> None:
+    patterns = ["./src/**/__init__.py", "charts/*/Chart.yaml", "*.toml"]
+    assert expand_globs(patterns, root_dir=sample_tree) == {
+        "./src/**/__init__.py": [Path("src/pkg/__init__.py"), Path("src/pkg/sub/__init__.py")],
+        "charts/*/Chart.yaml": [Path("charts/api/Chart.yaml"), Path("charts/web/Chart.yaml")],
+        "*.toml": [],
+    }
+
+
+def test_expand_globs_git(sample_tree: Path) -> None:
+    try:
+        subprocess.run(["git", "init", "-q"], cwd=sample_tree, check=True, capture_output=True)
+    except (OSError, subprocess.CalledProcessError):
+        pytest.skip("git is not available")
+
+    patterns = ["src/**/*.py", "build/**/*.py"]
+    assert expand_globs(patterns, root_dir=sample_tree, use_git=True) == {
+        "src/**/*.py": [Path("src/pkg/__init__.py"), Path("src/pkg/sub/__init__.py")],
+        "build/**/*.py": [],
+    }
+
+
+def test_expand_globs_git_fallback(sample_tree: Path) -> None:
+    # Not a git repository, so the directory walk should be used instead
+    patterns = ["src/**/*.py"]
+    assert expand_globs(patterns, root_dir=sample_tree, use_git=True) == {
+        "src/**/*.py": [Path("src/pkg/__init__.py"), Path("src/pkg/sub/__init__.py")],
+    }
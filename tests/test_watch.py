@@ -0,0 +1,181 @@
+import contextlib
+import os
+import sys
+import threading
+import time
+import typing as t
+from pathlib import Path
+
+import pytest
+
+from bumper import check
+from bumper.config import BumperConfigError
+from bumper.watch import ConsistencyIndex, InotifyWatcher, PollingWatcher, Watcher, watch
+
+SAMPLE_CONFIG = """\
+[tool.bumper]
+current_version = "0.1.0"
+versioning_type = "semver"
+
+[[tool.bumper.files]]
+file = "./README.md"
+search = "rev: v{current_version}"
+
+[[tool.bumper.files]]
+file = "./pkg/__init__.py"
+search = '__version__ = "{current_version}"'
+"""
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    (tmp_path / ".bumper.toml").write_text(SAMPLE_CONFIG)
+    (tmp_path / "README.md").write_text("rev: v0.1.0\n")
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "__init__.py").write_text('__version__ = "0.1.0"\n')
+
+    return tmp_path
+
+
+def test_index_refresh_rescans_touched_file(project: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    index = ConsistencyIndex(project / ".bumper.toml")
+    assert index.ok
+    assert index.paths == {
+        project / ".bumper.toml",
+        project / "README.md",
+        project / "pkg" / "__init__.py",
+    }
+
+    scanned = []
+    real_check_job = check.check_job
+
+    def _record_check_job(job: check.CheckJob) -> check.CheckResult:
+        scanned.append(job.file)
+        return real_check_job(job)
+
+    monkeypatch.setattr("bumper.watch.check_job", _record_check_job)
+    (project / "README.md").write_text("rev: v0.2.0\n")
+    (refreshed,) = index.refresh([project / "README.md", project / "unrelated.txt"])
+    assert scanned == [project / "README.md"]
+    assert refreshed.label == "README.md" and refreshed.matched == [False]
+    assert not index.ok
+
+
+def test_index_refresh_config_reloads(project: Path) -> None:
+    index = ConsistencyIndex(project / ".bumper.toml")
+    (project / ".bumper.toml").write_text(SAMPLE_CONFIG.replace("0.1.0", "0.2.0"))
+
+    refreshed = index.refresh([project / ".bumper.toml"])
+    assert [r.label for r in refreshed] == ["README.md", "__init__.py", ".bumper.toml"]
+    assert str(index.current_version) == "0.2.0"
+    assert [r.ok for r in refreshed] == [False, False, True]
+
+
+def test_index_invalid_config_retained(project: Path) -> None:
+    index = ConsistencyIndex(project / ".bumper.toml")
+    (project / ".bumper.toml").write_text("[tool.bumper]\n")
+
+    with pytest.raises(BumperConfigError):
+        index.refresh([project / ".bumper.toml"])
+
+    assert str(index.current_version) == "0.1.0"
+    assert len(index.results) == 3 and index.ok
+
+
+def _assert_detects_replace(watcher: Watcher, project: Path) -> None:
+    target = project / "README.md"
+    with watcher:
+        watcher.watch([target, project / "missing.txt"])
+        assert watcher.wait(0.05) == set()
+
+        # Editors commonly save by moving a new file into place
+        tmp_file = project / "README.md.tmp"
+        tmp_file.write_text("rev: v0.2.0 \n")
+        os.replace(tmp_file, target)
+        assert watcher.wait(5) == {target}
+        assert watcher.wait(0.05) == set()
+
+
+def test_polling_watcher(project: Path) -> None:
+    _assert_detects_replace(PollingWatcher(interval=0.01), project)
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux only")
+def test_inotify_watcher(project: Path) -> None:
+    _assert_detects_replace(InotifyWatcher(), project)
+
+
+def _read_until(
+    capsys: pytest.CaptureFixture[str], seen: list[str], expected: str, timeout: float = 5
+) -> None:
+    deadline = time.monotonic() + timeout
+    while not any(expected in out for out in seen):
+        assert time.monotonic() < deadline, f"Did not output '{expected}'"
+        time.sleep(0.01)
+        seen.append(capsys.readouterr().out)
+
+
+@contextlib.contextmanager
+def _watching(project: Path, use_polling: bool) -> t.Iterator[None]:
+    stop = threading.Event()
+    kwargs: dict[str, t.Any] = {"use_polling": use_polling, "interval": 0.01, "stop": stop}
+    thread = threading.Thread(target=watch, args=(project / ".bumper.toml",), kwargs=kwargs)
+    thread.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        thread.join(timeout=5)
+
+    assert not thread.is_alive()
+
+
+@pytest.mark.parametrize("use_polling", (True, False))
+def test_watch_reports_drift(
+    project: Path, capsys: pytest.CaptureFixture[str], use_polling: bool
+) -> None:
+    seen: list[str] = []
+    with _watching(project, use_polling):
+        _read_until(capsys, seen, "Watching 3 file(s) for changes to version 0.1.0")
+        assert "All 3 search rule(s) matched." in "".join(seen)
+
+        (project / "README.md").write_text("rev: v0.2.0\n")
+        _read_until(capsys, seen, "README.md - No matches for 'rev: v{current_version}'")
+
+        (project / "README.md").write_text("rev: v0.1.0\n")
+        _read_until(capsys, seen, "README.md - All search rule(s) matched.")
+
+        (project / ".bumper.toml").write_text("[tool.bumper]\n")
+        _read_until(capsys, seen, "Invalid configuration, the previous configuration is retained")
+
+    assert "__init__.py" not in "".join(seen)
+
+
+@pytest.mark.parametrize("use_polling", (True, False))
+def test_watch_malformed_config_retained(
+    project: Path, capsys: pytest.CaptureFixture[str], use_polling: bool
+) -> None:
+    seen: list[str] = []
+    with _watching(project, use_polling):
+        _read_until(capsys, seen, "Watching 3 file(s)")
+
+        (project / ".bumper.toml").write_text("[tool.bumper\n= 1\n")
+        _read_until(capsys, seen, "Invalid configuration, the previous configuration is retained")
+
+        (project / ".bumper.toml").write_text(SAMPLE_CONFIG.replace("0.1.0", "0.2.0"))
+        _read_until(capsys, seen, "Reloaded configuration, current version is 0.2.0")
+
+
+@pytest.mark.parametrize("use_polling", (True, False))
+def test_watch_config_replaced(
+    project: Path, capsys: pytest.CaptureFixture[str], use_polling: bool
+) -> None:
+    seen: list[str] = []
+    with _watching(project, use_polling):
+        _read_until(capsys, seen, "Watching 3 file(s)")
+
+        (project / ".bumper.toml").unlink()
+        _read_until(capsys, seen, "Configuration file does not exist")
+
+        (project / ".bumper.toml").write_text(SAMPLE_CONFIG.replace("0.1.0", "0.2.0"))
+        _read_until(capsys, seen, "Reloaded configuration, current version is 0.2.0")